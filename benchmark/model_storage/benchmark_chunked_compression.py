@@ -0,0 +1,94 @@
+import argparse
+import logging
+import pathlib
+import tempfile
+import time
+from typing import Callable
+
+import numpy as np
+import torch
+from modyn.model_storage.internal.storage_strategies.full_model_strategies import BinaryFullModel
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="[%(asctime)s]  [%(filename)15s:%(lineno)4d] %(levelname)-8s %(message)s",
+    datefmt="%Y-%m-%d:%H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+
+def setup_argparser() -> argparse.ArgumentParser:
+    parser_ = argparse.ArgumentParser(description="Chunked Compression Microbenchmark")
+    parser_.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1_000_000, 10_000_000, 50_000_000],
+        help="Numbers of float32 parameters of the model.",
+    )
+    parser_.add_argument(
+        "--algorithms",
+        type=str,
+        nargs="+",
+        default=["ZIP_DEFLATED", "CHUNKED_DEFLATED", "CHUNKED_DEFLATED_FAST"],
+        help="Zip algorithms (or chunked codecs) to compare.",
+    )
+    parser_.add_argument("--repetitions", type=int, default=3, help="Number of measurements per configuration.")
+    parser_.add_argument("--seed", type=int, default=42, help="Seed of the model weights.")
+
+    return parser_
+
+
+def get_model_state(size: int, seed: int) -> dict:
+    # A large embedding table of which only some rows have been trained, and a few smaller dense layers
+    generator = torch.Generator().manual_seed(seed)
+    embedding = torch.zeros(size // 2)
+    trained = torch.rand(size // 2, generator=generator) < 0.3
+    embedding[trained] = torch.randn(int(trained.sum()), generator=generator)
+    return {
+        "embedding": embedding,
+        "linear": torch.randn(size // 4, generator=generator).to(torch.bfloat16).to(torch.float32),
+        "output": torch.randn(size - size // 2 - size // 4, generator=generator),
+    }
+
+
+def measure(func: Callable[[], None], repetitions: int) -> float:
+    latencies = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        func()
+        latencies.append(time.perf_counter() - start)
+    return float(np.median(latencies))
+
+
+def main() -> None:
+    args = setup_argparser().parse_args()
+
+    print("parameters,algorithm,operation,median_latency_s,throughput_mb_s,compression_ratio")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for size in args.sizes:
+            logger.info(f"Measuring a model with {size} parameters.")
+            model_state = get_model_state(size, args.seed)
+            megabytes = size * 4 / 1e6
+
+            for algorithm in args.algorithms:
+                strategy = BinaryFullModel(pathlib.Path(tmpdir), True, algorithm, {})
+                file_path = pathlib.Path(tmpdir) / f"{algorithm}.bin"
+
+                def store(strategy: BinaryFullModel = strategy, file_path: pathlib.Path = file_path) -> None:
+                    strategy.store_model(model_state, file_path)
+
+                def load(strategy: BinaryFullModel = strategy, file_path: pathlib.Path = file_path) -> None:
+                    loaded_state = strategy.load_model(dict(model_state), file_path)
+                    assert all(torch.equal(loaded_state[name], model_state[name]) for name in model_state)
+
+                store_latency = measure(store, args.repetitions)
+                load_latency = measure(load, args.repetitions)
+                ratio = size * 4 / file_path.stat().st_size
+
+                for operation, latency in [("store", store_latency), ("load", load_latency)]:
+                    print(f"{size},{algorithm},{operation},{latency:.6f},{megabytes / latency:.2f},{ratio:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+import argparse
+import io
+import logging
+import pathlib
+import tempfile
+import time
+from typing import BinaryIO, Callable, Union
+
+import numpy as np
+import torch
+from bitstring import BitArray
+from modyn.model_storage.internal.storage_strategies.incremental_model_strategies import WeightsDifference
+from modyn.utils import get_tensor_byte_size
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="[%(asctime)s]  [%(filename)15s:%(lineno)4d] %(levelname)-8s %(message)s",
+    datefmt="%Y-%m-%d:%H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+
+def setup_argparser() -> argparse.ArgumentParser:
+    parser_ = argparse.ArgumentParser(description="WeightsDifference Encoding Microbenchmark")
+    parser_.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[100_000, 1_000_000, 10_000_000],
+        help="Numbers of float32 parameters of the model.",
+    )
+    parser_.add_argument(
+        "--legacy-max-size",
+        type=int,
+        default=1_000_000,
+        help="Largest model for which the float-by-float implementation is measured, since it is very slow.",
+    )
+    parser_.add_argument("--operator", type=str, default="xor", choices=["xor", "sub"], help="Difference operator.")
+    parser_.add_argument("--no-rle", action="store_true", help="Disable the run-length encoding of the exponents.")
+    parser_.add_argument("--repetitions", type=int, default=3, help="Number of measurements per configuration.")
+    parser_.add_argument("--seed", type=int, default=42, help="Seed of the model weights.")
+
+    return parser_
+
+
+class LegacyWeightsDifference(WeightsDifference):
+    """The previous implementation, which splits the exponents float by float and run-length encodes byte by byte."""
+
+    def _store_model(self, model_state: dict, prev_model_state: dict, file_path: pathlib.Path) -> None:
+        bytestream = io.BytesIO()
+        exponent_bytestream = io.BytesIO() if self.split_exponent else None
+
+        for tensor_model, tensor_prev_model in zip(model_state.values(), prev_model_state.values()):
+            difference = self.difference_operator.calculate_difference(tensor_model, tensor_prev_model)
+
+            if exponent_bytestream is not None and tensor_model.dtype == torch.float32:
+                for i in range(0, len(difference), 4):
+                    reordered_diff = self.reorder_buffer(difference[i : i + 4])
+                    bytestream.write(reordered_diff[0:3])
+                    exponent_bytestream.write(reordered_diff[3:4])
+            else:
+                bytestream.write(difference)
+
+        with open(file_path, "wb") as file:
+            if exponent_bytestream is not None:
+                exponents = exponent_bytestream.getvalue()
+                if self.rle:
+                    exponents = self.encode_bytes(exponents)
+                file.write(len(exponents).to_bytes(8, byteorder="big"))
+                file.write(exponents)
+            file.write(bytestream.getbuffer().tobytes())
+
+    def _load_model_split_exponent(self, prev_model_state: dict, file: BinaryIO) -> dict:
+        exponent_bytes_amount = int.from_bytes(file.read(8), byteorder="big")
+
+        with io.BytesIO() as exponent_bytes:
+            exponent_bytes.write(
+                self.decode_bytes(file.read(exponent_bytes_amount)) if self.rle else file.read(exponent_bytes_amount)
+            )
+            exponent_bytes.seek(0)
+
+            for layer_name, tensor in prev_model_state.items():
+                num_bytes = get_tensor_byte_size(tensor)
+
+                if tensor.dtype == torch.float32:
+                    buffer = bytearray(num_bytes)
+                    for i in range(0, num_bytes, 4):
+                        buffer[i : i + 3] = file.read(3)
+                        buffer[i + 3 : i + 4] = exponent_bytes.read(1)
+
+                    prev_model_state[layer_name] = self.difference_operator.restore(tensor, self.reorder_buffer(buffer))
+                else:
+                    prev_model_state[layer_name] = self.difference_operator.restore(tensor, file.read(num_bytes))
+        return prev_model_state
+
+    @staticmethod
+    def reorder_buffer(buffer: Union[bytes, bytearray]) -> bytes:
+        bit_array = BitArray(buffer)
+        array_size = len(bit_array)
+
+        for i in range(0, array_size, 32):
+            sign_bit = bit_array[i + 24]
+            bit_array[i + 24] = bit_array[i + 16]
+            bit_array[i + 16] = sign_bit
+
+        return bit_array.bytes
+
+    @staticmethod
+    def encode_bytes(buffer: bytes) -> bytes:
+        if len(buffer) == 0:
+            return buffer
+        bytestream = io.BytesIO()
+
+        curr = buffer[0]
+        count = 0
+
+        for byte in buffer:
+            if byte == curr and count < 255:
+                count += 1
+            else:
+                bytestream.write(count.to_bytes(1, byteorder="big"))
+                bytestream.write(curr.to_bytes(1, byteorder="big"))
+                curr = byte
+                count = 1
+        bytestream.write(count.to_bytes(1, byteorder="big"))
+        bytestream.write(curr.to_bytes(1, byteorder="big"))
+
+        return bytestream.getvalue()
+
+    @staticmethod
+    def decode_bytes(buffer: bytes) -> bytes:
+        bytestream = io.BytesIO()
+
+        for i in range(0, len(buffer), 2):
+            count = int.from_bytes(buffer[i : i + 1], byteorder="big")
+
+            bytestream.write(count * buffer[i + 1 : i + 2])
+        return bytestream.getvalue()
+
+
+def get_model_states(size: int, seed: int) -> tuple[dict, dict]:
+    # A model with a large embedding table and a few smaller layers, where training changed a small share of weights
+    generator = torch.Generator().manual_seed(seed)
+    shapes = {"embedding": (size // 2,), "linear": (size // 4,), "output": (size - size // 2 - size // 4,)}
+    prev_model_state = {name: torch.randn(shape, generator=generator) for name, shape in shapes.items()}
+    model_state = {}
+    for name, tensor in prev_model_state.items():
+        changed = torch.rand(tensor.shape, generator=generator) < 0.1
+        model_state[name] = torch.where(changed, tensor + 0.01 * torch.randn(tensor.shape, generator=generator), tensor)
+    return model_state, prev_model_state
+
+
+def measure(func: Callable[[], None], repetitions: int) -> float:
+    latencies = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        func()
+        latencies.append(time.perf_counter() - start)
+    return float(np.median(latencies))
+
+
+def main() -> None:
+    args = setup_argparser().parse_args()
+    config = {"operator": args.operator, "split_exponent": True, "rle": not args.no_rle}
+    strategies = {
+        "legacy": LegacyWeightsDifference(pathlib.Path(), False, "", config),
+        "numpy": WeightsDifference(pathlib.Path(), False, "", config),
+    }
+
+    print("parameters,method,operation,median_latency_s,throughput_mb_s,identical")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for size in args.sizes:
+            logger.info(f"Measuring a model with {size} parameters.")
+            model_state, prev_model_state = get_model_states(size, args.seed)
+            megabytes = size * 4 / 1e6
+            reference = None
+
+            for method, strategy in strategies.items():
+                if method == "legacy" and size > args.legacy_max_size:
+                    continue
+                file_path = pathlib.Path(tmpdir) / f"{method}.bin"
+
+                def store(strategy: WeightsDifference = strategy, file_path: pathlib.Path = file_path) -> None:
+                    strategy.store_model(model_state, prev_model_state, file_path)
+
+                def load(strategy: WeightsDifference = strategy, file_path: pathlib.Path = file_path) -> None:
+                    strategy.load_model(dict(prev_model_state), file_path)
+
+                store_latency = measure(store, args.repetitions)
+                load_latency = measure(load, args.repetitions)
+
+                stored_bytes = file_path.read_bytes()
+                reference = stored_bytes if reference is None else reference
+                identical = stored_bytes == reference
+
+                for operation, latency in [("store", store_latency), ("load", load_latency)]:
+                    print(f"{size},{method},{operation},{latency:.6f},{megabytes / latency:.2f},{identical}")
+
+
+if __name__ == "__main__":
+    main()
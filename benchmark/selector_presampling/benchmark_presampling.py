@@ -0,0 +1,175 @@
+import argparse
+import logging
+import pathlib
+import tempfile
+import time
+from typing import Callable, Optional
+
+import yaml
+from modyn.metadata_database.metadata_database_connection import MetadataDatabaseConnection
+from modyn.metadata_database.models import SelectorStateMetadata
+from modyn.metadata_database.utils import ModelStorageStrategyConfig
+from modyn.selector.internal.selector_strategies.presampling_strategies import (
+    LabelBalancedPresamplingStrategy,
+    RandomPresamplingStrategy,
+)
+from modyn.selector.internal.storage_backend.database import DatabaseStorageBackend
+from sqlalchemy import Select, asc, func, select
+from sqlalchemy.sql.expression import func as sql_func
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="[%(asctime)s]  [%(filename)15s:%(lineno)4d] %(levelname)-8s %(message)s",
+    datefmt="%Y-%m-%d:%H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+
+def setup_argparser() -> argparse.ArgumentParser:
+    parser_ = argparse.ArgumentParser(description="Selector Presampling Benchmark")
+    parser_.add_argument(
+        "--config",
+        type=pathlib.Path,
+        action="store",
+        help="Modyn config whose metadata database is used. Defaults to a temporary SQLite database.",
+    )
+    parser_.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000, 1_000_000],
+        help="Numbers of samples in the selector state for which the presampling is measured.",
+    )
+    parser_.add_argument("--ratio", type=int, default=10, help="Presampling ratio in percent.")
+    parser_.add_argument("--num-classes", type=int, default=100, help="Number of labels of the samples.")
+    parser_.add_argument("--repetitions", type=int, default=3, help="Number of measurements per configuration.")
+
+    return parser_
+
+
+def get_modyn_config(config_path: Optional[pathlib.Path], database_dir: str) -> dict:
+    if config_path is not None:
+        with open(config_path, "r", encoding="utf-8") as config_file:
+            modyn_config = yaml.safe_load(config_file)
+    else:
+        modyn_config = {
+            "metadata_database": {
+                "drivername": "sqlite",
+                "username": "",
+                "password": "",
+                "host": "",
+                "port": "0",
+                "database": f"{database_dir}/presampling_benchmark.db",
+            },
+            "selector": {"insertion_threads": 1, "trigger_sample_directory": database_dir},
+        }
+    modyn_config["selector"]["insertion_threads"] = 1
+    return modyn_config
+
+
+def order_by_random_query(pipeline_id: int, target_size: int) -> Select:
+    # The query of RandomPresamplingStrategy before the Bernoulli sampling
+    subq = (
+        select(SelectorStateMetadata.sample_key)
+        .filter(SelectorStateMetadata.pipeline_id == pipeline_id)
+        .order_by(func.random())  # pylint: disable=not-callable
+        .limit(target_size)
+    )
+    return (
+        select(SelectorStateMetadata.sample_key)
+        .filter(SelectorStateMetadata.pipeline_id == pipeline_id, SelectorStateMetadata.sample_key.in_(subq))
+        .order_by(asc(SelectorStateMetadata.timestamp))
+    )
+
+
+def row_number_query(pipeline_id: int, fair_share: int) -> Select:
+    # The query of LabelBalancedPresamplingStrategy before the Bernoulli sampling
+    subquery = (
+        select(
+            SelectorStateMetadata,
+            sql_func.row_number()
+            .over(partition_by=SelectorStateMetadata.label, order_by=func.random())  # pylint: disable=not-callable
+            .label("row_num"),
+        )
+        .filter(SelectorStateMetadata.pipeline_id == pipeline_id)
+        .subquery()
+    )
+    return select(subquery.c.sample_key).where(subquery.c.row_num <= fair_share).order_by(asc(subquery.c.timestamp))
+
+
+def measure(modyn_config: dict, build_query: Callable[[], Select], repetitions: int) -> tuple[float, int]:
+    # Returns the median latency (including building the query, i.e., the sampling) and the number of samples
+    latencies = []
+    num_samples = 0
+    for _ in range(repetitions):
+        start = time.time()
+        with MetadataDatabaseConnection(modyn_config) as database:
+            num_samples = len(database.session.execute(build_query()).all())
+        latencies.append(time.time() - start)
+    return sorted(latencies)[len(latencies) // 2], num_samples
+
+
+def main() -> None:
+    args = setup_argparser().parse_args()
+
+    with tempfile.TemporaryDirectory() as database_dir:
+        modyn_config = get_modyn_config(args.config, database_dir)
+        with MetadataDatabaseConnection(modyn_config) as database:
+            database.create_tables()
+            pipeline_id = database.register_pipeline(
+                1, "ResNet18", "{}", False, "{}", ModelStorageStrategyConfig(name="PyTorchFullModel")
+            )
+            database.add_selector_state_metadata_trigger(pipeline_id, 0)
+
+        presampling_config = {"ratio": args.ratio}
+        backend = DatabaseStorageBackend(pipeline_id, modyn_config, 1_000_000)
+        random_presampler = RandomPresamplingStrategy(presampling_config, modyn_config, pipeline_id, backend)
+        balanced_presampler = LabelBalancedPresamplingStrategy(
+            presampling_config.copy(), modyn_config, pipeline_id, backend
+        )
+
+        num_samples = 0
+        print("samples,strategy,method,latency_s,sampled")
+        for size in sorted(args.sizes):
+            keys = list(range(num_samples, size))
+            backend.persist_samples(0, keys, keys, [key % args.num_classes for key in keys])
+            num_samples = size
+            target_size = random_presampler.get_target_size(size, None)
+            fair_share = target_size // args.num_classes
+
+            results = [
+                (
+                    "random",
+                    "order_by_random",
+                    measure(modyn_config, lambda: order_by_random_query(pipeline_id, target_size), args.repetitions),
+                ),
+                (
+                    "random",
+                    "bernoulli",
+                    measure(
+                        modyn_config,
+                        lambda: random_presampler.get_presampling_query(1, None, None, size),
+                        args.repetitions,
+                    ),
+                ),
+                (
+                    "label_balanced",
+                    "row_number_random",
+                    measure(modyn_config, lambda: row_number_query(pipeline_id, fair_share), args.repetitions),
+                ),
+                (
+                    "label_balanced",
+                    "bernoulli",
+                    measure(
+                        modyn_config,
+                        lambda: balanced_presampler.get_presampling_query(1, None, None, None),
+                        args.repetitions,
+                    ),
+                ),
+            ]
+            for strategy, method, (latency, sampled) in results:
+                print(f"{size},{strategy},{method},{latency:.4f},{sampled}")
+
+
+if __name__ == "__main__":
+    main()
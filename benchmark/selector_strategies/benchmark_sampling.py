@@ -0,0 +1,102 @@
+import argparse
+import logging
+import random
+import time
+from types import SimpleNamespace
+from typing import Callable
+
+import numpy as np
+from modyn.common.trigger_sample import keys_to_trigger_samples
+from modyn.common.trigger_sample.trigger_sample_storage import TRIGGER_SAMPLE_DTYPE
+from modyn.selector.internal.selector_strategies.abstract_selection_strategy import (
+    AbstractSelectionStrategy,
+    SampleKeys,
+)
+from modyn.selector.internal.selector_strategies.stream_sampling import sample_chunks
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="[%(asctime)s]  [%(filename)15s:%(lineno)4d] %(levelname)-8s %(message)s",
+    datefmt="%Y-%m-%d:%H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+
+def setup_argparser() -> argparse.ArgumentParser:
+    parser_ = argparse.ArgumentParser(description="Selection Strategy Sampling Microbenchmark")
+    parser_.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000, 1_000_000],
+        help="Numbers of keys in a partition for which shuffling and sampling is measured.",
+    )
+    parser_.add_argument("--ratio", type=int, default=10, help="Sample size in percent of the partition size.")
+    parser_.add_argument("--repetitions", type=int, default=5, help="Number of measurements per configuration.")
+    parser_.add_argument("--seed", type=int, default=42, help="Seed of the random generators.")
+
+    return parser_
+
+
+# The previous implementation of the strategies: Python lists with the random module, and a (key, weight) tuple
+# per key that is converted into trigger samples when the partition is stored.
+def shuffle_tuples(keys: list[int]) -> np.ndarray:
+    keys = list(keys)
+    random.shuffle(keys)
+    return np.asarray([(key, 1.0) for key in keys], dtype=TRIGGER_SAMPLE_DTYPE)
+
+
+def shuffle_list(keys: list[int]) -> np.ndarray:
+    keys = list(keys)
+    random.shuffle(keys)
+    return keys_to_trigger_samples(keys)
+
+
+def sample_list(keys: list[int], sample_size: int) -> np.ndarray:
+    # As before, a limited partition is shuffled once more on trigger
+    return shuffle_list(random.sample(keys, min(len(keys), sample_size)))
+
+
+def measure(func: Callable[[], np.ndarray], repetitions: int) -> float:
+    latencies = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        func()
+        latencies.append(time.perf_counter() - start)
+    return float(np.median(latencies))
+
+
+def main() -> None:
+    args = setup_argparser().parse_args()
+    random.seed(args.seed)
+
+    # The strategy helpers only need the generator, hence we do not need to set up a strategy and its database
+    strategy = SimpleNamespace(_rng=np.random.default_rng(args.seed))
+
+    def shuffle_numpy(keys: SampleKeys) -> np.ndarray:
+        return AbstractSelectionStrategy._shuffled_trigger_samples(strategy, keys)  # type: ignore
+
+    def sample_numpy(keys: list[int], sample_size: int) -> np.ndarray:
+        (sample,) = sample_chunks([keys], len(keys), sample_size, len(keys), strategy._rng)
+        return shuffle_numpy(sample)
+
+    print("size,operation,method,median_latency_s")
+    for size in args.sizes:
+        # Storage backends return the keys of a partition as a list
+        keys = list(range(size))
+        sample_size = size * args.ratio // 100
+
+        logger.info(f"Measuring partitions of {size} keys.")
+        methods: list[tuple[str, str, Callable[[], np.ndarray]]] = [
+            ("shuffle", "tuples", lambda: shuffle_tuples(keys)),
+            ("shuffle", "list", lambda: shuffle_list(keys)),
+            ("shuffle", "numpy", lambda: shuffle_numpy(keys)),
+            ("sample", "list", lambda: sample_list(keys, sample_size)),
+            ("sample", "numpy", lambda: sample_numpy(keys, sample_size)),
+        ]
+        for operation, method, func in methods:
+            print(f"{size},{operation},{method},{measure(func, args.repetitions):.6f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,16 @@
 """
-This submodule implements functions to run gRPC servers using multiprocessing.
+This submodule implements functions to run gRPC servers using multiprocessing and to stream models via gRPC.
 """
 
 import os
 
 from .grpc_helpers import GenericGRPCServer  # noqa: F401
+from .model_streaming import (  # noqa: F401
+    checksummed_chunks,
+    download_streamed_model,
+    read_chunks,
+    write_checksummed_chunks,
+)
 
 files = os.listdir(os.path.dirname(__file__))
 files.remove("__init__.py")
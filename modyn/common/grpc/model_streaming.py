@@ -0,0 +1,94 @@
+"""
+Functions to transfer models between the components as a stream of gRPC messages.
+
+Instead of writing a model to the directory of an FTP server and downloading (and hashing) it again at the receiver,
+the sender streams the bytes of the model in chunks. Both sides hash the chunks on the fly. The checksum is the same as
+the one of calculate_checksum for the file of the model.
+"""
+
+import hashlib
+import logging
+import pathlib
+from typing import BinaryIO, Iterable, Iterator, Optional
+
+from modyn.utils import MAX_MESSAGE_SIZE
+
+# Every chunk is sent in its own message, hence it must be smaller than the maximum message size
+CHUNK_SIZE = min(4 * 1024 * 1024, MAX_MESSAGE_SIZE // 2)
+CHECKSUM_HASH_FUNC = "blake2b"
+
+
+def read_chunks(file: BinaryIO, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Reads a file (or an in-memory buffer) in chunks of at most chunk_size bytes."""
+    while chunk := file.read(chunk_size):
+        yield chunk
+
+
+def checksummed_chunks(chunks: Iterable[bytes]) -> Iterator[tuple[bytes, bytes]]:
+    """
+    Hashes the chunks while they are sent.
+
+    Args:
+        chunks: the chunks of the model.
+
+    Returns:
+        Iterator[tuple[bytes, bytes]]: a (chunk, b"") tuple for every chunk, followed by (b"", checksum) with the
+            checksum over all chunks.
+    """
+    hash_func = hashlib.new(CHECKSUM_HASH_FUNC)
+    for chunk in chunks:
+        hash_func.update(chunk)
+        yield chunk, b""
+    yield b"", hash_func.digest()
+
+
+def write_checksummed_chunks(chunks: Iterable[tuple[bytes, bytes]], file: BinaryIO) -> bool:
+    """
+    Writes the received chunks to a file (or an in-memory buffer) while hashing them.
+
+    Args:
+        chunks: (chunk, checksum) tuples, where the checksum is only set for the last chunk.
+        file: the file to which the chunks are written.
+
+    Returns:
+        bool: whether the checksum of the received chunks matches the checksum sent with the last chunk.
+    """
+    hash_func = hashlib.new(CHECKSUM_HASH_FUNC)
+    checksum = b""
+    for chunk, chunk_checksum in chunks:
+        hash_func.update(chunk)
+        file.write(chunk)
+        checksum = chunk_checksum or checksum
+    return checksum == hash_func.digest()
+
+
+def download_streamed_model(
+    logger: logging.Logger,
+    chunks: Iterable[tuple[bytes, bytes]],
+    identifier: int,
+    base_directory: pathlib.Path,
+) -> Optional[pathlib.Path]:
+    """
+    Writes a streamed model to a file in the base directory.
+
+    Args:
+        logger: to log the events.
+        chunks: (chunk, checksum) tuples, where the checksum is only set for the last chunk.
+        identifier: the identifier that is used in the name of the model file.
+        base_directory: the directory, in which the model is stored.
+
+    Returns:
+        Optional[pathlib.Path]: the path to the model, if the model matches its checksum.
+    """
+    model_path = base_directory / f"trained_model_{identifier}.modyn"
+
+    with open(model_path, "wb") as model_file:
+        success = write_checksummed_chunks(chunks, model_file)
+
+    if not success:
+        logger.error("Streamed model does not match its checksum.")
+        model_path.unlink()
+        return None
+
+    logger.info(f"Successfully received model {identifier}.")
+    return model_path
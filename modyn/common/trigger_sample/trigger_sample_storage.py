@@ -13,12 +13,20 @@ from numpy.ctypeslib import ndpointer
 logger = logging.getLogger(__name__)
 
 NUMPY_HEADER_SIZE = 128
+TRIGGER_SAMPLE_DTYPE = np.dtype([("f0", "<i8"), ("f1", "<f8")])
+
+
+def keys_to_trigger_samples(keys: typing.Union[list[int], np.ndarray], weight: float = 1.0) -> np.ndarray:
+    """Builds the trigger samples of the keys with the same weight, without creating a (key, weight) tuple per key."""
+    trigger_samples = np.empty(len(keys), dtype=TRIGGER_SAMPLE_DTYPE)
+    trigger_samples["f0"] = keys
+    trigger_samples["f1"] = weight
+    return trigger_samples
 
 
 class ArrayWrapper:
-    def __init__(self, array: np.ndarray, f_release: typing.Callable) -> None:
+    def __init__(self, array: np.ndarray) -> None:
         self.array = array
-        self.f_release = f_release
 
     def __len__(self) -> int:
         return self.array.size
@@ -29,9 +37,6 @@ class ArrayWrapper:
     def __str__(self) -> str:
         return self.array.__str__()
 
-    def __del__(self) -> None:
-        self.f_release(self.array)
-
     def __eq__(self, other: typing.Any) -> typing.Any:
         return self.array == other
 
@@ -101,32 +106,6 @@ class TriggerSampleStorage:
         ]
         self._write_files_impl.restype = None
 
-        self._get_all_samples_impl = self.extension.get_all_samples
-        self._get_all_samples_impl.argtypes = [
-            ctypes.POINTER(ctypes.c_char),
-            ctypes.POINTER(ctypes.c_int64),
-            ctypes.POINTER(ctypes.c_char),
-        ]
-        self._get_all_samples_impl.restype = ctypes.POINTER(ctypes.c_char)
-
-        self._get_worker_samples_impl = self.extension.get_worker_samples
-        self._get_worker_samples_impl.argtypes = [
-            ctypes.POINTER(ctypes.c_char),
-            ctypes.POINTER(ctypes.c_int64),
-            ctypes.POINTER(ctypes.c_char),
-            ctypes.c_int64,
-            ctypes.c_int64,
-        ]
-        self._get_worker_samples_impl.restype = ctypes.POINTER(ctypes.c_char)
-
-        self._parse_file_impl = self.extension.parse_file
-        self._parse_file_impl.argtypes = [ctypes.POINTER(ctypes.c_char), ctypes.POINTER(ctypes.c_int64)]
-        self._parse_file_impl.restype = ctypes.POINTER(ctypes.c_char)
-
-        self._release_data_impl = self.extension.release_data
-        self._release_data_impl.argtypes = [ndpointer(dtype=[("f0", "<i8"), ("f1", "<f8")], flags="C_CONTIGUOUS")]
-        self._release_data_impl.restype = None
-
     def get_trigger_samples(
         self,
         pipeline_id: int,
@@ -196,12 +175,8 @@ class TriggerSampleStorage:
             retrieval_worker_id, total_retrieval_workers, num_samples_trigger_partition
         )
 
-        folder = ctypes.c_char_p(str(self.trigger_sample_directory).encode("utf-8"))
-        size_ptr = (ctypes.c_int64 * 1)()
-        pattern = ctypes.c_char_p(f"{pipeline_id}_{trigger_id}_{partition_id}_".encode("utf-8"))
-
-        data = self._get_worker_samples_impl(folder, size_ptr, pattern, start_index, worker_subset_size)
-        return self._cbytes_to_numpy(data, size_ptr)
+        files = self._get_files_for_partition(pipeline_id, trigger_id, partition_id)
+        return self._get_samples_in_range(files, start_index, start_index + worker_subset_size)
 
     def _get_all_samples(self, pipeline_id: int, trigger_id: int, partition_id: int) -> ArrayWrapper:
         """
@@ -213,30 +188,51 @@ class TriggerSampleStorage:
         :return: the trigger samples
         """
 
-        folder = ctypes.c_char_p(str(self.trigger_sample_directory).encode("utf-8"))
-        size_ptr = (ctypes.c_int64 * 1)()
-
-        pattern = ctypes.c_char_p(f"{pipeline_id}_{trigger_id}_{partition_id}_".encode("utf-8"))
+        files = self._get_files_for_partition(pipeline_id, trigger_id, partition_id)
+        return self._get_samples_in_range(files, 0, sys.maxsize)
 
-        data = self._get_all_samples_impl(folder, size_ptr, pattern)
-        return self._cbytes_to_numpy(data, size_ptr)
+    def _get_files_for_partition(self, pipeline_id: int, trigger_id: int, partition_id: int) -> list[Path]:
+        # Same order as the files are read by the C++ implementation, i.e., sorted by their name
+        prefix = f"{pipeline_id}_{trigger_id}_{partition_id}_"
+        return sorted(
+            Path(self.trigger_sample_directory) / file
+            for file in os.listdir(self.trigger_sample_directory)
+            if file.startswith(prefix)
+        )
 
-    def _cbytes_to_numpy(
-        self, data: ctypes.POINTER(ctypes.c_char), size_ptr: ctypes.POINTER(ctypes.c_uint64)  # type: ignore
-    ) -> ArrayWrapper:
-        """Convert ctypeslib bytes function output to numpy with dynamic size.
+    @staticmethod
+    def _map_file(file_path: Path) -> np.ndarray:
+        """Memory-maps the samples of the given file. The returned array is a read-only view of the file."""
+        num_samples = (file_path.stat().st_size - NUMPY_HEADER_SIZE) // TRIGGER_SAMPLE_DTYPE.itemsize
+        if num_samples <= 0:
+            # Empty files cannot be mapped
+            return np.empty((0,), dtype=TRIGGER_SAMPLE_DTYPE)
+        return np.memmap(
+            file_path, dtype=TRIGGER_SAMPLE_DTYPE, mode="r", offset=NUMPY_HEADER_SIZE, shape=(num_samples,)
+        )
 
-        Args:
-            data (ctypes.POINTER): The result of the c function
-            size_ptr (ctypes.POINTER): Pointer to the size
+    def _get_samples_in_range(self, files: list[Path], start_index: int, end_index: int) -> ArrayWrapper:
+        """
+        Return the samples in [start_index, end_index) of the concatenation of the given files.
 
-        Returns:
-            ArrayWrapper: Array of trigger samples
+        If the range lies within a single file, the result is a view of the memory-mapped file, i.e., no data is
+        copied. Only ranges spanning multiple files are concatenated into a new array.
         """
-        full_dtype = np.dtype([("f0", "<i8"), ("f1", "<f8")], (size_ptr[0],))  # type: ignore
-        full_ctype = ctypes.c_char * full_dtype.itemsize * size_ptr[0]
-        buffer = ctypes.cast(data, ctypes.POINTER(full_ctype)).contents
-        return ArrayWrapper(np.frombuffer(buffer, dtype=full_dtype), self._release_data_impl)
+        views = []
+        current_index = 0
+        for file_path in files:
+            if current_index >= end_index:
+                break
+            samples = self._map_file(file_path)
+            if current_index + len(samples) > start_index:
+                views.append(samples[max(start_index - current_index, 0) : end_index - current_index])
+            current_index += len(samples)
+
+        if len(views) == 0:
+            return ArrayWrapper(np.empty((0,), dtype=TRIGGER_SAMPLE_DTYPE))
+        if len(views) == 1:
+            return ArrayWrapper(views[0])
+        return ArrayWrapper(np.concatenate(views))
 
     def save_trigger_samples(
         self, pipeline_id: int, trigger_id: int, partition_id: int, trigger_samples: np.ndarray, data_lengths: list
@@ -307,13 +303,9 @@ class TriggerSampleStorage:
         """
 
         if not file_path.exists():
-            return np.empty((0,), dtype=[("f0", "<i8"), ("f1", "<f8")])
-
-        file = ctypes.c_char_p(str(file_path).encode("utf-8"))
-        size_ptr = (ctypes.c_int64 * 1)()
+            return np.empty((0,), dtype=TRIGGER_SAMPLE_DTYPE)
 
-        data = self._parse_file_impl(file, size_ptr)
-        return self._cbytes_to_numpy(data, size_ptr)
+        return ArrayWrapper(self._map_file(file_path))
 
     def _get_num_samples_in_file(self, file_path: Path) -> int:
         """Get the number of samples in the given file.
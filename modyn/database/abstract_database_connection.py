@@ -4,6 +4,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Optional
 
+from modyn.database.engine_registry import get_engine, is_in_memory
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.url import URL
@@ -30,6 +31,9 @@ class AbstractDatabaseConnection(ABC):
         self.host: Optional[str] = None
         self.port: Optional[int] = None
         self.database: Optional[str] = None
+        # Options of the connection pool, see engine_registry.POOL_OPTIONS
+        self.pool_options: dict = {}
+        self._owns_engine = False
 
     def setup_connection(self) -> None:
         self.url = URL.create(
@@ -40,12 +44,19 @@ class AbstractDatabaseConnection(ABC):
             port=self.port,
             database=self.database,
         )
-        self.engine = create_engine(self.url, echo=self.print_queries)
+        # In-memory databases only live as long as their connection, hence they cannot be shared via the registry
+        self._owns_engine = is_in_memory(self.url)
+        if self._owns_engine:
+            self.engine = create_engine(self.url, echo=self.print_queries)
+        else:
+            self.engine = get_engine(self.url, self.print_queries, self.pool_options)
         self.session = sessionmaker(bind=self.engine)()
 
     def terminate_connection(self) -> None:
+        # Returns the connection of the session to the pool of the engine
         self.session.close()
-        self.engine.dispose()
+        if self._owns_engine:
+            self.engine.dispose()
 
     def __enter__(self) -> AbstractDatabaseConnection:
         """Create the engine and session.
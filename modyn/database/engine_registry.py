@@ -0,0 +1,157 @@
+"""
+Process-wide registry of SQLAlchemy engines.
+
+Creating an engine for every database connection context means opening a new database connection (and initializing
+the dialect) for every query. Instead, the engines are created once per process and database, such that contexts reuse
+the pooled connections and the compiled statement cache of the engine.
+
+Pooled connections must not be shared between processes. After a fork, the child process hence drops the engines of
+the parent without closing their connections, which still belong to the parent, and creates its own engines.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.url import URL
+from sqlalchemy.pool import NullPool, QueuePool
+
+logger = logging.getLogger(__name__)
+
+# Defaults of the options that can be set in the database configuration
+DEFAULT_POOL_SIZE = 5
+DEFAULT_MAX_OVERFLOW = 10
+DEFAULT_POOL_TIMEOUT = 30
+DEFAULT_POOL_RECYCLE = -1
+DEFAULT_QUERY_CACHE_SIZE = 500
+POOL_OPTIONS = ["pool_size", "max_overflow", "pool_timeout", "pool_recycle", "query_cache_size"]
+
+COUNTERS = ["engines_created", "connections_opened", "connection_checkouts", "pool_waits"]
+
+_engines: dict[tuple, Engine] = {}
+_engines_pid = os.getpid()
+_lock = threading.RLock()
+_stats: dict[str, Any] = {counter: 0 for counter in COUNTERS} | {"pool_wait_time": 0.0}
+
+
+def _increment(counter: str, value: Any = 1) -> None:
+    with _lock:
+        _stats[counter] += value
+
+
+class CountingQueuePool(QueuePool):
+    """A QueuePool that counts how often (and how long) a checkout had to wait for a connection to be returned."""
+
+    # Engine.dispose recreates the pool with the same class and arguments
+    def __init__(self, *args: Any, max_overflow: int = DEFAULT_MAX_OVERFLOW, **kwargs: Any) -> None:
+        super().__init__(*args, max_overflow=max_overflow, **kwargs)
+        self._max_overflow_connections = max_overflow
+
+    def _do_get(self) -> Any:
+        # A negative max_overflow means that the pool may open arbitrarily many connections
+        unlimited = self._max_overflow_connections < 0
+        if unlimited or self.checkedin() > 0 or self.overflow() < self._max_overflow_connections:
+            return super()._do_get()
+
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            _increment("pool_waits")
+            _increment("pool_wait_time", time.perf_counter() - start)
+
+
+def _drop_engines_of_parent() -> None:
+    global _engines_pid  # pylint: disable=global-statement
+    for engine in _engines.values():
+        # The connections still belong to the parent process, hence we must not close them
+        engine.dispose(close=False)
+    _engines.clear()
+    _engines_pid = os.getpid()
+    for counter in _stats:
+        _stats[counter] = 0 if counter in COUNTERS else 0.0
+
+
+def _reset_after_fork() -> None:
+    global _lock  # pylint: disable=global-statement
+    # Another thread of the parent might have held the lock while forking
+    _lock = threading.RLock()
+    _drop_engines_of_parent()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def is_in_memory(url: URL) -> bool:
+    return url.drivername.startswith("sqlite") and url.database in [None, "", ":memory:"]
+
+
+def _create_engine(url: URL, echo: bool, pool_options: dict) -> Engine:
+    query_cache_size = pool_options.get("query_cache_size", DEFAULT_QUERY_CACHE_SIZE)
+    if url.drivername.startswith("sqlite"):
+        # Opening a SQLite connection is cheap, and SQLite files might be replaced (e.g., in tests), hence we do not
+        # keep connections open. We still reuse the engine and its compiled statement cache.
+        engine = create_engine(url, echo=echo, poolclass=NullPool, query_cache_size=query_cache_size)
+    else:
+        engine = create_engine(
+            url,
+            echo=echo,
+            poolclass=CountingQueuePool,
+            pool_size=pool_options.get("pool_size", DEFAULT_POOL_SIZE),
+            max_overflow=pool_options.get("max_overflow", DEFAULT_MAX_OVERFLOW),
+            pool_timeout=pool_options.get("pool_timeout", DEFAULT_POOL_TIMEOUT),
+            pool_recycle=pool_options.get("pool_recycle", DEFAULT_POOL_RECYCLE),
+            pool_pre_ping=True,
+            query_cache_size=query_cache_size,
+        )
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(*_: Any) -> None:
+        _increment("connections_opened")
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(*_: Any) -> None:
+        _increment("connection_checkouts")
+
+    _increment("engines_created")
+    return engine
+
+
+def get_engine(url: URL, echo: bool = False, database_config: Optional[dict] = None) -> Engine:
+    """
+    Returns the engine of this process for the database. The engine is created on first use, with the POOL_OPTIONS
+    given in the database configuration.
+    """
+    database_config = {} if database_config is None else database_config
+    pool_options = {option: database_config[option] for option in POOL_OPTIONS if option in database_config}
+    key = (url.render_as_string(hide_password=False), echo, tuple(sorted(pool_options.items())))
+
+    with _lock:
+        if _engines_pid != os.getpid():
+            # Fallback if the process has been forked without running the fork handlers
+            _drop_engines_of_parent()
+        if key not in _engines:
+            logger.debug(f"Creating engine for {url.render_as_string()} in process {os.getpid()}.")
+            _engines[key] = _create_engine(url, echo, pool_options)
+        return _engines[key]
+
+
+def get_connection_stats() -> dict[str, Any]:
+    """Returns the counters of the engines of this process."""
+    with _lock:
+        return dict(_stats)
+
+
+def dispose_engines() -> None:
+    """Closes all pooled connections and drops the engines of this process."""
+    with _lock:
+        for engine in _engines.values():
+            engine.dispose()
+        _engines.clear()
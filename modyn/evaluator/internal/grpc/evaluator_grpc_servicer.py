@@ -1,5 +1,6 @@
 """Evaluator GRPC servicer."""
 
+import itertools
 import json
 import logging
 import multiprocessing as mp
@@ -9,7 +10,7 @@ from threading import Lock
 from typing import Any, Optional
 
 import grpc
-from modyn.common.ftp import download_trained_model
+from modyn.common.grpc.model_streaming import download_streamed_model
 
 # pylint: disable-next=no-name-in-module
 from modyn.evaluator.internal.grpc.generated.evaluator_pb2 import (
@@ -31,7 +32,7 @@ from modyn.metadata_database.metadata_database_connection import MetadataDatabas
 from modyn.metadata_database.models import TrainedModel
 
 # pylint: disable-next=no-name-in-module
-from modyn.model_storage.internal.grpc.generated.model_storage_pb2 import FetchModelRequest, FetchModelResponse
+from modyn.model_storage.internal.grpc.generated.model_storage_pb2 import FetchModelChunk, FetchModelRequest
 from modyn.model_storage.internal.grpc.generated.model_storage_pb2_grpc import ModelStorageStub
 
 # pylint: disable-next=no-name-in-module
@@ -128,16 +129,6 @@ class EvaluatorGRPCServicer(EvaluatorServicer):
             logger.error(f"Model {model_class_name} not available!")
             return EvaluateModelResponse(evaluation_started=False)
 
-        fetch_request = FetchModelRequest(model_id=request.model_id, load_metadata=False)
-        fetch_resp: FetchModelResponse = self._model_storage_stub.FetchModel(fetch_request)
-
-        if not fetch_resp.success:
-            logger.error(
-                f"Trained model {request.model_id} cannot be fetched from model storage. "
-                f"Evaluation cannot be started."
-            )
-            return EvaluateModelResponse(evaluation_started=False)
-
         dataset_size = -1
         pipeline_id: Optional[int] = None
         trigger_id: Optional[int] = None
@@ -172,15 +163,24 @@ class EvaluatorGRPCServicer(EvaluatorServicer):
 
         assert dataset_size > -1
 
+        fetch_request = FetchModelRequest(model_id=request.model_id, load_metadata=False)
+        fetch_stream = self._model_storage_stub.FetchModelStream(fetch_request)
+        first_chunk: FetchModelChunk = next(fetch_stream, FetchModelChunk(success=False))
+
+        if not first_chunk.success:
+            logger.error(
+                f"Trained model {request.model_id} cannot be fetched from model storage. "
+                f"Evaluation cannot be started."
+            )
+            return EvaluateModelResponse(evaluation_started=False)
+
         with self._lock:
             evaluation_id = self._next_evaluation_id
             self._next_evaluation_id += 1
 
-        trained_model_path = download_trained_model(
+        trained_model_path = download_streamed_model(
             logger=logger,
-            model_storage_config=self._config["model_storage"],
-            remote_path=pathlib.Path(fetch_resp.model_path),
-            checksum=fetch_resp.checksum,
+            chunks=((chunk.chunk, chunk.checksum) for chunk in itertools.chain([first_chunk], fetch_stream)),
             identifier=evaluation_id,
             base_directory=self._base_dir,
         )
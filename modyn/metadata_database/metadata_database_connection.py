@@ -6,6 +6,7 @@ import logging
 from typing import Optional
 
 from modyn.database.abstract_database_connection import AbstractDatabaseConnection
+from modyn.database.engine_registry import POOL_OPTIONS
 from modyn.metadata_database.metadata_base import MetadataBase
 from modyn.metadata_database.models import Pipeline
 from modyn.metadata_database.models.selector_state_metadata import SelectorStateMetadata
@@ -37,6 +38,9 @@ class MetadataDatabaseConnection(AbstractDatabaseConnection):
             if "hash_partition_modulus" in self.modyn_config["metadata_database"]
             else 16
         )
+        self.pool_options = {
+            option: value for option, value in self.modyn_config["metadata_database"].items() if option in POOL_OPTIONS
+        }
         self.seed: int = (
             self.modyn_config["metadata_database"]["seed"] if "seed" in self.modyn_config["metadata_database"] else None
         )
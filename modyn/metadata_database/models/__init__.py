@@ -8,6 +8,7 @@ import os
 
 from .pipelines import Pipeline  # noqa: F401
 from .sample_training_metadata import SampleTrainingMetadata  # noqa: F401
+from .selector_state_counts import SelectorStateCount  # noqa: F401
 from .selector_state_metadata import SelectorStateMetadata  # noqa: F401
 from .trained_models import TrainedModel  # noqa: F401
 from .trigger_partitions import TriggerPartition  # noqa: F401
@@ -0,0 +1,80 @@
+"""SelectorStateCount model."""
+
+from typing import Any
+
+from modyn.metadata_database.metadata_base import MetadataBase
+from modyn.metadata_database.models.selector_state_metadata import SelectorStateMetadata
+from sqlalchemy import BigInteger, Column, Integer, func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm.session import Session
+
+
+class SelectorStateCount(MetadataBase):
+    """SelectorStateCount model.
+
+    Number of samples in the selector state per pipeline, trigger and label. The counts are maintained incrementally
+    in the transactions that persist the samples, such that the selector does not need to count the samples of the
+    selector state. Since the label is part of the primary key, samples without a label cannot be counted.
+    """
+
+    __tablename__ = "selector_state_counts"
+    # See https://docs.sqlalchemy.org/en/13/core/metadata.html?highlight=extend_existing#sqlalchemy.schema.Table.params.extend_existing  # noqa: E501
+    pipeline_id = Column("pipeline_id", Integer, primary_key=True)
+    seen_in_trigger_id = Column("seen_in_trigger_id", Integer, primary_key=True)
+    label = Column("label", Integer, primary_key=True)
+    num_samples = Column("num_samples", BigInteger, nullable=False)
+    __table_args__ = {"extend_existing": True}
+
+    @staticmethod
+    def add_samples(pipeline_id: int, trigger_id: int, label_counts: dict[Any, int], session: Session) -> None:
+        """Adds the number of new samples per label to the counts of the trigger. Does not commit the session."""
+        if len(label_counts) == 0:
+            return
+        if None in label_counts:
+            raise ValueError(f"Cannot count {label_counts[None]} samples without a label in pipeline {pipeline_id}.")
+
+        dialect = session.bind.dialect.name
+        assert dialect in ["postgresql", "sqlite"], f"Unsupported dialect for selector state counts: {dialect}"
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+
+        stmt = insert(SelectorStateCount).values(
+            [
+                {"pipeline_id": pipeline_id, "seen_in_trigger_id": trigger_id, "label": label, "num_samples": count}
+                # Sorted, such that concurrent writers lock the rows in the same order
+                for label, count in sorted(label_counts.items())
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["pipeline_id", "seen_in_trigger_id", "label"],
+            set_={"num_samples": SelectorStateCount.num_samples + stmt.excluded.num_samples},
+        )
+        session.execute(stmt)
+
+    @staticmethod
+    def backfill(pipeline_id: int, session: Session) -> bool:
+        """
+        Counts the selector state of the pipeline if there are no counts yet, e.g., since its samples have been
+        persisted before the counts were maintained. Does not commit the session.
+
+        Returns:
+            bool: whether the counts have been backfilled.
+        """
+        if session.query(SelectorStateCount.pipeline_id).filter(SelectorStateCount.pipeline_id == pipeline_id).first():
+            return False
+
+        label_counts_per_trigger: dict[int, dict[Any, int]] = {}
+        for trigger_id, label, count in (
+            session.query(
+                SelectorStateMetadata.seen_in_trigger_id,
+                SelectorStateMetadata.label,
+                func.count(),  # pylint: disable=not-callable
+            )
+            .filter(SelectorStateMetadata.pipeline_id == pipeline_id)
+            .group_by(SelectorStateMetadata.seen_in_trigger_id, SelectorStateMetadata.label)
+            .all()
+        ):
+            label_counts_per_trigger.setdefault(trigger_id, {})[label] = count
+
+        for trigger_id, label_counts in label_counts_per_trigger.items():
+            SelectorStateCount.add_samples(pipeline_id, trigger_id, label_counts, session)
+        return len(label_counts_per_trigger) > 0
@@ -96,6 +96,12 @@ class SelectorStateMetadata(
                 engine=engine,
             )
 
+    @staticmethod
+    def trigger_partition_name(pipeline_id: int, trigger_id: int) -> str:
+        """Name of the (PostgreSQL) partition table that holds the samples seen in a trigger, see add_trigger."""
+        # PartitionByMeta names partitions `<parent table>_<suffix>`
+        return f"{SelectorStateMetadata.__tablename__}__pid{pipeline_id}__tid{trigger_id}"
+
     @staticmethod
     def _create_partition(
         instance: Any,  # This is the class itself
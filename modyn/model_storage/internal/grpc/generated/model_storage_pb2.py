@@ -6,7 +6,6 @@ from google.protobuf import descriptor as _descriptor
 from google.protobuf import descriptor_pool as _descriptor_pool
 from google.protobuf import symbol_database as _symbol_database
 from google.protobuf.internal import builder as _builder
-
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -14,25 +13,29 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x13model_storage.proto\x12\x13modyn.model_storage\"\x85\x01\n\x14RegisterModelRequest\x12\x13\n\x0bpipeline_id\x18\x01 \x01(\x05\x12\x12\n\ntrigger_id\x18\x02 \x01(\x05\x12\x10\n\x08hostname\x18\x03 \x01(\t\x12\x0c\n\x04port\x18\x04 \x01(\x05\x12\x12\n\nmodel_path\x18\x05 \x01(\t\x12\x10\n\x08\x63hecksum\x18\x06 \x01(\x0c\":\n\x15RegisterModelResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x10\n\x08model_id\x18\x02 \x01(\x05\"<\n\x11\x46\x65tchModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\x05\x12\x15\n\rload_metadata\x18\x02 \x01(\x08\"K\n\x12\x46\x65tchModelResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x12\n\nmodel_path\x18\x02 \x01(\t\x12\x10\n\x08\x63hecksum\x18\x03 \x01(\x0c\"&\n\x12\x44\x65leteModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\x05\"&\n\x13\x44\x65leteModelResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x32\xbd\x02\n\x0cModelStorage\x12h\n\rRegisterModel\x12).modyn.model_storage.RegisterModelRequest\x1a*.modyn.model_storage.RegisterModelResponse\"\x00\x12_\n\nFetchModel\x12&.modyn.model_storage.FetchModelRequest\x1a\'.modyn.model_storage.FetchModelResponse\"\x00\x12\x62\n\x0b\x44\x65leteModel\x12\'.modyn.model_storage.DeleteModelRequest\x1a(.modyn.model_storage.DeleteModelResponse\"\x00\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x13model_storage.proto\x12\x13modyn.model_storage\"\x85\x01\n\x14RegisterModelRequest\x12\x13\n\x0bpipeline_id\x18\x01 \x01(\x05\x12\x12\n\ntrigger_id\x18\x02 \x01(\x05\x12\x10\n\x08hostname\x18\x03 \x01(\t\x12\x0c\n\x04port\x18\x04 \x01(\x05\x12\x12\n\nmodel_path\x18\x05 \x01(\t\x12\x10\n\x08\x63hecksum\x18\x06 \x01(\x0c\"^\n\x12RegisterModelChunk\x12\x13\n\x0bpipeline_id\x18\x01 \x01(\x05\x12\x12\n\ntrigger_id\x18\x02 \x01(\x05\x12\r\n\x05\x63hunk\x18\x03 \x01(\x0c\x12\x10\n\x08\x63hecksum\x18\x04 \x01(\x0c\":\n\x15RegisterModelResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x10\n\x08model_id\x18\x02 \x01(\x05\"<\n\x11\x46\x65tchModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\x05\x12\x15\n\rload_metadata\x18\x02 \x01(\x08\"K\n\x12\x46\x65tchModelResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x12\n\nmodel_path\x18\x02 \x01(\t\x12\x10\n\x08\x63hecksum\x18\x03 \x01(\x0c\"C\n\x0f\x46\x65tchModelChunk\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\r\n\x05\x63hunk\x18\x02 \x01(\x0c\x12\x10\n\x08\x63hecksum\x18\x03 \x01(\x0c\"&\n\x12\x44\x65leteModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\x05\"&\n\x13\x44\x65leteModelResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x32\x93\x04\n\x0cModelStorage\x12h\n\rRegisterModel\x12).modyn.model_storage.RegisterModelRequest\x1a*.modyn.model_storage.RegisterModelResponse\"\x00\x12n\n\x13RegisterModelStream\x12\'.modyn.model_storage.RegisterModelChunk\x1a*.modyn.model_storage.RegisterModelResponse\"\x00(\x01\x12_\n\nFetchModel\x12&.modyn.model_storage.FetchModelRequest\x1a\'.modyn.model_storage.FetchModelResponse\"\x00\x12\x64\n\x10\x46\x65tchModelStream\x12&.modyn.model_storage.FetchModelRequest\x1a$.modyn.model_storage.FetchModelChunk\"\x00\x30\x01\x12\x62\n\x0b\x44\x65leteModel\x12\'.modyn.model_storage.DeleteModelRequest\x1a(.modyn.model_storage.DeleteModelResponse\"\x00\x62\x06proto3')
 
-_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
-_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'model_storage_pb2', globals())
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'model_storage_pb2', _globals)
 if _descriptor._USE_C_DESCRIPTORS == False:
-
   DESCRIPTOR._options = None
-  _REGISTERMODELREQUEST._serialized_start=45
-  _REGISTERMODELREQUEST._serialized_end=178
-  _REGISTERMODELRESPONSE._serialized_start=180
-  _REGISTERMODELRESPONSE._serialized_end=238
-  _FETCHMODELREQUEST._serialized_start=240
-  _FETCHMODELREQUEST._serialized_end=300
-  _FETCHMODELRESPONSE._serialized_start=302
-  _FETCHMODELRESPONSE._serialized_end=377
-  _DELETEMODELREQUEST._serialized_start=379
-  _DELETEMODELREQUEST._serialized_end=417
-  _DELETEMODELRESPONSE._serialized_start=419
-  _DELETEMODELRESPONSE._serialized_end=457
-  _MODELSTORAGE._serialized_start=460
-  _MODELSTORAGE._serialized_end=777
+  _globals['_REGISTERMODELREQUEST']._serialized_start=45
+  _globals['_REGISTERMODELREQUEST']._serialized_end=178
+  _globals['_REGISTERMODELCHUNK']._serialized_start=180
+  _globals['_REGISTERMODELCHUNK']._serialized_end=274
+  _globals['_REGISTERMODELRESPONSE']._serialized_start=276
+  _globals['_REGISTERMODELRESPONSE']._serialized_end=334
+  _globals['_FETCHMODELREQUEST']._serialized_start=336
+  _globals['_FETCHMODELREQUEST']._serialized_end=396
+  _globals['_FETCHMODELRESPONSE']._serialized_start=398
+  _globals['_FETCHMODELRESPONSE']._serialized_end=473
+  _globals['_FETCHMODELCHUNK']._serialized_start=475
+  _globals['_FETCHMODELCHUNK']._serialized_end=542
+  _globals['_DELETEMODELREQUEST']._serialized_start=544
+  _globals['_DELETEMODELREQUEST']._serialized_end=582
+  _globals['_DELETEMODELRESPONSE']._serialized_start=584
+  _globals['_DELETEMODELRESPONSE']._serialized_end=622
+  _globals['_MODELSTORAGE']._serialized_start=625
+  _globals['_MODELSTORAGE']._serialized_end=1156
 # @@protoc_insertion_point(module_scope)
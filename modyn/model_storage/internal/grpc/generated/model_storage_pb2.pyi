@@ -44,6 +44,34 @@ class RegisterModelRequest(google.protobuf.message.Message):
 
 global___RegisterModelRequest = RegisterModelRequest
 
+@typing_extensions.final
+class RegisterModelChunk(google.protobuf.message.Message):
+    """The checkpoint is streamed in chunks. The pipeline and trigger are set in the first message,
+    the checksum over all chunks is set in the last message.
+    """
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    PIPELINE_ID_FIELD_NUMBER: builtins.int
+    TRIGGER_ID_FIELD_NUMBER: builtins.int
+    CHUNK_FIELD_NUMBER: builtins.int
+    CHECKSUM_FIELD_NUMBER: builtins.int
+    pipeline_id: builtins.int
+    trigger_id: builtins.int
+    chunk: builtins.bytes
+    checksum: builtins.bytes
+    def __init__(
+        self,
+        *,
+        pipeline_id: builtins.int = ...,
+        trigger_id: builtins.int = ...,
+        chunk: builtins.bytes = ...,
+        checksum: builtins.bytes = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["checksum", b"checksum", "chunk", b"chunk", "pipeline_id", b"pipeline_id", "trigger_id", b"trigger_id"]) -> None: ...
+
+global___RegisterModelChunk = RegisterModelChunk
+
 @typing_extensions.final
 class RegisterModelResponse(google.protobuf.message.Message):
     DESCRIPTOR: google.protobuf.descriptor.Descriptor
@@ -58,7 +86,7 @@ class RegisterModelResponse(google.protobuf.message.Message):
         success: builtins.bool = ...,
         model_id: builtins.int = ...,
     ) -> None: ...
-    def ClearField(self, field_name: typing_extensions.Literal["model_class_name", b"model_class_name", "success", b"success"]) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["model_id", b"model_id", "success", b"success"]) -> None: ...
 
 global___RegisterModelResponse = RegisterModelResponse
 
@@ -76,7 +104,7 @@ class FetchModelRequest(google.protobuf.message.Message):
         model_id: builtins.int = ...,
         load_metadata: builtins.bool = ...,
     ) -> None: ...
-    def ClearField(self, field_name: typing_extensions.Literal["load_metadata", b"load_metadata", "model_class_name", b"model_class_name"]) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["load_metadata", b"load_metadata", "model_id", b"model_id"]) -> None: ...
 
 global___FetchModelRequest = FetchModelRequest
 
@@ -101,6 +129,31 @@ class FetchModelResponse(google.protobuf.message.Message):
 
 global___FetchModelResponse = FetchModelResponse
 
+@typing_extensions.final
+class FetchModelChunk(google.protobuf.message.Message):
+    """The model is streamed in chunks. If the model cannot be fetched, a single message with success = false is sent.
+    The checksum over all chunks is set in the last message.
+    """
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    SUCCESS_FIELD_NUMBER: builtins.int
+    CHUNK_FIELD_NUMBER: builtins.int
+    CHECKSUM_FIELD_NUMBER: builtins.int
+    success: builtins.bool
+    chunk: builtins.bytes
+    checksum: builtins.bytes
+    def __init__(
+        self,
+        *,
+        success: builtins.bool = ...,
+        chunk: builtins.bytes = ...,
+        checksum: builtins.bytes = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["checksum", b"checksum", "chunk", b"chunk", "success", b"success"]) -> None: ...
+
+global___FetchModelChunk = FetchModelChunk
+
 @typing_extensions.final
 class DeleteModelRequest(google.protobuf.message.Message):
     DESCRIPTOR: google.protobuf.descriptor.Descriptor
@@ -112,7 +165,7 @@ class DeleteModelRequest(google.protobuf.message.Message):
         *,
         model_id: builtins.int = ...,
     ) -> None: ...
-    def ClearField(self, field_name: typing_extensions.Literal["model_class_name", b"model_class_name"]) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["model_id", b"model_id"]) -> None: ...
 
 global___DeleteModelRequest = DeleteModelRequest
 
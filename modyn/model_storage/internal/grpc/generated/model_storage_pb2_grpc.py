@@ -14,20 +14,30 @@ class ModelStorageStub(object):
             channel: A grpc.Channel.
         """
         self.RegisterModel = channel.unary_unary(
-            '/modyn.model_storage.ModelStorage/RegisterModel',
-            request_serializer=model__storage__pb2.RegisterModelRequest.SerializeToString,
-            response_deserializer=model__storage__pb2.RegisterModelResponse.FromString,
-        )
+                '/modyn.model_storage.ModelStorage/RegisterModel',
+                request_serializer=model__storage__pb2.RegisterModelRequest.SerializeToString,
+                response_deserializer=model__storage__pb2.RegisterModelResponse.FromString,
+                )
+        self.RegisterModelStream = channel.stream_unary(
+                '/modyn.model_storage.ModelStorage/RegisterModelStream',
+                request_serializer=model__storage__pb2.RegisterModelChunk.SerializeToString,
+                response_deserializer=model__storage__pb2.RegisterModelResponse.FromString,
+                )
         self.FetchModel = channel.unary_unary(
-            '/modyn.model_storage.ModelStorage/FetchModel',
-            request_serializer=model__storage__pb2.FetchModelRequest.SerializeToString,
-            response_deserializer=model__storage__pb2.FetchModelResponse.FromString,
-        )
+                '/modyn.model_storage.ModelStorage/FetchModel',
+                request_serializer=model__storage__pb2.FetchModelRequest.SerializeToString,
+                response_deserializer=model__storage__pb2.FetchModelResponse.FromString,
+                )
+        self.FetchModelStream = channel.unary_stream(
+                '/modyn.model_storage.ModelStorage/FetchModelStream',
+                request_serializer=model__storage__pb2.FetchModelRequest.SerializeToString,
+                response_deserializer=model__storage__pb2.FetchModelChunk.FromString,
+                )
         self.DeleteModel = channel.unary_unary(
-            '/modyn.model_storage.ModelStorage/DeleteModel',
-            request_serializer=model__storage__pb2.DeleteModelRequest.SerializeToString,
-            response_deserializer=model__storage__pb2.DeleteModelResponse.FromString,
-        )
+                '/modyn.model_storage.ModelStorage/DeleteModel',
+                request_serializer=model__storage__pb2.DeleteModelRequest.SerializeToString,
+                response_deserializer=model__storage__pb2.DeleteModelResponse.FromString,
+                )
 
 
 class ModelStorageServicer(object):
@@ -39,12 +49,24 @@ class ModelStorageServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def RegisterModelStream(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def FetchModel(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def FetchModelStream(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def DeleteModel(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -54,79 +76,122 @@ class ModelStorageServicer(object):
 
 def add_ModelStorageServicer_to_server(servicer, server):
     rpc_method_handlers = {
-        'RegisterModel': grpc.unary_unary_rpc_method_handler(
-            servicer.RegisterModel,
-            request_deserializer=model__storage__pb2.RegisterModelRequest.FromString,
-            response_serializer=model__storage__pb2.RegisterModelResponse.SerializeToString,
-        ),
-        'FetchModel': grpc.unary_unary_rpc_method_handler(
-            servicer.FetchModel,
-            request_deserializer=model__storage__pb2.FetchModelRequest.FromString,
-            response_serializer=model__storage__pb2.FetchModelResponse.SerializeToString,
-        ),
-        'DeleteModel': grpc.unary_unary_rpc_method_handler(
-            servicer.DeleteModel,
-            request_deserializer=model__storage__pb2.DeleteModelRequest.FromString,
-            response_serializer=model__storage__pb2.DeleteModelResponse.SerializeToString,
-        ),
+            'RegisterModel': grpc.unary_unary_rpc_method_handler(
+                    servicer.RegisterModel,
+                    request_deserializer=model__storage__pb2.RegisterModelRequest.FromString,
+                    response_serializer=model__storage__pb2.RegisterModelResponse.SerializeToString,
+            ),
+            'RegisterModelStream': grpc.stream_unary_rpc_method_handler(
+                    servicer.RegisterModelStream,
+                    request_deserializer=model__storage__pb2.RegisterModelChunk.FromString,
+                    response_serializer=model__storage__pb2.RegisterModelResponse.SerializeToString,
+            ),
+            'FetchModel': grpc.unary_unary_rpc_method_handler(
+                    servicer.FetchModel,
+                    request_deserializer=model__storage__pb2.FetchModelRequest.FromString,
+                    response_serializer=model__storage__pb2.FetchModelResponse.SerializeToString,
+            ),
+            'FetchModelStream': grpc.unary_stream_rpc_method_handler(
+                    servicer.FetchModelStream,
+                    request_deserializer=model__storage__pb2.FetchModelRequest.FromString,
+                    response_serializer=model__storage__pb2.FetchModelChunk.SerializeToString,
+            ),
+            'DeleteModel': grpc.unary_unary_rpc_method_handler(
+                    servicer.DeleteModel,
+                    request_deserializer=model__storage__pb2.DeleteModelRequest.FromString,
+                    response_serializer=model__storage__pb2.DeleteModelResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
-        'modyn.model_storage.ModelStorage', rpc_method_handlers)
+            'modyn.model_storage.ModelStorage', rpc_method_handlers)
     server.add_generic_rpc_handlers((generic_handler,))
 
- # This class is part of an EXPERIMENTAL API.
-
 
+ # This class is part of an EXPERIMENTAL API.
 class ModelStorage(object):
     """Missing associated documentation comment in .proto file."""
 
     @staticmethod
     def RegisterModel(request,
-                      target,
-                      options=(),
-                      channel_credentials=None,
-                      call_credentials=None,
-                      insecure=False,
-                      compression=None,
-                      wait_for_ready=None,
-                      timeout=None,
-                      metadata=None):
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
         return grpc.experimental.unary_unary(request, target, '/modyn.model_storage.ModelStorage/RegisterModel',
-                                             model__storage__pb2.RegisterModelRequest.SerializeToString,
-                                             model__storage__pb2.RegisterModelResponse.FromString,
-                                             options, channel_credentials,
-                                             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+            model__storage__pb2.RegisterModelRequest.SerializeToString,
+            model__storage__pb2.RegisterModelResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def RegisterModelStream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(request_iterator, target, '/modyn.model_storage.ModelStorage/RegisterModelStream',
+            model__storage__pb2.RegisterModelChunk.SerializeToString,
+            model__storage__pb2.RegisterModelResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
     @staticmethod
     def FetchModel(request,
-                   target,
-                   options=(),
-                   channel_credentials=None,
-                   call_credentials=None,
-                   insecure=False,
-                   compression=None,
-                   wait_for_ready=None,
-                   timeout=None,
-                   metadata=None):
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
         return grpc.experimental.unary_unary(request, target, '/modyn.model_storage.ModelStorage/FetchModel',
-                                             model__storage__pb2.FetchModelRequest.SerializeToString,
-                                             model__storage__pb2.FetchModelResponse.FromString,
-                                             options, channel_credentials,
-                                             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+            model__storage__pb2.FetchModelRequest.SerializeToString,
+            model__storage__pb2.FetchModelResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def FetchModelStream(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/modyn.model_storage.ModelStorage/FetchModelStream',
+            model__storage__pb2.FetchModelRequest.SerializeToString,
+            model__storage__pb2.FetchModelChunk.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
     @staticmethod
     def DeleteModel(request,
-                    target,
-                    options=(),
-                    channel_credentials=None,
-                    call_credentials=None,
-                    insecure=False,
-                    compression=None,
-                    wait_for_ready=None,
-                    timeout=None,
-                    metadata=None):
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
         return grpc.experimental.unary_unary(request, target, '/modyn.model_storage.ModelStorage/DeleteModel',
-                                             model__storage__pb2.DeleteModelRequest.SerializeToString,
-                                             model__storage__pb2.DeleteModelResponse.FromString,
-                                             options, channel_credentials,
-                                             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+            model__storage__pb2.DeleteModelRequest.SerializeToString,
+            model__storage__pb2.DeleteModelResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
@@ -1,20 +1,26 @@
 """Model storage GRPC servicer."""
 
+import io
+import itertools
 import logging
 import os
 import pathlib
+from typing import Iterator
 
 import grpc
 import torch
 from modyn.common.ftp.ftp_utils import download_file, get_pretrained_model_callback
+from modyn.common.grpc.model_streaming import checksummed_chunks, read_chunks, write_checksummed_chunks
 from modyn.model_storage.internal import ModelStorageManager
 
 # pylint: disable-next=no-name-in-module
 from modyn.model_storage.internal.grpc.generated.model_storage_pb2 import (
     DeleteModelRequest,
     DeleteModelResponse,
+    FetchModelChunk,
     FetchModelRequest,
     FetchModelResponse,
+    RegisterModelChunk,
     RegisterModelRequest,
     RegisterModelResponse,
 )
@@ -85,6 +91,39 @@ class ModelStorageGRPCServicer(ModelStorageServicer):
 
         return RegisterModelResponse(success=True, model_id=model_id)
 
+    def RegisterModelStream(
+        self, request_iterator: Iterator[RegisterModelChunk], context: grpc.ServicerContext
+    ) -> RegisterModelResponse:
+        """Registers a new model at the model storage component by receiving it as a stream of chunks.
+        The checkpoint is kept in memory, i.e., it is not written to a temporary file before storing it.
+
+        Args:
+            request_iterator: the chunks of the checkpoint of the model.
+            context: the request context.
+
+        Returns:
+            RegisterModelResponse: the response containing an identifier for the stored model.
+        """
+        first_chunk = next(request_iterator, None)
+        if first_chunk is None:
+            logger.error("Received an empty model stream.")
+            return RegisterModelResponse(success=False)
+
+        pipeline_id, trigger_id = first_chunk.pipeline_id, first_chunk.trigger_id
+        logger.info(f"Receiving model stream of pipeline {pipeline_id} and trigger {trigger_id}.")
+
+        with io.BytesIO() as checkpoint:
+            chunks = itertools.chain([first_chunk], request_iterator)
+            if not write_checksummed_chunks(((chunk.chunk, chunk.checksum) for chunk in chunks), checkpoint):
+                logger.error("Received model does not match its checksum.")
+                return RegisterModelResponse(success=False)
+
+            logger.info("Model stream completed. Invoking model storage manager.")
+            checkpoint.seek(0)
+            model_id = self.model_storage_manager.store_model(pipeline_id, trigger_id, checkpoint)
+
+        return RegisterModelResponse(success=True, model_id=model_id)
+
     def FetchModel(self, request: FetchModelRequest, context: grpc.ServicerContext) -> FetchModelResponse:
         """Fetch a model from the model storage component.
 
@@ -114,6 +153,36 @@ class ModelStorageGRPCServicer(ModelStorageServicer):
             checksum=calculate_checksum(model_file_path),
         )
 
+    def FetchModelStream(self, request: FetchModelRequest, context: grpc.ServicerContext) -> Iterator[FetchModelChunk]:
+        """Fetch a model from the model storage component as a stream of chunks.
+        The model is serialized in memory, i.e., it is not written to the FTP directory.
+
+        Args:
+            request: request containing the model id.
+            context: the request context.
+
+        Returns:
+            Iterator[FetchModelChunk]: the chunks of the serialized model.
+        """
+        logger.info(f"Try to stream model having id {request.model_id}")
+
+        model_dict = self.model_storage_manager.load_model(request.model_id, request.load_metadata)
+        if not model_dict:
+            logger.error(f"Trained model {request.model_id} could not be fetched.")
+            yield FetchModelChunk(success=False)
+            return
+
+        with io.BytesIO() as model_buffer:
+            torch.save(model_dict, model_buffer)
+            del model_dict
+            self.model_storage_manager._clear_cuda_mem()
+
+            model_buffer.seek(0)
+            for chunk, checksum in checksummed_chunks(read_chunks(model_buffer)):
+                yield FetchModelChunk(success=True, chunk=chunk, checksum=checksum)
+
+        logger.info(f"Streamed trained model {request.model_id}.")
+
     def DeleteModel(self, request: DeleteModelRequest, context: grpc.ServicerContext) -> DeleteModelResponse:
         """Delete model from the model storage component.
 
@@ -2,16 +2,18 @@ import gc
 import json
 import logging
 import pathlib
-from typing import Optional
+from typing import BinaryIO, Optional, Union
 
 import torch
 from modyn.metadata_database.metadata_database_connection import MetadataDatabaseConnection
 from modyn.metadata_database.models import Pipeline, TrainedModel
-from modyn.model_storage.internal.utils import ModelStoragePolicy
+from modyn.model_storage.internal.utils import ModelStateCache, ModelStoragePolicy
 from modyn.utils import current_time_millis, dynamic_module_import
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_RECONSTRUCTION_CACHE_MAX_SIZE_MB = 1024
+
 
 class ModelStorageManager:
     """
@@ -32,7 +34,17 @@ class ModelStorageManager:
         self._storage_dir = storage_dir
         self._ftp_dir = ftp_dir
 
-    def store_model(self, pipeline_id: int, trigger_id: int, checkpoint_path: pathlib.Path) -> int:
+        model_storage_config = modyn_config["model_storage"]
+        cache_size_mb = model_storage_config.get(
+            "reconstruction_cache_max_size_mb", DEFAULT_RECONSTRUCTION_CACHE_MAX_SIZE_MB
+        )
+        # reconstructed model states by model id, such that repeatedly loaded models (e.g., for an evaluation matrix)
+        # and parents of incrementally stored models do not have to be reconstructed again. The cache also holds the
+        # randomly initialized model states by ("base", pipeline id), which serve as templates for loading full models.
+        self._reconstruction_cache = ModelStateCache(cache_size_mb * 1024 * 1024)
+        self._max_delta_chain_length: Optional[int] = model_storage_config.get("max_delta_chain_length")
+
+    def store_model(self, pipeline_id: int, trigger_id: int, checkpoint_path: Union[pathlib.Path, BinaryIO]) -> int:
         """
         Store the trained model contained in the checkpoint file to disk. It uses the model storage policy that is
         specified for the pipeline. Depending on the trigger id, it is either stored fully (according to full model
@@ -41,7 +53,7 @@ class ModelStorageManager:
         Args:
             pipeline_id: the pipeline identifier for the model.
             trigger_id: the trigger associated with the model.
-            checkpoint_path: path to the checkpoint containing the model.
+            checkpoint_path: path to the checkpoint containing the model (or the checkpoint as file object).
 
         Returns:
             int: the model id which identifies the stored model.
@@ -105,7 +117,11 @@ class ModelStorageManager:
             policy.full_model_interval is None or trigger_id % policy.full_model_interval != 0
         ):
             parent_model_id: Optional[int] = self._determine_parent_model_id(pipeline_id, trigger_id)
-            if parent_model_id is not None:
+            if parent_model_id is None:
+                logger.warning("Previous model is not available! Storing full model...")
+            elif self._exceeds_delta_chain_length(parent_model_id):
+                logger.info(f"Delta chain of model {parent_model_id} reached its maximum length! Storing full model...")
+            else:
                 # load model state of the parent model.
                 parent_model_state = self._reconstruct_model_state(parent_model_id, policy)
 
@@ -117,7 +133,6 @@ class ModelStorageManager:
                 self._clear_cuda_mem()
 
                 return parent_model_id
-            logger.warning("Previous model is not available! Storing full model...")
 
         # store the model in its entirety.
         policy.full_model_strategy.store_model(state_dict, model_path)
@@ -136,8 +151,11 @@ class ModelStorageManager:
             model_id: the identifier of the model to be reconstructed.
             policy: the model storage policy of the pipeline.
         Returns:
-            dict: the reconstructed model state. Refers to the same object as model_state.
+            dict: the reconstructed model state. The caller may modify it without affecting the cached states.
         """
+        cached_model_state = self._reconstruction_cache.get(model_id)
+        if cached_model_state is not None:
+            return cached_model_state
 
         # we recursively overwrite the model state.
         with MetadataDatabaseConnection(self._modyn_config) as database:
@@ -146,19 +164,25 @@ class ModelStorageManager:
             # base case: we can load a fully stored model.
             model_state = self._get_base_model_state(model.pipeline_id)
             self._clear_cuda_mem()
-            return policy.full_model_strategy.load_model(model_state, self._storage_dir / model.model_path)
+            model_state = policy.full_model_strategy.load_model(model_state, self._storage_dir / model.model_path)
+        else:
+            # recursive step: we recurse to load the model state of the parent model.
+            model_state = self._reconstruct_model_state(model.parent_model, policy)
 
-        # recursive step: we recurse to load the model state of the parent model.
-        model_state = self._reconstruct_model_state(model.parent_model, policy)
+            self._clear_cuda_mem()
 
-        self._clear_cuda_mem()
+            # we apply the incremental strategy to load our model state.
+            model_state = policy.incremental_model_strategy.load_model(
+                model_state, self._storage_dir / model.model_path
+            )
 
-        # we apply the incremental strategy to load our model state.
-        return policy.incremental_model_strategy.load_model(model_state, self._storage_dir / model.model_path)
+        self._reconstruction_cache.put(model_id, model_state)
+        return model_state
 
     def _get_base_model_state(self, pipeline_id: int) -> dict:
         """
-        Get a randomly initialized model associated with the pipeline.
+        Get a randomly initialized model associated with the pipeline. The model state is kept on the CPU in the
+        reconstruction cache, such that the model is only instantiated again after its state has been evicted.
 
         Args:
             pipeline_id: the involved pipeline.
@@ -166,6 +190,14 @@ class ModelStorageManager:
         Returns:
             dict: the plain model state derived from the model architecture of the pipeline's models.
         """
+        cache_key = ("base", pipeline_id)
+        base_model_state = self._reconstruction_cache.get(cache_key)
+        if base_model_state is None:
+            base_model_state = self._instantiate_base_model_state(pipeline_id)
+            self._reconstruction_cache.put(cache_key, base_model_state)
+        return base_model_state
+
+    def _instantiate_base_model_state(self, pipeline_id: int) -> dict:
         with MetadataDatabaseConnection(self._modyn_config) as database:
             model_class_name, model_config, amp = database.get_model_configuration(pipeline_id)
         model_module = dynamic_module_import("modyn.models")
@@ -174,7 +206,12 @@ class ModelStorageManager:
         model_handler = getattr(model_module, model_class_name)
         # TODO(create issue): remove cuda and fix GPU loading for DLRM (also apex for model storage)
         device = "cuda:1" if torch.cuda.is_available() else "cpu"
-        return model_handler(json.loads(model_config), device, amp).model.state_dict()
+        model_state = model_handler(json.loads(model_config), device, amp).model.state_dict()
+        # the template must not pin GPU memory, the strategies only use the shapes and types of its tensors.
+        base_model_state = {layer: tensor.cpu() for layer, tensor in model_state.items()}
+        del model_state
+        self._clear_cuda_mem()
+        return base_model_state
 
     def _determine_parent_model_id(self, pipeline_id: int, trigger_id: int) -> Optional[int]:
         """
@@ -204,6 +241,26 @@ class ModelStorageManager:
         # otherwise return the parent model of the previous model.
         return previous_model.parent_model
 
+    def _exceeds_delta_chain_length(self, parent_model_id: int) -> bool:
+        """
+        Determines whether the delta chain of a fully stored model, i.e., the models stored as delta to it, has reached
+        the maximum length, such that the next model must be stored as a full snapshot.
+
+        Args:
+            parent_model_id: the fully stored model, to which the next model would be stored as delta.
+
+        Returns:
+            bool: True, whenever the next model must not be stored as delta to the parent model.
+        """
+        if self._max_delta_chain_length is None:
+            return False
+
+        with MetadataDatabaseConnection(self._modyn_config) as database:
+            delta_chain_length = (
+                database.session.query(TrainedModel).filter(TrainedModel.parent_model == parent_model_id).count()
+            )
+        return delta_chain_length >= self._max_delta_chain_length
+
     def load_model(self, model_id: int, metadata: bool) -> Optional[dict]:
         """
         Loads a given model and optionally, also appends the metadata.
@@ -263,6 +320,7 @@ class ModelStorageManager:
 
             database.session.delete(model)
             database.session.commit()
+        self._reconstruction_cache.evict(model_id)
         logger.info(f"Successfully deleted model {model_id}.")
         return True
 
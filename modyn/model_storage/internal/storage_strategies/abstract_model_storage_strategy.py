@@ -1,8 +1,14 @@
 import pathlib
 from abc import ABC
+from typing import Optional
 from zipfile import ZIP_DEFLATED
 
-from modyn.utils import dynamic_module_import
+from modyn.model_storage.internal.storage_strategies.chunked_compression import (
+    CHUNKED_CODECS,
+    compress_file_chunked,
+    decompress_file_chunked,
+)
+from modyn.utils import dynamic_module_import, unzip_file, zip_file
 
 
 class AbstractModelStorageStrategy(ABC):
@@ -17,16 +23,31 @@ class AbstractModelStorageStrategy(ABC):
         Args:
             zipping_dir: directory, in which the model is zipped.
             zip_activated: whether the generated file is zipped.
-            zip_algorithm_name: name of the zip algorithm.
+            zip_algorithm_name: name of the zip algorithm (or of a codec of the chunked container format).
         """
         self.zipping_dir = zipping_dir
         self.zip = zip_activated
         self.zip_algorithm = ZIP_DEFLATED
+        self.chunked_codec: Optional[str] = None
         self._validate_zip_config(zip_algorithm_name)
 
     def _validate_zip_config(self, zip_algorithm_name: str) -> None:
-        if self.zip and zip_algorithm_name:
+        if self.zip and zip_algorithm_name in CHUNKED_CODECS:
+            self.chunked_codec = zip_algorithm_name
+        elif self.zip and zip_algorithm_name:
             zip_module = dynamic_module_import("zipfile")
             if not hasattr(zip_module, zip_algorithm_name):
                 raise NotImplementedError(f"The zip algorithm {zip_algorithm_name} is unknown!")
             self.zip_algorithm = getattr(zip_module, zip_algorithm_name)
+
+    def _zip_file(self, file_path: pathlib.Path, zipped_file_path: pathlib.Path) -> None:
+        if self.chunked_codec is not None:
+            compress_file_chunked(file_path, zipped_file_path, self.chunked_codec)
+        else:
+            zip_file(file_path, zipped_file_path, self.zip_algorithm, remove_file=False)
+
+    def _unzip_file(self, zipped_file_path: pathlib.Path, file_path: pathlib.Path) -> None:
+        if self.chunked_codec is not None:
+            decompress_file_chunked(zipped_file_path, file_path)
+        else:
+            unzip_file(zipped_file_path, file_path, compression=self.zip_algorithm, remove_file=False)
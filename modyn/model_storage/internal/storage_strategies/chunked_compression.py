@@ -0,0 +1,174 @@
+"""
+Chunked container format for compressing the files of the model storage strategies.
+
+Zipping the file of a model compresses it as one monolithic stream on a single thread. Instead, the chunked container
+splits the file into fixed-size chunks that are compressed independently on a thread pool (the compressors of the
+standard library release the GIL). An index of the compressed chunk sizes at the end of the file allows to decompress
+the chunks in parallel as well, and to read an arbitrary byte range by decompressing only the chunks overlapping it.
+
+Layout: MAGIC | version (u8) | codec (u8) | compressed chunks | index (u64 per chunk) | footer.
+The footer contains the offset of the index, the chunk size and the uncompressed size of the file (u64 each).
+"""
+
+import bz2
+import collections
+import lzma
+import os
+import pathlib
+import struct
+import zlib
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import BinaryIO, Callable, Iterable, Iterator, NamedTuple, Optional
+
+import numpy as np
+
+MAGIC = b"MODYNCHK"
+VERSION = 1
+HEADER = struct.Struct(f"<{len(MAGIC)}sBB")
+FOOTER = struct.Struct("<QQQ")
+
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+DEFAULT_NUM_THREADS = min(32, os.cpu_count() or 1)
+
+
+class ChunkedCodec(NamedTuple):
+    codec_id: int
+    compress: Callable[[bytes], bytes]
+    decompress: Callable[[bytes], bytes]
+
+
+# The names extend the zip algorithms that can be configured for the model storage strategies
+CHUNKED_CODECS = {
+    "CHUNKED_DEFLATED": ChunkedCodec(1, lambda data: zlib.compress(data, 6), zlib.decompress),
+    "CHUNKED_DEFLATED_FAST": ChunkedCodec(2, lambda data: zlib.compress(data, 1), zlib.decompress),
+    "CHUNKED_BZIP2": ChunkedCodec(3, bz2.compress, bz2.decompress),
+    "CHUNKED_LZMA": ChunkedCodec(4, lzma.compress, lzma.decompress),
+}
+_DECOMPRESSORS = {codec.codec_id: codec.decompress for codec in CHUNKED_CODECS.values()}
+
+
+def _bounded_map(executor: Executor, func: Callable[[bytes], bytes], items: Iterable[bytes], window: int) -> Iterator:
+    """Like executor.map, but only window items are in flight, such that the input is not read at once."""
+    pending: collections.deque = collections.deque()
+    for item in items:
+        pending.append(executor.submit(func, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def compress_file_chunked(
+    file_path: pathlib.Path,
+    compressed_file_path: pathlib.Path,
+    codec_name: str = "CHUNKED_DEFLATED",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    num_threads: int = DEFAULT_NUM_THREADS,
+) -> None:
+    """
+    Compresses a file into the chunked container format.
+
+    Args:
+        file_path: the path to the file that should be compressed.
+        compressed_file_path: the path to the compressed file.
+        codec_name: the name of the codec used to compress the chunks.
+        chunk_size: the number of (uncompressed) bytes per chunk.
+        num_threads: the number of threads compressing the chunks.
+    """
+    assert file_path.exists(), "Cannot work with non-existing file"
+    assert chunk_size > 0, "The chunks must not be empty"
+    if codec_name not in CHUNKED_CODECS:
+        raise NotImplementedError(f"The chunked codec {codec_name} is unknown!")
+    codec = CHUNKED_CODECS[codec_name]
+
+    compressed_sizes = []
+    with open(file_path, "rb") as file, open(compressed_file_path, "wb") as compressed_file:
+        compressed_file.write(HEADER.pack(MAGIC, VERSION, codec.codec_id))
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            chunks = iter(lambda: file.read(chunk_size), b"")
+            for compressed_chunk in _bounded_map(executor, codec.compress, chunks, 2 * num_threads):
+                compressed_file.write(compressed_chunk)
+                compressed_sizes.append(len(compressed_chunk))
+
+        index_offset = compressed_file.tell()
+        compressed_file.write(np.array(compressed_sizes, dtype="<u8").tobytes())
+        compressed_file.write(FOOTER.pack(index_offset, chunk_size, file.tell()))
+
+
+class ChunkedFileReader:
+    """
+    Reads (parts of) a file in the chunked container format.
+    """
+
+    def __init__(self, compressed_file: BinaryIO, num_threads: int = DEFAULT_NUM_THREADS):
+        self._file = compressed_file
+        self._num_threads = num_threads
+
+        magic, version, codec_id = HEADER.unpack(self._file.read(HEADER.size))
+        if magic != MAGIC or version != VERSION or codec_id not in _DECOMPRESSORS:
+            raise ValueError("The file is not in the chunked container format.")
+        self._decompress = _DECOMPRESSORS[codec_id]
+
+        self._file.seek(-FOOTER.size, os.SEEK_END)
+        index_offset, self.chunk_size, self.size = FOOTER.unpack(self._file.read(FOOTER.size))
+        num_chunks = -(-self.size // self.chunk_size)
+
+        self._file.seek(index_offset)
+        compressed_sizes = np.frombuffer(self._file.read(8 * num_chunks), dtype="<u8").astype(np.int64)
+        self._offsets = np.concatenate([[HEADER.size], HEADER.size + np.cumsum(compressed_sizes)])
+
+    @property
+    def num_chunks(self) -> int:
+        return len(self._offsets) - 1
+
+    def _read_compressed_chunks(self, first_chunk: int, last_chunk: int) -> Iterator[bytes]:
+        self._file.seek(self._offsets[first_chunk])
+        for chunk_id in range(first_chunk, last_chunk):
+            yield self._file.read(self._offsets[chunk_id + 1] - self._offsets[chunk_id])
+
+    def read(self, offset: int = 0, size: Optional[int] = None) -> bytes:
+        """
+        Reads a byte range of the uncompressed file. Only the chunks overlapping the range are decompressed.
+
+        Args:
+            offset: the offset of the range in the uncompressed file.
+            size: the number of bytes to read, or None to read until the end of the file.
+
+        Returns:
+            bytes: the uncompressed bytes of the range.
+        """
+        end = self.size if size is None else min(self.size, offset + size)
+        if offset >= end:
+            return b""
+
+        first_chunk, last_chunk = offset // self.chunk_size, -(-end // self.chunk_size)
+        compressed_chunks = list(self._read_compressed_chunks(first_chunk, last_chunk))
+        if len(compressed_chunks) == 1:
+            data = self._decompress(compressed_chunks[0])
+        else:
+            with ThreadPoolExecutor(max_workers=self._num_threads) as executor:
+                data = b"".join(executor.map(self._decompress, compressed_chunks))
+        start = offset - first_chunk * self.chunk_size
+        return data[start : start + end - offset]
+
+    def decompress_to(self, file: BinaryIO) -> None:
+        """Writes the whole uncompressed file to the given file."""
+        with ThreadPoolExecutor(max_workers=self._num_threads) as executor:
+            compressed_chunks = self._read_compressed_chunks(0, self.num_chunks)
+            for chunk in _bounded_map(executor, self._decompress, compressed_chunks, 2 * self._num_threads):
+                file.write(chunk)
+
+
+def decompress_file_chunked(
+    compressed_file_path: pathlib.Path, file_path: pathlib.Path, num_threads: int = DEFAULT_NUM_THREADS
+) -> None:
+    """
+    Decompresses a file in the chunked container format.
+
+    Args:
+        compressed_file_path: the path to the compressed file.
+        file_path: the path pointing to the location where the decompressed file should be stored.
+        num_threads: the number of threads decompressing the chunks.
+    """
+    with open(compressed_file_path, "rb") as compressed_file, open(file_path, "wb") as file:
+        ChunkedFileReader(compressed_file, num_threads).decompress_to(file)
@@ -1,18 +1,26 @@
+import numpy as np
 import torch
 from modyn.model_storage.internal.storage_strategies.abstract_difference_operator import AbstractDifferenceOperator
-from modyn.utils import reconstruct_tensor_from_bytes
+
+
+def _byte_view(tensor: torch.Tensor) -> np.ndarray:
+    # Views the (contiguous) tensor as flat bytes without copying, which also works for dtypes unknown to NumPy
+    return tensor.contiguous().reshape(-1).view(torch.uint8).numpy()
 
 
 class XorDifferenceOperator(AbstractDifferenceOperator):
     @staticmethod
     def calculate_difference(tensor: torch.Tensor, tensor_prev: torch.Tensor) -> bytes:
-        bytes_curr = tensor.numpy().tobytes()
-        bytes_prev = tensor_prev.numpy().tobytes()
+        bytes_curr = _byte_view(tensor)
+        bytes_prev = _byte_view(tensor_prev)
 
-        return bytes(a ^ b for (a, b) in zip(bytes_curr, bytes_prev))
+        difference = np.empty_like(bytes_curr)
+        np.bitwise_xor(bytes_curr, bytes_prev, out=difference)
+        return difference.tobytes()
 
     @staticmethod
     def restore(tensor_prev: torch.Tensor, buffer: bytes) -> torch.Tensor:
-        prev_model_data = tensor_prev.numpy().tobytes()
-        new_model_data = bytes(a ^ b for (a, b) in zip(prev_model_data, buffer))
-        return reconstruct_tensor_from_bytes(tensor_prev, new_model_data)
+        # The restored weights are written directly into the memory of the new tensor
+        restored = torch.empty_like(tensor_prev, memory_format=torch.contiguous_format)
+        np.bitwise_xor(_byte_view(tensor_prev), np.frombuffer(buffer, dtype=np.uint8), out=_byte_view(restored))
+        return restored
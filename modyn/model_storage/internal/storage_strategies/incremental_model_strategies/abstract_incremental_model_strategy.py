@@ -3,7 +3,6 @@ import tempfile
 from abc import ABC, abstractmethod
 
 from modyn.model_storage.internal.storage_strategies.abstract_model_storage_strategy import AbstractModelStorageStrategy
-from modyn.utils import unzip_file, zip_file
 
 
 class AbstractIncrementalModelStrategy(AbstractModelStorageStrategy, ABC):
@@ -29,7 +28,7 @@ class AbstractIncrementalModelStrategy(AbstractModelStorageStrategy, ABC):
             with tempfile.NamedTemporaryFile(dir=self.zipping_dir) as temporary_file:
                 temp_file_path = pathlib.Path(temporary_file.name)
                 self._store_model(model_state, prev_model_state, temp_file_path)
-                zip_file(temp_file_path, file_path, self.zip_algorithm, remove_file=False)
+                self._zip_file(temp_file_path, file_path)
         else:
             self._store_model(model_state, prev_model_state, file_path)
 
@@ -51,6 +50,6 @@ class AbstractIncrementalModelStrategy(AbstractModelStorageStrategy, ABC):
         if self.zip:
             with tempfile.NamedTemporaryFile(dir=self.zipping_dir) as temporary_file:
                 temp_file_path = pathlib.Path(temporary_file.name)
-                unzip_file(file_path, temp_file_path, compression=self.zip_algorithm, remove_file=False)
+                self._unzip_file(file_path, temp_file_path)
                 return self._load_model(prev_model_state, temp_file_path)
         return self._load_model(prev_model_state, file_path)
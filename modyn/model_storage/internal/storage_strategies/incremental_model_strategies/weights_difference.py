@@ -2,8 +2,8 @@ import io
 import pathlib
 from typing import BinaryIO, Union
 
+import numpy as np
 import torch
-from bitstring import BitArray
 from modyn.model_storage.internal.storage_strategies.difference_operators import (
     SubDifferenceOperator,
     XorDifferenceOperator,
@@ -15,6 +15,13 @@ from modyn.utils import get_tensor_byte_size
 
 available_difference_operators = {"xor": XorDifferenceOperator, "sub": SubDifferenceOperator}
 
+# Bits of a little-endian float32 word: the sign bit and the lowest exponent bit are the most significant bits of its
+# fourth and third byte, respectively. Exchanging them moves the whole exponent into the fourth byte.
+SIGN_BIT = np.uint32(31)
+LOWEST_EXPONENT_BIT = np.uint32(23)
+SWAP_MASK = np.uint32((1 << 31) | (1 << 23))
+MAX_RUN_LENGTH = 255
+
 
 class WeightsDifference(AbstractIncrementalModelStrategy):
     """
@@ -45,10 +52,11 @@ class WeightsDifference(AbstractIncrementalModelStrategy):
             difference = self.difference_operator.calculate_difference(tensor_model, tensor_prev_model)
 
             if exponent_bytestream is not None and tensor_model.dtype == torch.float32:
-                for i in range(0, len(difference), 4):
-                    reordered_diff = self.reorder_buffer(difference[i : i + 4])
-                    bytestream.write(reordered_diff[0:3])
-                    exponent_bytestream.write(reordered_diff[3:4])
+                # One row per float, such that the byte planes are strided views
+                reordered_diff = self._reorder_words(np.frombuffer(difference, dtype="<u4")).view(np.uint8)
+                reordered_diff = reordered_diff.reshape(-1, 4)
+                bytestream.write(reordered_diff[:, 0:3].tobytes())
+                exponent_bytestream.write(reordered_diff[:, 3].tobytes())
             else:
                 bytestream.write(difference)
 
@@ -73,38 +81,36 @@ class WeightsDifference(AbstractIncrementalModelStrategy):
     def _load_model_split_exponent(self, prev_model_state: dict, file: BinaryIO) -> dict:
         exponent_bytes_amount = int.from_bytes(file.read(8), byteorder="big")
 
-        with io.BytesIO() as exponent_bytes:
-            exponent_bytes.write(
-                self.decode_bytes(file.read(exponent_bytes_amount)) if self.rle else file.read(exponent_bytes_amount)
-            )
-            exponent_bytes.seek(0)
+        exponent_bytes = file.read(exponent_bytes_amount)
+        exponents = np.frombuffer(self.decode_bytes(exponent_bytes) if self.rle else exponent_bytes, dtype=np.uint8)
+        exponent_offset = 0
 
-            for layer_name, tensor in prev_model_state.items():
-                num_bytes = get_tensor_byte_size(tensor)
+        for layer_name, tensor in prev_model_state.items():
+            num_bytes = get_tensor_byte_size(tensor)
 
-                if tensor.dtype == torch.float32:
-                    buffer = bytearray(num_bytes)
-                    for i in range(0, num_bytes, 4):
-                        buffer[i : i + 3] = file.read(3)
-                        buffer[i + 3 : i + 4] = exponent_bytes.read(1)
+            if tensor.dtype == torch.float32:
+                num_floats = num_bytes // 4
+                buffer = np.empty((num_floats, 4), dtype=np.uint8)
+                buffer[:, 0:3] = np.frombuffer(file.read(3 * num_floats), dtype=np.uint8).reshape(num_floats, 3)
+                buffer[:, 3] = exponents[exponent_offset : exponent_offset + num_floats]
+                exponent_offset += num_floats
 
-                    prev_model_state[layer_name] = self.difference_operator.restore(tensor, self.reorder_buffer(buffer))
-                else:
-                    prev_model_state[layer_name] = self.difference_operator.restore(tensor, file.read(num_bytes))
+                # Exchanging the bits again restores the original words
+                difference = self._reorder_words(buffer.reshape(-1).view("<u4")).tobytes()
+                prev_model_state[layer_name] = self.difference_operator.restore(tensor, difference)
+            else:
+                prev_model_state[layer_name] = self.difference_operator.restore(tensor, file.read(num_bytes))
         return prev_model_state
 
     @staticmethod
-    def reorder_buffer(buffer: Union[bytes, bytearray]) -> bytes:
-        bit_array = BitArray(buffer)
-        array_size = len(bit_array)
-
-        for i in range(0, array_size, 32):
-            # exchange sign bit with last exponent bit
-            sign_bit = bit_array[i + 24]
-            bit_array[i + 24] = bit_array[i + 16]
-            bit_array[i + 16] = sign_bit
+    def _reorder_words(words: np.ndarray) -> np.ndarray:
+        """Exchanges the sign bit with the lowest exponent bit of every little-endian float32 word."""
+        differing_bits = ((words >> SIGN_BIT) ^ (words >> LOWEST_EXPONENT_BIT)) & np.uint32(1)
+        return (words ^ (differing_bits * SWAP_MASK)).astype("<u4", copy=False)
 
-        return bit_array.bytes
+    @staticmethod
+    def reorder_buffer(buffer: Union[bytes, bytearray]) -> bytes:
+        return WeightsDifference._reorder_words(np.frombuffer(buffer, dtype="<u4")).tobytes()
 
     @staticmethod
     def encode_bytes(buffer: bytes) -> bytes:
@@ -119,23 +125,20 @@ class WeightsDifference(AbstractIncrementalModelStrategy):
         """
         if len(buffer) == 0:
             return buffer
-        bytestream = io.BytesIO()
+        data = np.frombuffer(buffer, dtype=np.uint8)
 
-        curr = buffer[0]
-        count = 0
+        run_starts = np.concatenate([[0], np.flatnonzero(np.diff(data)) + 1])
+        run_lengths = np.diff(np.append(run_starts, len(data)))
 
-        for byte in buffer:
-            if byte == curr and count < 255:
-                count += 1
-            else:
-                bytestream.write(count.to_bytes(1, byteorder="big"))
-                bytestream.write(curr.to_bytes(1, byteorder="big"))
-                curr = byte
-                count = 1
-        bytestream.write(count.to_bytes(1, byteorder="big"))
-        bytestream.write(curr.to_bytes(1, byteorder="big"))
+        # Runs longer than MAX_RUN_LENGTH are split into full pieces followed by the remainder
+        num_pieces = (run_lengths + MAX_RUN_LENGTH - 1) // MAX_RUN_LENGTH
+        counts = np.full(num_pieces.sum(), MAX_RUN_LENGTH, dtype=np.uint8)
+        counts[np.cumsum(num_pieces) - 1] = run_lengths - MAX_RUN_LENGTH * (num_pieces - 1)
 
-        return bytestream.getvalue()
+        encoded = np.empty(2 * len(counts), dtype=np.uint8)
+        encoded[0::2] = counts
+        encoded[1::2] = np.repeat(data[run_starts], num_pieces)
+        return encoded.tobytes()
 
     @staticmethod
     def decode_bytes(buffer: bytes) -> bytes:
@@ -149,10 +152,6 @@ class WeightsDifference(AbstractIncrementalModelStrategy):
             bytes: the decoded bytes.
         """
         assert len(buffer) % 2 == 0, "should be of even length"
-        bytestream = io.BytesIO()
-
-        for i in range(0, len(buffer), 2):
-            count = int.from_bytes(buffer[i : i + 1], byteorder="big")
+        encoded = np.frombuffer(buffer, dtype=np.uint8)
 
-            bytestream.write(count * buffer[i + 1 : i + 2])
-        return bytestream.getvalue()
+        return np.repeat(encoded[1::2], encoded[0::2]).tobytes()
@@ -6,6 +6,7 @@ The model storage module contains all classes and functions related to the stora
 
 import os
 
+from .model_state_cache import ModelStateCache, get_model_state_byte_size  # noqa: F401
 from .model_storage_policy import ModelStoragePolicy  # noqa: F401
 
 files = os.listdir(os.path.dirname(__file__))
@@ -0,0 +1,112 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+import torch
+
+
+def get_model_state_byte_size(model_state: dict) -> int:
+    """
+    Get the amount of bytes held by the tensors of a model state.
+
+    Args:
+        model_state: the model state.
+
+    Returns:
+        int: the number of bytes of all tensors in the model state.
+    """
+    return sum(
+        tensor.numel() * tensor.element_size() for tensor in model_state.values() if isinstance(tensor, torch.Tensor)
+    )
+
+
+class ModelStateCache:
+    """
+    Thread-safe LRU cache of model states, bounded by the number of bytes of the cached tensors.
+
+    The strategies of the model storage replace the entries of the model states they are given instead of modifying
+    the tensors in place. Hence, the cache stores and returns shallow copies of the model states, which share the
+    tensors but can be modified by the caller without affecting the cached entries.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[dict, int]] = OrderedDict()
+        self._cached_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def cached_bytes(self) -> int:
+        return self._cached_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Optional[dict]:
+        """
+        Get a copy of a cached model state and mark it as recently used.
+
+        Args:
+            key: the key of the model state.
+
+        Returns:
+            Optional[dict]: a shallow copy of the model state, if it is cached.
+        """
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(self._entries[key][0])
+
+    def put(self, key: Hashable, model_state: dict) -> bool:
+        """
+        Cache a copy of a model state. Evicts the least recently used model states until the cache fits.
+
+        Args:
+            key: the key of the model state.
+            model_state: the model state.
+
+        Returns:
+            bool: whether the model state has been cached, i.e., whether it is not larger than the cache.
+        """
+        num_bytes = get_model_state_byte_size(model_state)
+        with self._lock:
+            self._remove(key)
+            if num_bytes > self.max_bytes:
+                return False
+
+            while self._cached_bytes + num_bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+            self._entries[key] = (dict(model_state), num_bytes)
+            self._cached_bytes += num_bytes
+            return True
+
+    def evict(self, key: Hashable) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._cached_bytes = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "cached_bytes": self._cached_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._cached_bytes -= entry[1]
@@ -182,6 +182,26 @@ class SamplesResponse(google.protobuf.message.Message):
 
 global___SamplesResponse = SamplesResponse
 
+@typing_extensions.final
+class PackedSamplesResponse(google.protobuf.message.Message):
+    """Keys as little-endian int64 and weights as little-endian float32"""
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    TRAINING_SAMPLES_SUBSET_FIELD_NUMBER: builtins.int
+    TRAINING_SAMPLES_WEIGHTS_FIELD_NUMBER: builtins.int
+    training_samples_subset: builtins.bytes
+    training_samples_weights: builtins.bytes
+    def __init__(
+        self,
+        *,
+        training_samples_subset: builtins.bytes = ...,
+        training_samples_weights: builtins.bytes = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["training_samples_subset", b"training_samples_subset", "training_samples_weights", b"training_samples_weights"]) -> None: ...
+
+global___PackedSamplesResponse = PackedSamplesResponse
+
 @typing_extensions.final
 class GetNumberOfSamplesRequest(google.protobuf.message.Message):
     DESCRIPTOR: google.protobuf.descriptor.Descriptor
@@ -406,3 +426,63 @@ class SeedSelectorResponse(google.protobuf.message.Message):
     def ClearField(self, field_name: typing_extensions.Literal["success", b"success"]) -> None: ...
 
 global___SeedSelectorResponse = SeedSelectorResponse
+
+@typing_extensions.final
+class EvictTriggerRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    PIPELINE_ID_FIELD_NUMBER: builtins.int
+    TRIGGER_ID_FIELD_NUMBER: builtins.int
+    pipeline_id: builtins.int
+    trigger_id: builtins.int
+    def __init__(
+        self,
+        *,
+        pipeline_id: builtins.int = ...,
+        trigger_id: builtins.int = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["pipeline_id", b"pipeline_id", "trigger_id", b"trigger_id"]) -> None: ...
+
+global___EvictTriggerRequest = EvictTriggerRequest
+
+@typing_extensions.final
+class EvictTriggerResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    EVICTED_KEYS_FIELD_NUMBER: builtins.int
+    evicted_keys: builtins.int
+    def __init__(
+        self,
+        *,
+        evicted_keys: builtins.int = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["evicted_keys", b"evicted_keys"]) -> None: ...
+
+global___EvictTriggerResponse = EvictTriggerResponse
+
+@typing_extensions.final
+class CacheStatsResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    HITS_FIELD_NUMBER: builtins.int
+    MISSES_FIELD_NUMBER: builtins.int
+    EVICTIONS_FIELD_NUMBER: builtins.int
+    CACHED_KEYS_FIELD_NUMBER: builtins.int
+    CACHED_PARTITIONS_FIELD_NUMBER: builtins.int
+    hits: builtins.int
+    misses: builtins.int
+    evictions: builtins.int
+    cached_keys: builtins.int
+    cached_partitions: builtins.int
+    def __init__(
+        self,
+        *,
+        hits: builtins.int = ...,
+        misses: builtins.int = ...,
+        evictions: builtins.int = ...,
+        cached_keys: builtins.int = ...,
+        cached_partitions: builtins.int = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["cached_keys", b"cached_keys", "cached_partitions", b"cached_partitions", "evictions", b"evictions", "hits", b"hits", "misses", b"misses"]) -> None: ...
+
+global___CacheStatsResponse = CacheStatsResponse
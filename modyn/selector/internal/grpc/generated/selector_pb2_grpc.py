@@ -14,20 +14,25 @@ class SelectorStub(object):
             channel: A grpc.Channel.
         """
         self.get_sample_keys_and_weights = channel.unary_stream(
-            '/selector.Selector/get_sample_keys_and_weights',
-            request_serializer=selector__pb2.GetSamplesRequest.SerializeToString,
-            response_deserializer=selector__pb2.SamplesResponse.FromString,
-        )
+                '/selector.Selector/get_sample_keys_and_weights',
+                request_serializer=selector__pb2.GetSamplesRequest.SerializeToString,
+                response_deserializer=selector__pb2.SamplesResponse.FromString,
+                )
+        self.get_packed_sample_keys_and_weights = channel.unary_stream(
+                '/selector.Selector/get_packed_sample_keys_and_weights',
+                request_serializer=selector__pb2.GetSamplesRequest.SerializeToString,
+                response_deserializer=selector__pb2.PackedSamplesResponse.FromString,
+                )
         self.inform_data = channel.unary_unary(
                 '/selector.Selector/inform_data',
                 request_serializer=selector__pb2.DataInformRequest.SerializeToString,
                 response_deserializer=selector__pb2.DataInformResponse.FromString,
                 )
         self.inform_data_and_trigger = channel.unary_unary(
-            '/selector.Selector/inform_data_and_trigger',
-            request_serializer=selector__pb2.DataInformRequest.SerializeToString,
-            response_deserializer=selector__pb2.TriggerResponse.FromString,
-        )
+                '/selector.Selector/inform_data_and_trigger',
+                request_serializer=selector__pb2.DataInformRequest.SerializeToString,
+                response_deserializer=selector__pb2.TriggerResponse.FromString,
+                )
         self.get_number_of_samples = channel.unary_unary(
                 '/selector.Selector/get_number_of_samples',
                 request_serializer=selector__pb2.GetNumberOfSamplesRequest.SerializeToString,
@@ -63,6 +68,16 @@ class SelectorStub(object):
                 request_serializer=selector__pb2.UsesWeightsRequest.SerializeToString,
                 response_deserializer=selector__pb2.UsesWeightsResponse.FromString,
                 )
+        self.evict_trigger_from_cache = channel.unary_unary(
+                '/selector.Selector/evict_trigger_from_cache',
+                request_serializer=selector__pb2.EvictTriggerRequest.SerializeToString,
+                response_deserializer=selector__pb2.EvictTriggerResponse.FromString,
+                )
+        self.get_cache_stats = channel.unary_unary(
+                '/selector.Selector/get_cache_stats',
+                request_serializer=selector__pb2.Empty.SerializeToString,
+                response_deserializer=selector__pb2.CacheStatsResponse.FromString,
+                )
 
 
 class SelectorServicer(object):
@@ -74,6 +89,12 @@ class SelectorServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def get_packed_sample_keys_and_weights(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def inform_data(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -128,6 +149,18 @@ class SelectorServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def evict_trigger_from_cache(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def get_cache_stats(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_SelectorServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -136,6 +169,11 @@ def add_SelectorServicer_to_server(servicer, server):
                     request_deserializer=selector__pb2.GetSamplesRequest.FromString,
                     response_serializer=selector__pb2.SamplesResponse.SerializeToString,
             ),
+            'get_packed_sample_keys_and_weights': grpc.unary_stream_rpc_method_handler(
+                    servicer.get_packed_sample_keys_and_weights,
+                    request_deserializer=selector__pb2.GetSamplesRequest.FromString,
+                    response_serializer=selector__pb2.PackedSamplesResponse.SerializeToString,
+            ),
             'inform_data': grpc.unary_unary_rpc_method_handler(
                     servicer.inform_data,
                     request_deserializer=selector__pb2.DataInformRequest.FromString,
@@ -181,45 +219,71 @@ def add_SelectorServicer_to_server(servicer, server):
                     request_deserializer=selector__pb2.UsesWeightsRequest.FromString,
                     response_serializer=selector__pb2.UsesWeightsResponse.SerializeToString,
             ),
+            'evict_trigger_from_cache': grpc.unary_unary_rpc_method_handler(
+                    servicer.evict_trigger_from_cache,
+                    request_deserializer=selector__pb2.EvictTriggerRequest.FromString,
+                    response_serializer=selector__pb2.EvictTriggerResponse.SerializeToString,
+            ),
+            'get_cache_stats': grpc.unary_unary_rpc_method_handler(
+                    servicer.get_cache_stats,
+                    request_deserializer=selector__pb2.Empty.FromString,
+                    response_serializer=selector__pb2.CacheStatsResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
-        'selector.Selector', rpc_method_handlers)
+            'selector.Selector', rpc_method_handlers)
     server.add_generic_rpc_handlers((generic_handler,))
 
- # This class is part of an EXPERIMENTAL API.
-
 
+ # This class is part of an EXPERIMENTAL API.
 class Selector(object):
     """Missing associated documentation comment in .proto file."""
 
     @staticmethod
     def get_sample_keys_and_weights(request,
-                                    target,
-                                    options=(),
-                                    channel_credentials=None,
-                                    call_credentials=None,
-                                    insecure=False,
-                                    compression=None,
-                                    wait_for_ready=None,
-                                    timeout=None,
-                                    metadata=None):
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
         return grpc.experimental.unary_stream(request, target, '/selector.Selector/get_sample_keys_and_weights',
-                                              selector__pb2.GetSamplesRequest.SerializeToString,
-                                              selector__pb2.SamplesResponse.FromString,
-                                              options, channel_credentials,
-                                              insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+            selector__pb2.GetSamplesRequest.SerializeToString,
+            selector__pb2.SamplesResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def get_packed_sample_keys_and_weights(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/selector.Selector/get_packed_sample_keys_and_weights',
+            selector__pb2.GetSamplesRequest.SerializeToString,
+            selector__pb2.PackedSamplesResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
     @staticmethod
     def inform_data(request,
-                    target,
-                    options=(),
-                    channel_credentials=None,
-                    call_credentials=None,
-                    insecure=False,
-                    compression=None,
-                    wait_for_ready=None,
-                    timeout=None,
-                    metadata=None):
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
         return grpc.experimental.unary_unary(request, target, '/selector.Selector/inform_data',
             selector__pb2.DataInformRequest.SerializeToString,
             selector__pb2.DataInformResponse.FromString,
@@ -228,37 +292,37 @@ class Selector(object):
 
     @staticmethod
     def inform_data_and_trigger(request,
-                                target,
-                                options=(),
-                                channel_credentials=None,
-                                call_credentials=None,
-                                insecure=False,
-                                compression=None,
-                                wait_for_ready=None,
-                                timeout=None,
-                                metadata=None):
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
         return grpc.experimental.unary_unary(request, target, '/selector.Selector/inform_data_and_trigger',
-                                             selector__pb2.DataInformRequest.SerializeToString,
-                                             selector__pb2.TriggerResponse.FromString,
-                                             options, channel_credentials,
-                                             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+            selector__pb2.DataInformRequest.SerializeToString,
+            selector__pb2.TriggerResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
     @staticmethod
     def get_number_of_samples(request,
-                              target,
-                              options=(),
-                              channel_credentials=None,
-                              call_credentials=None,
-                              insecure=False,
-                              compression=None,
-                              wait_for_ready=None,
-                              timeout=None,
-                              metadata=None):
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
         return grpc.experimental.unary_unary(request, target, '/selector.Selector/get_number_of_samples',
-                                             selector__pb2.GetNumberOfSamplesRequest.SerializeToString,
-                                             selector__pb2.NumberOfSamplesResponse.FromString,
-                                             options, channel_credentials,
-                                             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+            selector__pb2.GetNumberOfSamplesRequest.SerializeToString,
+            selector__pb2.NumberOfSamplesResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
     @staticmethod
     def get_status_bar_scale(request,
@@ -279,20 +343,20 @@ class Selector(object):
 
     @staticmethod
     def get_number_of_partitions(request,
-                                 target,
-                                 options=(),
-                                 channel_credentials=None,
-                                 call_credentials=None,
-                                 insecure=False,
-                                 compression=None,
-                                 wait_for_ready=None,
-                                 timeout=None,
-                                 metadata=None):
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
         return grpc.experimental.unary_unary(request, target, '/selector.Selector/get_number_of_partitions',
-                                             selector__pb2.GetNumberOfPartitionsRequest.SerializeToString,
-                                             selector__pb2.NumberOfPartitionsResponse.FromString,
-                                             options, channel_credentials,
-                                             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+            selector__pb2.GetNumberOfPartitionsRequest.SerializeToString,
+            selector__pb2.NumberOfPartitionsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
     @staticmethod
     def get_available_labels(request,
@@ -313,15 +377,15 @@ class Selector(object):
 
     @staticmethod
     def get_selection_strategy(request,
-                               target,
-                               options=(),
-                               channel_credentials=None,
-                               call_credentials=None,
-                               insecure=False,
-                               compression=None,
-                               wait_for_ready=None,
-                               timeout=None,
-                               metadata=None):
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
         return grpc.experimental.unary_unary(request, target, '/selector.Selector/get_selection_strategy',
             selector__pb2.GetSelectionStrategyRequest.SerializeToString,
             selector__pb2.SelectionStrategyResponse.FromString,
@@ -361,3 +425,37 @@ class Selector(object):
             selector__pb2.UsesWeightsResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def evict_trigger_from_cache(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/selector.Selector/evict_trigger_from_cache',
+            selector__pb2.EvictTriggerRequest.SerializeToString,
+            selector__pb2.EvictTriggerResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def get_cache_stats(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/selector.Selector/get_cache_stats',
+            selector__pb2.Empty.SerializeToString,
+            selector__pb2.CacheStatsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
@@ -5,12 +5,19 @@ import threading
 from typing import Iterable
 
 import grpc
+import numpy as np
+from modyn.common.trigger_sample import ArrayWrapper
+from modyn.common.trigger_sample.trigger_sample_storage import TRIGGER_SAMPLE_DTYPE
 
 # pylint: disable=no-name-in-module
 from modyn.selector.internal.grpc.generated.selector_pb2 import (
     AvailableLabelsResponse,
+    CacheStatsResponse,
     DataInformRequest,
     DataInformResponse,
+    Empty,
+    EvictTriggerRequest,
+    EvictTriggerResponse,
     GetAvailableLabelsRequest,
     GetNumberOfPartitionsRequest,
     GetNumberOfSamplesRequest,
@@ -20,6 +27,7 @@ from modyn.selector.internal.grpc.generated.selector_pb2 import (
     JsonString,
     NumberOfPartitionsResponse,
     NumberOfSamplesResponse,
+    PackedSamplesResponse,
     SamplesResponse,
     SeedSelectorRequest,
     SeedSelectorResponse,
@@ -76,6 +84,38 @@ class SelectorGRPCServicer(SelectorServicer):
             batch_weights = [sample[1] for sample in batch]
             yield SamplesResponse(training_samples_subset=batch_keys, training_samples_weights=batch_weights)
 
+    def get_packed_sample_keys_and_weights(  # pylint: disable-next=unused-argument
+        self, request: GetSamplesRequest, context: grpc.ServicerContext
+    ) -> Iterable[PackedSamplesResponse]:
+        pipeline_id, trigger_id, worker_id, partition_id = (
+            request.pipeline_id,
+            request.trigger_id,
+            request.worker_id,
+            request.partition_id,
+        )
+        logger.info(
+            f"[Pipeline {pipeline_id}]: Fetching packed samples for trigger id {trigger_id}"
+            + f" and worker id {worker_id} and partition id {partition_id}"
+        )
+
+        samples = self.selector_manager.get_sample_keys_and_weights(pipeline_id, trigger_id, worker_id, partition_id)
+        samples = np.asarray(
+            samples.array if isinstance(samples, ArrayWrapper) else samples, dtype=TRIGGER_SAMPLE_DTYPE
+        )
+
+        if len(samples) == 0:
+            logger.info("No samples found.")
+            yield PackedSamplesResponse()
+            return
+
+        # The buffers are built from the array columns, i.e., without converting every key to a Python object
+        for i in range(0, len(samples), self._sample_batch_size):
+            batch = samples[i : i + self._sample_batch_size]
+            yield PackedSamplesResponse(
+                training_samples_subset=batch["f0"].astype("<i8").tobytes(),
+                training_samples_weights=batch["f1"].astype("<f4").tobytes(),
+            )
+
     def inform_data(self, request: DataInformRequest, context: grpc.ServicerContext) -> DataInformResponse:
         pipeline_id, keys, timestamps, labels = request.pipeline_id, request.keys, request.timestamps, request.labels
         logger.info(f"[Pipeline {pipeline_id}]: Selector is informed of {len(keys)} new data points")
@@ -173,3 +213,20 @@ class SelectorGRPCServicer(SelectorServicer):
         seed_everything(seed)
 
         return SeedSelectorResponse(success=True)
+
+    def evict_trigger_from_cache(  # pylint: disable-next=unused-argument
+        self, request: EvictTriggerRequest, context: grpc.ServicerContext
+    ) -> EvictTriggerResponse:
+        pipeline_id, trigger_id = request.pipeline_id, request.trigger_id
+        logger.info(f"[Pipeline {pipeline_id}]: Received cache eviction request for trigger id {trigger_id}")
+
+        evicted_keys = self.selector_manager.evict_trigger_from_cache(pipeline_id, trigger_id)
+
+        return EvictTriggerResponse(evicted_keys=evicted_keys)
+
+    def get_cache_stats(  # pylint: disable-next=unused-argument
+        self, request: Empty, context: grpc.ServicerContext
+    ) -> CacheStatsResponse:
+        stats = self.selector_manager.get_cache_stats()
+
+        return CacheStatsResponse(**stats)
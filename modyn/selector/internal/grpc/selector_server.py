@@ -36,6 +36,7 @@ class SelectorGRPCServer(GenericGRPCServer):
         return state
 
     def _cleanup(self) -> None:
+        self.selector_manager.clear_cache()
         if (
             "cleanup_storage_directories_after_shutdown" in self.modyn_config["selector"]
             and self.modyn_config["selector"]["cleanup_storage_directories_after_shutdown"]
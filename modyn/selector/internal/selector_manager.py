@@ -12,6 +12,7 @@ from typing import Any, Optional
 from modyn.metadata_database.metadata_database_connection import MetadataDatabaseConnection
 from modyn.metadata_database.models.pipelines import Pipeline
 from modyn.selector.internal.selector_strategies.abstract_selection_strategy import AbstractSelectionStrategy
+from modyn.selector.internal.trigger_partition_cache import TriggerPartitionCache
 from modyn.selector.selector import Selector
 from modyn.utils.utils import dynamic_module_import, is_directory_writable
 
@@ -25,6 +26,7 @@ class SelectorManager:
         self._selectors: dict[int, Selector] = {}
         self._selector_locks: DictProxy[int, Any] = self._manager.dict()
         self._selector_cache_size = self._modyn_config["selector"]["keys_in_selector_cache"]
+        self._trigger_cache = TriggerPartitionCache(self._manager, self._selector_cache_size)
 
         # TODO(309): currently we have to prepare N locks and then share.
         # This is because we cannot share the manager with subprocesses.
@@ -91,7 +93,7 @@ class SelectorManager:
     def _instantiate_selector(self, pipeline_id: int, num_workers: int, selection_strategy: str) -> None:
         assert pipeline_id in self._selector_locks, f"Trying to register pipeline {pipeline_id} without existing lock!"
         selection_strategy = self._instantiate_strategy(json.loads(selection_strategy), pipeline_id)
-        selector = Selector(selection_strategy, pipeline_id, num_workers, self._modyn_config, self._selector_cache_size)
+        selector = Selector(selection_strategy, pipeline_id, num_workers, self._modyn_config, self._trigger_cache)
         self._selectors[pipeline_id] = selector
 
     def get_sample_keys_and_weights(
@@ -181,6 +183,17 @@ class SelectorManager:
 
         return self._selectors[pipeline_id].uses_weights()
 
+    def evict_trigger_from_cache(self, pipeline_id: int, trigger_id: int) -> int:
+        evicted_keys = self._trigger_cache.evict_trigger(pipeline_id, trigger_id)
+        logger.info(f"[Pipeline {pipeline_id}]: Evicted {evicted_keys} keys of trigger {trigger_id} from the cache.")
+        return evicted_keys
+
+    def get_cache_stats(self) -> dict[str, int]:
+        return self._trigger_cache.stats
+
+    def clear_cache(self) -> None:
+        self._trigger_cache.clear()
+
     def _instantiate_strategy(self, selection_strategy: dict, pipeline_id: int) -> AbstractSelectionStrategy:
         strategy_name = selection_strategy["name"]
         maximum_keys_in_memory = selection_strategy["maximum_keys_in_memory"]
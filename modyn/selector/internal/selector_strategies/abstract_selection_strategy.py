@@ -2,17 +2,30 @@ import logging
 import os
 import platform
 from abc import ABC, abstractmethod
-from typing import Any, Iterable, Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Iterable, Iterator, Optional, Union
 
 import numpy as np
 from modyn.common.benchmark.stopwatch import Stopwatch
-from modyn.common.trigger_sample import ArrayWrapper, TriggerSampleStorage
+from modyn.common.trigger_sample import ArrayWrapper, TriggerSampleStorage, keys_to_trigger_samples
+from modyn.common.trigger_sample.trigger_sample_storage import TRIGGER_SAMPLE_DTYPE
 from modyn.metadata_database.metadata_database_connection import MetadataDatabaseConnection
 from modyn.metadata_database.models import Trigger, TriggerPartition
+from modyn.selector.internal.selector_strategies.stream_sampling import sample_chunks
 from sqlalchemy import func
 
 logger = logging.getLogger(__name__)
 
+# Partitions of a trigger are written in the background while the strategy computes the next partitions
+PARTITION_WRITER_THREADS = 2
+PARTITION_WRITE_QUEUE_SIZE = 2 * PARTITION_WRITER_THREADS
+
+# A partition of a trigger: (key, weight) tuples or an array of trigger samples (see keys_to_trigger_samples)
+TriggerSamples = Union[list[tuple[int, float]], np.ndarray]
+# Keys of a partition: a list, as returned by the storage backends, or an int64 array
+SampleKeys = Union[list[int], np.ndarray]
+
 
 class AbstractSelectionStrategy(ABC):
     """This class is the base class for selection strategies.
@@ -94,18 +107,14 @@ class AbstractSelectionStrategy(ABC):
                 logger.info(f"Last trigger in DB for pipeline {pipeline_id} was {last_trigger_id}.")
                 self._next_trigger_id = last_trigger_id + 1
 
-        if self.has_limit and self.training_set_size_limit > self._maximum_keys_in_memory:
-            # TODO(#179) Otherwise, we need to somehow sample over multiple not-in-memory partitions, which is a problem
-            # Right now, we interpret the limit as a limit per partition
-            # (this means a limit of 2 with 4 partitions with lead to 8 data points!)
-            # This is also problematic since the limit now depends on the chunking. However, we need to think about
-            # how to do this carefully
-            raise ValueError(
-                "We currently do not support a limit that is "
-                "larger than the maximum amount of keys we may hold in memory."
-            )
-
         self._trigger_sample_directory = self._modyn_config["selector"]["trigger_sample_directory"]
+        # Number of keys per partition of the triggers of this pipeline, populated on trigger or lazily from the
+        # database (e.g., after a restart), such that serving the keys of a partition needs no database query
+        self._partition_sizes: dict[int, list[int]] = {}
+
+        # The generator is seeded from the global NumPy state, such that seeding the selector keeps strategies
+        # reproducible (see seed_everything)
+        self._rng = np.random.default_rng(np.random.randint(np.iinfo(np.int32).max))
 
     @property
     def maximum_keys_in_memory(self) -> int:
@@ -120,21 +129,35 @@ class AbstractSelectionStrategy(ABC):
             self._storage_backend._maximum_keys_in_memory = value
 
     @abstractmethod
-    def _on_trigger(self) -> Iterable[tuple[list[tuple[int, float]], dict[str, Any]]]:
+    def _on_trigger(self) -> Iterable[tuple[TriggerSamples, dict[str, Any]]]:
         """
         Internal function. Defined by concrete strategy implementations. Calculates the next set of data to
         train on. Returns an iterator over lists, if next set of data consists of more than _maximum_keys_in_memory
         keys.
 
         Returns:
-            Iterable[tuple[list[tuple[int, float]], dict[str, Any]]]:
+            Iterable[tuple[TriggerSamples, dict[str, Any]]]:
                 Iterable over partitions. Each partition consists of a list of training samples.
                 In each list, each entry is a training sample, where the first element of the tuple
-                is the key, and the second element is the associated weight. Each partition also has
-                a log attached to it, the second element in the tuple
+                is the key, and the second element is the associated weight. Instead of a list, strategies
+                can return an array of trigger samples, which avoids creating a tuple per sample.
+                Each partition also has a log attached to it, the second element in the tuple
         """
         raise NotImplementedError
 
+    def _sample_limit(self, chunks: Iterable[SampleKeys], population_size: int) -> Iterator[np.ndarray]:
+        """
+        Returns a uniform random sample of `limit` keys out of the `population_size` keys in the chunks, as evenly
+        sized partitions of at most `maximum_keys_in_memory` keys. The limit applies to all chunks, not per chunk.
+        """
+        return sample_chunks(
+            chunks, population_size, self.training_set_size_limit, self._maximum_keys_in_memory, self._rng
+        )
+
+    def _shuffled_trigger_samples(self, keys: SampleKeys, weight: float = 1.0) -> np.ndarray:
+        """Returns the keys in random order as trigger samples with the same weight."""
+        return keys_to_trigger_samples(self._rng.permutation(np.asarray(keys, dtype=np.int64)), weight)
+
     @abstractmethod
     def _reset_state(self) -> None:
         """Resets the internal state of the strategy, e.g., by clearing buffers."""
@@ -180,22 +203,57 @@ class AbstractSelectionStrategy(ABC):
         )
 
     @staticmethod
-    def _store_trigger_num_keys(
-        modyn_config: dict, pipeline_id: int, trigger_id: int, partition_id: int, num_keys: int
+    def _store_trigger_partitions(
+        modyn_config: dict, pipeline_id: int, trigger_id: int, partition_num_keys: dict[int, int]
     ) -> None:
+        if len(partition_num_keys) == 0:
+            return
+
         with MetadataDatabaseConnection(modyn_config) as database:
-            trigger_partition = TriggerPartition(
-                pipeline_id=pipeline_id, trigger_id=trigger_id, partition_id=partition_id, num_keys=num_keys
-            )
             # TODO(#246): Maybe clean this up after some time.
-            database.session.add(trigger_partition)
+            database.session.bulk_insert_mappings(
+                TriggerPartition,
+                [
+                    {
+                        "pipeline_id": pipeline_id,
+                        "trigger_id": trigger_id,
+                        "partition_id": partition_id,
+                        "num_keys": num_keys,
+                    }
+                    for partition_id, num_keys in partition_num_keys.items()
+                ],
+            )
             database.session.commit()
 
-    # pylint: disable=too-many-locals,too-many-statements
+    def _get_data_lengths(self, num_samples: int) -> list[int]:
+        # Every partition is split into one file per insertion thread
+        if (self._is_mac and self._is_test) or self._disable_mt:
+            return [num_samples]
+
+        samples_per_proc = int(num_samples / self._insertion_threads)
+        data_lengths = [samples_per_proc] * (self._insertion_threads - 1) if samples_per_proc > 0 else []
+        if sum(data_lengths) < num_samples:
+            data_lengths.append(num_samples - sum(data_lengths))
+        return data_lengths
+
+    def _store_partition(
+        self, partition: int, trigger_id: int, training_samples: np.ndarray, data_lengths: list[int]
+    ) -> dict[str, Any]:
+        swt = Stopwatch()
+        swt.start("store_triggersamples")
+        AbstractSelectionStrategy._store_triggersamples_impl(
+            partition, trigger_id, self._pipeline_id, training_samples, data_lengths, self._modyn_config
+        )
+        return {"store_triggersamples_time": swt.stop()}
+
+    # pylint: disable=too-many-locals
     def trigger(self) -> tuple[int, int, int, dict[str, Any]]:
         """
         Causes the strategy to compute the training set, and (if so configured) reset its internal state.
 
+        The partitions are written by a pool of writer threads while the strategy computes the next partitions.
+        At most PARTITION_WRITE_QUEUE_SIZE partitions are in flight, which bounds the memory of the trigger.
+
         Returns:
             tuple[int, int, int]: Trigger ID, how many keys are in the trigger, number of overall partitions
         """
@@ -215,66 +273,39 @@ class AbstractSelectionStrategy(ABC):
 
         partition_num_keys = {}
         partition: Optional[int] = None
+        num_writers = 1 if self._disable_mt else PARTITION_WRITER_THREADS
+        pending_writes: deque[tuple[dict[str, Any], Future]] = deque()
         swt.start("on_trigger")
 
-        for partition, (training_samples, partition_log) in enumerate(self._on_trigger()):
-            overall_partition_log = {"partition_log": partition_log, "on_trigger_time": swt.stop("on_trigger")}
+        with ThreadPoolExecutor(max_workers=num_writers, thread_name_prefix="partition_writer") as writers:
+            for partition, (training_samples, partition_log) in enumerate(self._on_trigger()):
+                overall_partition_log = {"partition_log": partition_log, "on_trigger_time": swt.stop("on_trigger")}
 
-            logger.info(
-                f"Strategy for pipeline {self._pipeline_id} returned batch of"
-                + f" {len(training_samples)} samples for new trigger {trigger_id}."
-            )
+                # Strategies can yield lists of (key, weight) tuples or arrays of trigger samples
+                samples = np.asarray(training_samples, dtype=TRIGGER_SAMPLE_DTYPE)
+                logger.info(
+                    f"Strategy for pipeline {self._pipeline_id} returned batch of"
+                    + f" {len(samples)} samples for new trigger {trigger_id}."
+                )
 
-            partition_num_keys[partition] = len(training_samples)
+                partition_num_keys[partition] = len(samples)
+                total_keys_in_trigger += len(samples)
 
-            total_keys_in_trigger += len(training_samples)
+                swt.start("wait_for_writers", overwrite=True)
+                while len(pending_writes) >= PARTITION_WRITE_QUEUE_SIZE:
+                    self._finish_partition_write(pending_writes.popleft(), log)
+                overall_partition_log["wait_for_writers_time"] = swt.stop()
 
-            if (self._is_mac and self._is_test) or self._disable_mt:
-                swt.start("store_triggersamples", overwrite=True)
-                AbstractSelectionStrategy._store_triggersamples_impl(
-                    partition,
-                    trigger_id,
-                    self._pipeline_id,
-                    np.array(training_samples, dtype=np.dtype("i8,f8")),
-                    [len(training_samples)],
-                    self._modyn_config,
+                future = writers.submit(
+                    self._store_partition, partition, trigger_id, samples, self._get_data_lengths(len(samples))
                 )
-                overall_partition_log["store_triggersamples_time"] = swt.stop()
-                log["trigger_partitions"].append(overall_partition_log)
+                pending_writes.append((overall_partition_log, future))
                 swt.start("on_trigger", overwrite=True)
-                continue
-
-            swt.start("store_triggersamples", overwrite=True)
-            swt.start("mt_prep", overwrite=True)
-            samples_per_proc = int(len(training_samples) / self._insertion_threads)
 
-            data_lengths = []
+            swt.stop("on_trigger")
+            while len(pending_writes) > 0:
+                self._finish_partition_write(pending_writes.popleft(), log)
 
-            overall_partition_log["mt_prep_time"] = swt.stop()
-            swt.start("mt_finish", overwrite=True)
-
-            if samples_per_proc > 0:
-                data_lengths = [samples_per_proc] * (self._insertion_threads - 1)
-
-            if sum(data_lengths) < len(training_samples):
-                data_lengths.append(len(training_samples) - sum(data_lengths))
-
-            AbstractSelectionStrategy._store_triggersamples_impl(
-                partition,
-                trigger_id,
-                self._pipeline_id,
-                np.array(training_samples, dtype=np.dtype("i8,f8")),
-                data_lengths,
-                self._modyn_config,
-            )
-
-            overall_partition_log["mt_finish_time"] = swt.stop()
-            overall_partition_log["store_triggersamples_time"] = swt.stop("store_triggersamples")
-
-            log["trigger_partitions"].append(overall_partition_log)
-            swt.start("on_trigger", overwrite=True)
-
-        swt.stop("on_trigger")
         num_partitions = partition + 1 if partition is not None else 0
         log["num_partitions"] = num_partitions
         log["num_keys"] = total_keys_in_trigger
@@ -292,14 +323,10 @@ class AbstractSelectionStrategy(ABC):
             database.session.commit()
 
         # Insert all partition lengths into DB
-        for partition, partition_keys in partition_num_keys.items():
-            AbstractSelectionStrategy._store_trigger_num_keys(
-                modyn_config=self._modyn_config,
-                pipeline_id=self._pipeline_id,
-                trigger_id=trigger_id,
-                partition_id=partition,
-                num_keys=partition_keys,
-            )
+        AbstractSelectionStrategy._store_trigger_partitions(
+            self._modyn_config, self._pipeline_id, trigger_id, partition_num_keys
+        )
+        self._partition_sizes[trigger_id] = [partition_num_keys[partition_id] for partition_id in range(num_partitions)]
 
         log["db_update_time"] = swt.stop()
 
@@ -311,6 +338,31 @@ class AbstractSelectionStrategy(ABC):
         self._next_trigger_id += 1
         return trigger_id, total_keys_in_trigger, num_partitions, log
 
+    @staticmethod
+    def _finish_partition_write(pending_write: tuple[dict[str, Any], Future], log: dict[str, Any]) -> None:
+        # Raises the exception of the writer, if any. Partitions are finished in order, hence the logs are ordered.
+        overall_partition_log, future = pending_write
+        overall_partition_log.update(future.result())
+        log["trigger_partitions"].append(overall_partition_log)
+
+    def _get_partition_sizes(self, trigger_id: int) -> list[int]:
+        if trigger_id in self._partition_sizes:
+            return self._partition_sizes[trigger_id]
+
+        with MetadataDatabaseConnection(self._modyn_config) as database:
+            num_keys = (
+                database.session.query(TriggerPartition.num_keys)
+                .filter(TriggerPartition.pipeline_id == self._pipeline_id, TriggerPartition.trigger_id == trigger_id)
+                .order_by(TriggerPartition.partition_id)
+                .all()
+            )
+
+        # The partitions of a trigger are inserted at once at the end of the trigger
+        partition_sizes = [row[0] for row in num_keys]
+        if len(partition_sizes) > 0:
+            self._partition_sizes[trigger_id] = partition_sizes
+        return partition_sizes
+
     def get_trigger_partition_keys(
         self, trigger_id: int, partition_id: int, worker_id: int = -1, num_workers: int = -1
     ) -> ArrayWrapper:
@@ -329,18 +381,9 @@ class AbstractSelectionStrategy(ABC):
                 is the key, and the second element is the associated weight.
         """
 
-        with MetadataDatabaseConnection(self._modyn_config) as database:
-            num_samples_trigger_partition = (
-                database.session.query(TriggerPartition.num_keys)
-                .filter(
-                    TriggerPartition.pipeline_id == self._pipeline_id,
-                    TriggerPartition.trigger_id == trigger_id,
-                    TriggerPartition.partition_id == partition_id,
-                )
-                .first()
-            )
-            assert num_samples_trigger_partition is not None, f"Could not find TriggerPartition {partition_id} in DB"
-            num_samples_trigger_partition = num_samples_trigger_partition[0]
+        partition_sizes = self._get_partition_sizes(trigger_id)
+        assert partition_id < len(partition_sizes), f"Could not find TriggerPartition {partition_id} in DB"
+        num_samples_trigger_partition = partition_sizes[partition_id]
 
         data = TriggerSampleStorage(self._trigger_sample_directory).get_trigger_samples(
             pipeline_id=self._pipeline_id,
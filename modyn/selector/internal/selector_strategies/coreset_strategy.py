@@ -1,19 +1,20 @@
 import logging
-import random
-from typing import Any, Iterable
+from typing import Iterable
 
+import numpy as np
 from modyn.common.benchmark.stopwatch import Stopwatch
-from modyn.metadata_database.models import SelectorStateMetadata
 from modyn.selector.internal.selector_strategies import AbstractSelectionStrategy
+from modyn.selector.internal.selector_strategies.abstract_selection_strategy import SampleKeys, TriggerSamples
 from modyn.selector.internal.selector_strategies.downsampling_strategies import (
     DownsamplingScheduler,
     instantiate_scheduler,
 )
 from modyn.selector.internal.selector_strategies.presampling_strategies import AbstractPresamplingStrategy
 from modyn.selector.internal.selector_strategies.presampling_strategies.utils import instantiate_presampler
+from modyn.selector.internal.selector_strategies.stream_sampling import even_partitions
 from modyn.selector.internal.storage_backend import AbstractStorageBackend
 from modyn.selector.internal.storage_backend.database import DatabaseStorageBackend
-from sqlalchemy.orm.session import Session
+from modyn.selector.internal.storage_backend.local import LocalStorageBackend
 
 logger = logging.getLogger(__name__)
 
@@ -28,16 +29,16 @@ class CoresetStrategy(AbstractSelectionStrategy):
         self._storage_backend: AbstractStorageBackend
         if "storage_backend" in config:
             if config["storage_backend"] == "local":
-                # TODO(#324): Support local backend on CoresetStrategy
-                raise NotImplementedError("The CoresetStrategy currently does not support the local backend.")
-
-            if config["storage_backend"] == "database":
+                self._storage_backend = LocalStorageBackend(
+                    self._pipeline_id, self._modyn_config, self._maximum_keys_in_memory
+                )
+            elif config["storage_backend"] == "database":
                 self._storage_backend = DatabaseStorageBackend(
                     self._pipeline_id, self._modyn_config, self._maximum_keys_in_memory
                 )
             else:
                 raise NotImplementedError(
-                    f"Unknown storage backend \"{config['storage_backend']}\". Supported: database"
+                    f"Unknown storage backend \"{config['storage_backend']}\". Supported: local, database"
                 )
         else:
             logger.info("CoresetStrategy defaulting to database backend.")
@@ -64,16 +65,19 @@ class CoresetStrategy(AbstractSelectionStrategy):
         self.downsampling_scheduler.inform_next_trigger(self._next_trigger_id)
         return trigger_id, total_keys_in_trigger, num_partitions, log
 
-    def _on_trigger(self) -> Iterable[tuple[list[tuple[int, float]], dict[str, object]]]:
+    def _on_trigger(self) -> Iterable[tuple[TriggerSamples, dict[str, object]]]:
         for samples in self._get_data():
-            random.shuffle(samples)
             # Add logging here when required.
-            yield [(sample, 1.0) for sample in samples], {}
+            yield self._shuffled_trigger_samples(samples), {}
+
+    def _get_data(self) -> Iterable[SampleKeys]:
+        if isinstance(self._storage_backend, LocalStorageBackend):
+            yield from self._get_data_local()
+            return
 
-    def _get_data(self) -> Iterable[list[int]]:
         assert isinstance(
             self._storage_backend, DatabaseStorageBackend
-        ), "CoresetStrategy currently only supports DatabaseBackend"
+        ), "CoresetStrategy currently only supports the local and database backends"
 
         trigger_dataset_size = None
         if self.presampling_strategy.requires_trigger_dataset_size:
@@ -84,11 +88,30 @@ class CoresetStrategy(AbstractSelectionStrategy):
             tail_triggers=self.tail_triggers,
             limit=self.training_set_size_limit if self.has_limit else None,
             trigger_dataset_size=trigger_dataset_size,
+            rng=self._rng,
         )
 
         for samples, _ in self._storage_backend._partitioned_execute_stmt(stmt, self._maximum_keys_in_memory, None):
             yield samples
 
+    def _get_data_local(self) -> Iterable[np.ndarray]:
+        assert isinstance(self._storage_backend, LocalStorageBackend)
+
+        smallest_included_trigger_id = (
+            self._next_trigger_id - self.tail_triggers if self.tail_triggers is not None else None
+        )
+        limit = self.training_set_size_limit if self.has_limit else None
+        population_size = self._storage_backend.get_sample_count(smallest_included_trigger_id)
+        presampled_keys = self.presampling_strategy.get_presampled_keys(
+            self._storage_backend.get_keys_and_timestamps(smallest_included_trigger_id),
+            limit,
+            population_size,
+            self._rng,
+        )
+
+        expected_size = min(self.presampling_strategy.get_target_size(population_size, limit), population_size)
+        yield from even_partitions(presampled_keys, expected_size, self._maximum_keys_in_memory)
+
     def _reset_state(self) -> None:
         pass  # As we currently hold everything in database (#116), this currently is a noop.
 
@@ -99,21 +122,9 @@ class CoresetStrategy(AbstractSelectionStrategy):
             self._storage_backend, DatabaseStorageBackend
         ), "FreshnessStrategy currently only supports DatabaseBackend"
 
-        def _session_callback(session: Session) -> Any:
-            return (
-                session.query(SelectorStateMetadata.sample_key)
-                .filter(
-                    SelectorStateMetadata.pipeline_id == self._pipeline_id,
-                    (
-                        SelectorStateMetadata.seen_in_trigger_id >= self._next_trigger_id - self.tail_triggers
-                        if self.tail_triggers is not None
-                        else True
-                    ),
-                )
-                .count()
-            )
-
-        return self._storage_backend._execute_on_session(_session_callback)
+        return self._storage_backend.get_sample_count(
+            self._next_trigger_id - self.tail_triggers if self.tail_triggers is not None else None
+        )
 
     def get_available_labels(self) -> list[int]:
         return self._storage_backend.get_available_labels(self._next_trigger_id, tail_triggers=self.tail_triggers)
@@ -1,15 +1,23 @@
 # pylint: disable=singleton-comparison
 # flake8: noqa: E712
 import logging
-import random
 from math import isclose
 from typing import Any, Iterable, Iterator
 
+import numpy as np
 from modyn.common.benchmark.stopwatch import Stopwatch
 from modyn.metadata_database.models import SelectorStateMetadata
-from modyn.selector.internal.selector_strategies.abstract_selection_strategy import AbstractSelectionStrategy
+from modyn.selector.internal.selector_strategies.abstract_selection_strategy import (
+    AbstractSelectionStrategy,
+    SampleKeys,
+    TriggerSamples,
+)
+from modyn.selector.internal.selector_strategies.presampling_strategies.database_sampling import keys_filter
+from modyn.selector.internal.selector_strategies.stream_sampling import sample_chunks
+from modyn.selector.internal.selector_strategies.used_key_index import UsedKeyIndex
 from modyn.selector.internal.storage_backend import AbstractStorageBackend
 from modyn.selector.internal.storage_backend.database import DatabaseStorageBackend
+from modyn.selector.internal.storage_backend.local import LocalStorageBackend
 from sqlalchemy import exc, func, update
 from sqlalchemy.orm.session import Session
 from sqlalchemy.sql.selectable import Select
@@ -28,6 +36,11 @@ class FreshnessSamplingStrategy(AbstractSelectionStrategy):
 
     It cannot be used with reset, because we need to keep state over multiple triggers.
 
+    With `track_used_in_memory`, the used samples are tracked in an in-memory index (loaded from the storage backend
+    on the first trigger after a restart) instead of the used flag of the storage backend. The used/unused counts and
+    samples are then computed in memory from a scan of all keys, and the samples used in a trigger are persisted with a
+    single batched update at the end of the trigger.
+
     Args:
         config (dict): The configuration for the selector.
     """
@@ -39,6 +52,7 @@ class FreshnessSamplingStrategy(AbstractSelectionStrategy):
         assert self.tail_triggers is None or self.tail_triggers == 0, "Tail triggers not supported for this strategy."
         self.unused_data_ratio = self._config["unused_data_ratio"]
         self._is_first_trigger = True
+        self._used_key_index = UsedKeyIndex() if self._config.get("track_used_in_memory", False) else None
 
         if self.unused_data_ratio < 1 or self.unused_data_ratio > 99:
             raise ValueError(
@@ -55,16 +69,16 @@ class FreshnessSamplingStrategy(AbstractSelectionStrategy):
         self._storage_backend: AbstractStorageBackend
         if "storage_backend" in config:
             if config["storage_backend"] == "local":
-                # TODO(#324): Support local backend on FreshnessSamplingStrategy
-                raise NotImplementedError("The FreshnessSamplingStrategy currently does not support the local backend.")
-
-            if config["storage_backend"] == "database":
+                self._storage_backend = LocalStorageBackend(
+                    self._pipeline_id, self._modyn_config, self._maximum_keys_in_memory
+                )
+            elif config["storage_backend"] == "database":
                 self._storage_backend = DatabaseStorageBackend(
                     self._pipeline_id, self._modyn_config, self._maximum_keys_in_memory
                 )
             else:
                 raise NotImplementedError(
-                    f"Unknown storage backend \"{config['storage_backend']}\". Supported: database"
+                    f"Unknown storage backend \"{config['storage_backend']}\". Supported: local, database"
                 )
         else:
             logger.info("FreshnessSamplingStrategy defaulting to database backend.")
@@ -81,7 +95,7 @@ class FreshnessSamplingStrategy(AbstractSelectionStrategy):
         persist_log = self._storage_backend.persist_samples(self._next_trigger_id, keys, timestamps, labels)
         return {"total_persist_time": swt.stop(), "persist_log": persist_log}
 
-    def _on_trigger(self) -> Iterable[tuple[list[tuple[int, float]], dict[str, Any]]]:
+    def _on_trigger(self) -> Iterable[tuple[TriggerSamples, dict[str, Any]]]:
         """
         Internal function. Calculates the next set of data to
         train on.
@@ -102,27 +116,24 @@ class FreshnessSamplingStrategy(AbstractSelectionStrategy):
 
         for samples in get_data_func():
             self._mark_used(samples)
-            random.shuffle(samples)
 
             # Add logging here when required.
-            yield [(sample, 1.0) for sample in samples], {}
+            yield self._shuffled_trigger_samples(samples), {}
+
+        if self._used_key_index is not None:
+            self._persist_used(self._used_key_index.commit())
 
-    def _get_first_trigger_data(self) -> Iterable[list[int]]:
+    def _get_first_trigger_data(self) -> Iterable[SampleKeys]:
         assert self._is_first_trigger
         self._is_first_trigger = False
 
         if self.has_limit:
-            # TODO(#179): this assumes limit < len(samples)
-            for samples in self._get_all_unused_data():
-                yield (
-                    random.sample(samples, self.training_set_size_limit)
-                    if self.training_set_size_limit < len(samples)
-                    else samples
-                )
+            # The limit applies to all unused data, hence we first count it and then sample it chunk by chunk
+            yield from self._sample_limit(self._get_all_unused_data(), self._get_count_of_data(False))
         else:
             yield from self._get_all_unused_data()
 
-    def _get_trigger_data(self) -> Iterable[list[int]]:
+    def _get_trigger_data(self) -> Iterable[np.ndarray]:
         assert not self._is_first_trigger
         count_unused_samples = self._get_count_of_data(False)
         count_used_samples = self._get_count_of_data(True)
@@ -140,11 +151,13 @@ class FreshnessSamplingStrategy(AbstractSelectionStrategy):
         unused_generator = self._get_data_sample(num_unused_samples, False)
         used_generator = self._get_data_sample(num_used_samples, True)
 
-        next_unused_sample: list[int] = next(unused_generator, [])
-        next_used_sample: list[int] = next(used_generator, [])
+        next_unused_sample: SampleKeys = next(unused_generator, [])
+        next_used_sample: SampleKeys = next(used_generator, [])
 
         while len(next_unused_sample) > 0 or len(next_used_sample) > 0:
-            yield next_unused_sample + next_used_sample
+            yield np.concatenate(
+                [np.asarray(next_unused_sample, dtype=np.int64), np.asarray(next_used_sample, dtype=np.int64)]
+            )
             next_unused_sample = next(unused_generator, [])
             next_used_sample = next(used_generator, [])
 
@@ -182,15 +195,33 @@ class FreshnessSamplingStrategy(AbstractSelectionStrategy):
 
         return num_unused_samples, num_used_samples
 
-    def _get_data_sample(self, sample_size: int, used: bool) -> Iterator[list[int]]:
+    def _get_data_sample(self, sample_size: int, used: bool) -> Iterator[SampleKeys]:
         """Returns sample of data. Returns ins batches of  self._maximum_keys_in_memory / 2
 
         Returns:
             list[str]: Keys of used samples
         """
+        yield_per = max(int(self._maximum_keys_in_memory / 2), 1)
+        if self._used_key_index is not None:
+            yield from sample_chunks(
+                self._get_indexed_data(used), self._get_count_of_data(used), sample_size, yield_per, self._rng
+            )
+            return
+
+        if isinstance(self._storage_backend, LocalStorageBackend):
+            local_data = (
+                self._storage_backend.get_used_data(yield_per)
+                if used
+                else self._storage_backend.get_unused_data(yield_per)
+            )
+            yield from sample_chunks(
+                (keys for keys, _ in local_data), self._get_count_of_data(used), sample_size, yield_per, self._rng
+            )
+            return
+
         assert isinstance(
             self._storage_backend, DatabaseStorageBackend
-        ), "FreshnessStrategy currently only supports DatabaseBackend"
+        ), "FreshnessStrategy currently only supports the local and database backends"
 
         def _chunk_callback(chunk: Any) -> None:
             _, used_data = zip(*chunk)
@@ -206,7 +237,6 @@ class FreshnessSamplingStrategy(AbstractSelectionStrategy):
                 .limit(sample_size)
             )
 
-        yield_per = max(int(self._maximum_keys_in_memory / 2), 1)
         # Change to `yield from` when we actually use the log returned here.
         for keys, _ in self._storage_backend._get_pipeline_data(
             (SelectorStateMetadata.used == used,),
@@ -216,15 +246,24 @@ class FreshnessSamplingStrategy(AbstractSelectionStrategy):
         ):
             yield keys
 
-    def _get_all_unused_data(self) -> Iterator[list[int]]:
+    def _get_all_unused_data(self) -> Iterator[SampleKeys]:
         """Returns all unused samples
 
         Returns:
             list[str]: Keys of unused samples
         """
+        if self._used_key_index is not None:
+            yield from self._get_indexed_data(False)
+            return
+
+        if isinstance(self._storage_backend, LocalStorageBackend):
+            for keys, _ in self._storage_backend.get_unused_data():
+                yield keys
+            return
+
         assert isinstance(
             self._storage_backend, DatabaseStorageBackend
-        ), "FreshnessStrategy currently only supports DatabaseBackend"
+        ), "FreshnessStrategy currently only supports the local and database backends"
 
         def _chunk_callback(chunk: Any) -> None:
             _, used = zip(*chunk)
@@ -247,9 +286,16 @@ class FreshnessSamplingStrategy(AbstractSelectionStrategy):
         Returns:
             list[str]: Keys of unused samples
         """
+        if self._used_key_index is not None:
+            num_used_samples = len(self._get_used_key_index())
+            return num_used_samples if used else self._storage_backend.get_sample_count() - num_used_samples
+
+        if isinstance(self._storage_backend, LocalStorageBackend):
+            return self._storage_backend.get_sample_count(used=used)
+
         assert isinstance(
             self._storage_backend, DatabaseStorageBackend
-        ), "FreshnessStrategy currently only supports DatabaseBackend"
+        ), "FreshnessStrategy currently only supports the local and database backends"
 
         def _session_callback(session: Session) -> Any:
             return (
@@ -262,17 +308,33 @@ class FreshnessSamplingStrategy(AbstractSelectionStrategy):
 
         return self._storage_backend._execute_on_session(_session_callback)
 
-    def _mark_used(self, keys: list[int]) -> None:
+    def _mark_used(self, keys: SampleKeys) -> None:
         """Sets samples to used"""
+        if self._used_key_index is not None:
+            # Persisted at the end of the trigger
+            self._used_key_index.mark(keys)
+            return
+
+        self._persist_used(keys)
+
+    def _persist_used(self, keys: SampleKeys) -> None:
         if len(keys) == 0:
             return
+        if isinstance(self._storage_backend, LocalStorageBackend):
+            self._storage_backend.mark_used(keys)
+            return
+
         assert isinstance(
             self._storage_backend, DatabaseStorageBackend
-        ), "FreshnessStrategy currently only supports DatabaseBackend"
+        ), "FreshnessStrategy currently only supports the local and database backends"
 
         def _session_callback(session: Session) -> None:
             try:
-                stmt = update(SelectorStateMetadata).where(SelectorStateMetadata.sample_key.in_(keys)).values(used=True)
+                stmt = (
+                    update(SelectorStateMetadata)
+                    .where(keys_filter(self._storage_backend, np.asarray(keys, dtype=np.int64)))
+                    .values(used=True)
+                )
                 session.execute(stmt)
                 session.commit()
             except exc.SQLAlchemyError as exception:
@@ -281,6 +343,30 @@ class FreshnessSamplingStrategy(AbstractSelectionStrategy):
 
         self._storage_backend._execute_on_session(_session_callback)
 
+    def _get_used_key_index(self) -> UsedKeyIndex:
+        assert self._used_key_index is not None
+        if not self._used_key_index.loaded:
+            self._used_key_index.load(keys for keys, _ in self._get_used_data())
+        return self._used_key_index
+
+    def _get_used_data(self) -> Iterable[tuple[list[int], dict[str, object]]]:
+        """Returns all samples that are marked as used in the storage backend"""
+        if isinstance(self._storage_backend, LocalStorageBackend):
+            return self._storage_backend.get_used_data()
+
+        assert isinstance(
+            self._storage_backend, DatabaseStorageBackend
+        ), "FreshnessStrategy currently only supports the local and database backends"
+        return self._storage_backend._get_pipeline_data((SelectorStateMetadata.used == True,))
+
+    def _get_indexed_data(self, used: bool) -> Iterator[np.ndarray]:
+        """Returns the used/unused samples according to the in-memory index, in chunks of all samples"""
+        used_key_index = self._get_used_key_index()
+        for keys, _ in self._storage_backend.get_all_data():
+            key_array = np.asarray(keys, dtype=np.int64)
+            mask = used_key_index.contains(key_array)
+            yield key_array[mask] if used else key_array[~mask]
+
     def _reset_state(self) -> None:
         raise NotImplementedError("This strategy does not support resets.")
 
@@ -1,11 +1,16 @@
 # pylint: disable=singleton-comparison
 # flake8: noqa: E712
 import logging
-import random
-from typing import Iterable
+from typing import Iterable, Iterator, Optional
 
+import numpy as np
 from modyn.common.benchmark.stopwatch import Stopwatch
-from modyn.selector.internal.selector_strategies.abstract_selection_strategy import AbstractSelectionStrategy
+from modyn.selector.internal.selector_strategies.abstract_selection_strategy import (
+    AbstractSelectionStrategy,
+    SampleKeys,
+    TriggerSamples,
+)
+from modyn.selector.internal.selector_strategies.stream_sampling import last_keys_of_chunks
 from modyn.selector.internal.storage_backend import AbstractStorageBackend
 from modyn.selector.internal.storage_backend.database import DatabaseStorageBackend
 from modyn.selector.internal.storage_backend.local import LocalStorageBackend
@@ -75,7 +80,7 @@ class NewDataStrategy(AbstractSelectionStrategy):
         persist_log = self._storage_backend.persist_samples(self._next_trigger_id, keys, timestamps, labels)
         return {"total_persist_time": swt.stop(), "persist_log": persist_log}
 
-    def _on_trigger(self) -> Iterable[tuple[list[tuple[int, float]], dict[str, object]]]:
+    def _on_trigger(self) -> Iterable[tuple[TriggerSamples, dict[str, object]]]:
         """
         Internal function. Defined by concrete strategy implementations. Calculates the next set of data to
         train on. Returns an iterator over lists, if next set of data consists of more than _maximum_keys_in_memory
@@ -98,75 +103,92 @@ class NewDataStrategy(AbstractSelectionStrategy):
         swt = Stopwatch()
         for samples, partition_log in get_data_func():
             swt.start("shuffle", overwrite=True)
-            random.shuffle(samples)
+            trigger_samples = self._shuffled_trigger_samples(samples)
             partition_log["shuffle_time"] = swt.stop()
-            yield [(sample, 1.0) for sample in samples], partition_log
+            yield trigger_samples, partition_log
 
-    def _get_data_reset(self) -> Iterable[tuple[list[int], dict[str, object]]]:
+    def _get_data_reset(self) -> Iterable[tuple[SampleKeys, dict[str, object]]]:
         assert self.reset_after_trigger
 
         if self.has_limit:
-            # TODO(#179): this assumes limit < len(samples)
-            swt = Stopwatch()
-            for samples, partition_log in self._get_current_trigger_data():
-                swt.start("sample_time")
-                samples = random.sample(samples, min(len(samples), self.training_set_size_limit))
-                partition_log["sample_time"] = swt.stop()
-                yield samples, partition_log
+            yield from self._get_sample(self._get_current_trigger_data(), self._next_trigger_id)
         else:
             yield from self._get_current_trigger_data()
 
-    def _get_data_tail(self) -> Iterable[tuple[list[int], dict[str, object]]]:
+    def _get_data_tail(self) -> Iterable[tuple[SampleKeys, dict[str, object]]]:
         assert not self.reset_after_trigger and self.tail_triggers > 0
 
         if self.has_limit:
-            swt = Stopwatch()
-            # TODO(#179): this assumes limit < len(samples)
-            for samples, partition_log in self._get_tail_triggers_data():
-                swt.start("sample_time")
-                samples = random.sample(samples, min(len(samples), self.training_set_size_limit))
-                partition_log["sample_time"] = swt.stop()
-                yield samples, partition_log
+            yield from self._get_sample(self._get_tail_triggers_data(), self._next_trigger_id - self.tail_triggers)
         else:
             yield from self._get_tail_triggers_data()
 
-    def _get_data_no_reset(self) -> Iterable[tuple[list[int], dict[str, object]]]:
+    def _get_data_no_reset(self) -> Iterable[tuple[SampleKeys, dict[str, object]]]:
         assert not self.reset_after_trigger
 
         if self.has_limit:
-            swt = Stopwatch()
-            for samples, partition_log in self._get_all_data():
-                # TODO(#179): this assumes limit < len(samples)
-                swt.start("handle_limit_time", overwrite=True)
-                samples = self._handle_limit_no_reset(samples)
-                partition_log["handle_limit_time"] = swt.stop()
-
-                yield samples, partition_log
+            yield from self._handle_limit_no_reset(self._get_all_data())
         else:
             yield from self._get_all_data()
 
-    def _handle_limit_no_reset(self, samples: list[int]) -> list[int]:
+    def _handle_limit_no_reset(
+        self, data: Iterable[tuple[SampleKeys, dict[str, object]]]
+    ) -> Iterable[tuple[np.ndarray, dict[str, object]]]:
         assert self.limit_reset_strategy is not None
 
         if self.limit_reset_strategy == "lastX":
-            return self._last_x_limit(samples)
+            return self._last_x_limit(data)
 
         if self.limit_reset_strategy == "sampleUAR":
-            return self._sample_uar(samples)
+            return self._sample_uar(data)
 
         raise NotImplementedError(f"Unsupport limit reset strategy: {self.limit_reset_strategy}")
 
-    def _last_x_limit(self, samples: list[int]) -> list[int]:
+    def _last_x_limit(
+        self, data: Iterable[tuple[SampleKeys, dict[str, object]]]
+    ) -> Iterable[tuple[np.ndarray, dict[str, object]]]:
         assert self.has_limit
         assert self.training_set_size_limit > 0
 
-        return samples[-self.training_set_size_limit :]
+        population_size = self._storage_backend.get_sample_count()
+        yield from self._timed_partitions(
+            last_keys_of_chunks(
+                (keys for keys, _ in data),
+                population_size,
+                self.training_set_size_limit,
+                self._maximum_keys_in_memory,
+            ),
+            "handle_limit_time",
+        )
 
-    def _sample_uar(self, samples: list[int]) -> list[int]:
+    def _sample_uar(
+        self, data: Iterable[tuple[SampleKeys, dict[str, object]]]
+    ) -> Iterable[tuple[np.ndarray, dict[str, object]]]:
         assert self.has_limit
         assert self.training_set_size_limit > 0
 
-        return random.sample(samples, min(len(samples), self.training_set_size_limit))
+        yield from self._get_sample(data, None, "handle_limit_time")
+
+    def _get_sample(
+        self,
+        data: Iterable[tuple[SampleKeys, dict[str, object]]],
+        smallest_included_trigger_id: Optional[int],
+        log_key: str = "sample_time",
+    ) -> Iterable[tuple[np.ndarray, dict[str, object]]]:
+        # The limit applies to all data, hence we first count the keys and then sample them chunk by chunk
+        population_size = self._storage_backend.get_sample_count(smallest_included_trigger_id)
+        yield from self._timed_partitions(self._sample_limit((keys for keys, _ in data), population_size), log_key)
+
+    @staticmethod
+    def _timed_partitions(
+        partitions: Iterator[np.ndarray], log_key: str
+    ) -> Iterable[tuple[np.ndarray, dict[str, object]]]:
+        # The time includes fetching the chunks of the partition from the storage backend
+        swt = Stopwatch()
+        swt.start(log_key)
+        for partition in partitions:
+            yield partition, {log_key: swt.stop()}
+            swt.start(log_key, overwrite=True)
 
     def _get_current_trigger_data(self) -> Iterable[tuple[list[int], dict[str, object]]]:
         """Returns all samples seen during current trigger.
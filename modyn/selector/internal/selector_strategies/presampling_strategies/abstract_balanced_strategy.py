@@ -1,15 +1,18 @@
 from typing import Any, Optional
 
+import numpy as np
 import sqlalchemy
 from modyn.metadata_database.models import SelectorStateMetadata
 from modyn.selector.internal.selector_strategies.presampling_strategies.abstract_presampling_strategy import (
     AbstractPresamplingStrategy,
 )
+from modyn.selector.internal.selector_strategies.presampling_strategies.database_sampling import (
+    sample_keys,
+    select_sampled_keys,
+)
 from modyn.selector.internal.storage_backend.abstract_storage_backend import AbstractStorageBackend
 from modyn.selector.internal.storage_backend.database.database_storage_backend import DatabaseStorageBackend
-from sqlalchemy import Select, asc, func, select
-from sqlalchemy.orm.session import Session
-from sqlalchemy.sql.expression import func as sql_func
+from sqlalchemy import Select
 
 
 def get_fair_share(capacity: int, requests: list[int]) -> int:
@@ -57,62 +60,56 @@ class AbstractBalancedPresamplingStrategy(AbstractPresamplingStrategy):
         tail_triggers: Optional[int],
         limit: Optional[int],
         trigger_dataset_size: Optional[int],
+        rng: np.random.Generator,
     ) -> Select:
         assert self.balanced_column is not None
-        samples_count = self._get_samples_count_per_balanced_column(next_trigger_id, tail_triggers)
+        counts = self._get_samples_count_per_group(next_trigger_id, tail_triggers)
+        samples_count = list(counts.values())
         target_size = self.get_target_size(sum(samples_count), limit)
         fair_share = get_fair_share(target_size, samples_count)
 
-        # randomly permute samples class by class or trigger by trigger.
-        # Then use row_number (in the next query) to get N random samples for each class/trigger
-        subquery = select(
-            SelectorStateMetadata,
-            sql_func.row_number()
-            .over(partition_by=self.balanced_column, order_by=func.random())  # pylint: disable=not-callable
-            .label("row_num"),
-        ).filter(
+        if self.force_required_target_size:
+            quota, sample_limit = self._get_force_required_target_size_quota(fair_share, samples_count, target_size)
+        elif self.force_column_balancing:
+            quota, sample_limit = self._get_force_column_balancing_quota(fair_share, samples_count, target_size)
+        else:
+            quota, sample_limit = fair_share, None
+
+        # Sample `quota` random samples of each class/trigger.
+        filters = [
             SelectorStateMetadata.pipeline_id == self.pipeline_id,
             (
                 SelectorStateMetadata.seen_in_trigger_id >= next_trigger_id - tail_triggers
                 if tail_triggers is not None
                 else True
             ),
+        ]
+        keys = sample_keys(
+            self._storage_backend,
+            filters,
+            {group: quota for group in counts},
+            counts,
+            group_column=self.balanced_column,
+            limit=sample_limit,
+            rng=rng,
         )
 
-        if self.force_required_target_size:
-            return self._get_force_required_target_size_query(fair_share, samples_count, subquery, target_size)
-        if self.force_column_balancing:
-            return self._get_force_column_balancing_query(fair_share, samples_count, subquery, target_size)
-
-        return self._get_base_query(fair_share, subquery)
+        return select_sampled_keys(self._storage_backend, filters, keys)
 
-    def _get_force_column_balancing_query(
-        self, fair_share: int, samples_count: list[int], subquery: Select, target_size: int
-    ) -> Select:
+    def _get_force_column_balancing_quota(
+        self, fair_share: int, samples_count: list[int], target_size: int
+    ) -> tuple[int, Optional[int]]:
         """
         Each class/trigger has exactly the same number of samples
         """
         smallest_size = min(samples_count)
         if smallest_size < fair_share:
-            return (
-                select(subquery.c.sample_key)
-                .where(subquery.c.row_num <= smallest_size)
-                .order_by(asc(subquery.c.timestamp))
-                .limit(target_size)
-            )
-        return self._get_base_query(fair_share, subquery)
-
-    def _get_base_query(self, fair_share: int, subquery: Select) -> Select:
-        """
-
-        Class/Trigger j gets min(fair_share, number_samples[j]) samples
+            return smallest_size, target_size
+        return fair_share, None
 
-        """
-        return select(subquery.c.sample_key).where(subquery.c.row_num <= fair_share).order_by(asc(subquery.c.timestamp))
-
-    def _get_force_required_target_size_query(
-        self, fair_share: int, samples_count: list[int], subquery: Select, target_size: int
-    ) -> Select:
+    def _get_force_required_target_size_quota(
+        self, fair_share: int, samples_count: list[int], target_size: int
+    ) -> tuple[int, Optional[int]]:
         """
 
         The returned number of samples is exactly target_size. Some classes/triggers might get more samples than others
@@ -121,37 +118,24 @@ class AbstractBalancedPresamplingStrategy(AbstractPresamplingStrategy):
         predicted_number_of_samples = get_fair_share_predicted_total(fair_share, samples_count)
         if predicted_number_of_samples < target_size:
             # if we are below the target, overshoot and then limit
-            return (
-                select(subquery.c.sample_key)
-                .where(subquery.c.row_num <= fair_share + 1)
-                .order_by(asc(subquery.c.timestamp))
-                .limit(target_size)
-            )
-        return self._get_base_query(fair_share, subquery)
+            return fair_share + 1, target_size
+        return fair_share, None
 
     def _get_samples_count_per_balanced_column(self, next_trigger_id: int, tail_triggers: Optional[int]) -> list[int]:
         """
 
-        Performs a group_by query and returns a list with the number of samples for each group
+        Returns a list with the number of samples for each group
+
+        """
+        return list(self._get_samples_count_per_group(next_trigger_id, tail_triggers).values())
 
+    def _get_samples_count_per_group(self, next_trigger_id: int, tail_triggers: Optional[int]) -> dict[Any, int]:
         """
 
-        def _session_callback(session: Session) -> Any:
-            query = (
-                session.query(self.balanced_column, func.count())  # pylint: disable=not-callable
-                .filter(
-                    SelectorStateMetadata.pipeline_id == self.pipeline_id,
-                    (
-                        SelectorStateMetadata.seen_in_trigger_id >= next_trigger_id - tail_triggers
-                        if tail_triggers is not None
-                        else True
-                    ),
-                )
-                .group_by(self.balanced_column)
-            )
-            samples_count = query.all()
-
-            # el[0] is the class/trigger, el[1] is the count
-            return [el[1] for el in samples_count]
-
-        return self._storage_backend._execute_on_session(_session_callback)
+        Returns the number of samples for each class/trigger, read from the incrementally maintained counts
+
+        """
+        assert isinstance(self._storage_backend, DatabaseStorageBackend)
+        return self._storage_backend.get_sample_count_per_group(
+            self.balanced_column.key, next_trigger_id - tail_triggers if tail_triggers is not None else None
+        )
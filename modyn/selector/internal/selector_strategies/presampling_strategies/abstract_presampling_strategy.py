@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
+import numpy as np
 from modyn.selector.internal.storage_backend.abstract_storage_backend import AbstractStorageBackend
 from sqlalchemy import Select
 
@@ -29,13 +30,28 @@ class AbstractPresamplingStrategy(ABC):
         tail_triggers: Optional[int],
         limit: Optional[int],
         trigger_dataset_size: Optional[int],
+        rng: np.random.Generator,
     ) -> Select:
         """
         This abstract class should return the query to get the presampled samples. The query should have only
-        SelectorStateMetadata.sample_key in the SELECT clause.
+        SelectorStateMetadata.sample_key in the SELECT clause. Random presampling strategies draw from `rng`.
         """
         raise NotImplementedError()
 
+    def get_presampled_keys(
+        self,
+        chunks: Iterable[tuple[np.ndarray, np.ndarray]],
+        limit: Optional[int],
+        trigger_dataset_size: int,
+        rng: np.random.Generator,
+    ) -> Iterator[np.ndarray]:
+        """
+        Counterpart of get_presampling_query for the local storage backend. Gets the chunks of keys and timestamps of
+        all `trigger_dataset_size` samples that might be sampled during the next trigger and returns the presampled
+        keys, ordered by timestamp, in chunks.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support the local storage backend.")
+
     def get_target_size(self, trigger_dataset_size: int, limit: Optional[int]) -> int:
         assert trigger_dataset_size >= 0
         target_presampling = int(trigger_dataset_size * self.presampling_ratio / 100)
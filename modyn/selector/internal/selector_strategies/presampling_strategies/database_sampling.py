@@ -0,0 +1,194 @@
+"""
+Uniform random sampling of selector state rows without sorting the table by `random()`.
+
+Instead of `ORDER BY random() LIMIT n`, every group of rows (e.g., a label or a trigger) is scanned once with a
+Bernoulli filter, whose probability is derived from the known number of rows in the group such that the filter
+returns slightly more rows than required. The exact number of rows is then drawn from the candidates on the client.
+If a group returns too few candidates, it is topped up with another Bernoulli pass over the group. Since the union of
+Bernoulli samples is again a Bernoulli sample, the candidates are exchangeable, and the final sample is a uniform
+sample without replacement, just as with `ORDER BY random()`.
+"""
+
+import math
+from typing import Any, Optional
+
+import numpy as np
+from modyn.metadata_database.models import SelectorStateMetadata
+from modyn.selector.internal.storage_backend.abstract_storage_backend import AbstractStorageBackend
+from sqlalchemy import BigInteger, ColumnElement, Select, any_, asc, bindparam, case, func, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+from sqlalchemy.orm.session import Session
+
+# Number of standard deviations of the Bernoulli sample size that we add as a margin to avoid a top-up pass
+OVERSAMPLING_STDDEVS = 3
+OVERSAMPLING_MIN_ROWS = 10
+
+
+def is_postgres(storage_backend: AbstractStorageBackend) -> bool:
+    return storage_backend._modyn_config["metadata_database"]["drivername"].startswith("postgresql")
+
+
+def bernoulli_probability(sample_size: int, num_rows: int) -> float:
+    """Returns the probability for a Bernoulli filter such that it returns at least `sample_size` rows w.h.p."""
+    if num_rows <= 0:
+        return 1.0
+    expected_rows = sample_size + OVERSAMPLING_STDDEVS * math.sqrt(sample_size) + OVERSAMPLING_MIN_ROWS
+    return min(1.0, expected_rows / num_rows)
+
+
+def _bernoulli_threshold(probability: float, postgres: bool) -> Any:
+    # PostgreSQL's random() returns a float in [0, 1), SQLite's random() a signed 64 bit integer.
+    # We compare with <= such that a probability of 1 keeps all rows on SQLite.
+    if postgres:
+        return probability
+    return max(min(math.ceil(probability * 2**64) - 2**63 - 1, 2**63 - 1), -(2**63))
+
+
+def _bernoulli_filter(
+    probabilities: dict[Any, float], group_column: Optional[InstrumentedAttribute], postgres: bool
+) -> ColumnElement[bool]:
+    if group_column is None:
+        threshold = _bernoulli_threshold(probabilities[None], postgres)
+    else:
+        # Rows of groups without probability compare to NULL and are hence filtered out
+        threshold = case(
+            {group: _bernoulli_threshold(probability, postgres) for group, probability in probabilities.items()},
+            value=group_column,
+            else_=None,
+        )
+
+    random_value = func.random()  # pylint: disable=not-callable
+    return random_value < threshold if postgres else random_value <= threshold
+
+
+def sample_keys(
+    storage_backend: AbstractStorageBackend,
+    filters: list[ColumnElement[bool]],
+    quotas: dict[Any, int],
+    counts: dict[Any, int],
+    rng: np.random.Generator,
+    group_column: Optional[InstrumentedAttribute] = None,
+    limit: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Draws a uniform random sample (without replacement) of `quotas[group]` rows from every group of the rows matching
+    `filters`. The groups are given by the values of `group_column`, or are a single group `None` if no column is given.
+    `counts` holds the number of rows per group, which is used to derive the probability of the Bernoulli filter.
+    If a group has fewer rows than its quota, all of its rows are returned. The final sample is drawn with `rng`, which
+    is the generator of the selection strategy, such that seeding the selector keeps the sample reproducible.
+
+    Returns:
+        np.ndarray: The sampled keys, ordered by timestamp and truncated to `limit`, if given.
+    """
+    candidates = _draw_candidates(storage_backend, filters, quotas, counts, group_column)
+
+    sampled_keys, sampled_timestamps = [np.empty(0, dtype=np.int64)], [np.empty(0, dtype=np.int64)]
+    for group, (keys, timestamps) in candidates.items():
+        if len(keys) > quotas[group]:
+            indices = rng.choice(len(keys), size=quotas[group], replace=False)
+            keys, timestamps = keys[indices], timestamps[indices]
+        sampled_keys.append(keys)
+        sampled_timestamps.append(timestamps)
+
+    keys = np.concatenate(sampled_keys)
+    keys = keys[np.argsort(np.concatenate(sampled_timestamps), kind="stable")]
+    return keys if limit is None else keys[:limit]
+
+
+def _draw_candidates(
+    storage_backend: AbstractStorageBackend,
+    filters: list[ColumnElement[bool]],
+    quotas: dict[Any, int],
+    counts: dict[Any, int],
+    group_column: Optional[InstrumentedAttribute],
+) -> dict[Any, tuple[np.ndarray, np.ndarray]]:
+    # Returns the keys and timestamps of the Bernoulli samples per group, which hold at least the quota (if possible)
+    # Combined probability with which every row of the group has been drawn so far
+    probabilities = {group: 0.0 for group in quotas}
+    candidates: dict[Any, tuple[np.ndarray, np.ndarray]] = {
+        group: (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)) for group in quotas
+    }
+    pending = {group for group, quota in quotas.items() if quota > 0}
+
+    while len(pending) > 0:
+        pass_probabilities = {}
+        for group in pending:
+            if probabilities[group] == 0.0:
+                target = bernoulli_probability(quotas[group], counts.get(group, 0))
+            else:
+                # Top-up: draw the rows not drawn yet such that the combined probability doubles
+                target = min(1.0, 2 * probabilities[group])
+            pass_probabilities[group] = 1.0 if target >= 1.0 else 1 - (1 - target) / (1 - probabilities[group])
+            probabilities[group] = target
+
+        for group, (keys, timestamps) in _fetch_candidates(
+            storage_backend, filters, pass_probabilities, group_column
+        ).items():
+            all_keys, indices = np.unique(np.concatenate([candidates[group][0], keys]), return_index=True)
+            candidates[group] = (all_keys, np.concatenate([candidates[group][1], timestamps])[indices])
+
+        pending = {
+            group for group in pending if len(candidates[group][0]) < quotas[group] and probabilities[group] < 1.0
+        }
+
+    return candidates
+
+
+def _fetch_candidates(
+    storage_backend: AbstractStorageBackend,
+    filters: list[ColumnElement[bool]],
+    probabilities: dict[Any, float],
+    group_column: Optional[InstrumentedAttribute],
+) -> dict[Any, tuple[np.ndarray, np.ndarray]]:
+    columns = [SelectorStateMetadata.sample_key, SelectorStateMetadata.timestamp]
+    if group_column is not None:
+        columns.append(group_column)
+    stmt = select(*columns).filter(
+        *filters, _bernoulli_filter(probabilities, group_column, is_postgres(storage_backend))
+    )
+
+    def _session_callback(session: Session) -> Any:
+        # Executing on the connection skips the ORM result processing, which dominates for many candidates
+        return session.connection().execute(stmt).fetchall()
+
+    rows = storage_backend._execute_on_session(_session_callback)
+    if group_column is None:
+        return {None: _to_arrays(rows)}
+
+    rows_per_group: dict[Any, list[Any]] = {group: [] for group in probabilities}
+    for row in rows:
+        if row[2] in rows_per_group:
+            rows_per_group[row[2]].append(row)
+    return {group: _to_arrays(group_rows) for group, group_rows in rows_per_group.items()}
+
+
+def _to_arrays(rows: list[Any]) -> tuple[np.ndarray, np.ndarray]:
+    keys = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+    timestamps = np.fromiter((row[1] for row in rows), dtype=np.int64, count=len(rows))
+    return keys, timestamps
+
+
+def keys_filter(storage_backend: AbstractStorageBackend, keys: np.ndarray) -> ColumnElement[bool]:
+    """
+    Returns a filter for the rows with the given keys. On PostgreSQL, the keys are bound as a single array parameter.
+    On other databases, the keys are rendered into the statement, which avoids the limit on the number of parameters.
+    """
+    if is_postgres(storage_backend):
+        return SelectorStateMetadata.sample_key == any_(
+            bindparam("sampled_keys", keys.tolist(), type_=ARRAY(BigInteger))
+        )
+    return SelectorStateMetadata.sample_key.in_(
+        bindparam("sampled_keys", keys.tolist(), expanding=True, literal_execute=True)
+    )
+
+
+def select_sampled_keys(
+    storage_backend: AbstractStorageBackend, filters: list[ColumnElement[bool]], keys: np.ndarray
+) -> Select:
+    """Returns the query selecting the sampled keys ordered by timestamp, as expected from a presampling query."""
+    return (
+        select(SelectorStateMetadata.sample_key)
+        .filter(*filters, keys_filter(storage_backend, keys))
+        .order_by(asc(SelectorStateMetadata.timestamp))
+    )
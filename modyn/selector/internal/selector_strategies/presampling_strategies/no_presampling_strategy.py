@@ -1,7 +1,9 @@
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
+import numpy as np
 from modyn.metadata_database.models import SelectorStateMetadata
 from modyn.selector.internal.selector_strategies.presampling_strategies import AbstractPresamplingStrategy
+from modyn.selector.internal.selector_strategies.stream_sampling import first_keys_of_chunks, order_by_timestamp
 from modyn.selector.internal.storage_backend.abstract_storage_backend import AbstractStorageBackend
 from sqlalchemy import Select, asc, select
 
@@ -21,6 +23,7 @@ class NoPresamplingStrategy(AbstractPresamplingStrategy):
         tail_triggers: Optional[int],
         limit: Optional[int],
         trigger_dataset_size: Optional[int],
+        rng: np.random.Generator,  # pylint: disable=unused-argument
     ) -> Select:
         stmt = (
             select(SelectorStateMetadata.sample_key)
@@ -39,3 +42,12 @@ class NoPresamplingStrategy(AbstractPresamplingStrategy):
             stmt = stmt.limit(limit)
 
         return stmt
+
+    def get_presampled_keys(
+        self,
+        chunks: Iterable[tuple[np.ndarray, np.ndarray]],
+        limit: Optional[int],
+        trigger_dataset_size: int,  # pylint: disable=unused-argument
+        rng: np.random.Generator,  # pylint: disable=unused-argument
+    ) -> Iterator[np.ndarray]:
+        return first_keys_of_chunks(order_by_timestamp(chunks), limit)
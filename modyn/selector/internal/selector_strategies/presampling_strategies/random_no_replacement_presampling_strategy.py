@@ -1,12 +1,17 @@
 from typing import Optional
 
+import numpy as np
 from modyn.metadata_database.models import SelectorStateMetadata
 from modyn.selector.internal.selector_strategies.presampling_strategies.abstract_presampling_strategy import (
     AbstractPresamplingStrategy,
 )
+from modyn.selector.internal.selector_strategies.presampling_strategies.database_sampling import (
+    keys_filter,
+    sample_keys,
+)
 from modyn.selector.internal.storage_backend.abstract_storage_backend import AbstractStorageBackend
 from modyn.selector.internal.storage_backend.database.database_storage_backend import DatabaseStorageBackend
-from sqlalchemy import Select, asc, func, select
+from sqlalchemy import Select, asc, select
 from sqlalchemy.orm.session import Session
 
 
@@ -31,17 +36,18 @@ class RandomNoReplacementPresamplingStrategy(AbstractPresamplingStrategy):
         tail_triggers: Optional[int],
         limit: Optional[int],
         trigger_dataset_size: Optional[int],
+        rng: np.random.Generator,
     ) -> Select:
         assert trigger_dataset_size is not None
         assert trigger_dataset_size >= 0
 
         target_size = self.get_target_size(trigger_dataset_size, limit)
 
-        # get the query to sample up to target size points that have not been used since last_complete_trigger
-        subq = self._get_query_sample_random(next_trigger_id, tail_triggers, target_size)
+        # sample up to target size points that have not been used since last_complete_trigger
+        keys = self._sample_random(next_trigger_id, tail_triggers, target_size, rng)
 
-        # update last_used_in_trigger of the samples selected in the subquery
-        self._update_last_used_in_trigger(next_trigger_id, subq)
+        # update last_used_in_trigger of the sampled points
+        self._update_last_used_in_trigger(next_trigger_id, keys)
 
         # count how many samples are retrieved
         number_of_sampled_points = self._count_number_of_sampled_points(next_trigger_id)
@@ -52,8 +58,8 @@ class RandomNoReplacementPresamplingStrategy(AbstractPresamplingStrategy):
 
             # repeat the above for remaining_points_to_be_sampled. Note that now self.last_complete_trigger is changed,
             # so points that were not sampled before can now be taken
-            subq = self._get_query_sample_random(next_trigger_id, tail_triggers, remaining_points_to_be_sampled)
-            self._update_last_used_in_trigger(next_trigger_id, subq)
+            keys = self._sample_random(next_trigger_id, tail_triggers, remaining_points_to_be_sampled, rng)
+            self._update_last_used_in_trigger(next_trigger_id, keys)
 
         # then the query to select the samples is straightforward, just a filter on last_used_in_trigger
         stmt = (
@@ -67,30 +73,32 @@ class RandomNoReplacementPresamplingStrategy(AbstractPresamplingStrategy):
 
         return stmt
 
-    def _get_query_sample_random(self, next_trigger_id: int, tail_triggers: Optional[int], target_size: int) -> Select:
-        subq = (
-            select(SelectorStateMetadata.sample_key)
-            .filter(
-                SelectorStateMetadata.pipeline_id == self.pipeline_id,
-                (
-                    SelectorStateMetadata.seen_in_trigger_id >= next_trigger_id - tail_triggers
-                    if tail_triggers is not None
-                    else True
-                ),
-                # just consider points that have not been used since the last complete trigger
-                SelectorStateMetadata.last_used_in_trigger < self.last_complete_trigger,
-            )
-            .order_by(func.random())  # pylint: disable=E1102
-            .limit(target_size)
-        )
-        return subq
-
-    def _update_last_used_in_trigger(self, next_trigger_id: int, subq: Select) -> None:
+    def _sample_random(
+        self, next_trigger_id: int, tail_triggers: Optional[int], target_size: int, rng: np.random.Generator
+    ) -> np.ndarray:
+        filters = [
+            SelectorStateMetadata.pipeline_id == self.pipeline_id,
+            (
+                SelectorStateMetadata.seen_in_trigger_id >= next_trigger_id - tail_triggers
+                if tail_triggers is not None
+                else True
+            ),
+            # just consider points that have not been used since the last complete trigger
+            SelectorStateMetadata.last_used_in_trigger < self.last_complete_trigger,
+        ]
+
+        def _session_callback(session: Session) -> int:
+            return session.query(SelectorStateMetadata.sample_key).filter(*filters).count()
+
+        num_candidates = self._storage_backend._execute_on_session(_session_callback)
+        return sample_keys(self._storage_backend, filters, {None: target_size}, {None: num_candidates}, rng)
+
+    def _update_last_used_in_trigger(self, next_trigger_id: int, keys: np.ndarray) -> None:
         def _session_callback(session: Session) -> None:
             session.query(SelectorStateMetadata).filter(
                 SelectorStateMetadata.pipeline_id == self.pipeline_id,
-                SelectorStateMetadata.sample_key.in_(subq),
-            ).update({"last_used_in_trigger": next_trigger_id})
+                keys_filter(self._storage_backend, keys),
+            ).update({"last_used_in_trigger": next_trigger_id}, synchronize_session=False)
             session.commit()
 
         self._storage_backend._execute_on_session(_session_callback)
@@ -1,11 +1,17 @@
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
+import numpy as np
 from modyn.metadata_database.models import SelectorStateMetadata
 from modyn.selector.internal.selector_strategies.presampling_strategies.abstract_presampling_strategy import (
     AbstractPresamplingStrategy,
 )
+from modyn.selector.internal.selector_strategies.presampling_strategies.database_sampling import (
+    sample_keys,
+    select_sampled_keys,
+)
+from modyn.selector.internal.selector_strategies.stream_sampling import order_by_timestamp, sample_keys_and_timestamps
 from modyn.selector.internal.storage_backend.abstract_storage_backend import AbstractStorageBackend
-from sqlalchemy import Select, asc, func, select
+from sqlalchemy import Select
 
 
 class RandomPresamplingStrategy(AbstractPresamplingStrategy):
@@ -21,34 +27,31 @@ class RandomPresamplingStrategy(AbstractPresamplingStrategy):
         tail_triggers: Optional[int],
         limit: Optional[int],
         trigger_dataset_size: Optional[int],
+        rng: np.random.Generator,
     ) -> Select:
-        # TODO(#224) write an efficient query using TABLESAMPLE
         assert trigger_dataset_size is not None
         assert trigger_dataset_size >= 0
 
         target_size = self.get_target_size(trigger_dataset_size, limit)
 
-        subq = (
-            select(SelectorStateMetadata.sample_key)
-            .filter(
-                SelectorStateMetadata.pipeline_id == self.pipeline_id,
-                (
-                    SelectorStateMetadata.seen_in_trigger_id >= next_trigger_id - tail_triggers
-                    if tail_triggers is not None
-                    else True
-                ),
-            )
-            .order_by(func.random())  # pylint: disable=E1102
-            .limit(target_size)
-        )
-
-        stmt = (
-            select(SelectorStateMetadata.sample_key)
-            .filter(
-                SelectorStateMetadata.pipeline_id == self.pipeline_id,
-                SelectorStateMetadata.sample_key.in_(subq),
-            )
-            .order_by(asc(SelectorStateMetadata.timestamp))
-        )
-
-        return stmt
+        filters = [
+            SelectorStateMetadata.pipeline_id == self.pipeline_id,
+            (
+                SelectorStateMetadata.seen_in_trigger_id >= next_trigger_id - tail_triggers
+                if tail_triggers is not None
+                else True
+            ),
+        ]
+        keys = sample_keys(self._storage_backend, filters, {None: target_size}, {None: trigger_dataset_size}, rng)
+
+        return select_sampled_keys(self._storage_backend, filters, keys)
+
+    def get_presampled_keys(
+        self,
+        chunks: Iterable[tuple[np.ndarray, np.ndarray]],
+        limit: Optional[int],
+        trigger_dataset_size: int,
+        rng: np.random.Generator,
+    ) -> Iterator[np.ndarray]:
+        target_size = self.get_target_size(trigger_dataset_size, limit)
+        return order_by_timestamp(sample_keys_and_timestamps(chunks, trigger_dataset_size, target_size, rng))
@@ -1,5 +1,6 @@
 from typing import Optional
 
+import numpy as np
 from modyn.metadata_database.models import SelectorStateMetadata
 from modyn.selector.internal.selector_strategies.presampling_strategies import AbstractBalancedPresamplingStrategy
 from modyn.selector.internal.storage_backend.abstract_storage_backend import AbstractStorageBackend
@@ -20,7 +21,8 @@ class TriggerBalancedPresamplingStrategy(AbstractBalancedPresamplingStrategy):
         tail_triggers: Optional[int],
         limit: Optional[int],
         trigger_dataset_size: Optional[int],
+        rng: np.random.Generator,
     ) -> Select:
         if tail_triggers == 0:
             raise ValueError("You cannot balance across triggers if you use reset_after_trigger")
-        return super().get_presampling_query(next_trigger_id, tail_triggers, limit, trigger_dataset_size)
+        return super().get_presampling_query(next_trigger_id, tail_triggers, limit, trigger_dataset_size, rng)
@@ -0,0 +1,184 @@
+"""
+Memory-bounded limits over the chunks of keys returned by the storage backends.
+
+The keys are streamed twice: the number of keys is known upfront (from the counts of the storage backend), and the
+chunks are then sampled one at a time. For a uniform sample without replacement of `sample_size` out of
+`population_size` keys, the number of keys drawn from a chunk follows a hypergeometric distribution over the
+remaining keys. Drawing this number for every chunk and then a uniform sample of that size from the chunk results in a
+uniform sample over all chunks, while only holding a chunk and a partition of the output in memory.
+The selected keys are regrouped into evenly sized partitions.
+"""
+
+import math
+from typing import Iterable, Iterator, Optional, Union
+
+import numpy as np
+
+# NumPy's hypergeometric sampler requires both populations to be smaller than this. For larger remaining populations,
+# we approximate the hypergeometric distribution with the binomial distribution, which has the same mean.
+MAX_HYPERGEOMETRIC_POPULATION = 10**9
+
+
+def _chunk_sample_size(
+    chunk_size: int, remaining_population: int, remaining_sample_size: int, rng: np.random.Generator
+) -> int:
+    # Number of keys out of a uniform sample of `remaining_sample_size` remaining keys that are part of this chunk
+    if remaining_sample_size == 0:
+        return 0
+    remaining_population = max(remaining_population, chunk_size, remaining_sample_size)
+    other_keys = remaining_population - chunk_size
+    if other_keys == 0:
+        return min(chunk_size, remaining_sample_size)
+
+    if other_keys < MAX_HYPERGEOMETRIC_POPULATION and chunk_size < MAX_HYPERGEOMETRIC_POPULATION:
+        return int(rng.hypergeometric(chunk_size, other_keys, remaining_sample_size))
+
+    num_keys = int(rng.binomial(remaining_sample_size, chunk_size / remaining_population))
+    return max(min(num_keys, chunk_size), remaining_sample_size - other_keys)
+
+
+def sample_chunks(
+    chunks: Iterable[Union[list[int], np.ndarray]],
+    population_size: int,
+    sample_size: int,
+    partition_size: int,
+    rng: np.random.Generator,
+) -> Iterator[np.ndarray]:
+    """
+    Draws a uniform random sample (without replacement) of `sample_size` keys from the chunks, which together hold
+    `population_size` keys. If the chunks hold fewer keys than `sample_size`, all keys are returned.
+
+    Returns:
+        Iterator[np.ndarray]: The sampled keys in evenly sized partitions of at most `partition_size` keys.
+    """
+
+    def _sampled_chunks() -> Iterator[np.ndarray]:
+        remaining_population, remaining_sample_size = population_size, sample_size
+        for chunk in chunks:
+            keys = np.asarray(chunk, dtype=np.int64)
+            num_keys = _chunk_sample_size(len(keys), remaining_population, remaining_sample_size, rng)
+            remaining_population = max(remaining_population - len(keys), 0)
+            remaining_sample_size -= num_keys
+            yield keys if num_keys == len(keys) else rng.choice(keys, size=num_keys, replace=False, shuffle=False)
+
+    return even_partitions(_sampled_chunks(), min(sample_size, population_size), partition_size)
+
+
+def sample_keys_and_timestamps(
+    chunks: Iterable[tuple[np.ndarray, np.ndarray]],
+    population_size: int,
+    sample_size: int,
+    rng: np.random.Generator,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """
+    Like sample_chunks, but for chunks of keys with their timestamps. The sampled keys of a chunk keep their order.
+
+    Returns:
+        Iterator[tuple[np.ndarray, np.ndarray]]: The sampled keys and their timestamps, per chunk.
+    """
+    remaining_population, remaining_sample_size = population_size, sample_size
+    for keys, timestamps in chunks:
+        num_keys = _chunk_sample_size(len(keys), remaining_population, remaining_sample_size, rng)
+        remaining_population = max(remaining_population - len(keys), 0)
+        remaining_sample_size -= num_keys
+        if num_keys == len(keys):
+            yield keys, timestamps
+        elif num_keys > 0:
+            indices = np.sort(rng.choice(len(keys), size=num_keys, replace=False, shuffle=False))
+            yield keys[indices], timestamps[indices]
+
+
+def order_by_timestamp(chunks: Iterable[tuple[np.ndarray, np.ndarray]]) -> Iterator[np.ndarray]:
+    """
+    Orders the keys of the chunks by their timestamps (stable). Consecutive chunks whose timestamp ranges overlap are
+    sorted together. Since the samples of a pipeline arrive mostly in order of their timestamps, only few chunks
+    (typically the chunks of one trigger) have to be held in memory at once. A chunk is never reordered with a group
+    of chunks that has already been returned.
+
+    Returns:
+        Iterator[np.ndarray]: The keys ordered by timestamp, in chunks.
+    """
+    group_keys: list[np.ndarray] = []
+    group_timestamps: list[np.ndarray] = []
+    group_max_timestamp = 0
+
+    def _sorted_group() -> np.ndarray:
+        keys, timestamps = np.concatenate(group_keys), np.concatenate(group_timestamps)
+        return keys[np.argsort(timestamps, kind="stable")]
+
+    for keys, timestamps in chunks:
+        if len(keys) == 0:
+            continue
+        if len(group_keys) > 0 and timestamps.min() >= group_max_timestamp:
+            # All keys of the chunk come after the keys of the group
+            yield _sorted_group()
+            group_keys, group_timestamps = [], []
+
+        chunk_max_timestamp = int(timestamps.max())
+        group_max_timestamp = max(group_max_timestamp, chunk_max_timestamp) if group_keys else chunk_max_timestamp
+        group_keys.append(np.asarray(keys, dtype=np.int64))
+        group_timestamps.append(np.asarray(timestamps))
+
+    if len(group_keys) > 0:
+        yield _sorted_group()
+
+
+def first_keys_of_chunks(chunks: Iterable[np.ndarray], num_keys: Optional[int]) -> Iterator[np.ndarray]:
+    """Selects the first `num_keys` keys (or all keys, if not given) from the chunks."""
+    remaining_keys = num_keys
+    for keys in chunks:
+        if remaining_keys is None:
+            yield keys
+            continue
+        if remaining_keys <= 0:
+            return
+        yield keys[:remaining_keys]
+        remaining_keys -= len(keys)
+
+
+def last_keys_of_chunks(
+    chunks: Iterable[Union[list[int], np.ndarray]], population_size: int, num_keys: int, partition_size: int
+) -> Iterator[np.ndarray]:
+    """
+    Selects the last `num_keys` keys from the chunks, which together hold `population_size` keys.
+
+    Returns:
+        Iterator[np.ndarray]: The selected keys in evenly sized partitions of at most `partition_size` keys.
+    """
+
+    def _selected_chunks() -> Iterator[np.ndarray]:
+        keys_to_skip = max(population_size - num_keys, 0)
+        for chunk in chunks:
+            keys = np.asarray(chunk, dtype=np.int64)
+            yield keys[keys_to_skip:]
+            keys_to_skip = max(keys_to_skip - len(keys), 0)
+
+    return even_partitions(_selected_chunks(), min(num_keys, population_size), partition_size)
+
+
+def even_partitions(chunks: Iterable[np.ndarray], expected_size: int, partition_size: int) -> Iterator[np.ndarray]:
+    """
+    Regroups the chunks into partitions of at most `partition_size` keys. If the chunks hold `expected_size` keys,
+    the partitions are of equal size, except for the last one, which might be smaller.
+    """
+    num_partitions = max(math.ceil(expected_size / partition_size), 1)
+    size = math.ceil(expected_size / num_partitions) if expected_size > 0 else partition_size
+
+    buffer: list[np.ndarray] = []
+    buffered_keys = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        buffered_keys += len(chunk)
+        if buffered_keys < size:
+            continue
+
+        keys = np.concatenate(buffer)
+        num_full_partitions = len(keys) // size
+        for start in range(0, num_full_partitions * size, size):
+            yield keys[start : start + size]
+        # Copy the remaining keys such that the concatenated keys can be released with the yielded partitions
+        buffer = [keys[num_full_partitions * size :].copy()]
+        buffered_keys = len(buffer[0])
+
+    if buffered_keys > 0:
+        yield np.concatenate(buffer)
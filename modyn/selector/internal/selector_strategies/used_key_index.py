@@ -0,0 +1,66 @@
+"""
+In-memory index of the samples of a pipeline that have been used for training.
+
+The FreshnessSamplingStrategy needs the used flag of every sample to count and sample used and unused data. Instead of
+querying (and updating) the flag in the storage backend for every partition, the selector can keep the used keys in
+memory. The keys are held as a sorted NumPy array (8 bytes per used key), such that membership of a whole chunk of keys
+is checked with a single vectorized binary search.
+"""
+
+from typing import Iterable, Union
+
+import numpy as np
+
+
+class UsedKeyIndex:
+    """
+    Set of the used sample keys of a pipeline.
+
+    Keys marked as used during a trigger are buffered and only added to the set on `commit`, which returns the newly
+    used keys such that they can be persisted in a single batch. Hence, the samples drawn during a trigger do not depend
+    on the keys of the trigger that have already been marked.
+    """
+
+    def __init__(self) -> None:
+        self._keys = np.empty(0, dtype=np.int64)
+        self._pending: list[np.ndarray] = []
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def load(self, chunks: Iterable[Union[list[int], np.ndarray]]) -> None:
+        """Replaces the set with the used keys persisted in the storage backend."""
+        self._keys = np.unique(
+            np.concatenate([np.empty(0, dtype=np.int64)] + [np.asarray(chunk, dtype=np.int64) for chunk in chunks])
+        )
+        self._pending = []
+        self.loaded = True
+
+    def contains(self, keys: Union[list[int], np.ndarray]) -> np.ndarray:
+        """Returns a boolean mask stating for each key whether it has been used (not considering pending keys)."""
+        keys = np.asarray(keys, dtype=np.int64)
+        if len(self._keys) == 0:
+            return np.zeros(len(keys), dtype=bool)
+
+        positions = np.minimum(np.searchsorted(self._keys, keys), len(self._keys) - 1)
+        return self._keys[positions] == keys
+
+    def mark(self, keys: Union[list[int], np.ndarray]) -> None:
+        """Marks the keys as used. They are added to the set on the next commit."""
+        if len(keys) > 0:
+            # We copy the keys since partitions might be views on larger arrays that could otherwise be released
+            self._pending.append(np.array(keys, dtype=np.int64))
+
+    def commit(self) -> np.ndarray:
+        """Adds the pending keys to the set and returns the keys that have not been used before (sorted)."""
+        if len(self._pending) == 0:
+            return np.empty(0, dtype=np.int64)
+
+        pending = np.unique(np.concatenate(self._pending))
+        self._pending = []
+        new_keys = pending[~self.contains(pending)]
+        if len(new_keys) > 0:
+            # Both arrays are sorted and disjoint, hence we can merge them with a stable sort
+            self._keys = np.sort(np.concatenate([self._keys, new_keys]), kind="stable")
+        return new_keys
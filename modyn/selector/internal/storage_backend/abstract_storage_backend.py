@@ -44,3 +44,7 @@ class AbstractStorageBackend(ABC):
     @abstractmethod
     def get_all_data(self) -> Iterable[tuple[list[int], dict[str, object]]]:
         raise NotImplementedError()
+
+    @abstractmethod
+    def get_sample_count(self, smallest_included_trigger_id: Optional[int] = None) -> int:
+        raise NotImplementedError()
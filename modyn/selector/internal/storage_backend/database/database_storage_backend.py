@@ -1,17 +1,22 @@
 import logging
-import multiprocessing as mp
 from typing import Any, Callable, Iterable, Optional
 
 from modyn.common.benchmark.stopwatch import Stopwatch
 from modyn.metadata_database.metadata_database_connection import MetadataDatabaseConnection
-from modyn.metadata_database.models import SelectorStateMetadata
+from modyn.metadata_database.models import SelectorStateCount, SelectorStateMetadata
 from modyn.selector.internal.storage_backend import AbstractStorageBackend
-from sqlalchemy import select
+from modyn.selector.internal.storage_backend.database.selector_state_bulk_loader import persist_samples_batched
+from sqlalchemy import func, select
 
 logger = logging.getLogger(__name__)
 
 
 class DatabaseStorageBackend(AbstractStorageBackend):
+    def __init__(self, pipeline_id: int, modyn_config: dict, maximum_keys_in_memory: int):
+        super().__init__(pipeline_id, modyn_config, maximum_keys_in_memory)
+        # Whether we made sure that the counts table covers the selector state of the pipeline
+        self._counts_checked = False
+
     def persist_samples(
         self, seen_in_trigger_id: int, keys: list[int], timestamps: list[int], labels: list[int]
     ) -> dict[str, Any]:
@@ -24,82 +29,28 @@ class DatabaseStorageBackend(AbstractStorageBackend):
         # This is done outside of subprocesses to avoid issues with duplicate table creation
         swt.start("trigger_creation")
         with MetadataDatabaseConnection(self._modyn_config) as database:
+            self._ensure_counts(database)
             database.add_selector_state_metadata_trigger(self._pipeline_id, seen_in_trigger_id)
         log["trigger_creation_time"] = swt.stop()
 
-        if self._disable_mt or (self._is_test and self._is_mac):
-            swt.start("persist_samples_time")
-            DatabaseStorageBackend._persist_samples_impl(
-                keys, timestamps, labels, self._pipeline_id, self._modyn_config, seen_in_trigger_id
-            )
-            log["persist_samples_time"] = swt.stop()
-        else:
-            self._mt_persist_samples_impl(keys, timestamps, labels, seen_in_trigger_id, log)
-
-        return log
-
-    # pylint: disable=too-many-locals
-
-    def _mt_persist_samples_impl(
-        self, keys: list[int], timestamps: list[int], labels: list[int], seen_in_trigger_id: int, log: dict
-    ) -> None:
-        swt = Stopwatch()
-        samples_per_proc = int(len(keys) / self._insertion_threads)
-        processes: list[mp.Process] = []
+        # Samples are inserted by a persistent pool of writer processes, via COPY on PostgreSQL
+        num_writers = 0 if self._disable_mt or (self._is_test and self._is_mac) else self._insertion_threads
         swt.start("persist_samples_time")
-
-        for i in range(self._insertion_threads):
-            start_idx = i * samples_per_proc
-            end_idx = start_idx + samples_per_proc if i < self._insertion_threads - 1 else len(keys)
-            proc_keys = keys[start_idx:end_idx]
-            proc_timestamps = timestamps[start_idx:end_idx]
-            proc_labels = labels[start_idx:end_idx]
-
-            if len(proc_keys) > 0:
-                logger.debug(f"Starting persisting process for {len(proc_keys)} samples.")
-                proc = mp.Process(
-                    target=DatabaseStorageBackend._persist_samples_impl,
-                    args=(
-                        proc_keys,
-                        proc_timestamps,
-                        proc_labels,
-                        self._pipeline_id,
-                        self._modyn_config,
-                        seen_in_trigger_id,
-                    ),
-                )
-                proc.start()
-                processes.append(proc)
-
-        for proc in processes:
-            proc.join()
-
+        log["persist_batches"] = persist_samples_batched(
+            self._modyn_config, self._pipeline_id, seen_in_trigger_id, keys, timestamps, labels, num_writers
+        )
         log["persist_samples_time"] = swt.stop()
 
-    @staticmethod
-    def _persist_samples_impl(
-        keys: list[int],
-        timestamps: list[int],
-        labels: list[int],
-        pipeline_id: int,
-        modyn_config: dict,
-        seen_in_trigger_id: int,
-    ) -> None:
-        with MetadataDatabaseConnection(modyn_config) as database:
-            database.session.bulk_insert_mappings(
-                SelectorStateMetadata,
-                [
-                    {
-                        "pipeline_id": pipeline_id,
-                        "sample_key": key,
-                        "timestamp": timestamp,
-                        "label": label,
-                        "seen_in_trigger_id": seen_in_trigger_id,
-                    }
-                    for key, timestamp, label in zip(keys, timestamps, labels)
-                ],
-            )
-            database.session.commit()
+        return log
+
+    def _ensure_counts(self, database: MetadataDatabaseConnection) -> None:
+        """Backfills the counts table from the selector state once, if the pipeline has samples but no counts."""
+        if self._counts_checked:
+            return
+        if SelectorStateCount.backfill(self._pipeline_id, database.session):
+            logger.info(f"Backfilled the selector state counts of pipeline {self._pipeline_id}.")
+        database.session.commit()
+        self._counts_checked = True
 
     def get_data_since_trigger(
         self, smallest_included_trigger_id: int
@@ -134,13 +85,14 @@ class DatabaseStorageBackend(AbstractStorageBackend):
 
     def get_available_labels(self, next_trigger_id: int, tail_triggers: Optional[int] = None) -> list[int]:
         with MetadataDatabaseConnection(self._modyn_config) as database:
+            self._ensure_counts(database)
             result = (
-                database.session.query(SelectorStateMetadata.label)
+                database.session.query(SelectorStateCount.label)
                 .filter(
-                    SelectorStateMetadata.pipeline_id == self._pipeline_id,
-                    SelectorStateMetadata.seen_in_trigger_id < next_trigger_id,
+                    SelectorStateCount.pipeline_id == self._pipeline_id,
+                    SelectorStateCount.seen_in_trigger_id < next_trigger_id,
                     (
-                        SelectorStateMetadata.seen_in_trigger_id >= next_trigger_id - tail_triggers - 1
+                        SelectorStateCount.seen_in_trigger_id >= next_trigger_id - tail_triggers - 1
                         if tail_triggers is not None
                         else True
                     ),
@@ -152,6 +104,38 @@ class DatabaseStorageBackend(AbstractStorageBackend):
 
         return available_labels
 
+    def get_sample_count(self, smallest_included_trigger_id: Optional[int] = None) -> int:
+        """Returns the number of samples seen since a trigger (or in total, if not given), using the counts table."""
+        return sum(self.get_sample_count_per_group("label", smallest_included_trigger_id).values())
+
+    def get_sample_count_per_group(
+        self, group_by: str, smallest_included_trigger_id: Optional[int] = None
+    ) -> dict[Any, int]:
+        """
+        Returns the number of samples seen since a trigger (or in total, if not given) per value of the `group_by`
+        column ("label" or "seen_in_trigger_id"), ordered by value. The counts are read from the counts table, i.e.,
+        the cost depends on the number of triggers and labels instead of the number of samples.
+        """
+        group_column = getattr(SelectorStateCount, group_by)
+        with MetadataDatabaseConnection(self._modyn_config) as database:
+            self._ensure_counts(database)
+            result = (
+                database.session.query(group_column, func.sum(SelectorStateCount.num_samples))
+                .filter(
+                    SelectorStateCount.pipeline_id == self._pipeline_id,
+                    (
+                        SelectorStateCount.seen_in_trigger_id >= smallest_included_trigger_id
+                        if smallest_included_trigger_id is not None
+                        else True
+                    ),
+                )
+                .group_by(group_column)
+                .order_by(group_column)
+                .all()
+            )
+
+        return {group: int(count) for group, count in result}
+
     def _get_pipeline_data(
         self,
         additional_filter: tuple,
@@ -0,0 +1,178 @@
+import io
+import json
+import logging
+import multiprocessing as mp
+import os
+import struct
+import threading
+from collections import Counter
+from multiprocessing.pool import Pool
+from typing import Any
+
+import numpy as np
+from modyn.common.benchmark.stopwatch import Stopwatch
+from modyn.metadata_database.metadata_database_connection import MetadataDatabaseConnection
+from modyn.metadata_database.models import SelectorStateCount, SelectorStateMetadata
+
+logger = logging.getLogger(__name__)
+
+# Columns in the order in which they are written to COPY. The defaults of `used` and `last_used_in_trigger` are
+# client-side defaults, hence we need to write them explicitly.
+COPY_COLUMNS = ["pipeline_id", "sample_key", "seen_in_trigger_id", "used", "timestamp", "label", "last_used_in_trigger"]
+
+# See https://www.postgresql.org/docs/current/sql-copy.html#id-1.9.3.55.9.4
+PGCOPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+PGCOPY_TRAILER = struct.pack(">h", -1)
+
+# Every tuple consists of the number of fields, followed by the byte length and the value of every field
+PGCOPY_ROW_DTYPE: np.dtype = np.dtype(
+    [("num_fields", ">i2")]
+    + [
+        field
+        for column, column_type in zip(COPY_COLUMNS, [">i4", ">i8", ">i4", "u1", ">i8", ">i4", ">i4"])
+        for field in [(f"{column}_length", ">i4"), (column, column_type)]
+    ]
+)
+
+
+def encode_pgcopy_binary(
+    pipeline_id: int, seen_in_trigger_id: int, keys: list[int], timestamps: list[int], labels: list[int]
+) -> bytes:
+    """Encodes the samples in the binary COPY format of PostgreSQL, with the columns in the order of COPY_COLUMNS."""
+    rows = np.empty(len(keys), dtype=PGCOPY_ROW_DTYPE)
+    rows["num_fields"] = len(COPY_COLUMNS)
+    for column in COPY_COLUMNS:
+        rows[f"{column}_length"] = PGCOPY_ROW_DTYPE[column].itemsize
+
+    rows["pipeline_id"] = pipeline_id
+    rows["sample_key"] = keys
+    rows["seen_in_trigger_id"] = seen_in_trigger_id
+    rows["used"] = False
+    rows["timestamp"] = timestamps
+    rows["label"] = labels
+    rows["last_used_in_trigger"] = -1
+
+    return PGCOPY_HEADER + rows.tobytes() + PGCOPY_TRAILER
+
+
+# The connections of a writer process, by metadata database configuration. Only used for COPY, since SQLite databases
+# might be replaced between inserts (e.g., in tests) and we would keep writing to the old file.
+_writer_connections: dict[str, MetadataDatabaseConnection] = {}
+
+
+def _get_writer_connection(modyn_config: dict) -> MetadataDatabaseConnection:
+    config_key = json.dumps(modyn_config["metadata_database"], sort_keys=True)
+    if config_key not in _writer_connections:
+        database = MetadataDatabaseConnection(modyn_config)
+        database.setup_connection()
+        _writer_connections[config_key] = database
+    return _writer_connections[config_key]
+
+
+def write_batch(
+    modyn_config: dict,
+    pipeline_id: int,
+    seen_in_trigger_id: int,
+    keys: list[int],
+    timestamps: list[int],
+    labels: list[int],
+) -> dict[str, Any]:
+    """
+    Inserts a batch of samples into the selector state. On PostgreSQL, the batch is streamed via binary COPY into the
+    partition of the trigger. On other databases, we fall back to a bulk insert. The counts of the selector state are
+    updated in the same transaction, such that they always match the persisted samples.
+
+    Returns:
+        dict[str, Any]: The log of the batch.
+    """
+    swt = Stopwatch()
+    swt.start("persist_batch")
+
+    if modyn_config["metadata_database"]["drivername"].startswith("postgresql"):
+        database = _get_writer_connection(modyn_config)
+        table = SelectorStateMetadata.trigger_partition_name(pipeline_id, seen_in_trigger_id)
+        data = encode_pgcopy_binary(pipeline_id, seen_in_trigger_id, keys, timestamps, labels)
+        try:
+            cursor = database.session.connection().connection.cursor()
+            cursor.copy_expert(
+                f"COPY {table} ({', '.join(COPY_COLUMNS)}) FROM STDIN WITH (FORMAT binary)", io.BytesIO(data)
+            )
+            SelectorStateCount.add_samples(pipeline_id, seen_in_trigger_id, Counter(labels), database.session)
+            database.session.commit()
+        except Exception:
+            database.session.rollback()
+            raise
+        method = "copy"
+    else:
+        with MetadataDatabaseConnection(modyn_config) as database:
+            database.session.bulk_insert_mappings(
+                SelectorStateMetadata,
+                [
+                    {
+                        "pipeline_id": pipeline_id,
+                        "sample_key": key,
+                        "timestamp": timestamp,
+                        "label": label,
+                        "seen_in_trigger_id": seen_in_trigger_id,
+                    }
+                    for key, timestamp, label in zip(keys, timestamps, labels)
+                ],
+            )
+            SelectorStateCount.add_samples(pipeline_id, seen_in_trigger_id, Counter(labels), database.session)
+            database.session.commit()
+        method = "bulk_insert"
+
+    return {"batch_size": len(keys), "method": method, "persist_batch_time": swt.stop(), "writer": os.getpid()}
+
+
+# One pool per process and number of writers. The writer processes live as long as the process.
+_writer_pools: dict[int, Pool] = {}
+_writer_pools_lock = threading.Lock()
+
+
+def get_writer_pool(num_writers: int) -> Pool:
+    with _writer_pools_lock:
+        if num_writers not in _writer_pools:
+            logger.debug(f"Starting pool of {num_writers} selector state writers.")
+            # pylint: disable-next=consider-using-with
+            _writer_pools[num_writers] = mp.Pool(processes=num_writers)
+        return _writer_pools[num_writers]
+
+
+def persist_samples_batched(
+    modyn_config: dict,
+    pipeline_id: int,
+    seen_in_trigger_id: int,
+    keys: list[int],
+    timestamps: list[int],
+    labels: list[int],
+    num_writers: int,
+    min_batch_size: int = 10000,
+) -> list[dict[str, Any]]:
+    """
+    Inserts the samples using the persistent pool of `num_writers` writer processes, where every writer receives one
+    batch of at least `min_batch_size` samples, since smaller batches are not worth the overhead of a writer.
+    If `num_writers` is 0, the samples are inserted as a single batch by the calling process.
+
+    Returns:
+        list[dict[str, Any]]: The logs of all batches.
+    """
+    if len(keys) == 0:
+        return []
+
+    if num_writers == 0:
+        return [write_batch(modyn_config, pipeline_id, seen_in_trigger_id, keys, timestamps, labels)]
+
+    batch_size = max(-(-len(keys) // num_writers), min_batch_size)
+    batches = [
+        (
+            modyn_config,
+            pipeline_id,
+            seen_in_trigger_id,
+            keys[start : start + batch_size],
+            timestamps[start : start + batch_size],
+            labels[start : start + batch_size],
+        )
+        for start in range(0, len(keys), batch_size)
+    ]
+    return get_writer_pool(num_writers).starmap(write_batch, batches)
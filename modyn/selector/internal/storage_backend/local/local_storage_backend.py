@@ -1,27 +1,257 @@
 import logging
-from typing import Any, Iterable, Optional
+import pathlib
+import tempfile
+from typing import Any, Callable, Iterable, Iterator, Optional
 
+import numpy as np
+from modyn.common.benchmark.stopwatch import Stopwatch
 from modyn.selector.internal.storage_backend import AbstractStorageBackend
 
 logger = logging.getLogger(__name__)
 
+# Columns of a trigger segment. The trigger in which the samples have been seen is implicitly given by the segment.
+COLUMN_DTYPES = {
+    "keys": np.int64,
+    "timestamps": np.int64,
+    "labels": np.int64,
+    "used": np.bool_,
+}
+
+# A filter gets the segment and returns a boolean mask of the samples to return (or None for all samples)
+SegmentFilter = Callable[["TriggerSegment"], Optional[np.ndarray]]
+
+
+class TriggerSegment:
+    """
+    The samples seen during one trigger, stored in NumPy columns. While samples are appended, the columns have
+    spare capacity. A segment can be spilled to memory-mapped files, after which the columns are backed by disk.
+    """
+
+    def __init__(self, trigger_id: int) -> None:
+        self.trigger_id = trigger_id
+        self.size = 0
+        self.spilled = False
+        self._columns: dict[str, np.ndarray] = {name: np.empty(0, dtype=dtype) for name, dtype in COLUMN_DTYPES.items()}
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self._columns[column][: self.size]
+
+    def append(self, keys: list[int], timestamps: list[int], labels: list[int]) -> None:
+        num_samples = len(keys)
+        if self.spilled:
+            # Samples arrived after the segment has been spilled. Load it back into memory.
+            self._columns = {name: np.array(self[name]) for name in COLUMN_DTYPES}
+            self.spilled = False
+
+        required_size = self.size + num_samples
+        if required_size > len(self._columns["keys"]):
+            capacity = max(required_size, 2 * len(self._columns["keys"]))
+            for name, column in self._columns.items():
+                resized = np.empty(capacity, dtype=column.dtype)
+                resized[: self.size] = column[: self.size]
+                self._columns[name] = resized
+
+        new_samples = slice(self.size, required_size)
+        self._columns["keys"][new_samples] = keys
+        self._columns["timestamps"][new_samples] = timestamps
+        self._columns["labels"][new_samples] = labels
+        self._columns["used"][new_samples] = False
+        self.size = required_size
+
+    def spill(self, directory: pathlib.Path) -> None:
+        """Writes the columns to memory-mapped files in `directory` and releases their memory."""
+        if self.spilled or self.size == 0:
+            return
+
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in COLUMN_DTYPES:
+            column = np.lib.format.open_memmap(
+                directory / f"trigger_{self.trigger_id}_{name}.npy",
+                mode="w+",
+                dtype=self._columns[name].dtype,
+                shape=(self.size,),
+            )
+            column[:] = self[name]
+            column.flush()
+            self._columns[name] = column
+        self.spilled = True
+
 
 class LocalStorageBackend(AbstractStorageBackend):
+    """
+    Stores the samples of a pipeline in the memory of the selector, in one columnar segment per trigger.
+    All queries are answered with vectorized filters on the segments instead of database queries. The segments are
+    processed one at a time, such that spilled segments are not loaded into memory all at once.
+    If the segments of previous triggers hold more than `maximum_keys_in_memory` samples, they are spilled to
+    memory-mapped files in the `local_storage_directory` of the selector (by default, in the temporary directory).
+    """
+
+    def __init__(self, pipeline_id: int, modyn_config: dict, maximum_keys_in_memory: int):
+        super().__init__(pipeline_id, modyn_config, maximum_keys_in_memory)
+        self._segments: dict[int, TriggerSegment] = {}
+
+        selector_config = modyn_config["selector"]
+        base_directory = (
+            pathlib.Path(selector_config["local_storage_directory"])
+            if "local_storage_directory" in selector_config
+            else pathlib.Path(tempfile.gettempdir()) / "modyn_local_storage"
+        )
+        self._spill_directory = base_directory / f"pipeline_{pipeline_id}"
+
     def persist_samples(
         self, seen_in_trigger_id: int, keys: list[int], timestamps: list[int], labels: list[int]
     ) -> dict[str, Any]:
-        raise NotImplementedError()
+        assert len(keys) == len(timestamps) and len(keys) == len(labels)
+
+        log = {}
+        swt = Stopwatch()
+
+        swt.start("persist_samples_time")
+        if seen_in_trigger_id not in self._segments:
+            self._segments[seen_in_trigger_id] = TriggerSegment(seen_in_trigger_id)
+        self._segments[seen_in_trigger_id].append(keys, timestamps, labels)
+        log["persist_samples_time"] = swt.stop()
+
+        swt.start("spill_time")
+        log["spilled_triggers"] = self._spill_previous_triggers(seen_in_trigger_id)
+        log["spill_time"] = swt.stop()
+
+        return log
+
+    def _spill_previous_triggers(self, current_trigger_id: int) -> list[int]:
+        # The segment of the current trigger stays in memory, since it is still growing
+        keys_in_memory = sum(segment.size for segment in self._segments.values() if not segment.spilled)
+        spilled_triggers = []
+        for trigger_id in sorted(self._segments):
+            if keys_in_memory <= self._maximum_keys_in_memory or trigger_id >= current_trigger_id:
+                break
+            segment = self._segments[trigger_id]
+            if not segment.spilled:
+                keys_in_memory -= segment.size
+                segment.spill(self._spill_directory)
+                spilled_triggers.append(trigger_id)
+
+        return spilled_triggers
 
     def get_available_labels(self, next_trigger_id: int, tail_triggers: Optional[int] = None) -> list[int]:
-        raise NotImplementedError()
+        labels = [
+            np.unique(segment["labels"])
+            for trigger_id, segment in self._segments.items()
+            if trigger_id < next_trigger_id
+            and (tail_triggers is None or trigger_id >= next_trigger_id - tail_triggers - 1)
+        ]
+        return np.unique(np.concatenate(labels)).tolist() if len(labels) > 0 else []
 
     def get_trigger_data(self, trigger_id: int) -> Iterable[tuple[list[int], dict[str, object]]]:
-        raise NotImplementedError()
+        """Generator to get all samples seen during a certain trigger
+
+        Returns:
+            Iterable[tuple[list[int], dict[str, object]]]:
+                Iterator over a tuple of a list of integers (maximum _maximum_keys_in_memory) and a log dict
+        """
+        yield from self._get_pipeline_data(lambda tid: tid == trigger_id)
 
     def get_data_since_trigger(
         self, smallest_included_trigger_id: int
     ) -> Iterable[tuple[list[int], dict[str, object]]]:
-        raise NotImplementedError()
+        """Generator to get all samples seen since a certain trigger
+
+        Returns:
+            Iterable[tuple[list[int], dict[str, object]]]:
+                Iterator over a tuple of a list of integers (maximum _maximum_keys_in_memory) and a log dict
+        """
+        yield from self._get_pipeline_data(lambda tid: tid >= smallest_included_trigger_id)
 
     def get_all_data(self) -> Iterable[tuple[list[int], dict[str, object]]]:
-        raise NotImplementedError()
+        """Generator to get all samples seen
+
+        Returns:
+            Iterable[tuple[list[int], dict[str, object]]]:
+                Iterator over a tuple of a list of integers (maximum _maximum_keys_in_memory) and a log dict
+        """
+        yield from self._get_pipeline_data(lambda _: True)
+
+    def get_unused_data(self, yield_per: Optional[int] = None) -> Iterable[tuple[list[int], dict[str, object]]]:
+        """Generator to get all samples that have not been marked as used"""
+        yield from self._get_pipeline_data(lambda _: True, lambda segment: ~segment["used"], yield_per)
+
+    def get_used_data(self, yield_per: Optional[int] = None) -> Iterable[tuple[list[int], dict[str, object]]]:
+        """Generator to get all samples that have been marked as used"""
+        yield from self._get_pipeline_data(lambda _: True, lambda segment: segment["used"], yield_per)
+
+    def get_sample_count(self, smallest_included_trigger_id: Optional[int] = None, used: Optional[bool] = None) -> int:
+        """Returns the number of (used/unused, if given) samples seen since a trigger (or in total, if not given)."""
+        return sum(
+            segment.size if used is None else int(np.count_nonzero(segment["used"] == used))
+            for trigger_id, segment in self._segments.items()
+            if smallest_included_trigger_id is None or trigger_id >= smallest_included_trigger_id
+        )
+
+    def get_keys_and_timestamps(
+        self, smallest_included_trigger_id: Optional[int] = None, yield_per: Optional[int] = None
+    ) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """
+        Generator to get the keys and timestamps of all samples seen since a trigger (or in total, if not given).
+        Yields slices of at most `yield_per` samples of one segment, which are views on the (possibly spilled) columns.
+        """
+        yield_per = self._maximum_keys_in_memory if yield_per is None else yield_per
+        for segment in self._sorted_segments():
+            if smallest_included_trigger_id is not None and segment.trigger_id < smallest_included_trigger_id:
+                continue
+            keys, timestamps = segment["keys"], segment["timestamps"]
+            for start in range(0, segment.size, yield_per):
+                yield keys[start : start + yield_per], timestamps[start : start + yield_per]
+
+    def mark_used(self, keys: list[int]) -> None:
+        """Marks all samples with the given keys as used."""
+        if len(keys) == 0:
+            return
+
+        sorted_keys = np.unique(np.asarray(keys, dtype=np.int64))
+        for segment in self._segments.values():
+            segment["used"][np.isin(segment["keys"], sorted_keys, assume_unique=False)] = True
+
+    def _sorted_segments(self) -> list[TriggerSegment]:
+        return [self._segments[trigger_id] for trigger_id in sorted(self._segments)]
+
+    def _get_pipeline_data(
+        self,
+        trigger_filter: Callable[[int], bool],
+        segment_filter: Optional[SegmentFilter] = None,
+        yield_per: Optional[int] = None,
+    ) -> Iterable[tuple[list[int], dict[str, object]]]:
+
+        def _selected_keys() -> Iterator[np.ndarray]:
+            for segment in self._sorted_segments():
+                if not trigger_filter(segment.trigger_id):
+                    continue
+                mask = segment_filter(segment) if segment_filter is not None else None
+                yield segment["keys"] if mask is None else segment["keys"][mask]
+
+        swt = Stopwatch()
+        swt.start("get_data")
+        for keys in self._chunk(_selected_keys(), yield_per):
+            yield keys, {"get_data_time": swt.stop()}
+            swt.start("get_data", overwrite=True)
+
+    def _chunk(self, key_arrays: Iterable[np.ndarray], yield_per: Optional[int]) -> Iterator[list[int]]:
+        # Like the database backend, we yield chunks of `yield_per` keys, independent of the triggers. We only hold
+        # one segment and the remainder of the previous segments (less than `yield_per` keys) at a time.
+        yield_per = self._maximum_keys_in_memory if yield_per is None else yield_per
+        remainder = np.empty(0, dtype=np.int64)
+        for keys in key_arrays:
+            start = 0
+            if len(remainder) > 0:
+                start = yield_per - len(remainder)
+                remainder = np.concatenate([remainder, keys[:start]])
+                if len(remainder) < yield_per:
+                    continue
+                yield remainder.tolist()
+
+            end_of_full_chunks = start + (max(len(keys) - start, 0) // yield_per) * yield_per
+            for chunk_start in range(start, end_of_full_chunks, yield_per):
+                yield keys[chunk_start : chunk_start + yield_per].tolist()
+            remainder = np.array(keys[end_of_full_chunks:], dtype=np.int64)
+
+        if len(remainder) > 0:
+            yield remainder.tolist()
@@ -0,0 +1,199 @@
+import logging
+import threading
+import time
+from multiprocessing import resource_tracker, shared_memory
+from multiprocessing.managers import DictProxy, SyncManager
+from typing import Any, Optional, Sequence, Union
+
+import numpy as np
+from modyn.common.trigger_sample import ArrayWrapper
+from modyn.common.trigger_sample.trigger_sample_storage import TRIGGER_SAMPLE_DTYPE
+
+logger = logging.getLogger(__name__)
+
+# (pipeline_id, trigger_id, partition_id)
+PartitionKey = tuple[int, int, int]
+
+
+class TriggerPartitionCache:
+    """
+    Caches the (key, weight) samples of trigger partitions in shared memory, shared by all selector gRPC processes.
+
+    Every cached partition is stored in its own shared memory segment. The index of cached partitions, their last
+    access and the hit/miss/eviction counters live in a multiprocessing manager, such that all processes see the same
+    cache. If the total number of cached keys exceeds `max_keys`, the least recently used partitions are evicted.
+    Every process maps the segments it reads and closes its mappings once the segments have been evicted.
+    """
+
+    def __init__(self, manager: SyncManager, max_keys: int) -> None:
+        # All processes need to share the resource tracker, otherwise segments are unlinked when a process exits
+        resource_tracker.ensure_running()
+        self._max_keys = max_keys
+        self._lock = manager.Lock()
+        # PartitionKey -> (segment name, number of keys, last access)
+        self._index: DictProxy[PartitionKey, tuple[str, int, float]] = manager.dict()
+        self._counters: DictProxy[str, int] = manager.dict(hits=0, misses=0, evictions=0, cached_keys=0)
+
+        self._init_local_state()
+
+    def _init_local_state(self) -> None:
+        # The mappings are local to a process and shared by its gRPC threads
+        self._segments: dict[str, shared_memory.SharedMemory] = {}
+        self._segments_lock = threading.Lock()
+        self._seen_evictions = 0
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_segments"]
+        del state["_segments_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._init_local_state()
+
+    @property
+    def max_keys(self) -> int:
+        return self._max_keys
+
+    def get(self, pipeline_id: int, trigger_id: int, partition_id: int) -> Optional[np.ndarray]:
+        """
+        Returns a read-only view of the samples of the partition, or None if the partition is not cached.
+        The view stays valid even if the partition is evicted while it is being used.
+        """
+        key = (pipeline_id, trigger_id, partition_id)
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                self._counters["misses"] += 1
+                return None
+
+            shm_name, num_keys, _ = entry
+            self._index[key] = (shm_name, num_keys, time.time())
+            self._counters["hits"] += 1
+            # Attach while holding the lock, since the segment cannot be unlinked in the meantime
+            samples = self._attach(shm_name, num_keys)
+            evictions = self._counters["evictions"]
+
+        self._close_evicted_segments(evictions)
+        return samples
+
+    def put(
+        self,
+        pipeline_id: int,
+        trigger_id: int,
+        partition_id: int,
+        samples: Union[np.ndarray, ArrayWrapper, Sequence[tuple[int, float]]],
+    ) -> bool:
+        """
+        Caches the samples of a partition, evicting the least recently used partitions if necessary.
+
+        Returns:
+            bool: Whether the partition is cached, i.e., False if the partition alone exceeds the cache size.
+        """
+        data = np.asarray(samples.array if isinstance(samples, ArrayWrapper) else samples, dtype=TRIGGER_SAMPLE_DTYPE)
+        if len(data) > self._max_keys:
+            return False
+
+        # Segments cannot be empty
+        shm = shared_memory.SharedMemory(create=True, size=max(data.nbytes, 1))
+        np.ndarray(data.shape, dtype=TRIGGER_SAMPLE_DTYPE, buffer=shm.buf)[:] = data
+        shm_name = shm.name
+        shm.close()
+
+        key = (pipeline_id, trigger_id, partition_id)
+        with self._lock:
+            if key in self._index:
+                # Another process cached the partition in the meantime
+                _unlink_segment(shm_name)
+                return True
+
+            self._evict_lru(self._max_keys - len(data))
+            self._index[key] = (shm_name, len(data), time.time())
+            self._counters["cached_keys"] += len(data)
+
+        return True
+
+    def evict_trigger(self, pipeline_id: int, trigger_id: int) -> int:
+        """Evicts all partitions of the trigger, e.g., after its training has finished. Returns the number of keys."""
+        with self._lock:
+            keys = [key for key in self._index.keys() if key[0] == pipeline_id and key[1] == trigger_id]
+            evicted_keys = sum(self._evict(key) for key in keys)
+            evictions = self._counters["evictions"]
+
+        self._close_evicted_segments(evictions)
+        return evicted_keys
+
+    def clear(self) -> None:
+        """Evicts all partitions and unlinks their segments."""
+        with self._lock:
+            for key in self._index.keys():
+                self._evict(key)
+            evictions = self._counters["evictions"]
+
+        self._close_evicted_segments(evictions)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            stats = self._counters.copy()
+            stats["cached_partitions"] = len(self._index)
+        return stats
+
+    def _evict_lru(self, max_cached_keys: int) -> None:
+        # Needs to be called while holding the lock
+        if self._counters["cached_keys"] <= max_cached_keys:
+            return
+
+        entries = sorted(self._index.items(), key=lambda item: item[1][2])
+        cached_keys = self._counters["cached_keys"]
+        for key, _ in entries:
+            if cached_keys <= max_cached_keys:
+                break
+            cached_keys -= self._evict(key)
+
+    def _evict(self, key: PartitionKey) -> int:
+        # Needs to be called while holding the lock. Processes that have mapped the segment can still read it.
+        shm_name, num_keys, _ = self._index.pop(key)
+        _unlink_segment(shm_name)
+        self._counters["cached_keys"] -= num_keys
+        self._counters["evictions"] += 1
+        return num_keys
+
+    def _attach(self, shm_name: str, num_keys: int) -> np.ndarray:
+        with self._segments_lock:
+            if shm_name not in self._segments:
+                self._segments[shm_name] = shared_memory.SharedMemory(name=shm_name)
+            # In contrast to np.ndarray, np.frombuffer keeps the buffer exported, i.e., the segment cannot be closed
+            samples = np.frombuffer(self._segments[shm_name].buf, dtype=TRIGGER_SAMPLE_DTYPE, count=num_keys)
+        samples.flags.writeable = False
+        return samples
+
+    def _close_evicted_segments(self, evictions: int) -> None:
+        with self._segments_lock:
+            if evictions == self._seen_evictions or len(self._segments) == 0:
+                return
+            self._seen_evictions = evictions
+
+        with self._lock:
+            cached_segments = {entry[0] for entry in self._index.values()}
+
+        with self._segments_lock:
+            for shm_name in [name for name in self._segments if name not in cached_segments]:
+                try:
+                    self._segments[shm_name].close()
+                except BufferError:
+                    # Some samples of this segment are still being sent. We retry after the next eviction.
+                    self._seen_evictions = -1
+                    continue
+                del self._segments[shm_name]
+
+
+def _unlink_segment(shm_name: str) -> None:
+    try:
+        shm = shared_memory.SharedMemory(name=shm_name)
+    except FileNotFoundError:
+        logger.warning(f"Shared memory segment {shm_name} of the trigger partition cache does not exist anymore.")
+        return
+    shm.unlink()
+    shm.close()
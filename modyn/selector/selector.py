@@ -4,11 +4,13 @@ from typing import Any, Dict, Optional, Union
 
 import numpy as np
 from modyn.common.trigger_sample import ArrayWrapper
+from modyn.database.engine_registry import get_connection_stats
 from modyn.metadata_database.metadata_database_connection import MetadataDatabaseConnection
 from modyn.metadata_database.models.triggers import Trigger
 from modyn.selector.internal.selector_strategies import CoresetStrategy
 from modyn.selector.internal.selector_strategies.abstract_selection_strategy import AbstractSelectionStrategy
-from modyn.utils.utils import flatten, get_partition_for_worker
+from modyn.selector.internal.trigger_partition_cache import TriggerPartitionCache
+from modyn.utils.utils import get_partition_for_worker
 
 
 class Selector:
@@ -22,17 +24,15 @@ class Selector:
         pipeline_id: int,
         num_workers: int,
         modyn_config: dict,
-        cache_size: int = 100000,
+        trigger_cache: Optional[TriggerPartitionCache] = None,
     ) -> None:
         self._strategy = strategy
         self._pipeline_id = pipeline_id
         self._num_workers = num_workers
         self._modyn_config = modyn_config
 
-        # TODO(#308): Share partition cache between selector instances
-        self._trigger_cache: Dict[int, list[ArrayWrapper]] = {}
-        self._maximum_keys_in_cache = cache_size
-        self._current_keys_in_cache = 0
+        # The partition cache is shared between the selectors of all pipelines and gRPC processes
+        self._trigger_cache = trigger_cache
 
         self._trigger_size_cache: Dict[int, int] = {}
         self._trigger_partition_cache: Dict[int, int] = {}
@@ -74,14 +74,13 @@ class Selector:
         if worker_id < 0 or worker_id >= self._num_workers:
             raise ValueError(f"Asked for worker id {worker_id}, but only have {self._num_workers} workers!")
 
-        if trigger_id in self._trigger_cache:
-            start_index, worker_subset_size = get_partition_for_worker(
-                worker_id, self._num_workers, len(self._trigger_cache[trigger_id][partition_id])
-            )
-            return np.asanyarray(
-                self._trigger_cache[trigger_id][partition_id][start_index : start_index + worker_subset_size],
-                dtype=[("f0", "<i8"), ("f1", "<f8")],
-            )
+        if self._trigger_cache is not None:
+            cached_samples = self._trigger_cache.get(self._pipeline_id, trigger_id, partition_id)
+            if cached_samples is not None:
+                start_index, worker_subset_size = get_partition_for_worker(
+                    worker_id, self._num_workers, len(cached_samples)
+                )
+                return cached_samples[start_index : start_index + worker_subset_size]
         return self._strategy.get_trigger_partition_keys(trigger_id, partition_id, worker_id, self._num_workers)
 
     def inform_data(self, keys: list[int], timestamps: list[int], labels: list[int]) -> dict[str, Any]:
@@ -102,20 +101,25 @@ class Selector:
 
         assert trigger_id not in self._trigger_size_cache, "Trigger ID already exists, something went wrong."
 
-        if self._current_keys_in_cache + total_keys_in_trigger <= self._maximum_keys_in_cache:
-            # TODO(#178): offer function to delete old triggers from cache, e.g., after a training is done.
-            self._trigger_cache[trigger_id] = [
+        if self._trigger_cache is not None and total_keys_in_trigger <= self._trigger_cache.max_keys:
+            # Older partitions are evicted once the training on them is done or if the cache is full
+            partitions = [
                 self._strategy.get_trigger_partition_keys(trigger_id, partition_id)
                 for partition_id in range(partitions_in_trigger)
             ]
-            self._current_keys_in_cache += total_keys_in_trigger
-            assert total_keys_in_trigger == len(
-                flatten(self._trigger_cache[trigger_id])
+            assert total_keys_in_trigger == sum(
+                len(partition) for partition in partitions
             ), "Inconsistency in DB and Strategy"
-            log["cached"] = True
+            cached_partitions = [
+                self._trigger_cache.put(self._pipeline_id, trigger_id, partition_id, partition)
+                for partition_id, partition in enumerate(partitions)
+            ]
+            log["cached"] = all(cached_partitions)
 
         self._trigger_size_cache[trigger_id] = total_keys_in_trigger
         self._trigger_partition_cache[trigger_id] = partitions_in_trigger
+        # Counters of the database connections of this process, e.g., to detect an undersized connection pool
+        log["connection_stats"] = get_connection_stats()
 
         return trigger_id, log
 
@@ -25,6 +25,8 @@ from modyn.evaluator.internal.grpc.generated.evaluator_pb2_grpc import Evaluator
 from modyn.selector.internal.grpc.generated.selector_pb2 import (
     DataInformRequest,
     DataInformResponse,
+    EvictTriggerRequest,
+    EvictTriggerResponse,
     GetNumberOfSamplesRequest,
     GetStatusBarScaleRequest,
     NumberOfSamplesResponse,
@@ -47,7 +49,10 @@ from modyn.supervisor.internal.evaluation_result_writer import AbstractEvaluatio
 from modyn.supervisor.internal.grpc.enums import IdType, MsgType, PipelineStage
 from modyn.supervisor.internal.grpc.template_msg import id_submsg, pipeline_stage_msg
 from modyn.supervisor.internal.utils import EvaluationStatusReporter, TrainingStatusReporter
-from modyn.trainer_server.internal.grpc.generated.trainer_server_pb2 import CheckpointInfo, Data
+from modyn.trainer_server.internal.grpc.generated.trainer_server_pb2 import (
+    CheckpointInfo,
+    Data,
+)
 from modyn.trainer_server.internal.grpc.generated.trainer_server_pb2 import JsonString as TrainerServerJsonString
 from modyn.trainer_server.internal.grpc.generated.trainer_server_pb2 import (
     PythonString,
@@ -310,6 +315,26 @@ class GRPCHandler:
             )
             parallel_prefetch_requests = 1
 
+        if "shared_prefetching" in pipeline_config["training"]:
+            shared_prefetching = pipeline_config["training"]["shared_prefetching"]
+        else:
+            shared_prefetching = False
+
+        if "async_fetching" in pipeline_config["training"]:
+            async_fetching = pipeline_config["training"]["async_fetching"]
+        else:
+            async_fetching = False
+
+        if "keys_per_storage_request" in pipeline_config["training"]:
+            keys_per_storage_request = pipeline_config["training"]["keys_per_storage_request"]
+        else:
+            keys_per_storage_request = 0
+
+        if "packed_sample_keys" in pipeline_config["training"]:
+            packed_sample_keys = pipeline_config["training"]["packed_sample_keys"]
+        else:
+            packed_sample_keys = False
+
         if "seed" in pipeline_config["training"]:
             seed = pipeline_config["training"]["seed"]
         else:
@@ -320,6 +345,11 @@ class GRPCHandler:
         else:
             tokenizer = None
 
+        if "batched_bytes_parser" in pipeline_config["data"]:
+            batched_bytes_parser = pipeline_config["data"]["batched_bytes_parser"]
+        else:
+            batched_bytes_parser = False
+
         if "transformations" in pipeline_config["data"]:
             transform_list = pipeline_config["data"]["transformations"]
         else:
@@ -367,12 +397,17 @@ class GRPCHandler:
             "checkpoint_info": checkpoint_info,
             "transform_list": transform_list,
             "bytes_parser": PythonString(value=pipeline_config["data"]["bytes_parser_function"]),
+            "batched_bytes_parser": batched_bytes_parser,
             "label_transformer": PythonString(value=label_transformer),
             "lr_scheduler": TrainerServerJsonString(value=json.dumps(lr_scheduler_configs)),
             "grad_scaler_configuration": TrainerServerJsonString(value=json.dumps(grad_scaler_config)),
             "epochs_per_trigger": epochs_per_trigger,
             "num_prefetched_partitions": num_prefetched_partitions,
             "parallel_prefetch_requests": parallel_prefetch_requests,
+            "shared_prefetching": shared_prefetching,
+            "async_fetching": async_fetching,
+            "keys_per_storage_request": keys_per_storage_request,
+            "packed_sample_keys": packed_sample_keys,
             "seed": seed,
             "tokenizer": PythonString(value=tokenizer) if tokenizer is not None else None,
         }
@@ -407,6 +442,14 @@ class GRPCHandler:
 
         return response.status_bar_scale
 
+    def evict_trigger_from_selector_cache(self, pipeline_id: int, trigger_id: int) -> int:
+        assert self.selector is not None
+
+        request = EvictTriggerRequest(pipeline_id=pipeline_id, trigger_id=trigger_id)
+        response: EvictTriggerResponse = self.selector.evict_trigger_from_cache(request)
+
+        return response.evicted_keys
+
     # pylint: disable=too-many-nested-blocks
     def wait_for_training_completion(
         self, training_id: int, pipeline_id: int, trigger_id: int
@@ -5,6 +5,7 @@ import os
 import pathlib
 import sys
 import traceback
+from operator import itemgetter
 from time import sleep
 from typing import Any, Optional
 
@@ -157,7 +158,8 @@ class PipelineExecutor:
         Otherwise, the selector is informed
         """
         logger.info(f"Received {len(new_data)} new data points. Handling batches.")
-        new_data.sort(key=lambda tup: tup[1])
+        # itemgetter avoids a Python call per data point, and timsort is linear for (mostly) sorted replay data
+        new_data.sort(key=itemgetter(1))
         any_training_triggered = False
         new_data_len = len(new_data)
         self._update_pipeline_stage_and_enqueue_msg(
@@ -231,6 +233,9 @@ class PipelineExecutor:
         self.pipeline_log["supervisor"]["triggers"][trigger_id]["total_trainer_time"] = self._sw.stop()
         self.pipeline_log["supervisor"]["triggers"][trigger_id]["trainer_log"] = trainer_log
 
+        # The selector does not need to serve the keys of this trigger anymore
+        self.grpc.evict_trigger_from_selector_cache(self.pipeline_id, trigger_id)
+
         self._update_pipeline_stage_and_enqueue_msg(
             PipelineStage.STORE_TRAINED_MODEL, MsgType.ID, id_submsg(IdType.TRIGGER, trigger_id)
         )
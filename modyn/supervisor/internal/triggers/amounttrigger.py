@@ -1,3 +1,4 @@
+import numpy as np
 from modyn.supervisor.internal.triggers.trigger import Trigger
 
 
@@ -14,12 +15,13 @@ class DataAmountTrigger(Trigger):
 
         super().__init__(trigger_config)
 
-    def inform(self, new_data: list[tuple[int, int, int]]) -> list[int]:
+    # pylint: disable-next=unused-argument
+    def inform_columns(self, keys: np.ndarray, timestamps: np.ndarray, labels: np.ndarray) -> np.ndarray:
         assert self.remaining_data_points < self.data_points_for_trigger, "Inconsistent remaining datapoints"
 
         first_idx = self.data_points_for_trigger - self.remaining_data_points - 1
-        triggering_indices = list(range(first_idx, len(new_data), self.data_points_for_trigger))
+        triggering_indices = np.arange(first_idx, len(keys), self.data_points_for_trigger, dtype=np.int64)
 
-        self.remaining_data_points = (self.remaining_data_points + len(new_data)) % self.data_points_for_trigger
+        self.remaining_data_points = (self.remaining_data_points + len(keys)) % self.data_points_for_trigger
 
         return triggering_indices
@@ -1,5 +1,6 @@
 from typing import Optional
 
+import numpy as np
 from modyn.supervisor.internal.triggers.trigger import Trigger
 from modyn.utils import convert_timestr_to_seconds, validate_timestr
 
@@ -25,28 +26,29 @@ class TimeTrigger(Trigger):
 
         super().__init__(trigger_config)
 
-    def inform(self, new_data: list[tuple[int, int, int]]) -> list[int]:
+    # pylint: disable-next=unused-argument
+    def inform_columns(self, keys: np.ndarray, timestamps: np.ndarray, labels: np.ndarray) -> np.ndarray:
+        if len(timestamps) == 0:
+            return np.empty(0, dtype=np.int64)
+
         if self.next_trigger_at is None:
-            if len(new_data) > 0:
-                self.next_trigger_at = new_data[0][1] + self.trigger_every_s  # new_data is sorted
-            else:
-                return []
-
-        max_timestamp = new_data[-1][1]  # new_data is sorted
-        triggering_indices = []
-
-        while self.next_trigger_at <= max_timestamp:
-            # The next line gets the first item which has a timestamp larger or equal to the triggering timestamp
-            idx = next(idx for (idx, (_, timestamp, _)) in enumerate(new_data) if timestamp >= self.next_trigger_at)
-            # This index `idx` describes the first item not belonging to the trigger.
-            # Hence, the previous item causes a trigger.
-            # If this is the first item, then we need to emit a trigger for index -1.
-            # This means that there was a trigger before the first item that we got informed about
-            # However, there might have been multiple triggers, e.g., if there is one trigger every second
-            # and 5 seconds have passed since the last item came through
-            # This is caught by our while loop which increases step by step for `trigger_every_s`.
-
-            triggering_indices.append(idx - 1)
-            self.next_trigger_at += self.trigger_every_s
-
-        return triggering_indices
+            self.next_trigger_at = int(timestamps[0]) + self.trigger_every_s  # timestamps are sorted
+
+        max_timestamp = int(timestamps[-1])  # timestamps are sorted
+        if self.next_trigger_at > max_timestamp:
+            return np.empty(0, dtype=np.int64)
+
+        # All trigger timestamps up to (and including) the largest timestamp we have seen
+        num_triggers = (max_timestamp - self.next_trigger_at) // self.trigger_every_s + 1
+        trigger_timestamps = self.next_trigger_at + self.trigger_every_s * np.arange(num_triggers, dtype=np.int64)
+        self.next_trigger_at += num_triggers * self.trigger_every_s
+
+        # For every trigger timestamp, searchsorted gets the index of the first item which has a timestamp larger or
+        # equal to the triggering timestamp. This item is the first item not belonging to the trigger.
+        # Hence, the previous item causes a trigger.
+        # If this is the first item, then we need to emit a trigger for index -1.
+        # This means that there was a trigger before the first item that we got informed about
+        # However, there might have been multiple triggers, e.g., if there is one trigger every second
+        # and 5 seconds have passed since the last item came through. Then, we emit index -1 multiple times.
+        triggering_indices = np.asarray(np.searchsorted(timestamps, trigger_timestamps, side="left"), dtype=np.int64)
+        return triggering_indices - 1
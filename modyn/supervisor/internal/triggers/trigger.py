@@ -1,16 +1,18 @@
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 
 class Trigger(ABC):
     def __init__(self, trigger_config: dict) -> None:
         assert trigger_config is not None, "trigger_config cannot be None."
 
-    @abstractmethod
     def inform(self, new_data: list[tuple[int, int, int]]) -> list[int]:
         """The supervisor informs the trigger about new data.
         In case the concrete trigger implementation decides to trigger, we return a list of _indices into new_data_.
         This list contains the indices of all data points that cause a trigger.
         The list might be empty or only contain a single element, which concrete triggers need to respect.
+        This converts the data into columns and calls `inform_columns`.
 
              Parameters:
                      new_data (list[tuple[str, int, int]]): List of new data (keys, timestamps, labels). Can be empty.
@@ -18,3 +20,18 @@ class Trigger(ABC):
              Returns:
                      triggering_indices (list[int]): List of all indices that trigger training
         """
+        columns = np.array(new_data, dtype=np.int64).reshape(len(new_data), 3)
+        return self.inform_columns(columns[:, 0], columns[:, 1], columns[:, 2]).tolist()
+
+    @abstractmethod
+    def inform_columns(self, keys: np.ndarray, timestamps: np.ndarray, labels: np.ndarray) -> np.ndarray:
+        """Columnar version of `inform`. The i-th data point consists of keys[i], timestamps[i] and labels[i].
+
+        Parameters:
+                keys (np.ndarray): Keys of the new data. Can be empty.
+                timestamps (np.ndarray): Timestamps of the new data, sorted in ascending order.
+                labels (np.ndarray): Labels of the new data.
+
+        Returns:
+                triggering_indices (np.ndarray): Array (int64) of all indices that trigger training
+        """
@@ -0,0 +1,54 @@
+import io
+import logging
+import pathlib
+import tempfile
+
+from modyn.common.grpc import checksummed_chunks, download_streamed_model, read_chunks, write_checksummed_chunks
+from modyn.utils import calculate_checksum
+
+logger = logging.getLogger(__name__)
+
+
+def test_read_chunks():
+    assert list(read_chunks(io.BytesIO(b"0123456789"), 4)) == [b"0123", b"4567", b"89"]
+    assert not list(read_chunks(io.BytesIO(b""), 4))
+
+
+def test_checksummed_chunks():
+    with tempfile.TemporaryDirectory() as tempdir:
+        model_path = pathlib.Path(tempdir) / "model.modyn"
+        model_path.write_bytes(bytes(range(256)) * 100)
+
+        with open(model_path, "rb") as model_file:
+            chunks = list(checksummed_chunks(read_chunks(model_file, 1000)))
+
+        assert len(chunks) == 27
+        assert all(checksum == b"" for _, checksum in chunks[:-1])
+        assert b"".join(chunk for chunk, _ in chunks) == model_path.read_bytes()
+        assert chunks[-1] == (b"", calculate_checksum(model_path))
+
+
+def test_write_checksummed_chunks():
+    chunks = list(checksummed_chunks([b"our", b"test", b"model"]))
+
+    buffer = io.BytesIO()
+    assert write_checksummed_chunks(chunks, buffer)
+    assert buffer.getvalue() == b"ourtestmodel"
+
+    chunks[1] = (b"tset", b"")
+    assert not write_checksummed_chunks(chunks, io.BytesIO())
+    assert not write_checksummed_chunks(chunks[:-1], io.BytesIO())
+
+
+def test_download_streamed_model():
+    with tempfile.TemporaryDirectory() as tempdir:
+        base_directory = pathlib.Path(tempdir)
+        chunks = list(checksummed_chunks([b"our", b"test", b"model"]))
+
+        model_path = download_streamed_model(logger, chunks, 5, base_directory)
+        assert model_path == base_directory / "trained_model_5.modyn"
+        assert model_path.read_bytes() == b"ourtestmodel"
+
+        chunks[0] = (b"out", b"")
+        assert download_streamed_model(logger, chunks, 6, base_directory) is None
+        assert not (base_directory / "trained_model_6.modyn").exists()
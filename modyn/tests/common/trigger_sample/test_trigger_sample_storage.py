@@ -5,7 +5,11 @@ from pathlib import Path
 
 import numpy as np
 import pytest
-from modyn.common.trigger_sample.trigger_sample_storage import TriggerSampleStorage
+from modyn.common.trigger_sample.trigger_sample_storage import (
+    TRIGGER_SAMPLE_DTYPE,
+    TriggerSampleStorage,
+    keys_to_trigger_samples,
+)
 
 TMP_DIR = tempfile.mkdtemp()
 
@@ -226,3 +230,37 @@ def test_init_directory():
     _ = TriggerSampleStorage(TMP_DIR)
 
     assert os.path.exists(TMP_DIR)
+
+
+def test_get_trigger_samples_memory_mapped():
+    samples = np.array([(i, float(i)) for i in range(10)], dtype=np.dtype("i8,f8"))
+    TriggerSampleStorage(TMP_DIR).save_trigger_samples(1, 2, 3, samples, [6, 0, 4])
+
+    # Worker ranges within a single file are views of the mapped file
+    result = TriggerSampleStorage(TMP_DIR).get_trigger_samples(1, 2, 3, 0, 2, 10)
+    assert isinstance(result.array.base, np.memmap) or isinstance(result.array, np.memmap)
+    assert not result.array.flags.writeable
+    assert (result == samples[0:5]).all()
+
+    # Ranges spanning multiple files (including an empty one) are concatenated
+    result = TriggerSampleStorage(TMP_DIR).get_trigger_samples(1, 2, 3, 1, 2, 10)
+    assert (result == samples[5:10]).all()
+
+    result = TriggerSampleStorage(TMP_DIR).get_trigger_samples(1, 2, 3)
+    assert len(result) == 10
+    assert (result == samples).all()
+
+    assert len(TriggerSampleStorage(TMP_DIR).parse_file(Path(TMP_DIR) / "1_2_3_1.npy")) == 0
+    parsed = TriggerSampleStorage(TMP_DIR).parse_file(Path(TMP_DIR) / "1_2_3_2.npy")
+    assert (parsed == samples[6:10]).all()
+
+
+def test_keys_to_trigger_samples():
+    samples = keys_to_trigger_samples([3, 1, 2])
+    assert samples.dtype == TRIGGER_SAMPLE_DTYPE
+    assert samples.tolist() == [(3, 1.0), (1, 1.0), (2, 1.0)]
+
+    samples = keys_to_trigger_samples(np.array([5], dtype=np.int64), 0.5)
+    assert samples.tolist() == [(5, 0.5)]
+
+    assert len(keys_to_trigger_samples([])) == 0
@@ -0,0 +1,115 @@
+import multiprocessing as mp
+import os
+import pathlib
+import tempfile
+
+import pytest
+from modyn.database.engine_registry import (
+    CountingQueuePool,
+    dispose_engines,
+    get_connection_stats,
+    get_engine,
+    is_in_memory,
+)
+from sqlalchemy import exc, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.url import URL
+from sqlalchemy.pool import NullPool
+
+
+def get_sqlite_url(path: pathlib.Path) -> URL:
+    return URL.create(drivername="sqlite", database=str(path))
+
+
+def test_get_engine_reuses_engines():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        url = get_sqlite_url(pathlib.Path(tmpdir) / "test.db")
+        engines_created = get_connection_stats()["engines_created"]
+
+        engine = get_engine(url)
+        assert get_engine(url) is engine
+        assert get_engine(url, database_config={"drivername": "sqlite", "hash_partition_modulus": 4}) is engine
+        assert get_engine(url, database_config={"query_cache_size": 10}) is not engine
+        assert get_engine(get_sqlite_url(pathlib.Path(tmpdir) / "other.db")) is not engine
+        assert get_connection_stats()["engines_created"] == engines_created + 3
+
+        # SQLite connections are not kept open
+        assert isinstance(engine.pool, NullPool)
+        dispose_engines()
+        assert get_engine(url) is not engine
+        dispose_engines()
+
+
+def test_connection_stats():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = get_engine(get_sqlite_url(pathlib.Path(tmpdir) / "test.db"))
+        stats = get_connection_stats()
+
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+        new_stats = get_connection_stats()
+        assert new_stats["connections_opened"] == stats["connections_opened"] + 2
+        assert new_stats["connection_checkouts"] == stats["connection_checkouts"] + 2
+        dispose_engines()
+
+
+def test_counting_queue_pool():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = pathlib.Path(tmpdir) / "test.db"
+        engine = get_engine(get_sqlite_url(path))
+        pool = CountingQueuePool(
+            lambda: engine.raw_connection().driver_connection, pool_size=1, max_overflow=0, timeout=0.01
+        )
+        pool_waits = get_connection_stats()["pool_waits"]
+
+        connection = pool.connect()
+        connection.close()
+        connection = pool.connect()
+        connection.close()
+        assert get_connection_stats()["pool_waits"] == pool_waits
+
+        # The pool is exhausted, hence the checkout waits until it times out
+        connection = pool.connect()
+        with pytest.raises(exc.TimeoutError):
+            pool.connect()
+        connection.close()
+
+        assert get_connection_stats()["pool_waits"] == pool_waits + 1
+        assert get_connection_stats()["pool_wait_time"] > 0
+        pool.dispose()
+        dispose_engines()
+
+
+def _get_engine_in_child(url: URL, parent_engine: Engine, queue: mp.Queue) -> None:
+    # With fork, the arguments are not pickled, hence this is the engine of the parent
+    queue.put((get_engine(url) is not parent_engine, get_connection_stats()["engines_created"]))
+
+
+def test_fork_creates_new_engines():
+    if not hasattr(os, "fork"):
+        return
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        url = get_sqlite_url(pathlib.Path(tmpdir) / "test.db")
+        engine = get_engine(url)
+
+        queue: mp.Queue = mp.get_context("fork").Queue()
+        process = mp.get_context("fork").Process(target=_get_engine_in_child, args=(url, engine, queue))
+        process.start()
+        new_engine, engines_created = queue.get(timeout=30)
+        process.join()
+
+        assert new_engine
+        assert engines_created == 1
+        assert get_engine(url) is engine
+        dispose_engines()
+
+
+def test_is_in_memory():
+    assert is_in_memory(URL.create(drivername="sqlite", database=":memory:"))
+    assert is_in_memory(URL.create(drivername="sqlite"))
+    assert not is_in_memory(URL.create(drivername="sqlite", database="test.db"))
+    assert not is_in_memory(URL.create(drivername="postgresql", database=":memory:"))
@@ -6,6 +6,7 @@ import pathlib
 import platform
 import tempfile
 from time import sleep
+from typing import Iterator
 from unittest import mock
 from unittest.mock import MagicMock, patch
 
@@ -25,7 +26,11 @@ from modyn.evaluator.internal.metrics import Accuracy, F1Score
 from modyn.evaluator.internal.utils import EvaluationInfo, EvaluationProcessInfo, EvaluatorMessages
 from modyn.metadata_database.metadata_database_connection import MetadataDatabaseConnection
 from modyn.metadata_database.utils import ModelStorageStrategyConfig
-from modyn.model_storage.internal.grpc.generated.model_storage_pb2 import FetchModelRequest, FetchModelResponse
+from modyn.model_storage.internal.grpc.generated.model_storage_pb2 import (
+    FetchModelChunk,
+    FetchModelRequest,
+    FetchModelResponse,
+)
 from modyn.storage.internal.grpc.generated.storage_pb2 import GetDatasetSizeRequest, GetDatasetSizeResponse
 
 DATABASE = pathlib.Path(os.path.abspath(__file__)).parent / "test_evaluator.database"
@@ -84,6 +89,14 @@ class DummyModelStorageStub:
             return FetchModelResponse(success=True, model_path="trained_model.modyn", checksum=bytes(5))
         return FetchModelResponse(success=False)
 
+    # pylint: disable-next=invalid-name
+    def FetchModelStream(self, request: FetchModelRequest) -> Iterator[FetchModelChunk]:
+        if request.model_id == 1:
+            yield FetchModelChunk(success=True, chunk=b"trained_model")
+            yield FetchModelChunk(success=True, checksum=bytes(5))
+        else:
+            yield FetchModelChunk(success=False)
+
 
 class DummyStorageStub:
     # pylint: disable-next=invalid-name
@@ -212,7 +225,7 @@ def test_evaluate_model_invalid(test_connect_to_model_storage, test_connect_to_s
 
 
 @patch(
-    "modyn.evaluator.internal.grpc.evaluator_grpc_servicer.download_trained_model",
+    "modyn.evaluator.internal.grpc.evaluator_grpc_servicer.download_streamed_model",
     return_value=pathlib.Path("downloaded_model.modyn"),
 )
 @patch.object(EvaluatorGRPCServicer, "connect_to_storage", return_value=DummyStorageStub())
@@ -234,11 +247,11 @@ def test_evaluate_model_valid(
 
             download_model_mock.assert_called_once()
             kwargs = download_model_mock.call_args.kwargs
-            remote_file_path = kwargs["remote_path"]
+            chunks = list(kwargs["chunks"])
             base_directory = kwargs["base_directory"]
             identifier = kwargs["identifier"]
 
-            assert str(remote_file_path) == "trained_model.modyn"
+            assert chunks == [(b"trained_model", b""), (b"", bytes(5))]
             assert base_directory == evaluator._base_dir
             assert identifier == 0
             assert resp.evaluation_started
@@ -0,0 +1,76 @@
+# pylint: disable=redefined-outer-name
+import pytest
+from modyn.metadata_database.models import SelectorStateCount, SelectorStateMetadata
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture(autouse=True)
+def session():
+    engine = create_engine("sqlite:///:memory:", echo=True)
+    sess = sessionmaker(bind=engine)()
+
+    SelectorStateCount.metadata.create_all(engine)
+
+    yield sess
+
+    sess.close()
+    engine.dispose()
+
+
+def get_counts(session, pipeline_id):
+    return sorted(
+        session.query(SelectorStateCount.seen_in_trigger_id, SelectorStateCount.label, SelectorStateCount.num_samples)
+        .filter(SelectorStateCount.pipeline_id == pipeline_id)
+        .all()
+    )
+
+
+def test_add_samples(session):
+    SelectorStateCount.add_samples(1, 0, {10: 5, 11: 2}, session)
+    session.commit()
+    assert get_counts(session, 1) == [(0, 10, 5), (0, 11, 2)]
+
+    # Existing counts are incremented
+    SelectorStateCount.add_samples(1, 0, {11: 3, 12: 1}, session)
+    SelectorStateCount.add_samples(1, 1, {10: 4}, session)
+    SelectorStateCount.add_samples(2, 0, {10: 1}, session)
+    session.commit()
+    assert get_counts(session, 1) == [(0, 10, 5), (0, 11, 5), (0, 12, 1), (1, 10, 4)]
+    assert get_counts(session, 2) == [(0, 10, 1)]
+
+
+def test_add_no_samples(session):
+    SelectorStateCount.add_samples(1, 0, {}, session)
+    session.commit()
+    assert get_counts(session, 1) == []
+
+
+def test_add_samples_without_label(session):
+    with pytest.raises(ValueError):
+        SelectorStateCount.add_samples(1, 0, {10: 5, None: 2}, session)
+    session.rollback()
+    assert get_counts(session, 1) == []
+
+
+def test_backfill(session):
+    session.add_all(
+        [
+            SelectorStateMetadata(pipeline_id=1, sample_key=key, seen_in_trigger_id=trigger, timestamp=key, label=label)
+            for key, trigger, label in [(0, 0, 10), (1, 0, 10), (2, 0, 11), (3, 1, 10), (4, 0, 10)]
+        ]
+        + [SelectorStateMetadata(pipeline_id=2, sample_key=0, seen_in_trigger_id=0, timestamp=0, label=10)]
+    )
+    session.commit()
+
+    assert SelectorStateCount.backfill(1, session)
+    session.commit()
+    assert get_counts(session, 1) == [(0, 10, 3), (0, 11, 1), (1, 10, 1)]
+    assert get_counts(session, 2) == []
+
+    # Existing counts are not counted again
+    assert not SelectorStateCount.backfill(1, session)
+    assert not SelectorStateCount.backfill(3, session)
+    session.commit()
+    assert get_counts(session, 1) == [(0, 10, 3), (0, 11, 1), (1, 10, 1)]
+    assert get_counts(session, 3) == []
@@ -1,10 +1,12 @@
 # pylint: disable=unused-argument
+import io
 import pathlib
 import shutil
 import tempfile
 from unittest.mock import MagicMock, patch
 
 import torch
+from modyn.common.grpc.model_streaming import checksummed_chunks, read_chunks
 from modyn.model_storage.internal import ModelStorageManager
 
 # pylint: disable-next=no-name-in-module
@@ -13,6 +15,7 @@ from modyn.model_storage.internal.grpc.generated.model_storage_pb2 import (
     DeleteModelResponse,
     FetchModelRequest,
     FetchModelResponse,
+    RegisterModelChunk,
     RegisterModelRequest,
     RegisterModelResponse,
 )
@@ -107,6 +110,55 @@ def test_register_model_invalid(
     store_model_mock.assert_not_called()
 
 
+def get_register_model_chunks(model: bytes, chunk_size: int) -> list[RegisterModelChunk]:
+    return [
+        RegisterModelChunk(pipeline_id=1, trigger_id=10, chunk=chunk, checksum=checksum)
+        for chunk, checksum in checksummed_chunks(read_chunks(io.BytesIO(model), chunk_size))
+    ]
+
+
+@patch.object(ModelStorageManager, "__init__", return_value=None)
+@patch.object(ModelStorageManager, "store_model")
+def test_register_model_stream(store_model_mock: MagicMock, init_manager_mock):
+    stored_models = []
+
+    def store_model(pipeline_id: int, trigger_id: int, checkpoint: io.BytesIO) -> int:
+        stored_models.append((pipeline_id, trigger_id, checkpoint.read()))
+        return 15
+
+    store_model_mock.side_effect = store_model
+
+    with tempfile.TemporaryDirectory() as storage_dir:
+        storage_path = pathlib.Path(storage_dir)
+        servicer = ModelStorageGRPCServicer(get_modyn_config(), storage_path, storage_path)
+
+        resp: RegisterModelResponse = servicer.RegisterModelStream(
+            iter(get_register_model_chunks(b"Our test model", chunk_size=4)), None
+        )
+
+        assert resp.success
+        assert resp.model_id == 15
+        assert stored_models == [(1, 10, b"Our test model")]
+        # the model is not written to the ftp directory
+        assert not list(storage_path.iterdir())
+
+
+@patch.object(ModelStorageManager, "__init__", return_value=None)
+@patch.object(ModelStorageManager, "store_model")
+def test_register_model_stream_invalid(store_model_mock: MagicMock, init_manager_mock):
+    servicer = ModelStorageGRPCServicer(get_modyn_config(), pathlib.Path("storage_dir"), pathlib.Path("ftp_dir"))
+
+    chunks = get_register_model_chunks(b"Our test model", chunk_size=4)
+    chunks[0].chunk = b"Out "
+    resp: RegisterModelResponse = servicer.RegisterModelStream(iter(chunks), None)
+    assert not resp.success
+
+    resp = servicer.RegisterModelStream(iter([]), None)
+    assert not resp.success
+
+    store_model_mock.assert_not_called()
+
+
 @patch("modyn.model_storage.internal.grpc.model_storage_grpc_servicer.current_time_millis", return_value=100)
 @patch.object(ModelStorageManager, "__init__", return_value=None)
 @patch.object(ModelStorageManager, "load_model", return_value={"model": {"conv_1": 1}, "metadata": True})
@@ -151,6 +203,35 @@ def test_fetch_model_invalid(load_model_mock: MagicMock, init_manager_mock):
         assert not resp.success
 
 
+@patch.object(ModelStorageManager, "__init__", return_value=None)
+@patch.object(ModelStorageManager, "load_model", return_value={"model": {"conv_1": 1}, "metadata": True})
+def test_fetch_model_stream(load_model_mock: MagicMock, init_manager_mock):
+    with tempfile.TemporaryDirectory() as storage_dir:
+        storage_path = pathlib.Path(storage_dir)
+        servicer = ModelStorageGRPCServicer(get_modyn_config(), storage_path, storage_path)
+
+        chunks = list(servicer.FetchModelStream(FetchModelRequest(model_id=10, load_metadata=True), None))
+        load_model_mock.assert_called_once_with(10, True)
+
+        assert all(chunk.success for chunk in chunks)
+        assert all(not chunk.checksum for chunk in chunks[:-1])
+        model = b"".join(chunk.chunk for chunk in chunks)
+        assert chunks[-1].checksum == list(checksummed_chunks([model]))[-1][1]
+        assert torch.load(io.BytesIO(model)) == {"model": {"conv_1": 1}, "metadata": True}
+        # the model is not written to the ftp directory
+        assert not list(storage_path.iterdir())
+
+
+@patch.object(ModelStorageManager, "__init__", return_value=None)
+@patch.object(ModelStorageManager, "load_model", return_value=None)
+def test_fetch_model_stream_invalid(load_model_mock: MagicMock, init_manager_mock):
+    servicer = ModelStorageGRPCServicer(get_modyn_config(), pathlib.Path("storage_dir"), pathlib.Path("ftp_dir"))
+
+    chunks = list(servicer.FetchModelStream(FetchModelRequest(model_id=101, load_metadata=False), None))
+    assert len(chunks) == 1
+    assert not chunks[0].success
+
+
 @patch.object(ModelStorageManager, "__init__", return_value=None)
 @patch.object(ModelStorageManager, "delete_model", return_value=True)
 def test_delete_model(delete_model_mock: MagicMock, init_manager_mock):
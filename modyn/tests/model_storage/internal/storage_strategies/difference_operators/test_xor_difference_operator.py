@@ -1,3 +1,4 @@
+import pytest
 import torch
 from modyn.model_storage.internal.storage_strategies import AbstractDifferenceOperator
 from modyn.model_storage.internal.storage_strategies.difference_operators import XorDifferenceOperator
@@ -24,3 +25,34 @@ def test_calculate_restore():
 
     assert difference_operator.restore(ones, b"\x00\x00\x00\x00").item() == 1
     assert difference_operator.restore(ones, b"\x03\x00\x00\x00").item() == 2
+
+
+@pytest.mark.parametrize("dtype", [torch.float32, torch.float16, torch.bfloat16, torch.int64, torch.uint8])
+def test_calculate_and_restore(dtype: torch.dtype):
+    generator = torch.Generator().manual_seed(42)
+    tensor_prev = (torch.rand(7, 5, generator=generator) * 100).to(dtype)
+    tensor = (torch.rand(7, 5, generator=generator) * 100).to(dtype)
+
+    difference = XorDifferenceOperator.calculate_difference(tensor, tensor_prev)
+    bytes_curr = tensor.view(torch.uint8).numpy().tobytes()
+    bytes_prev = tensor_prev.view(torch.uint8).numpy().tobytes()
+    assert difference == bytes(a ^ b for (a, b) in zip(bytes_curr, bytes_prev))
+
+    restored = XorDifferenceOperator.restore(tensor_prev, difference)
+    assert restored.dtype == dtype
+    assert restored.shape == tensor.shape
+    assert torch.equal(restored, tensor)
+
+
+def test_restore_scalar_and_non_contiguous():
+    scalar = torch.tensor(5, dtype=torch.int64)
+    restored = XorDifferenceOperator.restore(scalar, XorDifferenceOperator.calculate_difference(scalar * 3, scalar))
+    assert restored.shape == torch.Size([])
+    assert restored.item() == 15
+
+    tensor_prev = torch.arange(12, dtype=torch.float32).reshape(3, 4).t()
+    tensor = tensor_prev * 2
+    restored = XorDifferenceOperator.restore(
+        tensor_prev, XorDifferenceOperator.calculate_difference(tensor, tensor_prev)
+    )
+    assert torch.equal(restored, tensor)
@@ -42,3 +42,22 @@ def test_load_model():
         state_dict = full_model_strategy.load_model(model.state_dict(), temp_file_path)
 
         assert state_dict["_weight"][0] == 0.5  # pylint: disable=unsubscriptable-object
+
+
+def test_store_and_load_model_chunked_compression():
+    model = MockModel()
+    full_model_strategy = BinaryFullModel(
+        zipping_dir=pathlib.Path(), zip_activated=True, zip_algorithm_name="CHUNKED_DEFLATED", config={}
+    )
+    assert full_model_strategy.chunked_codec == "CHUNKED_DEFLATED"
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        full_model_strategy.zipping_dir = pathlib.Path(temp_dir)
+        model_path = pathlib.Path(temp_dir) / "model.modyn"
+
+        state_dict = model.state_dict()
+        state_dict["_weight"] = torch.tensor([0.5, 2.0])
+        full_model_strategy.store_model(state_dict, model_path)
+
+        loaded_state = full_model_strategy.load_model(MockModel().state_dict(), model_path)
+        assert torch.equal(loaded_state["_weight"], torch.tensor([0.5, 2.0]))
@@ -2,8 +2,10 @@ import pathlib
 import tempfile
 from zipfile import ZIP_LZMA
 
+import numpy as np
 import pytest
 import torch
+from bitstring import BitArray
 from modyn.model_storage.internal.storage_strategies.difference_operators import (
     SubDifferenceOperator,
     XorDifferenceOperator,
@@ -105,6 +107,36 @@ def test_load_model():
             assert model_state["_weight"][0] == 1  # pylint: disable=unsubscriptable-object
 
 
+def reorder_buffer_bitwise(buffer: bytes) -> bytes:
+    bit_array = BitArray(buffer)
+    for i in range(0, len(bit_array), 32):
+        bit_array[i + 24], bit_array[i + 16] = bit_array[i + 16], bit_array[i + 24]
+    return bit_array.bytes
+
+
+def encode_bytes_bytewise(buffer: bytes) -> bytes:
+    encoded = bytearray()
+    for byte in buffer:
+        if len(encoded) > 0 and encoded[-1] == byte and encoded[-2] < 255:
+            encoded[-2] += 1
+        else:
+            encoded += bytes([1, byte])
+    return bytes(encoded)
+
+
+def test_reorder_buffer():
+    buffer = np.random.default_rng(42).integers(0, 256, size=4096, dtype=np.uint8).tobytes()
+    reordered = WeightsDifference.reorder_buffer(buffer)
+
+    assert reordered == reorder_buffer_bitwise(buffer)
+    assert WeightsDifference.reorder_buffer(reordered) == buffer
+    assert WeightsDifference.reorder_buffer(b"") == b""
+
+    # The lowest exponent bit of 1.0 (0x3f800000) is moved into the last byte, the sign bit into the third byte
+    assert WeightsDifference.reorder_buffer(b"\x00\x00\x80\x3f") == b"\x00\x00\x00\xbf"
+    assert WeightsDifference.reorder_buffer(b"\x00\x00\x00\x80") == b"\x00\x00\x80\x00"
+
+
 def test_rle():
     assert WeightsDifference.encode_bytes(b"") == b""
 
@@ -115,6 +147,16 @@ def test_rle():
     assert encoded == b"\xff\x00\xff\x00\x02\x00\x01\x01"
 
 
+def test_rle_matches_bytewise_encoding():
+    rng = np.random.default_rng(42)
+    # Long runs of few values, such that runs exceed 255 bytes
+    buffer = np.repeat(rng.integers(0, 3, size=200, dtype=np.uint8), rng.integers(1, 600, size=200)).tobytes()
+
+    encoded = WeightsDifference.encode_bytes(buffer)
+    assert encoded == encode_bytes_bytewise(buffer)
+    assert WeightsDifference.decode_bytes(encoded) == buffer
+
+
 def test_inv_rle():
     assert WeightsDifference.decode_bytes(b"") == b""
 
@@ -163,3 +205,46 @@ def test_store_then_load_model():
 
         assert state_dict["_bias"][0].item() == 1  # pylint: disable=unsubscriptable-object
         assert state_dict["_weight"][0].item() == 2  # pylint: disable=unsubscriptable-object
+
+
+@pytest.mark.parametrize("operator", ["xor", "sub"])
+def test_store_then_load_large_model(operator: str):
+    generator = torch.Generator().manual_seed(42)
+    before_state = {
+        "embedding": torch.rand(1000, 17, generator=generator),
+        "bias": torch.rand(33, generator=generator).to(torch.float16),
+        "weight": torch.rand(129, generator=generator),
+    }
+    after_state = {name: tensor + 0.01 * torch.ones_like(tensor) for name, tensor in before_state.items()}
+
+    incremental_strategy = WeightsDifference(
+        zipping_dir=pathlib.Path(),
+        zip_activated=False,
+        zip_algorithm_name="",
+        config={"operator": operator, "split_exponent": True, "rle": True},
+    )
+
+    with tempfile.NamedTemporaryFile() as temporary_file:
+        temp_file_path = pathlib.Path(temporary_file.name)
+        incremental_strategy.store_model(after_state, before_state, temp_file_path)
+
+        # The file is identical to the one written by splitting float by float
+        exponents, remaining = b"", b""
+        for tensor, tensor_prev in zip(after_state.values(), before_state.values()):
+            difference = incremental_strategy.difference_operator.calculate_difference(tensor, tensor_prev)
+            if tensor.dtype != torch.float32:
+                remaining += difference
+                continue
+            for i in range(0, len(difference), 4):
+                reordered = reorder_buffer_bitwise(difference[i : i + 4])
+                remaining += reordered[0:3]
+                exponents += reordered[3:4]
+        exponents = encode_bytes_bytewise(exponents)
+        with open(temp_file_path, "rb") as stored_model_file:
+            assert stored_model_file.read() == len(exponents).to_bytes(8, byteorder="big") + exponents + remaining
+
+        state_dict = incremental_strategy.load_model(
+            {name: tensor.clone() for name, tensor in before_state.items()}, temp_file_path
+        )
+        for name, tensor in after_state.items():
+            assert torch.allclose(state_dict[name], tensor)
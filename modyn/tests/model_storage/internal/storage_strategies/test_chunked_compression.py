@@ -0,0 +1,65 @@
+import io
+import pathlib
+import tempfile
+
+import numpy as np
+import pytest
+from modyn.model_storage.internal.storage_strategies.chunked_compression import (
+    CHUNKED_CODECS,
+    ChunkedFileReader,
+    compress_file_chunked,
+    decompress_file_chunked,
+)
+
+
+def get_test_bytes(size: int) -> bytes:
+    # compressible, but not trivially so
+    return np.random.default_rng(0).integers(0, 16, size, dtype=np.uint8).tobytes()
+
+
+@pytest.mark.parametrize("codec_name", list(CHUNKED_CODECS))
+@pytest.mark.parametrize("size", [0, 1, 1000, 4096, 10_000])
+def test_compress_and_decompress(codec_name: str, size: int):
+    data = get_test_bytes(size)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = pathlib.Path(temp_dir)
+        (temp_path / "model").write_bytes(data)
+
+        compress_file_chunked(temp_path / "model", temp_path / "model.zip", codec_name, chunk_size=1024, num_threads=3)
+        decompress_file_chunked(temp_path / "model.zip", temp_path / "restored", num_threads=2)
+
+        assert (temp_path / "restored").read_bytes() == data
+        if size >= 4096:
+            assert (temp_path / "model.zip").stat().st_size < size
+
+
+def test_partial_read():
+    data = get_test_bytes(10_000)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = pathlib.Path(temp_dir)
+        (temp_path / "model").write_bytes(data)
+        compress_file_chunked(temp_path / "model", temp_path / "model.zip", chunk_size=1000)
+
+        with open(temp_path / "model.zip", "rb") as compressed_file:
+            reader = ChunkedFileReader(compressed_file)
+            assert reader.num_chunks == 10
+            assert reader.size == 10_000
+
+            assert reader.read() == data
+            assert reader.read(500, 100) == data[500:600]
+            assert reader.read(999, 2) == data[999:1001]
+            assert reader.read(1500, 5000) == data[1500:6500]
+            assert reader.read(9990, 100) == data[9990:]
+            assert reader.read(10_000, 10) == b""
+
+
+def test_invalid_files():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = pathlib.Path(temp_dir)
+        (temp_path / "model").write_bytes(b"model")
+
+        with pytest.raises(NotImplementedError):
+            compress_file_chunked(temp_path / "model", temp_path / "model.zip", "CHUNKED_UNKNOWN")
+
+    with pytest.raises(ValueError):
+        ChunkedFileReader(io.BytesIO(b"not a chunked container file"))
@@ -90,6 +90,7 @@ def test__get_base_model_state():
     model_state = manager._get_base_model_state(1)
 
     assert len(model_state) == 122
+    assert all(tensor.device.type == "cpu" for tensor in model_state.values())
 
 
 @patch.object(ModelStorageManager, "_get_base_model_state", return_value=MockModel().state_dict())
@@ -166,6 +167,47 @@ def test__handle_new_model_incremental(previous_model_mock, reconstruct_model_mo
         previous_model_mock.assert_called_once_with(5, 4)
 
 
+@patch.object(ModelStorageManager, "_determine_parent_model_id")
+def test__handle_new_model_max_delta_chain_length(previous_model_mock: MagicMock):
+    with MetadataDatabaseConnection(get_modyn_config()) as database:
+        parent_id = database.add_trained_model(1, 10, "parent.modyn", "parent.metadata")
+        database.add_trained_model(1, 11, "child.modyn", "child.metadata", parent_model=parent_id)
+    previous_model_mock.return_value = parent_id
+
+    modyn_config = get_modyn_config()
+    modyn_config["model_storage"]["max_delta_chain_length"] = 1
+    manager = ModelStorageManager(modyn_config, pathlib.Path("storage"), pathlib.Path("ftp"))
+
+    with tempfile.NamedTemporaryFile() as temporary_file:
+        temp_file_path = pathlib.Path(temporary_file.name)
+
+        # the delta chain of the parent model is complete, hence the model is stored fully.
+        model_state = get_mock_model_after().state_dict()
+        assert (
+            manager._handle_new_model(1, 12, model_state, temp_file_path, manager.get_model_storage_policy(1)) is None
+        )
+        assert torch.load(temp_file_path)["_weight"].item() == 3
+
+    previous_model_mock.assert_called_once_with(1, 12)
+
+
+@patch.object(ModelStorageManager, "_instantiate_base_model_state", return_value=MockModel().state_dict())
+def test__get_base_model_state_cached(instantiate_mock: MagicMock):
+    manager = ModelStorageManager(get_modyn_config(), pathlib.Path("storage"), pathlib.Path("ftp"))
+
+    model_state = manager._get_base_model_state(1)
+    model_state["_weight"] = torch.zeros(1)
+
+    assert manager._get_base_model_state(1)["_weight"].item() == 1
+    instantiate_mock.assert_called_once_with(1)
+
+    # the template counts towards the bounded cache and is instantiated again after its eviction
+    assert ("base", 1) in manager._reconstruction_cache
+    manager._reconstruction_cache.clear()
+    manager._get_base_model_state(1)
+    assert instantiate_mock.call_count == 2
+
+
 def test_get_model_storage_policy():
     with MetadataDatabaseConnection(get_modyn_config()) as database:
         simple_pipeline = database.register_pipeline(
@@ -287,6 +329,34 @@ def test_load_model(base_model_mock: MagicMock):
         assert reconstructed_state["model"]["_weight"].item() == 3
 
 
+@patch.object(ModelStorageManager, "_get_base_model_state", return_value=MockModel().state_dict())
+def test_load_model_cached(base_model_mock: MagicMock):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_directory_path = pathlib.Path(temp_dir)
+        manager = ModelStorageManager(get_modyn_config(), temp_directory_path, temp_directory_path)
+
+        with MetadataDatabaseConnection(get_modyn_config()) as database:
+            parent_id = database.add_trained_model(1, 40, "parent.modyn", "parent.metadata")
+            child_id = database.add_trained_model(1, 41, "child.modyn", "child.metadata", parent_model=parent_id)
+
+        policy = manager.get_model_storage_policy(1)
+        policy.full_model_strategy.store_model(MockModel().state_dict(), temp_directory_path / "parent.modyn")
+        policy.incremental_model_strategy.store_model(
+            get_mock_model_after().state_dict(), MockModel().state_dict(), temp_directory_path / "child.modyn"
+        )
+
+        child_state = manager.load_model(child_id, False)["model"]
+        assert child_state["_weight"].item() == 3
+        assert parent_id in manager._reconstruction_cache and child_id in manager._reconstruction_cache
+
+        # the cached model states are not affected by modifications of the returned model states.
+        child_state["_weight"] = torch.zeros(1)
+        (temp_directory_path / "child.modyn").unlink()
+        assert manager.load_model(child_id, False)["model"]["_weight"].item() == 3
+        assert manager.load_model(parent_id, False)["model"]["_weight"].item() == 1
+        base_model_mock.assert_called_once()
+
+
 @patch.object(ModelStorageManager, "_get_base_model_state", return_value=MockModel().state_dict())
 def test_load_model_metadata(base_model_mock: MagicMock):
     with tempfile.TemporaryDirectory() as temp_dir:
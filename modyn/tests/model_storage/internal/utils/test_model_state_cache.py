@@ -0,0 +1,81 @@
+import torch
+from modyn.model_storage.internal.utils import ModelStateCache, get_model_state_byte_size
+
+
+def get_model_state(num_floats: int) -> dict:
+    return {"weight": torch.ones(num_floats, dtype=torch.float32), "step": torch.tensor(1, dtype=torch.int64)}
+
+
+def test_get_model_state_byte_size():
+    assert get_model_state_byte_size(get_model_state(4)) == 24
+    assert get_model_state_byte_size({"bias": torch.ones(2, dtype=torch.float16), "name": "model"}) == 4
+
+
+def test_get_put():
+    cache = ModelStateCache(100)
+    assert cache.get(1) is None
+
+    model_state = get_model_state(4)
+    assert cache.put(1, model_state)
+    assert 1 in cache
+    assert cache.cached_bytes == 24
+
+    cached_state = cache.get(1)
+    assert cached_state is not None
+    assert cached_state is not model_state
+    assert torch.equal(cached_state["weight"], model_state["weight"])
+    assert cache.get_stats() == {"entries": 1, "cached_bytes": 24, "hits": 1, "misses": 1}
+
+
+def test_entries_are_copies():
+    cache = ModelStateCache(100)
+    model_state = get_model_state(4)
+    cache.put(1, model_state)
+
+    # replacing entries of the given or returned model states does not affect the cache
+    model_state["weight"] = torch.zeros(4)
+    cached_state = cache.get(1)
+    assert cached_state is not None
+    cached_state["weight"] = torch.zeros(4)
+    assert cache.get(1)["weight"].sum().item() == 4  # type: ignore
+
+
+def test_lru_eviction():
+    cache = ModelStateCache(60)
+    cache.put(1, get_model_state(4))
+    cache.put(2, get_model_state(4))
+    assert cache.get(1) is not None
+
+    # model 2 is the least recently used one
+    cache.put(3, get_model_state(4))
+    assert 1 in cache and 3 in cache and 2 not in cache
+    assert cache.cached_bytes == 48
+
+    # replacing an entry does not count its bytes twice
+    cache.put(3, get_model_state(6))
+    assert len(cache) == 2
+    assert cache.cached_bytes == 56
+
+
+def test_too_large_model_state():
+    cache = ModelStateCache(60)
+    cache.put(1, get_model_state(4))
+
+    assert not cache.put(2, get_model_state(100))
+    assert 2 not in cache
+    assert 1 in cache
+
+
+def test_evict_and_clear():
+    cache = ModelStateCache(100)
+    cache.put(1, get_model_state(4))
+    cache.put(2, get_model_state(4))
+
+    cache.evict(1)
+    cache.evict(5)
+    assert 1 not in cache
+    assert cache.cached_bytes == 24
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.cached_bytes == 0
@@ -4,14 +4,21 @@ import tempfile
 from typing import Iterable
 from unittest.mock import MagicMock, patch
 
+import numpy as np
+from modyn.common.trigger_sample import ArrayWrapper
 from modyn.selector.internal.grpc.generated.selector_pb2 import (  # noqa: E402, E501, E611;
+    CacheStatsResponse,
     DataInformRequest,
+    Empty,
+    EvictTriggerRequest,
+    EvictTriggerResponse,
     GetNumberOfPartitionsRequest,
     GetNumberOfSamplesRequest,
     GetSamplesRequest,
     GetSelectionStrategyRequest,
     NumberOfPartitionsResponse,
     NumberOfSamplesResponse,
+    PackedSamplesResponse,
     SamplesResponse,
     SelectionStrategyResponse,
     TriggerResponse,
@@ -83,6 +90,34 @@ def test_get_sample_keys_and_weights_batching(test_get_sample_keys_and_weights:
         test_get_sample_keys_and_weights.assert_called_once_with(0, 1, 2, 3)
 
 
+@patch.object(SelectorManager, "init_metadata_db", noop_init_metadata_db)
+@patch.object(SelectorManager, "get_sample_keys_and_weights")
+def test_get_packed_sample_keys_and_weights(test_get_sample_keys_and_weights: MagicMock):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config = get_minimal_modyn_config()
+        config["selector"]["trigger_sample_directory"] = tmp_dir
+        mgr = SelectorManager(config)
+
+        servicer = SelectorGRPCServicer(mgr, 2)
+        request = GetSamplesRequest(pipeline_id=0, trigger_id=1, worker_id=2, partition_id=3)
+        test_get_sample_keys_and_weights.return_value = ArrayWrapper(
+            np.array([(10, 1.0), (11, 0.5), (2**40, 2.0)], dtype=np.dtype("i8,f8"))
+        )
+
+        responses: Iterable[PackedSamplesResponse] = list(servicer.get_packed_sample_keys_and_weights(request, None))
+        assert len(responses) == 2
+        assert np.frombuffer(responses[0].training_samples_subset, dtype="<i8").tolist() == [10, 11]
+        assert np.frombuffer(responses[0].training_samples_weights, dtype="<f4").tolist() == [1.0, 0.5]
+        assert np.frombuffer(responses[1].training_samples_subset, dtype="<i8").tolist() == [2**40]
+        assert np.frombuffer(responses[1].training_samples_weights, dtype="<f4").tolist() == [2.0]
+
+        test_get_sample_keys_and_weights.assert_called_once_with(0, 1, 2, 3)
+
+        test_get_sample_keys_and_weights.return_value = []
+        responses = list(servicer.get_packed_sample_keys_and_weights(request, None))
+        assert responses == [PackedSamplesResponse()]
+
+
 @patch.object(SelectorManager, "init_metadata_db", noop_init_metadata_db)
 @patch.object(SelectorManager, "get_sample_keys_and_weights")
 def test_get_sample_keys_and_weights_empty(test_get_sample_keys_and_weights: MagicMock):
@@ -182,3 +217,32 @@ def test_get_selection_strategy(test_get_selection_strategy_remote: MagicMock):
 
         response: SelectionStrategyResponse = servicer.get_selection_strategy(request, None)
         assert response == (False, "", {})
+
+
+@patch.object(SelectorManager, "init_metadata_db", noop_init_metadata_db)
+@patch.object(SelectorManager, "evict_trigger_from_cache")
+def test_evict_trigger_from_cache(test_evict_trigger_from_cache: MagicMock):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config = get_minimal_modyn_config()
+        config["selector"]["trigger_sample_directory"] = tmp_dir
+        mgr = SelectorManager(config)
+        servicer = SelectorGRPCServicer(mgr, 8096)
+        request = EvictTriggerRequest(pipeline_id=42, trigger_id=21)
+        test_evict_trigger_from_cache.return_value = 12
+
+        response: EvictTriggerResponse = servicer.evict_trigger_from_cache(request, None)
+        assert response.evicted_keys == 12
+
+        test_evict_trigger_from_cache.assert_called_once_with(42, 21)
+
+
+@patch.object(SelectorManager, "init_metadata_db", noop_init_metadata_db)
+def test_get_cache_stats():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config = get_minimal_modyn_config()
+        config["selector"]["trigger_sample_directory"] = tmp_dir
+        mgr = SelectorManager(config)
+        servicer = SelectorGRPCServicer(mgr, 8096)
+
+        response: CacheStatsResponse = servicer.get_cache_stats(Empty(), None)
+        assert response == CacheStatsResponse(hits=0, misses=0, evictions=0, cached_keys=0, cached_partitions=0)
@@ -0,0 +1,161 @@
+# pylint: disable=redefined-outer-name
+import os
+import pathlib
+import shutil
+import tempfile
+
+import numpy as np
+import pytest
+from modyn.metadata_database.metadata_database_connection import MetadataDatabaseConnection
+from modyn.metadata_database.models import SelectorStateMetadata
+from modyn.selector.internal.selector_strategies.presampling_strategies.database_sampling import (
+    bernoulli_probability,
+    sample_keys,
+    select_sampled_keys,
+)
+from modyn.selector.internal.storage_backend.database.database_storage_backend import DatabaseStorageBackend
+
+database_path = pathlib.Path(os.path.abspath(__file__)).parent / "test_storage.db"
+
+TMP_DIR = tempfile.mkdtemp()
+
+
+def get_minimal_modyn_config():
+    return {
+        "metadata_database": {
+            "drivername": "sqlite",
+            "username": "",
+            "password": "",
+            "host": "",
+            "port": "0",
+            "database": f"{database_path}",
+        },
+        "selector": {"insertion_threads": 8, "trigger_sample_directory": TMP_DIR},
+    }
+
+
+@pytest.fixture(scope="function", autouse=True)
+def setup_and_teardown():
+    pathlib.Path(TMP_DIR).mkdir(parents=True, exist_ok=True)
+    with MetadataDatabaseConnection(get_minimal_modyn_config()) as database:
+        database.create_tables()
+    yield
+
+    os.remove(database_path)
+    shutil.rmtree(TMP_DIR)
+
+
+@pytest.fixture
+def backend():
+    backend = DatabaseStorageBackend(0, get_minimal_modyn_config(), 1000)
+    # labels 0 (keys 0-99), 1 (keys 100-129) and 2 (keys 130-134); timestamps are the reversed keys
+    keys = list(range(135))
+    backend.persist_samples(0, keys, [1000 - key for key in keys], [0] * 100 + [1] * 30 + [2] * 5)
+    return backend
+
+
+def pipeline_filter():
+    return [SelectorStateMetadata.pipeline_id == 0]
+
+
+def test_bernoulli_probability():
+    assert bernoulli_probability(10, 0) == 1.0
+    assert bernoulli_probability(100, 100) == 1.0
+    assert bernoulli_probability(100, 10000) == pytest.approx((100 + 3 * 10 + 10) / 10000)
+
+
+def test_sample_keys(backend):
+    keys = sample_keys(backend, pipeline_filter(), {None: 20}, {None: 135}, np.random.default_rng(42))
+
+    assert len(keys) == 20
+    assert len(set(keys.tolist())) == 20
+    assert all(0 <= key < 135 for key in keys)
+    # ordered by timestamp
+    assert keys.tolist() == sorted(keys.tolist(), reverse=True)
+
+
+def test_sample_keys_all_rows(backend):
+    keys = sample_keys(backend, pipeline_filter(), {None: 200}, {None: 135}, np.random.default_rng(42))
+    assert keys.tolist() == list(reversed(range(135)))
+
+    assert len(sample_keys(backend, pipeline_filter(), {None: 0}, {None: 135}, np.random.default_rng(42))) == 0
+
+
+def test_sample_keys_top_up(backend):
+    # Wrong counts result in a far too small Bernoulli probability, such that the groups need to be topped up
+    keys = sample_keys(backend, pipeline_filter(), {None: 50}, {None: 10**9}, np.random.default_rng(42))
+    assert len(keys) == 50
+    assert len(set(keys.tolist())) == 50
+
+
+def test_sample_keys_grouped(backend):
+    keys = sample_keys(
+        backend,
+        pipeline_filter(),
+        {0: 10, 1: 10, 2: 10},
+        {0: 100, 1: 30, 2: 5},
+        np.random.default_rng(42),
+        group_column=SelectorStateMetadata.label,
+    )
+
+    assert len([key for key in keys if key < 100]) == 10
+    assert len([key for key in keys if 100 <= key < 130]) == 10
+    assert sorted(key for key in keys if key >= 130) == list(range(130, 135))
+    assert keys.tolist() == sorted(keys.tolist(), reverse=True)
+
+
+def test_sample_keys_grouped_subset_and_limit(backend):
+    # Groups without quota are not sampled
+    keys = sample_keys(
+        backend,
+        pipeline_filter(),
+        {1: 10},
+        {0: 100, 1: 30, 2: 5},
+        np.random.default_rng(42),
+        group_column=SelectorStateMetadata.label,
+    )
+    assert len(keys) == 10
+    assert all(100 <= key < 130 for key in keys)
+
+    keys = sample_keys(
+        backend,
+        pipeline_filter(),
+        {0: 10, 2: 10},
+        {0: 100, 1: 30, 2: 5},
+        np.random.default_rng(42),
+        group_column=SelectorStateMetadata.label,
+        limit=8,
+    )
+    # The limit keeps the samples with the smallest timestamps, i.e., all samples of label 2
+    assert len(keys) == 8
+    assert sorted(keys.tolist())[3:] == list(range(130, 135))
+
+
+def test_sample_keys_reproducible(backend):
+    # The wrong count results in a Bernoulli probability of 1, such that only the generator decides on the sample
+    keys = sample_keys(backend, pipeline_filter(), {None: 20}, {None: 20}, np.random.default_rng(42))
+    assert len(keys) == 20
+    assert np.array_equal(
+        keys, sample_keys(backend, pipeline_filter(), {None: 20}, {None: 20}, np.random.default_rng(42))
+    )
+
+
+def test_sample_keys_uniform(backend):
+    rng = np.random.default_rng(42)
+    counts = np.zeros(100, dtype=np.int64)
+    for _ in range(200):
+        keys = sample_keys(backend, pipeline_filter(), {0: 10}, {0: 100}, rng, group_column=SelectorStateMetadata.label)
+        counts[keys] += 1
+
+    # Every key is expected to be sampled 20 times
+    assert counts.sum() == 2000
+    assert counts.min() > 0
+    assert counts.max() < 50
+
+
+def test_select_sampled_keys(backend):
+    keys = np.array([5, 7, 110])
+    with MetadataDatabaseConnection(get_minimal_modyn_config()) as database:
+        result = database.session.execute(select_sampled_keys(backend, pipeline_filter(), keys)).all()
+
+    assert [row[0] for row in result] == [110, 7, 5]
@@ -3,6 +3,7 @@ import pathlib
 import shutil
 import tempfile
 
+import numpy as np
 import pytest
 from modyn.metadata_database.metadata_database_connection import MetadataDatabaseConnection
 from modyn.selector.internal.selector_strategies import CoresetStrategy
@@ -81,15 +82,15 @@ def test_get_query_wrong():
 
     # missing size
     with pytest.raises(AssertionError):
-        strat.get_presampling_query(120, None, None, None)
+        strat.get_presampling_query(120, None, None, None, np.random.default_rng(42))
 
     # negative size
     with pytest.raises(AssertionError):
-        strat.get_presampling_query(120, None, None, -1)
+        strat.get_presampling_query(120, None, None, -1, np.random.default_rng(42))
 
     # negative limit
     with pytest.raises(AssertionError):
-        strat.get_presampling_query(120, None, -18, 120)
+        strat.get_presampling_query(120, None, -18, 120, np.random.default_rng(42))
 
 
 def test_constructor_throws_on_invalid_config():
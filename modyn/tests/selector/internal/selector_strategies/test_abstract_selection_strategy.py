@@ -8,7 +8,7 @@ from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
-from modyn.common.trigger_sample import TriggerSampleStorage
+from modyn.common.trigger_sample import TriggerSampleStorage, keys_to_trigger_samples
 from modyn.metadata_database.metadata_database_connection import MetadataDatabaseConnection
 from modyn.metadata_database.models import Trigger, TriggerPartition
 from modyn.selector.internal.selector_strategies.abstract_selection_strategy import AbstractSelectionStrategy
@@ -80,6 +80,42 @@ def test__reset_state():
         strat._reset_state()
 
 
+@patch.multiple(AbstractSelectionStrategy, __abstractmethods__=set())
+def test_sample_limit():
+    strat = AbstractSelectionStrategy({"limit": 25, "reset_after_trigger": False}, get_minimal_modyn_config(), 42, 10)
+
+    chunks = [list(range(start, start + 10)) for start in range(0, 100, 10)]
+    partitions = list(strat._sample_limit(chunks, 100))
+    assert [len(partition) for partition in partitions] == [9, 9, 7]
+    samples = np.concatenate(partitions)
+    assert samples.dtype == np.int64
+    assert len(np.unique(samples)) == 25
+    assert samples.min() >= 0 and samples.max() < 100
+
+
+@patch.multiple(AbstractSelectionStrategy, __abstractmethods__=set())
+def test_shuffled_trigger_samples():
+    strat = AbstractSelectionStrategy({"limit": -1, "reset_after_trigger": False}, get_minimal_modyn_config(), 42, 1000)
+
+    trigger_samples = strat._shuffled_trigger_samples(np.arange(100, dtype=np.int64), 0.5)
+    assert sorted(trigger_samples["f0"].tolist()) == list(range(100))
+    assert np.all(trigger_samples["f1"] == 0.5)
+
+
+@patch.multiple(AbstractSelectionStrategy, __abstractmethods__=set())
+def test_generator_follows_global_seed():
+    def shuffled_keys():
+        strat = AbstractSelectionStrategy(
+            {"limit": -1, "reset_after_trigger": False}, get_minimal_modyn_config(), 42, 1000
+        )
+        return strat._shuffled_trigger_samples(list(range(100)))["f0"].tolist()
+
+    np.random.seed(42)
+    first = shuffled_keys()
+    np.random.seed(42)
+    assert shuffled_keys() == first
+
+
 @patch.multiple(AbstractSelectionStrategy, __abstractmethods__=set())
 def test_inform_data():
     strat = AbstractSelectionStrategy({"limit": -1, "reset_after_trigger": False}, get_minimal_modyn_config(), 42, 1000)
@@ -146,6 +182,35 @@ def test_trigger_without_reset_multiple_partitions(test_reset_state: MagicMock,
         strat.get_trigger_partition_keys(trigger_id, 2)
 
 
+@patch.multiple(AbstractSelectionStrategy, __abstractmethods__=set())
+@patch.object(AbstractSelectionStrategy, "_on_trigger")
+def test_partition_sizes_cached(test__on_trigger: MagicMock):
+    strat = AbstractSelectionStrategy({"limit": -1, "reset_after_trigger": False}, get_minimal_modyn_config(), 42, 1000)
+    test__on_trigger.return_value = [([(10, 1.0), (11, 1.0), (12, 1.0)], {}), ([(13, 1.0), (14, 1.0)], {})]
+    trigger_id, _, _, _ = strat.trigger()
+    assert strat._partition_sizes == {trigger_id: [3, 2]}
+
+    # Serving the keys of a partition does not query the database
+    with patch(
+        "modyn.selector.internal.selector_strategies.abstract_selection_strategy.MetadataDatabaseConnection"
+    ) as connection_mock:
+        assert strat.get_trigger_partition_keys(trigger_id, 1)[:].tolist() == [(13, 1.0), (14, 1.0)]
+        connection_mock.assert_not_called()
+
+    # After a restart, the sizes are loaded from the database once per trigger
+    new_strat = AbstractSelectionStrategy(
+        {"limit": -1, "reset_after_trigger": False}, get_minimal_modyn_config(), 42, 1000
+    )
+    assert new_strat._partition_sizes == {}
+    assert new_strat.get_trigger_partition_keys(trigger_id, 0)[:].tolist() == [(10, 1.0), (11, 1.0), (12, 1.0)]
+    assert new_strat._partition_sizes == {trigger_id: [3, 2]}
+
+    # Unknown triggers are not cached
+    with pytest.raises(AssertionError):
+        new_strat.get_trigger_partition_keys(trigger_id + 1, 0)
+    assert trigger_id + 1 not in new_strat._partition_sizes
+
+
 @patch.multiple(AbstractSelectionStrategy, __abstractmethods__=set())
 @patch.object(AbstractSelectionStrategy, "_on_trigger")
 @patch.object(AbstractSelectionStrategy, "_reset_state")
@@ -247,18 +312,53 @@ def test_two_strategies_increase_next_trigger_separately(test__on_trigger: Magic
     assert strat2._next_trigger_id == 2
 
 
-def test_store_trigger_num_keys():
+def test_store_trigger_partitions():
     with MetadataDatabaseConnection(get_minimal_modyn_config()) as database:
         database.session.add(Trigger(trigger_id=0, pipeline_id=42, num_keys=10, num_partitions=1))
         database.session.commit()
 
-    AbstractSelectionStrategy._store_trigger_num_keys(get_minimal_modyn_config(), 42, 0, 12, 10)
+    AbstractSelectionStrategy._store_trigger_partitions(get_minimal_modyn_config(), 42, 0, {})
+    AbstractSelectionStrategy._store_trigger_partitions(get_minimal_modyn_config(), 42, 0, {12: 10, 13: 5})
 
     with MetadataDatabaseConnection(get_minimal_modyn_config()) as database:
-        data = database.session.query(TriggerPartition).all()
+        data = database.session.query(TriggerPartition).order_by(TriggerPartition.partition_id).all()
 
-        assert len(data) == 1
+        assert len(data) == 2
         assert data[0].trigger_id == 0
         assert data[0].pipeline_id == 42
         assert data[0].partition_id == 12
         assert data[0].num_keys == 10
+        assert data[1].partition_id == 13
+        assert data[1].num_keys == 5
+
+
+@patch.multiple(AbstractSelectionStrategy, __abstractmethods__=set())
+@patch.object(AbstractSelectionStrategy, "_on_trigger")
+def test_trigger_numpy_partitions(test__on_trigger: MagicMock):
+    strat = AbstractSelectionStrategy({"limit": -1, "reset_after_trigger": False}, get_minimal_modyn_config(), 42, 1000)
+
+    partitions = [keys_to_trigger_samples(list(range(start, start + 10)), 0.5) for start in range(0, 100, 10)]
+    test__on_trigger.return_value = [(partition, {}) for partition in partitions]
+
+    trigger_id, trigger_num_keys, trigger_num_partitions, log = strat.trigger()
+
+    assert trigger_num_keys == 100
+    assert trigger_num_partitions == 10
+    # The partition logs stay in the order of the partitions, even though they are written concurrently
+    assert len(log["trigger_partitions"]) == 10
+    assert all("store_triggersamples_time" in partition_log for partition_log in log["trigger_partitions"])
+
+    for partition_id, partition in enumerate(partitions):
+        assert (strat.get_trigger_partition_keys(trigger_id, partition_id) == partition).all()
+
+
+@patch.multiple(AbstractSelectionStrategy, __abstractmethods__=set())
+@patch.object(AbstractSelectionStrategy, "_on_trigger")
+@patch.object(AbstractSelectionStrategy, "_store_triggersamples_impl")
+def test_trigger_writer_failure(test__store_triggersamples_impl: MagicMock, test__on_trigger: MagicMock):
+    strat = AbstractSelectionStrategy({"limit": -1, "reset_after_trigger": False}, get_minimal_modyn_config(), 42, 1000)
+    test__on_trigger.return_value = [([(10, 1.0)], {})]
+    test__store_triggersamples_impl.side_effect = OSError("disk full")
+
+    with pytest.raises(OSError):
+        strat.trigger()
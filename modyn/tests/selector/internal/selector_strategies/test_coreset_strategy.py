@@ -196,7 +196,7 @@ def test_no_presampling():
     assert len(indexes[0]) == 5
     assert len(indexes[1]) == 1
     assert set(key for key, _ in indexes[0]) == set([10, 11, 12, 13, 14])
-    assert indexes[1][0] == (15, 1.0)
+    assert indexes[1][0].tolist() == (15, 1.0)
 
 
 def test_chunking():
@@ -314,6 +314,56 @@ def test_get_tail_triggers_data():
     assert set(current_data).intersection(set(data2)) == set()
 
 
+def get_local_modyn_config():
+    config = get_minimal_modyn_config()
+    config["selector"]["local_storage_directory"] = f"{TMP_DIR}/local_storage"
+    return config
+
+
+def test_local_backend_random_presampling():
+    config = get_config_tail()
+    config["storage_backend"] = "local"
+    strat = CoresetStrategy(config, get_local_modyn_config(), 0, 2)
+
+    strat.inform_data([10, 11, 12, 13, 14, 15], [5, 4, 3, 2, 1, 0], [0, 0, 1, 1, 2, 2])
+    current_data = flatten(strat._get_data())
+    assert len(current_data) == 3  # 50% presampling
+    assert set(current_data) < {10, 11, 12, 13, 14, 15}
+    # Presampled keys are ordered by timestamp
+    assert current_data == sorted(current_data, reverse=True)
+
+    strat.trigger()
+    strat.inform_data([20, 21], [6, 7], [0, 0])
+    strat.trigger()
+    strat.inform_data([30, 31], [8, 9], [0, 0])
+
+    # since tail_trigger = 1 we should not get any point belonging to the first trigger
+    current_data = flatten(strat._get_data())
+    assert len(current_data) == 2
+    assert set(current_data) < {20, 21, 30, 31}
+
+
+def test_local_backend_no_presampling_with_limit():
+    config = get_config_all()
+    config["limit"] = 3
+    config["storage_backend"] = "local"
+    strat = CoresetStrategy(config, get_local_modyn_config(), 0, 1000)
+
+    strat.inform_data([10, 11, 12, 13, 14, 15], [5, 4, 3, 2, 1, 0], [0, 0, 1, 1, 2, 2])
+    strat.maximum_keys_in_memory = 2
+
+    assert [keys.tolist() for keys in strat._get_data()] == [[15, 14], [13]]
+
+
+def test_local_backend_unsupported_presampling():
+    config = get_config()
+    config["presampling_config"]["strategy"] = "LabelBalanced"
+    config["storage_backend"] = "local"
+
+    with pytest.raises(AssertionError):
+        CoresetStrategy(config, get_local_modyn_config(), 0, 1000)
+
+
 def test_no_presampling_with_limit():
     config = get_config_all()
     config["limit"] = 3
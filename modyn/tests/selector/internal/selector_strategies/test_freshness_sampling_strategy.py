@@ -59,6 +59,67 @@ def test_constructor_throws_on_invalid_config():
         FreshnessSamplingStrategy(conf, get_minimal_modyn_config(), 0, 1000)
 
 
+def test_local_backend(tmp_path):
+    config = get_freshness_config()
+    config["storage_backend"] = "local"
+    config["limit"] = 4
+    modyn_config = get_minimal_modyn_config()
+    modyn_config["selector"]["local_storage_directory"] = str(tmp_path)
+    strat = FreshnessSamplingStrategy(config, modyn_config, 0, 1000)
+
+    strat.inform_data([10, 11, 12, 13], [0, 1, 2, 3], [0, 0, 1, 1])
+    first_trigger = [key for samples, _ in strat._on_trigger() for key, _ in samples]
+    assert set(first_trigger) == {10, 11, 12, 13}
+    assert strat._get_count_of_data(True) == 4
+
+    strat.inform_data([14, 15, 16, 17], [4, 5, 6, 7], [0, 0, 1, 1])
+    assert strat._get_count_of_data(False) == 4
+
+    # 50% unused data
+    second_trigger = [key for samples, _ in strat._on_trigger() for key, _ in samples]
+    assert len(second_trigger) == 4
+    assert len(set(second_trigger) & {14, 15, 16, 17}) == 2
+    assert len(set(second_trigger) & {10, 11, 12, 13}) == 2
+    assert strat._get_count_of_data(False) == 2
+
+
+@pytest.mark.parametrize("storage_backend", ["database", "local"])
+def test_track_used_in_memory(storage_backend: str, tmp_path):
+    config = get_freshness_config()
+    config["storage_backend"] = storage_backend
+    config["track_used_in_memory"] = True
+    config["limit"] = 4
+    modyn_config = get_minimal_modyn_config()
+    modyn_config["selector"]["local_storage_directory"] = str(tmp_path)
+    strat = FreshnessSamplingStrategy(config, modyn_config, 0, 2)
+
+    strat.inform_data([10, 11, 12, 13, 14, 15], [0, 1, 2, 3, 4, 5], [0, 0, 1, 1, 0, 1])
+    with patch.object(strat, "_persist_used", wraps=strat._persist_used) as persist_mock:
+        first_trigger = [key for samples, _ in strat._on_trigger() for key, _ in samples]
+        persist_mock.assert_called_once()
+
+    assert len(first_trigger) == 4
+    assert set(first_trigger) <= {10, 11, 12, 13, 14, 15}
+    assert strat._get_count_of_data(True) == 4
+    assert strat._get_count_of_data(False) == 2
+
+    strat.inform_data([16, 17], [6, 7], [0, 0])
+    second_trigger = [key for samples, _ in strat._on_trigger() for key, _ in samples]
+
+    # 50% unused data
+    assert len(second_trigger) == 4
+    assert len(set(second_trigger) - set(first_trigger)) == 2
+    assert len(set(second_trigger) & set(first_trigger)) == 2
+    assert strat._get_count_of_data(False) == 2
+
+    # The used flags of the storage backend are persisted after every trigger
+    if storage_backend == "database":
+        restarted = FreshnessSamplingStrategy(config, modyn_config, 0, 2)
+        assert restarted._get_count_of_data(False) == 2
+        assert restarted._get_count_of_data(True) == 6
+        assert {key for keys, _ in restarted._get_used_data() for key in keys} == set(first_trigger + second_trigger)
+
+
 def test_inform_data():
     strat = FreshnessSamplingStrategy(get_freshness_config(), get_minimal_modyn_config(), 0, 1000)
     strat.inform_data([10, 11, 12], [0, 1, 2], ["dog", "dog", "cat"])
@@ -175,7 +236,7 @@ def test__get_first_trigger_data(
     result = list(strat._get_first_trigger_data())
     assert len(result) == 1
     result = result[0]
-    assert result == [10, 11, 12, 13]
+    assert result.tolist() == [10, 11, 12, 13]
 
     strat.training_set_size_limit = 2
     strat._is_first_trigger = True
@@ -215,8 +276,16 @@ def test__get_first_trigger_data_partitions(
     with pytest.raises(AssertionError):
         list(strat._get_first_trigger_data())
 
-    # TODO(#179): We do not support a limit larger than or equal to the partition size right now
-    # Write test as soon as this is supported again.
+    # The limit applies to all partitions
+    test__get_all_unused_data.return_value = [[10, 11], [12, 13]]
+    strat.has_limit = True
+    strat.training_set_size_limit = 3
+    strat.maximum_keys_in_memory = 2
+    strat._is_first_trigger = True
+    result = [keys.tolist() for keys in strat._get_first_trigger_data()]
+    assert [len(keys) for keys in result] == [2, 1]
+    assert len(set(flatten(result))) == 3
+    assert set(flatten(result)) < set([10, 11, 12, 13])
 
 
 @patch.object(FreshnessSamplingStrategy, "_get_data_sample")
@@ -30,18 +30,17 @@ def get_minimal_modyn_config():
         "selector": {
             "insertion_threads": 8,
             "trigger_sample_directory": TMP_DIR,
+            "local_storage_directory": f"{TMP_DIR}/local_storage",
         },
     }
 
 
-def get_config():
-    # TODO(MaxiBoether): also test local
-    return {"reset_after_trigger": False, "limit": -1, "storage_backend": "database"}
+def get_config(storage_backend: str = "database"):
+    return {"reset_after_trigger": False, "limit": -1, "storage_backend": storage_backend}
 
 
-def get_config_tail():
-    # TODO(MaxiBoether): also test local
-    return {"reset_after_trigger": False, "limit": -1, "tail_triggers": 1, "storage_backend": "database"}
+def get_config_tail(storage_backend: str = "database"):
+    return {"reset_after_trigger": False, "limit": -1, "tail_triggers": 1, "storage_backend": storage_backend}
 
 
 @pytest.fixture(scope="function", autouse=True)
@@ -78,7 +77,8 @@ def test_constructor_throws_on_invalid_config():
     NewDataStrategy(conf, get_minimal_modyn_config(), 0, 1000)  # should work
 
 
-def test_e2e_noreset_nolimit():
+@pytest.mark.parametrize("storage_backend", ["database", "local"])
+def test_e2e_noreset_nolimit(storage_backend: str):
     data1 = list(range(10))
     timestamps1 = list(range(10))
     labels1 = [0] * 10
@@ -88,7 +88,7 @@ def test_e2e_noreset_nolimit():
     labels2 = [0] * 10
 
     # NO RESET // NO LIMIT #
-    conf = get_config()
+    conf = get_config(storage_backend)
     conf["limit"] = -1
     conf["reset_after_trigger"] = False
     strat = NewDataStrategy(conf, get_minimal_modyn_config(), 0, 100)
@@ -108,7 +108,8 @@ def test_e2e_noreset_nolimit():
     assert {int(key) for (key, _) in training_samples} == set(range(20))
 
 
-def test_e2e_noreset_nolimit_memory_limits():
+@pytest.mark.parametrize("storage_backend", ["database", "local"])
+def test_e2e_noreset_nolimit_memory_limits(storage_backend: str):
     data1 = list(range(10))
     timestamps1 = list(range(10))
     labels1 = [0] * 10
@@ -118,7 +119,7 @@ def test_e2e_noreset_nolimit_memory_limits():
     labels2 = [0] * 10
 
     # NO RESET // NO LIMIT #
-    conf = get_config()
+    conf = get_config(storage_backend)
     conf["limit"] = -1
     conf["reset_after_trigger"] = False
     strat = NewDataStrategy(conf, get_minimal_modyn_config(), 0, 5)
@@ -149,7 +150,8 @@ def test_e2e_noreset_nolimit_memory_limits():
     assert {int(key) for (key, _) in training_samples_part3} == set(range(15, 20))
 
 
-def test_e2e_reset_nolimit():
+@pytest.mark.parametrize("storage_backend", ["database", "local"])
+def test_e2e_reset_nolimit(storage_backend: str):
     data1 = list(range(10))
     timestamps1 = list(range(10))
     labels1 = [0] * 10
@@ -159,7 +161,7 @@ def test_e2e_reset_nolimit():
     labels2 = [0] * 10
 
     # RESET // NO LIMIT #
-    conf = get_config()
+    conf = get_config(storage_backend)
     conf["limit"] = -1
     conf["reset_after_trigger"] = True
 
@@ -182,7 +184,8 @@ def test_e2e_reset_nolimit():
     assert {int(key) for (key, _) in training_samples} == set(range(10, 20))
 
 
-def test_e2e_reset_limit():
+@pytest.mark.parametrize("storage_backend", ["database", "local"])
+def test_e2e_reset_limit(storage_backend: str):
     data1 = list(range(10))
     timestamps1 = list(range(10))
     labels1 = [0] * 10
@@ -192,7 +195,7 @@ def test_e2e_reset_limit():
     labels2 = [0] * 10
 
     # RESET // LIMIT #
-    conf = get_config()
+    conf = get_config(storage_backend)
     conf["limit"] = 5
     conf["reset_after_trigger"] = True
 
@@ -215,7 +218,8 @@ def test_e2e_reset_limit():
     assert {int(key) for (key, _) in training_samples} < set(range(10, 20))
 
 
-def test_e2e_reset_limit_uar():
+@pytest.mark.parametrize("storage_backend", ["database", "local"])
+def test_e2e_reset_limit_uar(storage_backend: str):
     data1 = list(range(10))
     timestamps1 = list(range(10))
     labels1 = [0] * 10
@@ -224,7 +228,7 @@ def test_e2e_reset_limit_uar():
     timestamps2 = list(range(10, 20))
     labels2 = [0] * 10
     # NO RESET // LIMIT (UAR) #
-    conf = get_config()
+    conf = get_config(storage_backend)
     conf["limit"] = 5
     conf["reset_after_trigger"] = False
     conf["limit_reset"] = "sampleUAR"
@@ -247,7 +251,8 @@ def test_e2e_reset_limit_uar():
     assert {int(key) for (key, _) in training_samples} < set(range(20))
 
 
-def test_e2e_reset_limit_lastx():
+@pytest.mark.parametrize("storage_backend", ["database", "local"])
+def test_e2e_reset_limit_lastx(storage_backend: str):
     data1 = list(range(10))
     timestamps1 = list(range(10))
     labels1 = [0] * 10
@@ -257,7 +262,7 @@ def test_e2e_reset_limit_lastx():
     labels2 = [0] * 10
 
     # NO RESET // LIMIT (lastX) #
-    conf = get_config()
+    conf = get_config(storage_backend)
     conf["limit"] = 5
     conf["reset_after_trigger"] = False
     conf["limit_reset"] = "lastX"
@@ -280,7 +285,8 @@ def test_e2e_reset_limit_lastx():
     assert {int(key) for (key, _) in training_samples} == set(range(15, 20))
 
 
-def test_e2e_reset_limit_lastx_large():
+@pytest.mark.parametrize("storage_backend", ["database", "local"])
+def test_e2e_reset_limit_lastx_large(storage_backend: str):
     data1 = list(range(10))
     timestamps1 = list(range(10))
     labels1 = [0] * 10
@@ -290,7 +296,7 @@ def test_e2e_reset_limit_lastx_large():
     labels2 = [0] * 10
 
     # NO RESET // LIMIT (lastX w/ large limit) #
-    conf = get_config()
+    conf = get_config(storage_backend)
     conf["limit"] = 15
     conf["reset_after_trigger"] = False
     conf["limit_reset"] = "lastX"
@@ -313,6 +319,28 @@ def test_e2e_reset_limit_lastx_large():
     assert {int(key) for (key, _) in training_samples} == set(range(5, 20))
 
 
+@pytest.mark.parametrize("storage_backend", ["database", "local"])
+def test_e2e_limit_larger_than_memory(storage_backend: str):
+    conf = get_config(storage_backend)
+    conf["limit"] = 25
+    conf["reset_after_trigger"] = True
+
+    # The limit exceeds the number of keys we may hold in memory
+    strat = NewDataStrategy(conf, get_minimal_modyn_config(), 0, 10)
+    strat.inform_data(list(range(100)), list(range(100)), [0] * 100)
+    trigger_id, trigger_num_keys, trigger_num_partitions, _ = strat.trigger()
+    assert trigger_num_keys == 25
+    assert trigger_num_partitions == 3
+
+    partitions = [
+        [int(key) for (key, _) in strat.get_trigger_partition_keys(trigger_id, partition)] for partition in range(3)
+    ]
+    assert [len(partition) for partition in partitions] == [9, 9, 7]
+    samples = flatten(partitions)
+    assert len(set(samples)) == 25
+    assert set(samples) < set(range(100))
+
+
 def test_inform_data():
     with MetadataDatabaseConnection(get_minimal_modyn_config()) as database:
         data = database.session.query(
@@ -493,7 +521,7 @@ def test__get_data_no_reset_limit(
     conf["limit"] = 2
     conf["limit_reset"] = "sampleUAR"
 
-    test__handle_limit_no_reset.return_value = [10, 11]
+    test__handle_limit_no_reset.return_value = [([10, 11], {})]
     test__get_all_data.return_value = [([10, 11, 12], {})]
     strat = NewDataStrategy(conf, get_minimal_modyn_config(), 0, 1000)
 
@@ -503,27 +531,6 @@ def test__get_data_no_reset_limit(
     test__handle_limit_no_reset.assert_called_once()
 
 
-@patch.object(NewDataStrategy, "_get_current_trigger_data")
-@patch.object(NewDataStrategy, "_get_all_data")
-@patch.object(NewDataStrategy, "_handle_limit_no_reset")
-def test__get_data_no_reset_limit_partitions(
-    test__handle_limit_no_reset: MagicMock, test__get_all_data: MagicMock, test__get_current_trigger_data: MagicMock
-):
-    conf = get_config()
-    conf["reset_after_trigger"] = False
-    conf["limit"] = 2
-    conf["limit_reset"] = "sampleUAR"
-
-    test__handle_limit_no_reset.side_effect = lambda x: [x[0], x[1]]
-    test__get_all_data.return_value = [([10, 11, 12], {}), ([13, 14, 15], {})]
-    strat = NewDataStrategy(conf, get_minimal_modyn_config(), 0, 1000)
-
-    assert [data for data, _ in strat._get_data_no_reset()] == [[10, 11], [13, 14]]
-    test__get_all_data.assert_called_once()
-    test__get_current_trigger_data.assert_not_called()
-    assert test__handle_limit_no_reset.call_count == 2
-
-
 @patch.object(NewDataStrategy, "_last_x_limit")
 @patch.object(NewDataStrategy, "_sample_uar")
 def test__handle_limit_no_reset_lastx(test__sample_uar: MagicMock, test__last_x_limit: MagicMock):
@@ -558,29 +565,39 @@ def test__handle_limit_no_reset_sampleuar(test__sample_uar: MagicMock, test__las
     test__sample_uar.assert_called_once_with(["x"])
 
 
-def test__last_x_limit():
-    conf = get_config()
+@pytest.mark.parametrize("storage_backend", ["database", "local"])
+def test__last_x_limit(storage_backend: str):
+    conf = get_config(storage_backend)
     conf["limit"] = 5
     conf["limit_reset"] = "lastX"
 
-    strat = NewDataStrategy(conf, get_minimal_modyn_config(), 0, 1000)
-    assert strat._last_x_limit(list(range(1, 10))) == list(range(5, 10))
+    strat = NewDataStrategy(conf, get_minimal_modyn_config(), 0, 3)
+    strat.inform_data(list(range(1, 10)), list(range(1, 10)), [0] * 9)
 
+    # The limit applies to all partitions, and the selected keys are split into evenly sized partitions
+    partitions = [keys.tolist() for keys, _ in strat._last_x_limit(strat._get_all_data())]
+    assert partitions == [[5, 6, 7], [8, 9]]
 
-def test__sample_uar():
-    conf = get_config()
+
+@pytest.mark.parametrize("storage_backend", ["database", "local"])
+def test__sample_uar(storage_backend: str):
+    conf = get_config(storage_backend)
     conf["limit"] = 5
     conf["limit_reset"] = "sampleUAR"
 
-    strat = NewDataStrategy(conf, get_minimal_modyn_config(), 0, 1000)
-    samples = strat._sample_uar(list(range(1, 10)))
+    strat = NewDataStrategy(conf, get_minimal_modyn_config(), 0, 3)
+    strat.inform_data(list(range(1, 10)), list(range(1, 10)), [0] * 9)
 
-    assert len(samples) == 5
+    partitions = [keys.tolist() for keys, _ in strat._sample_uar(strat._get_all_data())]
+    assert [len(partition) for partition in partitions] == [3, 2]
+    samples = flatten(partitions)
+    assert len(set(samples)) == 5
     assert set(samples) < set(range(1, 10))
 
 
-def test__get_current_trigger_data_no_partitions():
-    strat = NewDataStrategy(get_config(), get_minimal_modyn_config(), 0, 1000)
+@pytest.mark.parametrize("storage_backend", ["database", "local"])
+def test__get_current_trigger_data_no_partitions(storage_backend: str):
+    strat = NewDataStrategy(get_config(storage_backend), get_minimal_modyn_config(), 0, 1000)
     data1 = list(range(10))
     timestamps1 = list(range(10))
     labels = [0] * 10
@@ -601,8 +618,9 @@ def test__get_current_trigger_data_no_partitions():
     assert set(current_data) == set(data2)
 
 
-def test__get_current_trigger_data_partitions():
-    conf = get_config()
+@pytest.mark.parametrize("storage_backend", ["database", "local"])
+def test__get_current_trigger_data_partitions(storage_backend: str):
+    conf = get_config(storage_backend)
     strat = NewDataStrategy(conf, get_minimal_modyn_config(), 0, 1)
     data1 = list(range(10))
     timestamps1 = list(range(10))
@@ -628,8 +646,9 @@ def test__get_current_trigger_data_partitions():
     assert set(current_data) == set(data2)
 
 
-def test__get_tail_triggers_data():
-    conf = get_config_tail()
+@pytest.mark.parametrize("storage_backend", ["database", "local"])
+def test__get_tail_triggers_data(storage_backend: str):
+    conf = get_config_tail(storage_backend)
     strat = NewDataStrategy(conf, get_minimal_modyn_config(), 0, 1)
 
     data1 = list(range(10))
@@ -683,8 +702,9 @@ def test__get_tail_triggers_data():
     assert set(current_data) == set(data3 + data4)
 
 
-def test__get_all_data_no_partitions():
-    strat = NewDataStrategy(get_config(), get_minimal_modyn_config(), 0, 1000)
+@pytest.mark.parametrize("storage_backend", ["database", "local"])
+def test__get_all_data_no_partitions(storage_backend: str):
+    strat = NewDataStrategy(get_config(storage_backend), get_minimal_modyn_config(), 0, 1000)
     data1 = list(range(10))
     timestamps1 = list(range(10))
     labels = [0] * 10
@@ -703,8 +723,9 @@ def test__get_all_data_no_partitions():
     assert all_data == data1 + data2
 
 
-def test__get_all_data_partitions():
-    conf = get_config()
+@pytest.mark.parametrize("storage_backend", ["database", "local"])
+def test__get_all_data_partitions(storage_backend: str):
+    conf = get_config(storage_backend)
     strat = NewDataStrategy(conf, get_minimal_modyn_config(), 0, 1)
 
     data1 = list(range(10))
@@ -732,8 +753,9 @@ def test__reset_state():
     strat._reset_state()
 
 
-def test__get_all_data_partitions_with_same_timestamp():
-    conf = get_config()
+@pytest.mark.parametrize("storage_backend", ["database", "local"])
+def test__get_all_data_partitions_with_same_timestamp(storage_backend: str):
+    conf = get_config(storage_backend)
     strat = NewDataStrategy(conf, get_minimal_modyn_config(), 0, 1)
 
     data1 = list(range(10))
@@ -0,0 +1,124 @@
+import numpy as np
+from modyn.selector.internal.selector_strategies.stream_sampling import (
+    _chunk_sample_size,
+    even_partitions,
+    first_keys_of_chunks,
+    last_keys_of_chunks,
+    order_by_timestamp,
+    sample_chunks,
+    sample_keys_and_timestamps,
+)
+
+
+def get_chunks(num_keys: int, chunk_size: int) -> list[list[int]]:
+    return [list(range(start, min(start + chunk_size, num_keys))) for start in range(0, num_keys, chunk_size)]
+
+
+def test_sample_chunks():
+    rng = np.random.default_rng(42)
+    partitions = list(sample_chunks(get_chunks(100, 7), 100, 30, 8, rng))
+
+    assert [len(partition) for partition in partitions] == [8, 8, 8, 6]
+    samples = np.concatenate(partitions)
+    assert len(np.unique(samples)) == 30
+    assert samples.min() >= 0 and samples.max() < 100
+
+
+def test_sample_chunks_uniform():
+    rng = np.random.default_rng(42)
+    counts = np.zeros(100, dtype=np.int64)
+    for _ in range(500):
+        for partition in sample_chunks(get_chunks(100, 7), 100, 10, 4, rng):
+            counts[partition] += 1
+
+    # Every key is expected to be sampled 50 times, independent of its chunk
+    assert counts.sum() == 5000
+    assert counts.min() > 20
+    assert counts.max() < 90
+
+
+def test_sample_chunks_all_keys():
+    rng = np.random.default_rng(42)
+    partitions = list(sample_chunks(get_chunks(10, 3), 10, 20, 4, rng))
+
+    assert [len(partition) for partition in partitions] == [4, 4, 2]
+    assert sorted(np.concatenate(partitions).tolist()) == list(range(10))
+    assert len(list(sample_chunks([], 0, 20, 4, rng))) == 0
+
+
+def test_sample_chunks_wrong_population_size():
+    rng = np.random.default_rng(42)
+
+    # If there are more keys than expected, we still return the sample size
+    samples = np.concatenate(list(sample_chunks(get_chunks(100, 10), 50, 30, 8, rng)))
+    assert len(np.unique(samples)) == 30
+
+    samples = np.concatenate(list(sample_chunks(get_chunks(100, 10), 0, 30, 8, rng)))
+    assert len(np.unique(samples)) == 30
+
+
+def test_sample_keys_and_timestamps():
+    rng = np.random.default_rng(42)
+    chunks = [(np.arange(start, start + 10), np.arange(start, start + 10) * 2) for start in range(0, 100, 10)]
+    sampled_chunks = list(sample_keys_and_timestamps(chunks, 100, 30, rng))
+
+    keys = np.concatenate([keys for keys, _ in sampled_chunks])
+    assert len(np.unique(keys)) == 30
+    assert np.all(np.diff(keys) > 0)
+    assert all(np.array_equal(timestamps, keys * 2) for keys, timestamps in sampled_chunks)
+
+    sampled_chunks = list(sample_keys_and_timestamps(chunks, 100, 200, rng))
+    assert np.array_equal(np.concatenate([keys for keys, _ in sampled_chunks]), np.arange(100))
+
+
+def test_order_by_timestamp():
+    chunks = [
+        (np.array([1, 2, 3]), np.array([10, 12, 11])),
+        (np.array([4, 5]), np.array([11, 13])),
+        (np.array([], dtype=np.int64), np.array([], dtype=np.int64)),
+        (np.array([6, 7]), np.array([13, 14])),
+        (np.array([8]), np.array([20])),
+    ]
+    ordered_chunks = list(order_by_timestamp(chunks))
+    assert [keys.tolist() for keys in ordered_chunks] == [[1, 3, 4, 2, 5], [6, 7], [8]]
+    assert not list(order_by_timestamp([]))
+
+
+def test_first_keys_of_chunks():
+    chunks = [np.arange(start, start + 5) for start in range(0, 20, 5)]
+    assert [keys.tolist() for keys in first_keys_of_chunks(chunks, 7)] == [list(range(5)), [5, 6]]
+    assert np.array_equal(np.concatenate(list(first_keys_of_chunks(chunks, None))), np.arange(20))
+    assert not list(first_keys_of_chunks(chunks, 0))
+
+
+def test_chunk_sample_size():
+    rng = np.random.default_rng(42)
+    assert _chunk_sample_size(10, 100, 0, rng) == 0
+    assert _chunk_sample_size(10, 10, 5, rng) == 5
+    assert 0 <= _chunk_sample_size(10, 100, 5, rng) <= 5
+
+    # Populations beyond NumPy's hypergeometric sampler
+    assert 0 <= _chunk_sample_size(10, 10**10, 5, rng) <= 5
+    assert _chunk_sample_size(10**6, 10**10, 10**10 - 10, rng) >= 10**6 - 10
+
+
+def test_last_keys_of_chunks():
+    partitions = list(last_keys_of_chunks(get_chunks(20, 3), 20, 7, 4))
+    assert [partition.tolist() for partition in partitions] == [[13, 14, 15, 16], [17, 18, 19]]
+
+    partitions = list(last_keys_of_chunks(get_chunks(5, 3), 5, 7, 4))
+    assert [partition.tolist() for partition in partitions] == [[0, 1, 2], [3, 4]]
+
+
+def test_even_partitions():
+    chunks = [np.arange(start, start + 5) for start in range(0, 25, 5)]
+    partitions = list(even_partitions(chunks, 25, 10))
+    assert [partition.tolist() for partition in partitions] == [
+        list(range(0, 9)),
+        list(range(9, 18)),
+        list(range(18, 25)),
+    ]
+
+    # Without the expected size, we use full partitions
+    partitions = list(even_partitions(iter(chunks), 0, 10))
+    assert [len(partition) for partition in partitions] == [10, 10, 5]
@@ -0,0 +1,44 @@
+import numpy as np
+from modyn.selector.internal.selector_strategies.used_key_index import UsedKeyIndex
+
+
+def test_load():
+    index = UsedKeyIndex()
+    assert not index.loaded
+    assert len(index) == 0
+    assert index.contains([1, 2]).tolist() == [False, False]
+
+    index.load([[5, 3], np.array([9, 3])])
+    assert index.loaded
+    assert len(index) == 3
+    assert index.contains([1, 3, 5, 7, 9, 11]).tolist() == [False, True, True, False, True, False]
+
+
+def test_mark_and_commit():
+    index = UsedKeyIndex()
+    index.load([[4, 2]])
+
+    index.mark([6, 2])
+    index.mark(np.array([1, 6]))
+    index.mark([])
+
+    # Marked keys are only added on commit
+    assert index.contains([1, 6]).tolist() == [False, False]
+    assert index.commit().tolist() == [1, 6]
+    assert index.contains([1, 2, 3, 4, 5, 6]).tolist() == [True, True, False, True, False, True]
+    assert len(index) == 4
+
+    assert index.commit().tolist() == []
+    index.mark([4])
+    assert index.commit().tolist() == []
+    assert len(index) == 4
+
+
+def test_mark_copies_keys():
+    index = UsedKeyIndex()
+    index.load([])
+    keys = np.array([1, 2, 3])
+    index.mark(keys[:2])
+    keys[0] = 10
+
+    assert index.commit().tolist() == [1, 2]
@@ -5,7 +5,7 @@ import tempfile
 
 import pytest
 from modyn.metadata_database.metadata_database_connection import MetadataDatabaseConnection
-from modyn.metadata_database.models import SelectorStateMetadata
+from modyn.metadata_database.models import SelectorStateCount, SelectorStateMetadata
 from modyn.selector.internal.storage_backend.database import DatabaseStorageBackend
 from modyn.utils.utils import flatten
 from sqlalchemy import select
@@ -42,7 +42,8 @@ def setup_and_teardown():
 
 def test_persist_samples():
     backend = DatabaseStorageBackend(42, get_minimal_modyn_config(), 1000)
-    backend.persist_samples(0, [10, 11, 12], [0, 1, 2], [40, 41, 42])
+    log = backend.persist_samples(0, [10, 11, 12], [0, 1, 2], [40, 41, 42])
+    assert sum(batch_log["batch_size"] for batch_log in log["persist_batches"]) == 3
 
     with MetadataDatabaseConnection(get_minimal_modyn_config()) as database:
         data = database.session.query(
@@ -66,6 +67,58 @@ def test_persist_samples():
         assert labels[0] == 40 and labels[1] == 41 and labels[2] == 42
 
 
+def test_sample_counts():
+    backend = DatabaseStorageBackend(42, get_minimal_modyn_config(), 1000)
+    backend.persist_samples(0, [10, 11, 12], [0, 1, 2], [40, 41, 40])
+    backend.persist_samples(0, [13, 14], [3, 4], [40, 42])
+    backend.persist_samples(1, [15, 16], [5, 6], [41, 41])
+    DatabaseStorageBackend(43, get_minimal_modyn_config(), 1000).persist_samples(0, [17], [7], [40])
+
+    with MetadataDatabaseConnection(get_minimal_modyn_config()) as database:
+        counts = database.session.query(
+            SelectorStateCount.seen_in_trigger_id, SelectorStateCount.label, SelectorStateCount.num_samples
+        ).filter(SelectorStateCount.pipeline_id == 42)
+        assert sorted(counts.all()) == [(0, 40, 3), (0, 41, 1), (0, 42, 1), (1, 41, 2)]
+
+    assert backend.get_sample_count() == 7
+    assert backend.get_sample_count(1) == 2
+    assert backend.get_sample_count(2) == 0
+    assert backend.get_sample_count_per_group("label") == {40: 3, 41: 3, 42: 1}
+    assert backend.get_sample_count_per_group("label", 1) == {41: 2}
+    assert backend.get_sample_count_per_group("seen_in_trigger_id") == {0: 5, 1: 2}
+
+
+def test_sample_counts_backfilled():
+    with MetadataDatabaseConnection(get_minimal_modyn_config()) as database:
+        database.add_selector_state_metadata_trigger(42, 0)
+        database.session.bulk_insert_mappings(
+            SelectorStateMetadata,
+            [
+                {"pipeline_id": 42, "sample_key": key, "timestamp": key, "label": label, "seen_in_trigger_id": 0}
+                for key, label in [(10, 40), (11, 41), (12, 40)]
+            ],
+        )
+        database.session.commit()
+
+    # The samples have been persisted without counts, e.g., by an older version
+    backend = DatabaseStorageBackend(42, get_minimal_modyn_config(), 1000)
+    assert backend.get_sample_count_per_group("label") == {40: 2, 41: 1}
+    backend.persist_samples(1, [13], [13], [41])
+    assert backend.get_sample_count_per_group("label") == {40: 2, 41: 2}
+    assert backend.get_available_labels(2) == [40, 41]
+
+
+def test_persist_samples_without_label():
+    backend = DatabaseStorageBackend(42, get_minimal_modyn_config(), 1000)
+    with pytest.raises(ValueError):
+        backend.persist_samples(0, [10, 11], [0, 1], [40, None])
+
+    # The samples are not persisted without their counts
+    with MetadataDatabaseConnection(get_minimal_modyn_config()) as database:
+        assert database.session.query(SelectorStateMetadata).count() == 0
+    assert backend.get_sample_count() == 0
+
+
 def test_get_data_since_trigger():
     backend = DatabaseStorageBackend(42, get_minimal_modyn_config(), 2)
     backend.persist_samples(0, [10, 11, 12], [0, 1, 2], [40, 41, 42])
@@ -113,34 +166,14 @@ def test_get_available_labels_with_tail():
     # Next trigger is 0
     assert sorted(backend.get_available_labels(0)) == []
 
-    with MetadataDatabaseConnection(get_minimal_modyn_config()) as database:
-        # first trigger
-        database.session.add(
-            SelectorStateMetadata(pipeline_id=1, sample_key=0, seen_in_trigger_id=0, timestamp=0, label=1)
-        )
-        database.session.add(
-            SelectorStateMetadata(pipeline_id=1, sample_key=1, seen_in_trigger_id=0, timestamp=0, label=18)
-        )
-        database.session.add(
-            SelectorStateMetadata(pipeline_id=1, sample_key=2, seen_in_trigger_id=0, timestamp=0, label=1)
-        )
-        database.session.add(
-            SelectorStateMetadata(pipeline_id=1, sample_key=3, seen_in_trigger_id=0, timestamp=0, label=0)
-        )
-        database.session.commit()
+    # first trigger
+    backend.persist_samples(0, [0, 1, 2, 3], [0, 0, 0, 0], [1, 18, 1, 0])
 
     # Next trigger is 1, trigger 0 has data now
     assert sorted(backend.get_available_labels(1)) == [0, 1, 18]
 
-    with MetadataDatabaseConnection(get_minimal_modyn_config()) as database:
-        # second trigger
-        database.session.add(
-            SelectorStateMetadata(pipeline_id=1, sample_key=4, seen_in_trigger_id=1, timestamp=0, label=0)
-        )
-        database.session.add(
-            SelectorStateMetadata(pipeline_id=1, sample_key=5, seen_in_trigger_id=1, timestamp=0, label=890)
-        )
-        database.session.commit()
+    # second trigger
+    backend.persist_samples(1, [4, 5], [0, 0], [0, 890])
 
     # Next trigger is 2, trigger 1 has data now
     assert sorted(backend.get_available_labels(2, tail_triggers=0)) == [0, 890]
@@ -151,34 +184,14 @@ def test_get_available_labels_no_tail():
     # Next trigger is 0
     assert sorted(backend.get_available_labels(0)) == []
 
-    with MetadataDatabaseConnection(get_minimal_modyn_config()) as database:
-        # first trigger
-        database.session.add(
-            SelectorStateMetadata(pipeline_id=1, sample_key=0, seen_in_trigger_id=0, timestamp=0, label=1)
-        )
-        database.session.add(
-            SelectorStateMetadata(pipeline_id=1, sample_key=1, seen_in_trigger_id=0, timestamp=0, label=18)
-        )
-        database.session.add(
-            SelectorStateMetadata(pipeline_id=1, sample_key=2, seen_in_trigger_id=0, timestamp=0, label=1)
-        )
-        database.session.add(
-            SelectorStateMetadata(pipeline_id=1, sample_key=3, seen_in_trigger_id=0, timestamp=0, label=0)
-        )
-        database.session.commit()
+    # first trigger
+    backend.persist_samples(0, [0, 1, 2, 3], [0, 0, 0, 0], [1, 18, 1, 0])
 
     # Next trigger is 1, trigger 0 has data now
     assert sorted(backend.get_available_labels(1)) == [0, 1, 18]
 
-    with MetadataDatabaseConnection(get_minimal_modyn_config()) as database:
-        # second trigger
-        database.session.add(
-            SelectorStateMetadata(pipeline_id=1, sample_key=4, seen_in_trigger_id=1, timestamp=0, label=0)
-        )
-        database.session.add(
-            SelectorStateMetadata(pipeline_id=1, sample_key=5, seen_in_trigger_id=1, timestamp=0, label=890)
-        )
-        database.session.commit()
+    # second trigger
+    backend.persist_samples(1, [4, 5], [0, 0], [0, 890])
 
     # Next trigger is 2, trigger 1 has data now
     assert sorted(backend.get_available_labels(2)) == [0, 1, 18, 890]
@@ -0,0 +1,154 @@
+import os
+import pathlib
+import shutil
+import struct
+import tempfile
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+from modyn.metadata_database.metadata_database_connection import MetadataDatabaseConnection
+from modyn.metadata_database.models import SelectorStateMetadata
+from modyn.selector.internal.storage_backend.database.selector_state_bulk_loader import (
+    COPY_COLUMNS,
+    PGCOPY_HEADER,
+    PGCOPY_ROW_DTYPE,
+    PGCOPY_TRAILER,
+    encode_pgcopy_binary,
+    get_writer_pool,
+    persist_samples_batched,
+    write_batch,
+)
+
+database_path = pathlib.Path(os.path.abspath(__file__)).parent / "test_bulk_loader.db"
+TMP_DIR = tempfile.mkdtemp()
+
+
+def get_minimal_modyn_config():
+    return {
+        "metadata_database": {
+            "drivername": "sqlite",
+            "username": "",
+            "password": "",
+            "host": "",
+            "port": "0",
+            "database": f"{database_path}",
+        },
+        "selector": {"insertion_threads": 3, "trigger_sample_directory": TMP_DIR},
+    }
+
+
+@pytest.fixture(scope="function", autouse=True)
+def setup_and_teardown():
+    pathlib.Path(TMP_DIR).mkdir(parents=True, exist_ok=True)
+
+    with MetadataDatabaseConnection(get_minimal_modyn_config()) as database:
+        database.create_tables()
+    yield
+
+    os.remove(database_path)
+    shutil.rmtree(TMP_DIR)
+
+
+def get_persisted_samples() -> list[tuple]:
+    with MetadataDatabaseConnection(get_minimal_modyn_config()) as database:
+        return (
+            database.session.query(
+                SelectorStateMetadata.pipeline_id,
+                SelectorStateMetadata.seen_in_trigger_id,
+                SelectorStateMetadata.sample_key,
+                SelectorStateMetadata.timestamp,
+                SelectorStateMetadata.label,
+                SelectorStateMetadata.used,
+                SelectorStateMetadata.last_used_in_trigger,
+            )
+            .order_by(SelectorStateMetadata.sample_key)
+            .all()
+        )
+
+
+def test_encode_pgcopy_binary():
+    data = encode_pgcopy_binary(42, 3, [10, 2**40], [5, 6], [0, 1])
+
+    assert data.startswith(PGCOPY_HEADER) and data.endswith(PGCOPY_TRAILER)
+    assert len(data) == len(PGCOPY_HEADER) + 2 * PGCOPY_ROW_DTYPE.itemsize + len(PGCOPY_TRAILER)
+    assert PGCOPY_ROW_DTYPE.itemsize == 2 + 7 * 4 + 4 + 8 + 4 + 1 + 8 + 4 + 4
+
+    # First tuple: number of fields, then (length, value) for every column
+    first_row = data[len(PGCOPY_HEADER) : len(PGCOPY_HEADER) + PGCOPY_ROW_DTYPE.itemsize]
+    assert struct.unpack(">hiiiqiiibiqiiii", first_row) == (
+        len(COPY_COLUMNS), 4, 42, 8, 10, 4, 3, 1, 0, 8, 5, 4, 0, 4, -1
+    )  # fmt: skip
+
+    rows = np.frombuffer(data[len(PGCOPY_HEADER) : -len(PGCOPY_TRAILER)], dtype=PGCOPY_ROW_DTYPE)
+    assert rows["sample_key"].tolist() == [10, 2**40]
+    assert rows["label"].tolist() == [0, 1]
+
+
+def test_write_batch_bulk_insert():
+    log = write_batch(get_minimal_modyn_config(), 42, 3, [10, 11], [5, 6], [0, 1])
+
+    assert log["batch_size"] == 2
+    assert log["method"] == "bulk_insert"
+    assert log["persist_batch_time"] >= 0
+    assert get_persisted_samples() == [(42, 3, 10, 5, 0, False, -1), (42, 3, 11, 6, 1, False, -1)]
+
+
+@patch("modyn.selector.internal.storage_backend.database.selector_state_bulk_loader._get_writer_connection")
+def test_write_batch_copy(test_get_writer_connection: MagicMock):
+    config = get_minimal_modyn_config()
+    config["metadata_database"]["drivername"] = "postgresql"
+    database = MagicMock()
+    database.session.bind.dialect.name = "postgresql"
+    test_get_writer_connection.return_value = database
+    cursor = database.session.connection.return_value.connection.cursor.return_value
+
+    keys, timestamps, labels = [10, 11], [5, 6], [0, 1]
+    log = write_batch(config, 42, 3, keys, timestamps, labels)
+
+    assert log["method"] == "copy"
+    test_get_writer_connection.assert_called_once_with(config)
+    statement, stream = cursor.copy_expert.call_args[0]
+    assert statement.startswith("COPY selector_state_metadata__pid42__tid3 (pipeline_id, sample_key,")
+    assert statement.endswith("FROM STDIN WITH (FORMAT binary)")
+    assert stream.getvalue() == encode_pgcopy_binary(42, 3, keys, timestamps, labels)
+    # The counts are upserted in the transaction of the samples
+    database.session.execute.assert_called_once()
+    database.session.commit.assert_called_once()
+
+
+@patch("modyn.selector.internal.storage_backend.database.selector_state_bulk_loader._get_writer_connection")
+def test_write_batch_copy_rollback(test_get_writer_connection: MagicMock):
+    config = get_minimal_modyn_config()
+    config["metadata_database"]["drivername"] = "postgresql"
+    database = MagicMock()
+    test_get_writer_connection.return_value = database
+    database.session.connection.return_value.connection.cursor.return_value.copy_expert.side_effect = RuntimeError
+
+    with pytest.raises(RuntimeError):
+        write_batch(config, 42, 3, [10], [5], [0])
+    database.session.rollback.assert_called_once()
+    database.session.commit.assert_not_called()
+
+
+def test_persist_samples_batched():
+    keys = list(range(10))
+    logs = persist_samples_batched(get_minimal_modyn_config(), 42, 3, keys, keys, keys, 3, min_batch_size=1)
+
+    assert [log["batch_size"] for log in logs] == [4, 4, 2]
+    assert [sample[2] for sample in get_persisted_samples()] == keys
+
+    # The writer processes are reused
+    assert get_writer_pool(3) is get_writer_pool(3)
+    logs = persist_samples_batched(get_minimal_modyn_config(), 42, 4, keys, keys, keys, 3, min_batch_size=5)
+    assert [log["batch_size"] for log in logs] == [5, 5]
+    assert len(get_persisted_samples()) == 20
+    assert persist_samples_batched(get_minimal_modyn_config(), 42, 5, [], [], [], 3) == []
+
+
+def test_persist_samples_batched_single_process():
+    logs = persist_samples_batched(get_minimal_modyn_config(), 42, 3, [10, 11], [5, 6], [0, 1], 0)
+
+    assert len(logs) == 1
+    assert logs[0]["writer"] == os.getpid()
+    assert len(get_persisted_samples()) == 2
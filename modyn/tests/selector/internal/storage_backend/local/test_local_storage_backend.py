@@ -0,0 +1,171 @@
+import pathlib
+import shutil
+import tempfile
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from modyn.selector.internal.storage_backend.local import LocalStorageBackend
+from modyn.selector.internal.storage_backend.local.local_storage_backend import TriggerSegment
+from modyn.utils.utils import flatten
+
+TMP_DIR = tempfile.mkdtemp()
+
+
+def get_minimal_modyn_config():
+    return {
+        "selector": {
+            "insertion_threads": 8,
+            "trigger_sample_directory": "/does/not/exist",
+            "local_storage_directory": TMP_DIR,
+        },
+    }
+
+
+@pytest.fixture(scope="function", autouse=True)
+def setup_and_teardown():
+    pathlib.Path(TMP_DIR).mkdir(parents=True, exist_ok=True)
+    yield
+    shutil.rmtree(TMP_DIR)
+
+
+def get_backend(maximum_keys_in_memory: int = 1000) -> LocalStorageBackend:
+    backend = LocalStorageBackend(42, get_minimal_modyn_config(), maximum_keys_in_memory)
+    backend.persist_samples(0, [10, 11, 12], [0, 1, 2], [40, 41, 42])
+    backend.persist_samples(1, [13, 14, 15], [3, 4, 5], [40, 41, 42])
+    backend.persist_samples(2, [16, 17, 18], [6, 7, 8], [43, 43, 43])
+    return backend
+
+
+def test_trigger_segment_append():
+    segment = TriggerSegment(3)
+    segment.append([1, 2], [10, 20], [0, 1])
+    segment.append([], [], [])
+    segment.append([3], [30], [2])
+
+    assert segment.size == 3
+    assert segment["keys"].tolist() == [1, 2, 3]
+    assert segment["timestamps"].tolist() == [10, 20, 30]
+    assert segment["labels"].tolist() == [0, 1, 2]
+    assert not segment["used"].any()
+
+
+def test_trigger_segment_spill():
+    segment = TriggerSegment(3)
+    segment.append([1, 2], [10, 20], [0, 1])
+    segment.spill(pathlib.Path(TMP_DIR))
+
+    assert segment.spilled
+    assert isinstance(segment["keys"], np.memmap)
+    assert (pathlib.Path(TMP_DIR) / "trigger_3_keys.npy").exists()
+    assert segment["keys"].tolist() == [1, 2]
+
+    # Spilled segments can still be updated and appended to
+    segment["used"][0] = True
+    segment.append([3], [30], [2])
+    assert not segment.spilled
+    assert segment["keys"].tolist() == [1, 2, 3]
+    assert segment["used"].tolist() == [True, False, False]
+
+
+def test_persist_samples():
+    backend = LocalStorageBackend(42, get_minimal_modyn_config(), 1000)
+    log = backend.persist_samples(0, [10, 11, 12], [0, 1, 2], [40, 41, 42])
+
+    assert log["spilled_triggers"] == []
+    assert list(backend._segments.keys()) == [0]
+    assert backend._segments[0]["keys"].tolist() == [10, 11, 12]
+    assert backend._segments[0]["timestamps"].tolist() == [0, 1, 2]
+    assert backend._segments[0]["labels"].tolist() == [40, 41, 42]
+
+
+def test_persist_samples_spills_previous_triggers():
+    backend = LocalStorageBackend(42, get_minimal_modyn_config(), 4)
+    assert backend.persist_samples(0, [10, 11, 12], [0, 1, 2], [40, 41, 42])["spilled_triggers"] == []
+    # The current trigger is never spilled, even if it exceeds the limit
+    assert backend.persist_samples(1, [13, 14, 15, 16, 17], [3, 4, 5, 6, 7], [40, 41, 42, 43, 44])[
+        "spilled_triggers"
+    ] == [0]
+    assert backend._segments[0].spilled and not backend._segments[1].spilled
+    assert (pathlib.Path(TMP_DIR) / "pipeline_42" / "trigger_0_keys.npy").exists()
+
+    assert flatten([keys for keys, _ in backend.get_all_data()]) == [10, 11, 12, 13, 14, 15, 16, 17]
+
+
+def test_get_trigger_data():
+    backend = get_backend(2)
+
+    data = [keys for keys, _ in backend.get_trigger_data(1)]
+    assert data == [[13, 14], [15]]
+    assert [keys for keys, _ in backend.get_trigger_data(5)] == []
+
+
+def test_get_data_since_trigger():
+    backend = get_backend(2)
+
+    data_since_trigger_one = [keys for keys, _ in backend.get_data_since_trigger(1)]
+    assert len(data_since_trigger_one) == 3  # Validate partitioning
+    assert flatten(data_since_trigger_one) == [13, 14, 15, 16, 17, 18]  # Validate content
+
+
+def test_get_all_data():
+    backend = get_backend(4)
+
+    data = [keys for keys, _ in backend.get_all_data()]
+    assert data == [[10, 11, 12, 13], [14, 15, 16, 17], [18]]
+
+
+def test_get_available_labels():
+    backend = get_backend()
+
+    assert backend.get_available_labels(0) == []
+    assert backend.get_available_labels(2) == [40, 41, 42]
+    assert backend.get_available_labels(3) == [40, 41, 42, 43]
+    assert backend.get_available_labels(3, tail_triggers=0) == [43]
+    assert backend.get_available_labels(3, tail_triggers=1) == [40, 41, 42, 43]
+
+
+def test_mark_used_and_counts():
+    backend = get_backend()
+    assert backend.get_sample_count() == 9
+    assert backend.get_sample_count(smallest_included_trigger_id=1) == 6
+
+    backend.mark_used([11, 14, 18, 99])
+    backend.mark_used([])
+    assert backend.get_sample_count(used=True) == 3
+    assert backend.get_sample_count(used=False) == 6
+    assert backend.get_sample_count(used=True, smallest_included_trigger_id=2) == 1
+    assert flatten([keys for keys, _ in backend.get_unused_data()]) == [10, 12, 13, 15, 16, 17]
+
+
+def test_get_used_data():
+    backend = get_backend()
+    backend.mark_used([11, 14, 18])
+
+    assert [keys for keys, _ in backend.get_used_data(yield_per=2)] == [[11, 14], [18]]
+    assert [keys for keys, _ in backend.get_unused_data(yield_per=4)] == [[10, 12, 13, 15], [16, 17]]
+
+
+def test_chunks_across_spilled_segments():
+    backend = LocalStorageBackend(42, get_minimal_modyn_config(), 2)
+    backend.persist_samples(0, [10, 11, 12], [0, 1, 2], [0, 0, 0])
+    backend.persist_samples(1, [13], [3], [0])
+    backend.persist_samples(2, [14, 15, 16, 17, 18], [4, 5, 6, 7, 8], [0, 0, 0, 0, 0])
+    assert backend._segments[0].spilled and backend._segments[1].spilled
+
+    # The chunks do not depend on the segments, and the spilled segments are read one at a time
+    with patch("numpy.concatenate", wraps=np.concatenate) as concatenate_mock:
+        assert [keys for keys, _ in backend.get_all_data()] == [[10, 11], [12, 13], [14, 15], [16, 17], [18]]
+        assert all(sum(len(array) for array in call.args[0]) <= 2 for call in concatenate_mock.call_args_list)
+
+    assert [keys for keys, _ in backend.get_all_data()] == [[10, 11], [12, 13], [14, 15], [16, 17], [18]]
+    assert [keys for keys, _ in backend.get_data_since_trigger(1)] == [[13, 14], [15, 16], [17, 18]]
+
+
+def test_get_keys_and_timestamps():
+    backend = get_backend()
+
+    chunks = list(backend.get_keys_and_timestamps(1, yield_per=2))
+    assert [keys.tolist() for keys, _ in chunks] == [[13, 14], [15], [16, 17], [18]]
+    assert [timestamps.tolist() for _, timestamps in chunks] == [[3, 4], [5], [6, 7], [8]]
+    assert sum(len(keys) for keys, _ in backend.get_keys_and_timestamps()) == 9
@@ -219,3 +219,32 @@ def test_get_number_of_samples(selector_get_number_of_samples: MagicMock, test__
             selec.get_number_of_samples(pipe_id + 1, 0)
 
         selector_get_number_of_samples.assert_called_once_with(21)
+
+
+@patch("modyn.selector.internal.selector_manager.MetadataDatabaseConnection", MockDatabaseConnection)
+@patch.object(SelectorManager, "init_metadata_db", noop_init_metadata_db)
+@patch.object(SelectorManager, "_instantiate_strategy")
+def test_trigger_cache_shared_between_selectors(test__instantiate_strategy: MagicMock):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config = get_modyn_config()
+        config["selector"]["trigger_sample_directory"] = tmp_dir
+        selec = SelectorManager(config)
+        test__instantiate_strategy.return_value = MockStrategy()
+
+        selec._populate_pipeline_if_exists(EXISTING_PIPELINE_ID)
+        assert selec._selectors[EXISTING_PIPELINE_ID]._trigger_cache is selec._trigger_cache
+
+        selec._trigger_cache.put(EXISTING_PIPELINE_ID, 21, 0, [(10, 1.0), (11, 1.0)])
+        assert selec._trigger_cache.get(EXISTING_PIPELINE_ID, 21, 0) is not None
+        assert selec.get_cache_stats()["cached_keys"] == 2
+
+        assert selec.evict_trigger_from_cache(EXISTING_PIPELINE_ID, 21) == 2
+        assert selec.evict_trigger_from_cache(EXISTING_PIPELINE_ID, 21) == 0
+        assert selec.get_cache_stats() == {
+            "hits": 1,
+            "misses": 0,
+            "evictions": 1,
+            "cached_keys": 0,
+            "cached_partitions": 0,
+        }
+        selec.clear_cache()
@@ -0,0 +1,116 @@
+# pylint: disable=redefined-outer-name
+import multiprocessing as mp
+from multiprocessing import Manager
+
+import numpy as np
+import pytest
+from modyn.common.trigger_sample import ArrayWrapper
+from modyn.selector.internal.trigger_partition_cache import TriggerPartitionCache
+
+
+@pytest.fixture
+def manager():
+    with Manager() as sync_manager:
+        yield sync_manager
+
+
+def samples(*keys: int) -> list[tuple[int, float]]:
+    return [(key, float(key)) for key in keys]
+
+
+def test_put_and_get(manager):
+    cache = TriggerPartitionCache(manager, 10)
+    assert cache.get(1, 2, 0) is None
+
+    assert cache.put(1, 2, 0, samples(10, 11, 12))
+    assert cache.put(1, 2, 1, ArrayWrapper(np.array(samples(13), dtype=np.dtype("i8,f8"))))
+    assert cache.put(1, 2, 2, [])
+
+    result = cache.get(1, 2, 0)
+    assert result.tolist() == samples(10, 11, 12)
+    assert not result.flags.writeable
+    assert cache.get(1, 2, 1).tolist() == samples(13)
+    assert len(cache.get(1, 2, 2)) == 0
+    assert cache.get(2, 2, 0) is None
+
+    assert cache.stats == {"hits": 3, "misses": 2, "evictions": 0, "cached_keys": 4, "cached_partitions": 3}
+    cache.clear()
+    assert cache.stats["cached_partitions"] == 0
+
+
+def test_put_existing_partition(manager):
+    cache = TriggerPartitionCache(manager, 10)
+    assert cache.put(1, 2, 0, samples(10))
+    assert cache.put(1, 2, 0, samples(11, 12))
+
+    assert cache.get(1, 2, 0).tolist() == samples(10)
+    assert cache.stats["cached_keys"] == 1
+    cache.clear()
+
+
+def test_partition_exceeding_cache(manager):
+    cache = TriggerPartitionCache(manager, 2)
+    assert not cache.put(1, 2, 0, samples(10, 11, 12))
+    assert cache.get(1, 2, 0) is None
+
+
+def test_lru_eviction(manager):
+    cache = TriggerPartitionCache(manager, 4)
+    cache.put(1, 2, 0, samples(10, 11))
+    cache.put(1, 2, 1, samples(12, 13))
+
+    # Accessing the first partition makes the second one the least recently used one
+    first_partition = cache.get(1, 2, 0)
+    cache.put(1, 3, 0, samples(14))
+
+    assert cache.get(1, 2, 1) is None
+    assert cache.get(1, 2, 0).tolist() == samples(10, 11)
+    assert cache.get(1, 3, 0).tolist() == samples(14)
+    assert cache.stats["evictions"] == 1
+    assert cache.stats["cached_keys"] == 3
+
+    # Views of evicted partitions stay valid
+    cache.clear()
+    assert first_partition.tolist() == samples(10, 11)
+
+
+def test_evict_trigger(manager):
+    cache = TriggerPartitionCache(manager, 10)
+    cache.put(1, 2, 0, samples(10))
+    cache.put(1, 2, 1, samples(11, 12))
+    cache.put(1, 3, 0, samples(13))
+    cache.put(2, 2, 0, samples(14))
+    cache.get(1, 2, 0)
+
+    assert cache.evict_trigger(1, 2) == 3
+    assert cache.evict_trigger(1, 2) == 0
+    assert cache.get(1, 2, 0) is None
+    assert cache.get(1, 3, 0) is not None
+    assert cache.get(2, 2, 0) is not None
+    assert cache.stats["evictions"] == 2
+    assert cache.stats["cached_keys"] == 2
+
+    # Mappings of evicted segments are closed by the process
+    assert len(cache._segments) == 2
+    cache.clear()
+    assert len(cache._segments) == 0
+
+
+def _read_partition(cache: TriggerPartitionCache, result_queue: mp.Queue) -> None:
+    result_queue.put(cache.get(1, 2, 0).tolist())
+    cache.put(1, 2, 1, samples(12))
+
+
+def test_shared_between_processes(manager):
+    cache = TriggerPartitionCache(manager, 10)
+    cache.put(1, 2, 0, samples(10, 11))
+
+    result_queue: mp.Queue = mp.Queue()
+    process = mp.Process(target=_read_partition, args=(cache, result_queue))
+    process.start()
+    assert result_queue.get(timeout=30) == samples(10, 11)
+    process.join()
+
+    assert cache.get(1, 2, 1).tolist() == samples(12)
+    assert cache.stats["hits"] == 2
+    cache.clear()
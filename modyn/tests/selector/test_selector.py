@@ -1,12 +1,22 @@
 # pylint: disable=no-value-for-parameter,redefined-outer-name
+from multiprocessing import Manager
 from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
 from modyn.selector.internal.selector_strategies.abstract_selection_strategy import AbstractSelectionStrategy
+from modyn.selector.internal.trigger_partition_cache import TriggerPartitionCache
 from modyn.selector.selector import Selector
 
 
+@pytest.fixture
+def trigger_cache():
+    with Manager() as manager:
+        cache = TriggerPartitionCache(manager, 10)
+        yield cache
+        cache.clear()
+
+
 class MockStrategy(AbstractSelectionStrategy):
     def __init__(self):  # pylint: disable=super-init-not-called
         pass
@@ -30,9 +40,10 @@ def test_init():
     assert selec._num_workers == 2
 
 
-def test_get_sample_keys_and_weights_cached():
-    selector = Selector(MockStrategy(), 42, 3, {})
-    selector._trigger_cache[42] = [[(10, 1.0), (11, 1.0)], [(12, 1.0), (13, 1.0)]]
+def test_get_sample_keys_and_weights_cached(trigger_cache):
+    selector = Selector(MockStrategy(), 42, 3, {}, trigger_cache)
+    trigger_cache.put(42, 42, 0, [(10, 1.0), (11, 1.0)])
+    trigger_cache.put(42, 42, 1, [(12, 1.0), (13, 1.0)])
     selector._trigger_partition_cache[42] = 2
     selector._trigger_size_cache[42] = 4
 
@@ -48,6 +59,20 @@ def test_get_sample_keys_and_weights_cached():
     with pytest.raises(ValueError):
         selector.get_sample_keys_and_weights(42, 2, 1337)
 
+    assert trigger_cache.stats["hits"] == 2
+
+
+@patch.object(MockStrategy, "get_trigger_partition_keys")
+def test_get_sample_keys_and_weights_cache_miss(test_get_trigger_partition_keys: MagicMock, trigger_cache):
+    selector = Selector(MockStrategy(), 42, 3, {}, trigger_cache)
+    selector._trigger_partition_cache[42] = 1
+    selector._trigger_size_cache[42] = 2
+    test_get_trigger_partition_keys.return_value = [(10, 1.0), (11, 1.0)]
+
+    assert selector.get_sample_keys_and_weights(42, 2, 0) == [(10, 1.0), (11, 1.0)]
+    test_get_trigger_partition_keys.assert_called_once_with(42, 0, 2, 3)
+    assert trigger_cache.stats["misses"] == 1
+
 
 @patch.object(MockStrategy, "get_trigger_partition_keys")
 def test_get_sample_keys_and_weight_no_cache(test_get_trigger_partition_keys: MagicMock):
@@ -75,24 +100,25 @@ def test_inform_data(test_inform_data: MagicMock):
 @patch.object(MockStrategy, "trigger")
 @patch.object(MockStrategy, "get_trigger_partition_keys")
 def test_inform_data_and_trigger_caching(
-    test_get_trigger_partition_keys: MagicMock, test_trigger: MagicMock, test_inform_data: MagicMock
+    test_get_trigger_partition_keys: MagicMock, test_trigger: MagicMock, test_inform_data: MagicMock, trigger_cache
 ):
-    selector = Selector(MockStrategy(), 42, 3, {})
-    assert selector._current_keys_in_cache == 0
+    selector = Selector(MockStrategy(), 42, 3, {}, trigger_cache)
+    assert trigger_cache.stats["cached_keys"] == 0
 
     test_trigger.return_value = (42, 2, 2, {})  # 2 keys in trigger, 2 partitions
     test_get_trigger_partition_keys.return_value = [(10, 1.0)]
 
-    selector._maximum_keys_in_cache = 10  # Enforce that 2 keys fit into cache
-
-    trigger_id, _ = selector.inform_data_and_trigger([10, 11, 12], [0, 1, 2], ["cat", "dog", "cat"])
+    # The cache can hold 10 keys, i.e., both partitions fit into the cache
+    trigger_id, log = selector.inform_data_and_trigger([10, 11, 12], [0, 1, 2], ["cat", "dog", "cat"])
 
     test_inform_data.assert_called_once_with([10, 11, 12], [0, 1, 2], ["cat", "dog", "cat"])
     assert trigger_id == 42
     # We have two partitions with [(10, 1.0)] as data
 
     # This test configures the selector to store the partitions in memory
-    assert selector._trigger_cache[42] == [[(10, 1.0)], [(10, 1.0)]]
+    assert log["cached"]
+    for partition_id in range(2):
+        assert trigger_cache.get(42, 42, partition_id).tolist() == [(10, 1.0)]
     assert selector._trigger_partition_cache[42] == 2
     assert selector._trigger_size_cache[42] == 2
 
@@ -103,21 +129,23 @@ def test_inform_data_and_trigger_caching(
 def test_inform_data_and_trigger_nocaching(
     test_get_trigger_partition_keys: MagicMock, test_trigger: MagicMock, test_inform_data: MagicMock
 ):
-    selector = Selector(MockStrategy(), 42, 3, {})
-    assert selector._current_keys_in_cache == 0
+    with Manager() as manager:
+        # Enforce that 1 key fit into cache => we can't cache 2 keys
+        trigger_cache = TriggerPartitionCache(manager, 1)
+        selector = Selector(MockStrategy(), 42, 3, {}, trigger_cache)
 
-    test_trigger.return_value = (42, 2, 2, {})  # 2 keys in trigger, 2 partitions
-    test_get_trigger_partition_keys.return_value = [(10, 1.0)]
+        test_trigger.return_value = (42, 2, 2, {})  # 2 keys in trigger, 2 partitions
+        test_get_trigger_partition_keys.return_value = [(10, 1.0)]
 
-    # Enforce that 1 key fit into cache => we can't cache 2 keys
-    selector._maximum_keys_in_cache = 1
+        trigger_id, log = selector.inform_data_and_trigger([10, 11, 12], [0, 1, 2], ["cat", "dog", "cat"])
+        assert trigger_cache.stats["cached_keys"] == 0
 
-    trigger_id, _ = selector.inform_data_and_trigger([10, 11, 12], [0, 1, 2], ["cat", "dog", "cat"])
     test_inform_data.assert_called_once_with([10, 11, 12], [0, 1, 2], ["cat", "dog", "cat"])
     assert trigger_id == 42
 
     # This test configures the selector such that the partitions do not fit into cache
-    assert 42 not in selector._trigger_cache
+    assert not log["cached"]
+    test_get_trigger_partition_keys.assert_not_called()
     assert selector._trigger_size_cache[42] == 2
     assert selector._trigger_partition_cache[42] == 2
 
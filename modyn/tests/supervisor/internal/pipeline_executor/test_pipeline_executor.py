@@ -381,6 +381,7 @@ def test__handle_triggers_within_batch_empty_triggers(
     test_inform_selector.assert_called_once_with(42, [(14, 5), (15, 6), (16, 7)])
 
 
+@patch.object(GRPCHandler, "evict_trigger_from_selector_cache")
 @patch.object(GRPCHandler, "store_trained_model", return_value=101)
 @patch.object(GRPCHandler, "start_training", return_value=1337)
 @patch.object(GRPCHandler, "start_evaluation")
@@ -390,6 +391,7 @@ def test__run_training(
     test_start_evaluation: MagicMock,
     test_start_training: MagicMock,
     test_store_trained_model: MagicMock,
+    test_evict_trigger_from_selector_cache: MagicMock,
 ):
     pe = get_non_connecting_pipeline_executor()  # pylint: disable=no-value-for-parameter
     pe.pipeline_id = 42
@@ -399,11 +401,13 @@ def test__run_training(
     assert pe.current_training_id == 1337
 
     test_wait_for_training_completion.assert_called_once_with(1337, 42, 21)
+    test_evict_trigger_from_selector_cache.assert_called_once_with(42, 21)
     test_start_training.assert_called_once_with(42, 21, get_minimal_pipeline_config(), None)
     test_store_trained_model.assert_called_once()
     test_start_evaluation.assert_not_called()
 
 
+@patch.object(GRPCHandler, "evict_trigger_from_selector_cache")
 @patch.object(GRPCHandler, "store_trained_model", return_value=101)
 @patch.object(GRPCHandler, "start_training", return_value=1337)
 @patch.object(GRPCHandler, "store_evaluation_results")
@@ -417,6 +421,7 @@ def test__run_training_with_evaluation(
     test_store_evaluation_results: MagicMock,
     test_start_training: MagicMock,
     test_store_trained_model: MagicMock,
+    test_evict_trigger_from_selector_cache: MagicMock,
 ):
     evaluations = {1: EvaluationStatusReporter(TRAINING_STATUS_QUEUE, EVAL_ID, "MNIST_eval", 1000)}
     test_start_evaluation.return_value = evaluations
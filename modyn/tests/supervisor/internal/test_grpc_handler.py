@@ -18,6 +18,8 @@ from modyn.evaluator.internal.grpc.generated.evaluator_pb2_grpc import Evaluator
 from modyn.selector.internal.grpc.generated.selector_pb2 import (
     DataInformRequest,
     DataInformResponse,
+    EvictTriggerRequest,
+    EvictTriggerResponse,
     GetNumberOfSamplesRequest,
     JsonString,
     NumberOfSamplesResponse,
@@ -355,6 +357,19 @@ def test_get_number_of_samples(test_connection_established):
         samples_method.assert_called_once_with(GetNumberOfSamplesRequest(pipeline_id=12, trigger_id=13))
 
 
+@patch("modyn.supervisor.internal.grpc_handler.grpc_connection_established", return_value=True)
+def test_evict_trigger_from_selector_cache(test_connection_established):
+    handler = GRPCHandler(get_simple_config(), mp.Queue(), mp.Queue(), mp.Queue())
+    handler.init_cluster_connection()
+    assert handler.selector is not None
+
+    with patch.object(
+        handler.selector, "evict_trigger_from_cache", return_value=EvictTriggerResponse(evicted_keys=42)
+    ) as evict_method:
+        assert handler.evict_trigger_from_selector_cache(12, 13) == 42
+        evict_method.assert_called_once_with(EvictTriggerRequest(pipeline_id=12, trigger_id=13))
+
+
 def test_stop_training_at_trainer_server():
     handler = get_non_connecting_handler()
     training_id = 42
@@ -527,8 +542,7 @@ def test_store_evaluation_results(test_connection_established):
 
             with open(file_path, "r", encoding="utf-8") as eval_file:
                 evaluation_results = json.load(eval_file)
-                assert evaluation_results == json.loads(
-                    """{
+                assert evaluation_results == json.loads("""{
                     "datasets": [
                         {
                             "MNIST_small": {
@@ -561,8 +575,7 @@ def test_store_evaluation_results(test_connection_established):
                             }
                         }
                     ]
-                }"""
-                )
+                }""")
 
 
 @patch("modyn.supervisor.internal.grpc_handler.grpc_connection_established", return_value=True)
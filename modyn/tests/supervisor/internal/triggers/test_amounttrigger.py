@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from modyn.supervisor.internal.triggers import DataAmountTrigger
 
@@ -20,23 +21,34 @@ def test_inform() -> None:
     trigger = DataAmountTrigger({"data_points_for_trigger": 1})
     # pylint: disable-next=use-implicit-booleaness-not-comparison
     assert trigger.inform([]) == []
-    assert trigger.inform([(10, 1)]) == [0]
-    assert trigger.inform([(10, 1), (10, 1)]) == [0, 1]
-    assert trigger.inform([(10, 1), (10, 1), (10, 1)]) == [0, 1, 2]
+    assert trigger.inform([(10, 1, 0)]) == [0]
+    assert trigger.inform([(10, 1, 0), (10, 1, 0)]) == [0, 1]
+    assert trigger.inform([(10, 1, 0), (10, 1, 0), (10, 1, 0)]) == [0, 1, 2]
 
     trigger = DataAmountTrigger({"data_points_for_trigger": 2})
     # pylint: disable-next=use-implicit-booleaness-not-comparison
-    assert trigger.inform([(10, 1)]) == []
-    assert trigger.inform([(10, 1)]) == [0]
-    assert trigger.inform([(10, 1), (10, 1)]) == [1]
-    assert trigger.inform([(10, 1), (10, 1), (10, 1), (10, 1)]) == [1, 3]
-    assert trigger.inform([(10, 1), (10, 1), (10, 1)]) == [1]
-    assert trigger.inform([(10, 1)]) == [0]
-    assert trigger.inform([(10, 1), (10, 1), (10, 1), (10, 1), (10, 1)]) == [1, 3]
-    assert trigger.inform([(10, 1)]) == [0]
+    assert trigger.inform([(10, 1, 0)]) == []
+    assert trigger.inform([(10, 1, 0)]) == [0]
+    assert trigger.inform([(10, 1, 0), (10, 1, 0)]) == [1]
+    assert trigger.inform([(10, 1, 0), (10, 1, 0), (10, 1, 0), (10, 1, 0)]) == [1, 3]
+    assert trigger.inform([(10, 1, 0), (10, 1, 0), (10, 1, 0)]) == [1]
+    assert trigger.inform([(10, 1, 0)]) == [0]
+    assert trigger.inform([(10, 1, 0), (10, 1, 0), (10, 1, 0), (10, 1, 0), (10, 1, 0)]) == [1, 3]
+    assert trigger.inform([(10, 1, 0)]) == [0]
 
     trigger = DataAmountTrigger({"data_points_for_trigger": 5})
     # pylint: disable-next=use-implicit-booleaness-not-comparison
-    assert trigger.inform([(10, 1), (10, 1), (10, 1), (10, 1)]) == []
-    assert trigger.inform([(10, 1), (10, 1), (10, 1)]) == [0]
-    assert trigger.inform([(10, 1), (10, 1), (10, 1)]) == [2]
+    assert trigger.inform([(10, 1, 0), (10, 1, 0), (10, 1, 0), (10, 1, 0)]) == []
+    assert trigger.inform([(10, 1, 0), (10, 1, 0), (10, 1, 0)]) == [0]
+    assert trigger.inform([(10, 1, 0), (10, 1, 0), (10, 1, 0)]) == [2]
+
+
+def test_inform_columns() -> None:
+    trigger = DataAmountTrigger({"data_points_for_trigger": 3})
+    keys = np.arange(10, dtype=np.int64)
+
+    assert trigger.inform_columns(keys[:2], keys[:2], keys[:2]).tolist() == []
+    result = trigger.inform_columns(keys, keys, keys)
+    assert result.dtype == np.int64
+    assert result.tolist() == [0, 3, 6, 9]
+    assert trigger.remaining_data_points == 0
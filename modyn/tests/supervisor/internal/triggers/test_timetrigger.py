@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from modyn.supervisor.internal.triggers import TimeTrigger
 
@@ -43,3 +44,34 @@ def test_inform() -> None:
     ]
     assert trigger.inform([(10, 15000, LABEL)]) == [-1, -1, -1, -1, -1, -1]
     assert trigger.inform([(10, 17000, LABEL), (10, 18000, LABEL)]) == [-1, -1, 0]
+
+
+def test_inform_columns() -> None:
+    trigger = TimeTrigger({"trigger_every": "10s"})
+    timestamps = np.array([0, 3, 10, 10, 25, 60], dtype=np.int64)
+    keys = np.arange(len(timestamps), dtype=np.int64)
+
+    result = trigger.inform_columns(keys, timestamps, np.zeros_like(keys))
+    assert result.dtype == np.int64
+    # Triggers at 10, 20, 30, 40, 50 and 60
+    assert result.tolist() == [1, 3, 4, 4, 4, 4]
+    assert trigger.next_trigger_at == 70
+    assert trigger.inform_columns(keys[:0], timestamps[:0], keys[:0]).tolist() == []
+
+
+def test_inform_matches_loop() -> None:
+    rng = np.random.default_rng(42)
+    trigger = TimeTrigger({"trigger_every": "7s"})
+    next_trigger_at = None
+    for _ in range(20):
+        timestamps = np.sort(rng.integers(0, 40, size=rng.integers(1, 20))) + (next_trigger_at or 0)
+        new_data = [(idx, int(timestamp), 0) for idx, timestamp in enumerate(timestamps)]
+
+        if next_trigger_at is None:
+            next_trigger_at = new_data[0][1] + 7
+        expected = []
+        while next_trigger_at <= new_data[-1][1]:
+            expected.append(next(idx for (idx, (_, ts, _)) in enumerate(new_data) if ts >= next_trigger_at) - 1)
+            next_trigger_at += 7
+
+        assert trigger.inform(new_data) == expected
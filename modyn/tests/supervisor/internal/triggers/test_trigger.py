@@ -1,9 +1,24 @@
 # pylint: disable=abstract-class-instantiated,unused-argument
 from unittest.mock import patch
 
+import numpy as np
 from modyn.supervisor.internal.triggers import Trigger
 
 
 @patch.multiple(Trigger, __abstractmethods__=set())
 def test_initialization() -> None:
     _ = Trigger({})
+
+
+@patch.multiple(Trigger, __abstractmethods__=set())
+def test_inform_converts_to_columns() -> None:
+    trigger = Trigger({})
+    with patch.object(trigger, "inform_columns", return_value=np.array([1], dtype=np.int64)) as inform_columns_mock:
+        assert trigger.inform([(10, 100, 1), (11, 101, 0)]) == [1]
+        keys, timestamps, labels = inform_columns_mock.call_args[0]
+        assert keys.tolist() == [10, 11]
+        assert timestamps.tolist() == [100, 101]
+        assert labels.tolist() == [1, 0]
+
+        assert trigger.inform([]) == [1]
+        assert all(len(column) == 0 for column in inform_columns_mock.call_args[0])
@@ -1,3 +1,4 @@
+import asyncio
 import math
 
 import torch
@@ -61,6 +62,14 @@ def test_read():
         assert keys == list(range(1 + i * maximum_keys_in_memory, 1 + (i + 1) * maximum_keys_in_memory))
         assert all(math.isclose(k * v, 1, abs_tol=1e-5) for k, v in zip(keys, weights))
 
+    # the async variant falls back to the blocking implementation
+    assert asyncio.run(keysource.get_keys_and_weights_async(0, 1)) == keysource.get_keys_and_weights(0, 1)
+
+    async def collect_chunks():
+        return [chunk async for chunk in keysource.stream_keys_and_weights_async(0, 1)]
+
+    assert asyncio.run(collect_chunks()) == [keysource.get_keys_and_weights(0, 1)]
+
     keysource.end_of_trigger_cleaning()
     assert keysource.get_num_data_partitions() == 0
 
@@ -0,0 +1,93 @@
+# pylint: disable=unused-argument, no-name-in-module
+import asyncio
+from unittest.mock import patch
+
+import grpc
+import numpy as np
+import pytest
+from modyn.selector.internal.grpc.generated.selector_pb2 import (
+    GetSamplesRequest,
+    PackedSamplesResponse,
+    UsesWeightsResponse,
+)
+from modyn.trainer_server.internal.dataset.key_sources import PackedSelectorKeySource, SelectorKeySource
+
+KEY_SOURCE_MODULE = "modyn.trainer_server.internal.dataset.key_sources.selector_key_source"
+
+
+def packed(keys: list[int], weights: list[float]) -> PackedSamplesResponse:
+    return PackedSamplesResponse(
+        training_samples_subset=np.array(keys, dtype="<i8").tobytes(),
+        training_samples_weights=np.array(weights, dtype="<f4").tobytes(),
+    )
+
+
+class MockSelectorStub:
+    def __init__(self, channel) -> None:
+        pass
+
+    def get_packed_sample_keys_and_weights(self, request: GetSamplesRequest):
+        if request.partition_id == 0:
+            return [packed([1, 2], [-1.0, -2.0]), packed([3], [-3.0])]
+        return [PackedSamplesResponse()]
+
+    def uses_weights(self, request):
+        return UsesWeightsResponse(uses_weights=True)
+
+
+class AsyncMockSelectorStub(MockSelectorStub):
+    async def _stream(self, responses):
+        for response in responses:
+            yield response
+
+    def get_packed_sample_keys_and_weights(self, request):
+        return self._stream(super().get_packed_sample_keys_and_weights(request))
+
+
+def test_init():
+    keysource = PackedSelectorKeySource(12, 1, "localhost:1234")
+    assert isinstance(keysource, SelectorKeySource)
+    assert keysource._selectorstub is None
+    assert keysource._uses_weights is None
+
+
+@patch(f"{KEY_SOURCE_MODULE}.SelectorStub", MockSelectorStub)
+@patch(f"{KEY_SOURCE_MODULE}.grpc_connection_established", return_value=True)
+@patch.object(grpc, "insecure_channel", return_value=None)
+def test_get_keys_and_weights(test_grpc, test_connection):
+    keysource = PackedSelectorKeySource(12, 1, "localhost:1234")
+    with pytest.raises(AssertionError):
+        keysource.get_keys_and_weights(0, 0)
+
+    keysource.init_worker()
+    assert keysource.uses_weights()
+
+    keys, weights = keysource.get_keys_and_weights(0, 0)
+    assert keys == [1, 2, 3] and weights == [-1.0, -2.0, -3.0]
+    assert all(isinstance(key, int) for key in keys)
+
+    assert keysource.get_keys_and_weights(0, 1) == ([], [])
+
+    keysource._uses_weights = False
+    assert keysource.get_keys_and_weights(0, 0) == ([1, 2, 3], None)
+
+
+@pytest.mark.parametrize("weighted", [False, True])
+@patch(f"{KEY_SOURCE_MODULE}.SelectorStub", AsyncMockSelectorStub)
+@patch.object(grpc.aio, "insecure_channel", return_value=None)
+def test_stream_keys_and_weights_async(test_aio_channel, weighted):
+    keysource = PackedSelectorKeySource(12, 1, "localhost:1234")
+    keysource._uses_weights = weighted
+
+    async def collect_chunks():
+        return [chunk async for chunk in keysource.stream_keys_and_weights_async(0, 0)]
+
+    if weighted:
+        assert asyncio.run(collect_chunks()) == [([1, 2], [-1.0, -2.0]), ([3], [-3.0])]
+    else:
+        assert asyncio.run(collect_chunks()) == [([1, 2], None), ([3], None)]
+
+    keys, weights = asyncio.run(keysource.get_keys_and_weights_async(0, 0))
+    assert keys == [1, 2, 3]
+    assert weights == ([-1.0, -2.0, -3.0] if weighted else None)
+    test_aio_channel.assert_called_once()
@@ -1,5 +1,6 @@
 # pylint: disable=unused-argument, no-name-in-module
-from unittest.mock import patch
+import asyncio
+from unittest.mock import AsyncMock, patch
 
 import grpc
 import pytest
@@ -58,6 +59,15 @@ class WeightedMockSelectorStub(MockSelectorStub):
         return UsesWeightsResponse(uses_weights=True)
 
 
+class AsyncMockSelectorStub(MockSelectorStub):
+    async def _stream(self, responses):
+        for response in responses:
+            yield response
+
+    def get_sample_keys_and_weights(self, request):
+        return self._stream(super().get_sample_keys_and_weights(request))
+
+
 @patch("modyn.trainer_server.internal.dataset.key_sources.selector_key_source.SelectorStub", WeightedMockSelectorStub)
 @patch(
     "modyn.trainer_server.internal.dataset.key_sources.selector_key_source.grpc_connection_established",
@@ -138,3 +148,72 @@ def test_unweighted_key_source(test_grp, test_connection):
     keys, weights = keysource.get_keys_and_weights(0, 0)
     assert weights == [-1.0, -2.0, -3.0]
     assert keys == [1, 2, 3]
+
+
+@pytest.mark.parametrize("weighted", [False, True])
+@patch("modyn.trainer_server.internal.dataset.key_sources.selector_key_source.SelectorStub", AsyncMockSelectorStub)
+@patch.object(grpc.aio, "insecure_channel", return_value=None)
+def test_get_keys_and_weights_async(test_aio_channel, weighted):
+    keysource = SelectorKeySource(12, 1, "localhost:1234")
+    keysource._uses_weights = weighted
+
+    keys, weights = asyncio.run(keysource.get_keys_and_weights_async(0, 1))
+    assert keys == [10, 20, 30]
+    assert weights == ([-10.0, -20.0, -30.0] if weighted else None)
+
+    keys, weights = asyncio.run(keysource.get_keys_and_weights_async(1, 0))
+    assert keys == [100, 200, 300]
+    assert isinstance(keysource._async_selectorstub, AsyncMockSelectorStub)
+    test_aio_channel.assert_called_once()
+
+
+@patch("modyn.trainer_server.internal.dataset.key_sources.selector_key_source.SelectorStub", AsyncMockSelectorStub)
+@patch.object(grpc.aio, "insecure_channel", return_value=None)
+def test_stream_keys_and_weights_async(test_aio_channel):
+    keysource = SelectorKeySource(12, 1, "localhost:1234")
+    keysource._uses_weights = True
+
+    async def collect_chunks():
+        return [chunk async for chunk in keysource.stream_keys_and_weights_async(0, 0)]
+
+    with patch.object(
+        AsyncMockSelectorStub,
+        "get_sample_keys_and_weights",
+        lambda self, request: self._stream(
+            [
+                SamplesResponse(training_samples_subset=[1, 2], training_samples_weights=[-1.0, -2.0]),
+                SamplesResponse(training_samples_subset=[3], training_samples_weights=[-3.0]),
+            ]
+        ),
+    ):
+        assert asyncio.run(collect_chunks()) == [([1, 2], [-1.0, -2.0]), ([3], [-3.0])]
+
+        keysource._uses_weights = False
+        assert asyncio.run(collect_chunks()) == [([1, 2], None), ([3], None)]
+
+
+@patch("modyn.trainer_server.internal.dataset.key_sources.selector_key_source.SelectorStub", MockSelectorStub)
+@patch(
+    "modyn.trainer_server.internal.dataset.key_sources.selector_key_source.grpc_connection_established",
+    return_value=True,
+)
+@patch.object(grpc, "insecure_channel")
+@patch.object(grpc.aio, "insecure_channel")
+def test_close_channels(test_aio_channel, test_channel, test_connection):
+    test_aio_channel.return_value.close = AsyncMock()
+    keysource = SelectorKeySource(12, 1, "localhost:1234")
+    keysource.init_worker()
+    keysource._get_async_selectorstub()
+
+    asyncio.run(keysource.close_async())
+    test_aio_channel.return_value.close.assert_awaited_once()
+    assert keysource._async_selectorstub is None
+
+    keysource.end_of_trigger_cleaning()
+    test_channel.return_value.close.assert_called_once()
+    assert keysource._selectorstub is None
+
+    # closing again is a no-op
+    asyncio.run(keysource.close_async())
+    keysource.end_of_trigger_cleaning()
+    test_channel.return_value.close.assert_called_once()
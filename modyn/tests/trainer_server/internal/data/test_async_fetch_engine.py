@@ -0,0 +1,124 @@
+# pylint: disable=unused-argument,redefined-outer-name
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import grpc
+import pytest
+from modyn.trainer_server.internal.dataset.async_fetch_engine import AsyncFetchEngine
+
+ENGINE_MODULE = "modyn.trainer_server.internal.dataset.async_fetch_engine"
+
+
+def mock_channel():
+    channel = MagicMock()
+    channel.close = AsyncMock()
+    return channel
+
+
+@pytest.fixture
+def engine():
+    with (
+        patch.object(grpc.aio, "insecure_channel", return_value=mock_channel()),
+        patch(f"{ENGINE_MODULE}._channel_ready", AsyncMock(return_value=True)),
+        patch(f"{ENGINE_MODULE}.StorageStub") as stub,
+    ):
+        fetch_engine = AsyncFetchEngine("localhost:1234", 2)
+        fetch_engine.start()
+        assert fetch_engine.storage_stub is stub.return_value
+        yield fetch_engine
+        fetch_engine.shutdown()
+
+
+def test_start_and_shutdown(engine):
+    assert engine.running
+    loop_thread = engine._thread
+    assert loop_thread.is_alive()
+
+    engine.shutdown()
+    assert not engine.running
+    assert not loop_thread.is_alive()
+    assert engine.storage_stub is None
+
+    # shutting down twice is a no-op
+    engine.shutdown()
+
+
+@patch.object(grpc.aio, "insecure_channel", return_value=mock_channel())
+@patch(f"{ENGINE_MODULE}._channel_ready", AsyncMock(return_value=False))
+def test_connection_failure(test_channel):
+    engine = AsyncFetchEngine("localhost:1234", 1)
+    with pytest.raises(ConnectionError):
+        engine.start()
+    assert not engine.running
+
+
+def test_submit_returns_results(engine):
+    async def request(value):
+        await asyncio.sleep(0)
+        return value * 2
+
+    futures = [engine.submit(request(i)) for i in range(5)]
+    assert [future.result(timeout=5) for future in futures] == [0, 2, 4, 6, 8]
+
+
+def test_submit_propagates_exceptions(engine):
+    async def failing_request():
+        raise ValueError("request failed")
+
+    with pytest.raises(ValueError):
+        engine.submit(failing_request()).result(timeout=5)
+
+
+def test_concurrency_is_bounded(engine):
+    release = threading.Event()
+    active = []
+    max_active = []
+    started = []
+
+    async def request(request_id):
+        started.append(request_id)
+        active.append(request_id)
+        max_active.append(len(active))
+        while not release.is_set():
+            await asyncio.sleep(0.01)
+        active.remove(request_id)
+
+    futures = [engine.submit(request(i)) for i in range(5)]
+    while len(started) < 2:
+        pass
+
+    # Only two requests may run at the same time, in submission order
+    assert started == [0, 1]
+    release.set()
+    for future in futures:
+        future.result(timeout=5)
+
+    assert started == [0, 1, 2, 3, 4]
+    assert max(max_active) == 2
+
+
+def test_shutdown_cancels_pending_requests(engine):
+    async def blocking_request():
+        await asyncio.sleep(100)
+
+    futures = [engine.submit(blocking_request()) for _ in range(3)]
+    engine.shutdown()
+    assert all(future.cancelled() for future in futures)
+
+
+def test_shutdown_awaits_close_callback(engine):
+    loops = []
+
+    async def close_callback():
+        loops.append(asyncio.get_running_loop())
+
+    loop = engine._loop
+    engine.shutdown(close_callback)
+    assert loops == [loop]
+    assert not engine.running
+
+
+def test_shutdown_with_failing_close_callback(engine):
+    engine.shutdown(AsyncMock(side_effect=RuntimeError("close failed")))
+    assert not engine.running
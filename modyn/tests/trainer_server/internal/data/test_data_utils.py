@@ -36,3 +36,23 @@ def test_prepare_dataloaders(
     assert train_dataloader.num_workers == 4
     assert train_dataloader.batch_size == 128
     assert isinstance(train_dataloader.dataset, OnlineDataset)
+
+
+@patch.object(StorageStub, "__init__", noop_constructor_mock)
+@patch.object(SelectorStub, "__init__", noop_constructor_mock)
+@patch("modyn.trainer_server.internal.dataset.online_dataset.grpc_connection_established", return_value=True)
+@patch(
+    "modyn.trainer_server.internal.dataset.key_sources.selector_key_source.grpc_connection_established",
+    return_value=True,
+)
+@patch.object(grpc, "insecure_channel", return_value=None)
+@patch.object(SelectorKeySource, "uses_weights", return_value=False)
+def test_prepare_dataloaders_batched_bytes_parser(
+    test_weights, test_insecure_channel, test_grpc_connection_established, test_grpc_connection_established_selector
+):
+    train_dataloader, _ = prepare_dataloaders(
+        1, 1, "MNIST", 4, 128, get_mock_bytes_parser(), [], "", "", 42, 5, 5, None, None, batched_bytes_parser=True
+    )
+
+    assert train_dataloader.batch_size is None
+    assert train_dataloader.dataset._batch_size == 128
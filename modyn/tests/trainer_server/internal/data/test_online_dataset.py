@@ -1,14 +1,17 @@
 # pylint: disable=unused-argument, no-name-in-module, too-many-locals
+import asyncio
 import platform
-from unittest.mock import patch
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import grpc
 import pytest
 import torch
 from modyn.selector.internal.grpc.generated.selector_pb2 import SamplesResponse, UsesWeightsResponse
 from modyn.storage.internal.grpc.generated.storage_pb2 import GetResponse
-from modyn.trainer_server.internal.dataset.key_sources import SelectorKeySource
+from modyn.trainer_server.internal.dataset.key_sources import PackedSelectorKeySource, SelectorKeySource
 from modyn.trainer_server.internal.dataset.online_dataset import OnlineDataset
+from modyn.trainer_server.internal.dataset.partition_buffer import PartitionBuffer
 from torchvision import transforms
 
 
@@ -117,6 +120,36 @@ def test_init(test_insecure_channel, test_grpc_connection_established, test_grpc
     assert online_dataset._first_call
     assert online_dataset._bytes_parser_function is None
     assert online_dataset._storagestub is None
+    assert isinstance(online_dataset._key_source, SelectorKeySource)
+    assert not isinstance(online_dataset._key_source, PackedSelectorKeySource)
+
+
+@patch("modyn.trainer_server.internal.dataset.online_dataset.StorageStub", MockStorageStub)
+@patch(
+    "modyn.trainer_server.internal.dataset.key_sources.selector_key_source.grpc_connection_established",
+    return_value=True,
+)
+@patch("modyn.trainer_server.internal.dataset.online_dataset.grpc_connection_established", return_value=True)
+@patch.object(grpc, "insecure_channel", return_value=None)
+def test_init_packed_sample_keys(
+    test_insecure_channel, test_grpc_connection_established, test_grpc_connection_established_selector
+):
+    online_dataset = OnlineDataset(
+        pipeline_id=1,
+        trigger_id=1,
+        dataset_id="MNIST",
+        bytes_parser=get_mock_bytes_parser(),
+        serialized_transforms=[],
+        storage_address="localhost:1234",
+        selector_address="localhost:1234",
+        training_id=42,
+        tokenizer=None,
+        log_path=None,
+        num_prefetched_partitions=1,
+        parallel_prefetch_requests=1,
+        packed_sample_keys=True,
+    )
+    assert isinstance(online_dataset._key_source, PackedSelectorKeySource)
 
 
 @patch("modyn.trainer_server.internal.dataset.key_sources.selector_key_source.SelectorStub", MockSelectorStub)
@@ -893,3 +926,419 @@ def test_multi_epoch_dataloader_dataset(
             assert batch[0].tolist() == [4 * i, 4 * i + 1, 4 * i + 2, 4 * i + 3]
             assert torch.equal(batch[1], torch.Tensor([4 * i, 4 * i + 1, 4 * i + 2, 4 * i + 3]))
             assert torch.equal(batch[2], torch.ones(4, dtype=torch.float64))
+
+
+@pytest.mark.parametrize("num_workers", [0, 2])
+@pytest.mark.parametrize("prefetched_partitions", [1, 4])
+@patch("modyn.trainer_server.internal.dataset.key_sources.selector_key_source.SelectorStub", MockSelectorStub)
+@patch("modyn.trainer_server.internal.dataset.online_dataset.StorageStub", MockStorageStub)
+@patch(
+    "modyn.trainer_server.internal.dataset.key_sources.selector_key_source.grpc_connection_established",
+    return_value=True,
+)
+@patch("modyn.trainer_server.internal.dataset.online_dataset.grpc_connection_established", return_value=True)
+@patch.object(grpc, "insecure_channel", return_value=None)
+@patch.object(
+    OnlineDataset,
+    "_get_data_from_storage",
+    return_value=[(list(range(4)), [x.to_bytes(2, "big") for x in range(4)], [1] * 4, 0)],
+)
+@patch.object(SelectorKeySource, "get_keys_and_weights", return_value=(list(range(4)), None))
+@patch.object(SelectorKeySource, "get_num_data_partitions", return_value=3)
+def test_dataloader_dataset_shared_prefetching(
+    test_get_num_data_partitions,
+    test_get_data,
+    test_get_keys,
+    test_insecure_channel,
+    test_grpc_connection_established,
+    test_grpc_connection_established_selector,
+    prefetched_partitions,
+    num_workers,
+):
+    if platform.system() == "Darwin":
+        # On macOS, spawn is the default, which loses the mocks
+        return
+
+    online_dataset = OnlineDataset(
+        pipeline_id=1,
+        trigger_id=1,
+        dataset_id="MNIST",
+        bytes_parser="def bytes_parser_function(x):\n\treturn int.from_bytes(x, 'big')",
+        serialized_transforms=[],
+        storage_address="localhost:1234",
+        selector_address="localhost:1234",
+        training_id=42,
+        num_prefetched_partitions=prefetched_partitions,
+        parallel_prefetch_requests=1,
+        tokenizer=None,
+        log_path=None,
+    )
+    online_dataset.start_shared_prefetching(max(num_workers, 1))
+    dataloader = torch.utils.data.DataLoader(online_dataset, batch_size=4, num_workers=num_workers)
+
+    try:
+        for _ in range(2):
+            batches = list(dataloader)
+            assert len(batches) == 3 * max(num_workers, 1)
+            for batch in batches:
+                assert len(batch) == 3
+                assert batch[0].tolist() == [0, 1, 2, 3]
+                assert torch.equal(batch[1], torch.Tensor([0, 1, 2, 3]))
+                assert torch.equal(batch[2], torch.ones(4, dtype=int))
+    finally:
+        online_dataset.end_of_trigger_cleaning()
+
+    assert online_dataset._shared_prefetcher is None
+
+
+@patch("modyn.trainer_server.internal.dataset.online_dataset.SharedPrefetcher")
+def test_shared_prefetching_ignores_async_fetching(test_shared_prefetcher, caplog):
+    online_dataset = OnlineDataset(
+        pipeline_id=1,
+        trigger_id=1,
+        dataset_id="MNIST",
+        bytes_parser="def bytes_parser_function(x):\n\treturn int.from_bytes(x, 'big')",
+        serialized_transforms=[],
+        storage_address="localhost:1234",
+        selector_address="localhost:1234",
+        training_id=42,
+        num_prefetched_partitions=4,
+        parallel_prefetch_requests=2,
+        tokenizer=None,
+        log_path=None,
+        async_fetching=True,
+    )
+    online_dataset.start_shared_prefetching(2)
+
+    test_shared_prefetcher.assert_called_once_with(2, 4, 2)
+    assert "async_fetching is ignored with shared prefetching" in caplog.text
+
+
+def get_batched_bytes_parser():
+    return (
+        "import torch\n"
+        "def bytes_parser_function(x):\n\treturn int.from_bytes(x, 'big')\n"
+        "def batched_bytes_parser_function(x):\n\treturn torch.tensor([int.from_bytes(y, 'big') for y in x])"
+    )
+
+
+@pytest.mark.parametrize("weighted", [False, True])
+@pytest.mark.parametrize("prefetched_partitions", [0, 1, 5])
+@patch("modyn.trainer_server.internal.dataset.key_sources.selector_key_source.SelectorStub", MockSelectorStub)
+@patch("modyn.trainer_server.internal.dataset.online_dataset.StorageStub", MockStorageStub)
+@patch(
+    "modyn.trainer_server.internal.dataset.key_sources.selector_key_source.grpc_connection_established",
+    return_value=True,
+)
+@patch("modyn.trainer_server.internal.dataset.online_dataset.grpc_connection_established", return_value=True)
+@patch.object(grpc, "insecure_channel", return_value=None)
+@patch.object(
+    OnlineDataset,
+    "_get_data_from_storage",
+    return_value=[(list(range(10)), [x.to_bytes(2, "big") for x in range(10)], [1] * 10, 0)],
+)
+@patch.object(SelectorKeySource, "get_num_data_partitions", return_value=2)
+def test_dataloader_dataset_batched_bytes_parser(
+    test_get_num_data_partitions,
+    test_get_data,
+    test_insecure_channel,
+    test_grpc_connection_established,
+    test_grpc_connection_established_selector,
+    prefetched_partitions,
+    weighted,
+):
+    online_dataset = OnlineDataset(
+        pipeline_id=1,
+        trigger_id=1,
+        dataset_id="MNIST",
+        bytes_parser=get_batched_bytes_parser(),
+        serialized_transforms=["lambda x: x * 2"],
+        storage_address="localhost:1234",
+        selector_address="localhost:1234",
+        training_id=42,
+        num_prefetched_partitions=prefetched_partitions,
+        parallel_prefetch_requests=1,
+        tokenizer=None,
+        log_path=None,
+        batch_size=3,
+    )
+    weights = [0.5] * 10 if weighted else None
+    with (
+        patch.object(SelectorKeySource, "get_keys_and_weights", return_value=(list(range(10)), weights)),
+        patch.object(SelectorKeySource, "uses_weights", return_value=weighted),
+    ):
+        batches = list(torch.utils.data.DataLoader(online_dataset, batch_size=None))
+
+    # Batches span partitions and only the last batch is incomplete
+    expected_keys = list(range(10)) * 2
+    assert [len(batch[0]) for batch in batches] == [3, 3, 3, 3, 3, 3, 2]
+    assert torch.cat([batch[0] for batch in batches]).tolist() == expected_keys
+    assert torch.equal(torch.cat([batch[1] for batch in batches]), torch.tensor(expected_keys) * 2)
+    assert torch.equal(torch.cat([batch[2] for batch in batches]), torch.ones(20, dtype=torch.int64))
+    if weighted:
+        assert len(batches[0]) == 4
+        assert torch.equal(torch.cat([batch[3] for batch in batches]), torch.full((20,), 0.5, dtype=torch.float64))
+    else:
+        assert len(batches[0]) == 3
+
+
+def test_batched_bytes_parser_tokenizer():
+    with pytest.raises(ValueError):
+        OnlineDataset(
+            pipeline_id=1,
+            trigger_id=1,
+            dataset_id="MNIST",
+            bytes_parser=get_batched_bytes_parser(),
+            serialized_transforms=[],
+            storage_address="localhost:1234",
+            selector_address="localhost:1234",
+            training_id=42,
+            num_prefetched_partitions=1,
+            parallel_prefetch_requests=1,
+            tokenizer="DistilBertTokenizerTransform",
+            log_path=None,
+            batch_size=4,
+        )
+
+
+def get_async_fetching_dataset(prefetched_partitions, parallel_prefetch_requests, keys_per_storage_request=0):
+    return OnlineDataset(
+        pipeline_id=1,
+        trigger_id=1,
+        dataset_id="MNIST",
+        bytes_parser="def bytes_parser_function(x):\n\treturn int.from_bytes(x, 'big')",
+        serialized_transforms=[],
+        storage_address="localhost:1234",
+        selector_address="localhost:1234",
+        training_id=42,
+        num_prefetched_partitions=prefetched_partitions,
+        parallel_prefetch_requests=parallel_prefetch_requests,
+        tokenizer=None,
+        log_path=None,
+        async_fetching=True,
+        keys_per_storage_request=keys_per_storage_request,
+    )
+
+
+async def async_key_stream_side_effect(worker_id, partition_id):
+    # The keys of a partition arrive in chunks of three keys
+    keys = list(range(partition_id * 8, (partition_id + 1) * 8))
+    for idx in range(0, len(keys), 3):
+        await asyncio.sleep(0)
+        yield keys[idx : idx + 3], [0.5] * len(keys[idx : idx + 3])
+
+
+async def async_storage_side_effect(keys):
+    # Two responses per partition
+    for chunk in [keys[:5], keys[5:]]:
+        await asyncio.sleep(0)
+        yield chunk, [x.to_bytes(2, "big") for x in chunk], [1] * len(chunk), 0
+
+
+@pytest.mark.parametrize("keys_per_storage_request", [0, 1, 4])
+@pytest.mark.parametrize("weighted", [False, True])
+@pytest.mark.parametrize("num_workers", [0, 2])
+@pytest.mark.parametrize("parallel_prefetch_requests", [1, 3])
+@pytest.mark.parametrize("prefetched_partitions", [0, 1, 2, 5])
+@patch("modyn.trainer_server.internal.dataset.key_sources.selector_key_source.SelectorStub", MockSelectorStub)
+@patch(
+    "modyn.trainer_server.internal.dataset.key_sources.selector_key_source.grpc_connection_established",
+    return_value=True,
+)
+@patch.object(grpc, "insecure_channel", return_value=None)
+@patch.object(grpc.aio, "insecure_channel", return_value=MagicMock(close=AsyncMock()))
+@patch("modyn.trainer_server.internal.dataset.async_fetch_engine._channel_ready", AsyncMock(return_value=True))
+@patch.object(OnlineDataset, "_get_data_from_storage_async", side_effect=async_storage_side_effect)
+@patch.object(SelectorKeySource, "stream_keys_and_weights_async", side_effect=async_key_stream_side_effect)
+@patch.object(SelectorKeySource, "get_num_data_partitions", return_value=4)
+def test_dataloader_dataset_async_fetching(
+    test_get_num_data_partitions,
+    test_get_keys,
+    test_get_data,
+    test_aio_channel,
+    test_insecure_channel,
+    test_grpc_connection_established_selector,
+    prefetched_partitions,
+    parallel_prefetch_requests,
+    num_workers,
+    weighted,
+    keys_per_storage_request,
+):
+    if platform.system() == "Darwin" and num_workers > 0:
+        # On macOS, spawn is the default, which loses the mocks
+        return
+
+    online_dataset = get_async_fetching_dataset(
+        prefetched_partitions, parallel_prefetch_requests, keys_per_storage_request
+    )
+    dataloader = torch.utils.data.DataLoader(online_dataset, batch_size=4, num_workers=num_workers)
+
+    with patch.object(SelectorKeySource, "uses_weights", return_value=weighted):
+        for _ in range(2):
+            batches = list(dataloader)
+            assert len(batches) == 8 * max(num_workers, 1)
+            # The DataLoader interleaves the batches of the workers
+            worker_batches = batches[:: max(num_workers, 1)]
+            assert all(len(batch) == (4 if weighted else 3) for batch in worker_batches)
+            keys = torch.cat([batch[0] for batch in worker_batches]).tolist()
+            assert torch.equal(torch.cat([batch[1] for batch in worker_batches]), torch.Tensor(keys))
+            if keys_per_storage_request > 0:
+                # Concurrent storage requests may complete in any order within a partition
+                for partition_id in range(4):
+                    assert sorted(keys[8 * partition_id : 8 * (partition_id + 1)]) == list(
+                        range(8 * partition_id, 8 * (partition_id + 1))
+                    )
+            else:
+                assert keys == list(range(32))
+            if weighted:
+                assert torch.equal(torch.cat([batch[3] for batch in worker_batches]), torch.full((32,), 0.5).double())
+
+    online_dataset.end_of_trigger_cleaning()
+    assert online_dataset._fetch_engine is None
+
+
+@pytest.mark.parametrize("prefetched_partitions", [0, 2])
+@patch("modyn.trainer_server.internal.dataset.key_sources.selector_key_source.SelectorStub", MockSelectorStub)
+@patch(
+    "modyn.trainer_server.internal.dataset.key_sources.selector_key_source.grpc_connection_established",
+    return_value=True,
+)
+@patch.object(grpc, "insecure_channel", return_value=None)
+@patch.object(grpc.aio, "insecure_channel", return_value=MagicMock(close=AsyncMock()))
+@patch("modyn.trainer_server.internal.dataset.async_fetch_engine._channel_ready", AsyncMock(return_value=True))
+@patch.object(OnlineDataset, "_get_data_from_storage_async", side_effect=async_storage_side_effect)
+@patch.object(SelectorKeySource, "stream_keys_and_weights_async", side_effect=ValueError("selector failed"))
+@patch.object(SelectorKeySource, "get_num_data_partitions", return_value=4)
+def test_async_fetching_propagates_errors(
+    test_get_num_data_partitions,
+    test_get_keys,
+    test_get_data,
+    test_aio_channel,
+    test_insecure_channel,
+    test_grpc_connection_established_selector,
+    prefetched_partitions,
+):
+    online_dataset = get_async_fetching_dataset(prefetched_partitions, 1)
+
+    with pytest.raises(ValueError):
+        list(online_dataset)
+
+    online_dataset.end_of_trigger_cleaning()
+
+
+@pytest.mark.parametrize("keys_per_storage_request", [0, 2, 3, 100])
+@patch.object(SelectorKeySource, "stream_keys_and_weights_async", side_effect=async_key_stream_side_effect)
+def test_get_data_async_pipelining(test_stream_keys, keys_per_storage_request):
+    online_dataset = get_async_fetching_dataset(1, 1, keys_per_storage_request)
+    online_dataset._log_lock = threading.Lock()
+    requested_keys = []
+
+    async def storage_side_effect(keys):
+        requested_keys.append(keys)
+        yield keys, [x.to_bytes(2, "big") for x in keys], [1] * len(keys), 0
+
+    container = PartitionBuffer(True)
+    with patch.object(OnlineDataset, "_get_data_from_storage_async", side_effect=storage_side_effect):
+        asyncio.run(online_dataset._get_data_async(container, 0, 1, None, None, None, None))
+
+    expected_requests = {
+        0: [list(range(8, 16))],
+        2: [[8, 9, 10], [11, 12, 13], [14, 15]],
+        3: [[8, 9, 10], [11, 12, 13], [14, 15]],
+        100: [list(range(8, 16))],
+    }[keys_per_storage_request]
+    assert requested_keys == expected_requests
+    assert sorted(sample[0] for sample in container.samples(0, len(container))) == list(range(8, 16))
+    assert all(sample[3] == 0.5 for sample in container.samples(0, len(container)))
+
+    log = online_dataset._log["partitions"]["1"]
+    assert log["num_items"] == 8
+    assert log["num_storage_requests"] == len(expected_requests)
+
+
+@patch.object(SelectorKeySource, "stream_keys_and_weights_async", side_effect=async_key_stream_side_effect)
+def test_get_data_async_storage_error(test_stream_keys):
+    online_dataset = get_async_fetching_dataset(1, 1, 3)
+    online_dataset._log_lock = threading.Lock()
+
+    async def storage_side_effect(keys):
+        if keys[0] == 11:
+            raise ValueError("storage failed")
+        yield keys, [x.to_bytes(2, "big") for x in keys], [1] * len(keys), 0
+
+    partition_valid = {1: False}
+    with patch.object(OnlineDataset, "_get_data_from_storage_async", side_effect=storage_side_effect):
+        with pytest.raises(ValueError):
+            asyncio.run(
+                online_dataset._get_data_async(
+                    PartitionBuffer(True), 0, 1, partition_valid, {1: -1}, {1: threading.Lock()}, None
+                )
+            )
+
+    # The consumer is woken up although the partition has not been fetched completely
+    assert partition_valid[1]
+    assert "1" not in online_dataset._log["partitions"]
+
+
+class CountingMockStorageStub:
+    requested_keys: list[list[int]] = []
+
+    def __init__(self, channel) -> None:
+        pass
+
+    def Get(self, request):  # pylint: disable=invalid-name
+        CountingMockStorageStub.requested_keys.append(list(request.keys))
+        yield GetResponse(
+            samples=[key.to_bytes(2, "big") for key in request.keys], keys=request.keys, labels=[1] * len(request.keys)
+        )
+
+
+@pytest.mark.parametrize("prefetched_partitions", [0, 2])
+@patch("modyn.trainer_server.internal.dataset.key_sources.selector_key_source.SelectorStub", MockSelectorStub)
+@patch("modyn.trainer_server.internal.dataset.online_dataset.StorageStub", CountingMockStorageStub)
+@patch(
+    "modyn.trainer_server.internal.dataset.key_sources.selector_key_source.grpc_connection_established",
+    return_value=True,
+)
+@patch("modyn.trainer_server.internal.dataset.online_dataset.grpc_connection_established", return_value=True)
+@patch.object(grpc, "insecure_channel", return_value=None)
+@patch.object(SelectorKeySource, "get_num_data_partitions", return_value=1)
+def test_iter_sample_cache(
+    test_get_num_data_partitions,
+    test_insecure_channel,
+    test_grpc_connection_established,
+    test_grpc_connection_established_selector,
+    prefetched_partitions,
+    tmp_path,
+):
+    CountingMockStorageStub.requested_keys = []
+    online_dataset = OnlineDataset(
+        pipeline_id=1,
+        trigger_id=1,
+        dataset_id="MNIST",
+        bytes_parser="def bytes_parser_function(x):\n\treturn int.from_bytes(x, 'big')",
+        serialized_transforms=[],
+        storage_address="localhost:1234",
+        selector_address="localhost:1234",
+        training_id=42,
+        num_prefetched_partitions=prefetched_partitions,
+        parallel_prefetch_requests=1,
+        tokenizer=None,
+        log_path=tmp_path,
+        sample_cache_directory=tmp_path / "cache",
+        sample_cache_size=1 << 20,
+    )
+
+    with patch.object(SelectorKeySource, "get_keys_and_weights", return_value=(list(range(4)), None)):
+        assert [sample[0] for sample in online_dataset] == list(range(4))
+    with patch.object(SelectorKeySource, "get_keys_and_weights", return_value=(list(range(2, 6)), None)):
+        data = list(online_dataset)
+
+    # Cached samples are served first, only the misses are requested from the storage
+    assert [sample[0] for sample in data] == [2, 3, 4, 5]
+    assert [sample[1] for sample in data] == [2, 3, 4, 5]
+    assert CountingMockStorageStub.requested_keys == [[0, 1, 2, 3], [4, 5]]
+    assert online_dataset._sample_cache.stats == {"hits": 2, "misses": 6, "evictions": 0}
+
+    online_dataset.end_of_trigger_cleaning()
+    assert online_dataset._sample_cache is None
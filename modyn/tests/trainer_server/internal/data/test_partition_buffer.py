@@ -0,0 +1,106 @@
+import pytest
+from modyn.trainer_server.internal.dataset.partition_buffer import PartitionBuffer
+
+
+def test_init():
+    buffer = PartitionBuffer(False)
+    assert len(buffer) == 0
+    assert buffer.num_bytes == 0
+    assert not buffer.uses_weights
+    assert not list(buffer.samples(0, 0))
+
+
+def test_append_and_samples():
+    buffer = PartitionBuffer(False)
+    assert buffer.append([1, 2, 3], [b"a", b"bc", b""], [10, 20, 30]) == 3
+    assert buffer.append([4], [b"def"], [40]) == 1
+    assert buffer.append([], [], []) == 0
+
+    assert len(buffer) == 4
+    assert buffer.num_bytes == 6
+
+    samples = list(buffer.samples(0, 4))
+    assert [sample[0] for sample in samples] == [1, 2, 3, 4]
+    assert [bytes(sample[1]) for sample in samples] == [b"a", b"bc", b"", b"def"]
+    assert [sample[2] for sample in samples] == [10, 20, 30, 40]
+    assert [sample[3] for sample in samples] == [None] * 4
+    assert all(isinstance(sample[0], int) and isinstance(sample[1], memoryview) for sample in samples)
+
+    samples = list(buffer.samples(1, 3))
+    assert [sample[0] for sample in samples] == [2, 3]
+    assert [bytes(sample[1]) for sample in samples] == [b"bc", b""]
+
+
+def test_append_weights():
+    buffer = PartitionBuffer(True)
+    buffer.append([1, 2], [b"a", b"b"], [0, 1], [0.5, 2.0])
+    assert [sample[3] for sample in buffer.samples(0, 2)] == [0.5, 2.0]
+
+    with pytest.raises(AssertionError):
+        buffer.append([3], [b"c"], [0])
+
+    with pytest.raises(AssertionError):
+        PartitionBuffer(False).append([3], [b"c"], [0], [1.0])
+
+
+def test_growth_keeps_views_valid():
+    buffer = PartitionBuffer(True, initial_capacity=1, initial_arena_size=1)
+    buffer.append([0], [b"first"], [0], [1.0])
+    first_view = next(buffer.samples(0, 1))[1]
+
+    for i in range(1, 100):
+        buffer.append([i, i + 1000], [bytes(f"sample{i}", "utf-8"), b"x" * i], [i, i], [float(i), 1.0])
+
+    assert len(buffer) == 199
+    assert bytes(first_view) == b"first"
+
+    samples = list(buffer.samples(0, len(buffer)))
+    assert bytes(samples[0][1]) == b"first"
+    assert samples[1][0] == 1 and bytes(samples[1][1]) == b"sample1" and samples[1][3] == 1.0
+    assert samples[-1][0] == 1099 and bytes(samples[-1][1]) == b"x" * 99
+
+
+def test_invalid_range():
+    buffer = PartitionBuffer(False)
+    buffer.append([1], [b"a"], [0])
+
+    with pytest.raises(AssertionError):
+        list(buffer.samples(0, 2))
+
+
+@pytest.mark.parametrize("uses_weights", [True, False])
+def test_pack_and_unpack(uses_weights):
+    buffer = PartitionBuffer(uses_weights, initial_capacity=1, initial_arena_size=1)
+    weights = [0.5, 1.5, 2.5] if uses_weights else None
+    buffer.append([7, 8, 9], [b"abc", b"", b"de"], [1, 2, 3], weights)
+
+    packed = bytearray(buffer.packed_size)
+    buffer.pack_into(memoryview(packed))
+    unpacked = PartitionBuffer.from_packed(memoryview(packed))
+
+    assert len(unpacked) == 3
+    assert unpacked.uses_weights == uses_weights
+    assert unpacked.num_bytes == 5
+    samples = list(unpacked.samples(0, 3))
+    assert [sample[0] for sample in samples] == [7, 8, 9]
+    assert [bytes(sample[1]) for sample in samples] == [b"abc", b"", b"de"]
+    assert [sample[2] for sample in samples] == [1, 2, 3]
+    assert [sample[3] for sample in samples] == (weights if uses_weights else [None] * 3)
+
+
+def test_pack_empty():
+    buffer = PartitionBuffer(False)
+    packed = bytearray(buffer.packed_size)
+    buffer.pack_into(memoryview(packed))
+
+    unpacked = PartitionBuffer.from_packed(memoryview(packed))
+    assert len(unpacked) == 0
+    assert not list(unpacked.samples(0, 0))
+
+
+def test_pack_into_too_small():
+    buffer = PartitionBuffer(False)
+    buffer.append([1], [b"a"], [0])
+
+    with pytest.raises(AssertionError):
+        buffer.pack_into(memoryview(bytearray(buffer.packed_size - 1)))
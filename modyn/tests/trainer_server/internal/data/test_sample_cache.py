@@ -0,0 +1,141 @@
+# pylint: disable=unused-argument,redefined-outer-name
+import pathlib
+import shutil
+import tempfile
+
+import pytest
+from modyn.trainer_server.internal.dataset.sample_cache import SampleCache
+
+
+@pytest.fixture
+def cache_dir():
+    directory = pathlib.Path(tempfile.mkdtemp())
+    yield directory
+    shutil.rmtree(directory)
+
+
+def sample(key: int) -> bytes:
+    return f"sample{key}".encode("utf-8")
+
+
+def test_init(cache_dir):
+    cache = SampleCache(cache_dir, "MNIST", 1024)
+    assert (cache_dir / "MNIST" / "segments").is_dir()
+    assert (cache_dir / "MNIST" / "index.sqlite").exists()
+    assert cache.stats == {"hits": 0, "misses": 0, "evictions": 0}
+    cache.close()
+
+
+def test_put_and_get(cache_dir):
+    cache = SampleCache(cache_dir, "MNIST", 1024)
+    cache.put([1, 2, 3], [sample(1), sample(2), b""], [10, 20, 30])
+    cache.put([], [], [])
+
+    keys, samples, labels, missing = cache.get([4, 3, 1, 5])
+    assert keys == [3, 1]
+    assert samples == [b"", sample(1)]
+    assert labels == [30, 10]
+    assert missing == [4, 5]
+    assert cache.stats == {"hits": 2, "misses": 2, "evictions": 0}
+
+    # Keys that are already cached are not replaced
+    cache.put([1], [b"other"], [0])
+    _, samples, labels, _ = cache.get([1])
+    assert samples == [sample(1)] and labels == [10]
+    cache.close()
+
+
+def test_get_many_keys(cache_dir):
+    cache = SampleCache(cache_dir, "MNIST", 1 << 20)
+    keys = list(range(2000))
+    cache.put(keys, [sample(key) for key in keys], keys)
+
+    cached_keys, samples, labels, missing = cache.get(list(range(-5, 2005)))
+    assert cached_keys == keys
+    assert samples == [sample(key) for key in keys]
+    assert labels == keys
+    assert missing == list(range(-5, 0)) + list(range(2000, 2005))
+    cache.close()
+
+
+def test_shared_across_instances(cache_dir):
+    writer = SampleCache(cache_dir, "MNIST", 1024)
+    other_dataset = SampleCache(cache_dir, "CIFAR", 1024)
+    writer.put([1, 2], [sample(1), sample(2)], [0, 1])
+
+    reader = SampleCache(cache_dir, "MNIST", 1024)
+    assert reader.get([1, 2])[1] == [sample(1), sample(2)]
+    assert other_dataset.get([1, 2])[3] == [1, 2]
+
+    for cache in [writer, other_dataset, reader]:
+        cache.close()
+
+
+def test_lru_eviction(cache_dir):
+    # Every segment has 14 bytes, so the cache can hold two of them
+    cache = SampleCache(cache_dir, "MNIST", 30)
+    cache.put([1, 2], [sample(1), sample(2)], [0, 0])
+    cache.put([3, 4], [sample(3), sample(4)], [0, 0])
+
+    # Accessing the first segment makes the second one the least recently used one
+    assert cache.get([1])[0] == [1]
+    cache.put([5, 6], [sample(5), sample(6)], [0, 0])
+
+    keys, _, _, missing = cache.get([1, 2, 3, 4, 5, 6])
+    assert keys == [1, 2, 5, 6]
+    assert missing == [3, 4]
+    assert cache.stats["evictions"] == 1
+    assert len(list((cache_dir / "MNIST" / "segments").iterdir())) == 2
+    cache.close()
+
+
+def test_segment_evicted_by_other_process(cache_dir):
+    cache = SampleCache(cache_dir, "MNIST", 1024)
+    other = SampleCache(cache_dir, "MNIST", 1024)
+    cache.put([1], [sample(1)], [0])
+
+    # The other process has not mapped the segment yet, and it disappears after reading the index
+    for segment in (cache_dir / "MNIST" / "segments").iterdir():
+        segment.unlink()
+    keys, _, _, missing = other.get([1])
+    assert keys == [] and missing == [1]
+
+    cache.close()
+    other.close()
+
+
+def test_bounded_open_segments(cache_dir):
+    cache = SampleCache(cache_dir, "MNIST", 1024, max_open_segments=2)
+    for key in range(4):
+        cache.put([key], [sample(key)], [0])
+
+    # The segments of keys 0 to 3 have the ids 1 to 4, only the two most recently used ones stay mapped
+    assert cache.get([0, 1, 2])[1] == [sample(0), sample(1), sample(2)]
+    assert list(cache._segments) == [2, 3]
+    assert cache.get([1, 3])[1] == [sample(1), sample(3)]
+    assert list(cache._segments) == [2, 4]
+    cache.close()
+
+
+def test_unmaps_segments_evicted_by_other_process(cache_dir):
+    cache = SampleCache(cache_dir, "MNIST", 30)
+    other = SampleCache(cache_dir, "MNIST", 30)
+    cache.put([1, 2], [sample(1), sample(2)], [0, 0])
+    assert other.get([1])[0] == [1]
+    assert len(other._segments) == 1
+
+    # The cache evicts the segment that the other process has mapped
+    cache.put([3, 4], [sample(3), sample(4)], [0, 0])
+    cache.put([5, 6], [sample(5), sample(6)], [0, 0])
+    assert other.get([5])[0] == [5]
+    assert list(other._segments) == [3]
+
+    cache.close()
+    other.close()
+
+
+def test_invalid_size(cache_dir):
+    with pytest.raises(AssertionError):
+        SampleCache(cache_dir, "MNIST", 0)
+    with pytest.raises(AssertionError):
+        SampleCache(cache_dir, "MNIST", 1024, max_open_segments=0)
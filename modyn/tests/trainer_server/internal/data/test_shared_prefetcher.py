@@ -0,0 +1,217 @@
+# pylint: disable=protected-access,unused-argument,redefined-outer-name
+import threading
+import time
+
+import pytest
+from modyn.trainer_server.internal.dataset.key_sources import AbstractKeySource
+from modyn.trainer_server.internal.dataset.partition_buffer import PartitionBuffer
+from modyn.trainer_server.internal.dataset.shared_prefetcher import SharedPrefetcher, _PrefetcherServer
+
+
+class MockKeySource(AbstractKeySource):
+    def __init__(self, num_partitions: int, fail: bool = False) -> None:
+        super().__init__(1, 1)
+        self._num_partitions = num_partitions
+        self._fail = fail
+
+    def get_keys_and_weights(self, worker_id, partition_id):
+        raise NotImplementedError()
+
+    def get_num_data_partitions(self) -> int:
+        if self._fail:
+            raise ValueError("Selector unavailable")
+        return self._num_partitions
+
+    def uses_weights(self) -> bool:
+        return True
+
+    def init_worker(self) -> None:
+        pass
+
+    def end_of_trigger_cleaning(self) -> None:
+        pass
+
+
+class MockDataset:
+    def __init__(self) -> None:
+        self.fetched: list[tuple[int, int]] = []
+        self.lock = threading.Lock()
+
+    def _init_grpc(self) -> None:
+        pass
+
+    def _init_sample_cache(self) -> None:
+        pass
+
+    def shared_prefetching_copy(self, key_source, uses_weights):
+        assert uses_weights
+        return self
+
+    def fetch_partition_buffer(self, worker_id, partition_id):
+        with self.lock:
+            self.fetched.append((worker_id, partition_id))
+
+        buffer = PartitionBuffer(True)
+        keys = [100 * worker_id + 10 * partition_id + i for i in range(3)]
+        buffer.append(keys, [str(key).encode("utf-8") for key in keys], [partition_id] * 3, [1.0] * 3)
+        return buffer, {"num_items": 3}
+
+
+@pytest.fixture
+def prefetcher_setup():
+    dataset = MockDataset()
+    prefetcher = SharedPrefetcher(num_workers=2, num_prefetched_partitions=2)
+    server = _PrefetcherServer(
+        dataset, prefetcher._command_queue, prefetcher._response_queues, prefetcher.slots_per_worker
+    )
+    server_thread = threading.Thread(target=server.serve, daemon=True)
+    server_thread.start()
+
+    yield prefetcher, dataset
+
+    prefetcher._command_queue.put(None)
+    server_thread.join(timeout=10)
+
+
+class SlowMockDataset(MockDataset):
+    # The first partition is the slowest one, and partition `failing_partition` cannot be fetched
+    def __init__(self, failing_partition: int = -1) -> None:
+        super().__init__()
+        self.active = 0
+        self.max_active = 0
+        self._failing_partition = failing_partition
+
+    def fetch_partition_buffer(self, worker_id, partition_id):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.3 if partition_id == 0 else 0.1)
+        with self.lock:
+            self.active -= 1
+
+        if partition_id == self._failing_partition:
+            raise ValueError("Storage unavailable")
+        return super().fetch_partition_buffer(worker_id, partition_id)
+
+
+def start_server(dataset, prefetcher: SharedPrefetcher) -> threading.Thread:
+    server = _PrefetcherServer(
+        dataset,
+        prefetcher._command_queue,
+        prefetcher._response_queues,
+        prefetcher.slots_per_worker,
+        prefetcher._parallel_requests,
+    )
+    server_thread = threading.Thread(target=server.serve, daemon=True)
+    server_thread.start()
+    return server_thread
+
+
+def consume(prefetcher: SharedPrefetcher, worker_id: int, key_source: AbstractKeySource) -> list:
+    request_id, num_partitions, uses_weights = prefetcher.request_partitions(worker_id, key_source)
+    assert uses_weights
+
+    samples = []
+    for partition_id in range(num_partitions):
+        partition = prefetcher.get_partition(worker_id, request_id)
+        assert partition.partition_id == partition_id
+        assert partition.log == {"num_items": 3}
+        samples += [
+            (key, bytes(sample), label, weight) for key, sample, label, weight in partition.buffer.samples(0, 3)
+        ]
+        prefetcher.release_partition(worker_id, request_id, partition)
+
+    return samples
+
+
+def test_slots_per_worker():
+    assert SharedPrefetcher(4, 8).slots_per_worker == 2
+    assert SharedPrefetcher(4, 1).slots_per_worker == 1
+
+    # At most all slots of a worker are fetched concurrently
+    assert SharedPrefetcher(4, 8)._parallel_requests == 1
+    assert SharedPrefetcher(4, 8, 5)._parallel_requests == 2
+    assert SharedPrefetcher(1, 8, 0)._parallel_requests == 1
+
+    with pytest.raises(AssertionError):
+        SharedPrefetcher(0, 1)
+
+
+def test_getstate():
+    prefetcher = SharedPrefetcher(1, 1)
+    prefetcher._process = "dummy"
+    state = prefetcher.__getstate__()
+    assert state["_process"] is None
+    assert state["_unclosed_partitions"] == []
+
+
+def test_serve_workers(prefetcher_setup):
+    prefetcher, _ = prefetcher_setup
+
+    for worker_id in range(2):
+        samples = consume(prefetcher, worker_id, MockKeySource(3))
+        expected_keys = [100 * worker_id + 10 * partition_id + i for partition_id in range(3) for i in range(3)]
+        assert [sample[0] for sample in samples] == expected_keys
+        assert [sample[1] for sample in samples] == [str(key).encode("utf-8") for key in expected_keys]
+        assert [sample[2] for sample in samples] == [partition_id for partition_id in range(3) for _ in range(3)]
+        assert [sample[3] for sample in samples] == [1.0] * 9
+
+
+def test_slots_are_respected(prefetcher_setup):
+    prefetcher, dataset = prefetcher_setup
+    request_id, num_partitions, _ = prefetcher.request_partitions(0, MockKeySource(5))
+    assert num_partitions == 5
+
+    time.sleep(0.5)
+    assert dataset.fetched == [(0, 0)]  # One slot per worker
+
+    partition = prefetcher.get_partition(0, request_id)
+    prefetcher.release_partition(0, request_id, partition)
+    time.sleep(0.5)
+    assert dataset.fetched == [(0, 0), (0, 1)]
+
+
+def test_new_request_supersedes_old_one(prefetcher_setup):
+    prefetcher, _ = prefetcher_setup
+    prefetcher.request_partitions(0, MockKeySource(5))
+
+    # e.g., a new epoch after the previous one has been aborted
+    samples = consume(prefetcher, 0, MockKeySource(2))
+    assert [sample[0] for sample in samples] == [0, 1, 2, 10, 11, 12]
+
+
+def test_prefetching_error(prefetcher_setup):
+    prefetcher, _ = prefetcher_setup
+
+    with pytest.raises(RuntimeError, match="Selector unavailable"):
+        prefetcher.request_partitions(1, MockKeySource(1, fail=True))
+
+
+def test_parallel_requests():
+    dataset = SlowMockDataset()
+    prefetcher = SharedPrefetcher(num_workers=1, num_prefetched_partitions=4, parallel_prefetch_requests=2)
+    server_thread = start_server(dataset, prefetcher)
+
+    # The partitions are fetched concurrently, but handed over in order although partition 0 takes longest
+    samples = consume(prefetcher, 0, MockKeySource(5))
+    assert [sample[0] for sample in samples] == [10 * partition_id + i for partition_id in range(5) for i in range(3)]
+    assert dataset.max_active == 2
+
+    prefetcher._command_queue.put(None)
+    server_thread.join(timeout=10)
+
+
+def test_parallel_requests_error():
+    dataset = SlowMockDataset(failing_partition=1)
+    prefetcher = SharedPrefetcher(num_workers=1, num_prefetched_partitions=4, parallel_prefetch_requests=2)
+    server_thread = start_server(dataset, prefetcher)
+
+    request_id, _, _ = prefetcher.request_partitions(0, MockKeySource(5))
+    partition = prefetcher.get_partition(0, request_id)
+    assert partition.partition_id == 0
+    prefetcher.release_partition(0, request_id, partition)
+    with pytest.raises(RuntimeError, match="Storage unavailable"):
+        prefetcher.get_partition(0, request_id)
+
+    prefetcher._command_queue.put(None)
+    server_thread.join(timeout=10)
@@ -7,6 +7,7 @@ import platform
 import tempfile
 from io import BytesIO
 from time import sleep
+from typing import Iterator
 from unittest import mock
 from unittest.mock import MagicMock, patch
 
@@ -14,8 +15,10 @@ import torch
 from modyn.metadata_database.metadata_database_connection import MetadataDatabaseConnection
 from modyn.metadata_database.utils import ModelStorageStrategyConfig
 from modyn.model_storage.internal.grpc.generated.model_storage_pb2 import (
+    FetchModelChunk,
     FetchModelRequest,
     FetchModelResponse,
+    RegisterModelChunk,
     RegisterModelRequest,
     RegisterModelResponse,
 )
@@ -94,10 +97,22 @@ class DummyModelStorageStub:
             return FetchModelResponse(success=True, model_path="testpath.modyn")
         return FetchModelResponse(success=False)
 
+    # pylint: disable-next=invalid-name
+    def FetchModelStream(self, request: FetchModelRequest) -> Iterator[FetchModelChunk]:
+        if request.model_id <= 10:
+            yield FetchModelChunk(success=True, chunk=b"pretrained_model")
+            yield FetchModelChunk(success=True, checksum=bytes(5))
+        else:
+            yield FetchModelChunk(success=False)
+
     # pylint: disable-next=invalid-name
     def RegisterModel(self, request: RegisterModelRequest) -> RegisterModelResponse:
         return RegisterModelResponse(success=True, model_id=1)
 
+    # pylint: disable-next=invalid-name
+    def RegisterModelStream(self, request_iterator: Iterator[RegisterModelChunk]) -> RegisterModelResponse:
+        return RegisterModelResponse(success=True, model_id=1)
+
 
 class DummyModelWrapper:
     def __init__(self, model_configuration=None) -> None:
@@ -228,7 +243,7 @@ def test_start_training_invalid_id(test_hasattr, test_connect_to_model_storage):
 
 
 @patch(
-    "modyn.trainer_server.internal.grpc.trainer_server_grpc_servicer.download_trained_model",
+    "modyn.trainer_server.internal.grpc.trainer_server_grpc_servicer.download_streamed_model",
     return_value=pathlib.Path("downloaded_model.modyn"),
 )
 @patch.object(TrainerServerGRPCServicer, "connect_to_model_storage", return_value=DummyModelStorageStub())
@@ -264,12 +279,12 @@ def test_start_training(test_getattr, test_hasattr, test_connect_to_model_storag
 
             download_model_mock.assert_called_once()
             kwargs = download_model_mock.call_args.kwargs
-            remote_file_path = kwargs["remote_path"]
+            chunks = list(kwargs["chunks"])
             base_directory = kwargs["base_directory"]
             identifier = kwargs["identifier"]
 
             assert resp.training_id == 2
-            assert str(remote_file_path) == "testpath.modyn"
+            assert chunks == [(b"pretrained_model", b""), (b"", bytes(5))]
             assert base_directory == trainer_server._modyn_base_dir
             assert resp.training_started
             assert resp.training_id == identifier
@@ -553,7 +568,13 @@ def test_store_final_model_not_found(test_is_alive, test_connect_to_model_storag
 def test_store_final_model_found(test_is_alive, test_connect_to_model_storage):
     model_storage_mock = MagicMock()
     test_connect_to_model_storage.return_value = model_storage_mock
-    model_storage_mock.RegisterModel.return_value = RegisterModelResponse(success=True, model_id=1)
+    received_chunks: list[RegisterModelChunk] = []
+
+    def register_model_stream(request_iterator: Iterator[RegisterModelChunk]) -> RegisterModelResponse:
+        received_chunks.extend(request_iterator)
+        return RegisterModelResponse(success=True, model_id=1)
+
+    model_storage_mock.RegisterModelStream.side_effect = register_model_stream
     with tempfile.TemporaryDirectory() as temp:
         with tempfile.TemporaryDirectory() as final_temp:
             base_path = pathlib.Path(final_temp)
@@ -566,6 +587,7 @@ def test_store_final_model_found(test_is_alive, test_connect_to_model_storage):
             checkpoint_file = base_path / "model_final.modyn"
             torch.save(dict_to_save, checkpoint_file)
             checksum = calculate_checksum(checkpoint_file)
+            checkpoint_bytes = checkpoint_file.read_bytes()
 
             trainer_server._training_dict[1] = training_info
             trainer_server._training_process_dict[1] = get_training_process_info()
@@ -575,14 +597,12 @@ def test_store_final_model_found(test_is_alive, test_connect_to_model_storage):
 
             assert not os.path.isfile(checkpoint_file)
 
-            model_storage_mock.RegisterModel.assert_called_once()
-            req: RegisterModelRequest = model_storage_mock.RegisterModel.call_args[0][0]
-            assert req.pipeline_id == 1
-            assert req.trigger_id == 1
-            assert req.hostname == "trainer_server"
-            assert req.port == 3001
-            assert req.model_path == "model_final.modyn"
-            assert req.checksum == checksum
+            model_storage_mock.RegisterModelStream.assert_called_once()
+            model_storage_mock.RegisterModel.assert_not_called()
+            assert all(chunk.pipeline_id == 1 and chunk.trigger_id == 1 for chunk in received_chunks)
+            assert b"".join(chunk.chunk for chunk in received_chunks) == checkpoint_bytes
+            assert received_chunks[-1].checksum == checksum
+            assert all(not chunk.checksum for chunk in received_chunks[:-1])
 
 
 @patch.object(TrainerServerGRPCServicer, "connect_to_model_storage", return_value=DummyModelStorageStub())
@@ -130,6 +130,13 @@ def mock_get_dataloaders(
     num_parallel_requests,
     tokenizer,
     log_path,
+    shared_prefetching=False,
+    batched_bytes_parser=False,
+    async_fetching=False,
+    keys_per_storage_request=0,
+    sample_cache_directory=None,
+    sample_cache_size=0,
+    packed_sample_keys=False,
 ):
     mock_train_dataloader = iter(
         [(("1",) * 8, torch.ones(8, 10, requires_grad=True), torch.ones(8, dtype=int)) for _ in range(100)]
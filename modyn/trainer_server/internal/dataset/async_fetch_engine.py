@@ -0,0 +1,113 @@
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from typing import Any, Callable, Coroutine, Optional
+
+import grpc
+from modyn.storage.internal.grpc.generated.storage_pb2_grpc import StorageStub
+from modyn.utils import grpc_common_config
+
+logger = logging.getLogger(__name__)
+
+
+async def _channel_ready(channel: grpc.aio.Channel, timeout_sec: int = 5) -> bool:
+    try:
+        await asyncio.wait_for(channel.channel_ready(), timeout=timeout_sec)
+        return True
+    except asyncio.TimeoutError:
+        return False
+
+
+class AsyncFetchEngine:
+    """
+    Drives all partition requests of one OnlineDataset worker from a single asyncio event loop.
+
+    The event loop runs in a background thread and talks to the storage via a grpc.aio channel. Instead of starting
+    one thread per prefetched partition, every partition request is a coroutine submitted to the loop, and at most
+    `max_concurrent_requests` of them are running at the same time. Requests are served in submission order.
+    """
+
+    def __init__(self, storage_address: str, max_concurrent_requests: int) -> None:
+        self._storage_address = storage_address
+        self._max_concurrent_requests = max(1, max_concurrent_requests)
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._request_slots: Optional[asyncio.Semaphore] = None
+        self._storage_channel: Optional[grpc.aio.Channel] = None
+        self.storage_stub: Optional[StorageStub] = None
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None
+
+    def start(self) -> None:
+        assert self._loop is None, "Engine has already been started"
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+
+        try:
+            asyncio.run_coroutine_threadsafe(self._connect(), self._loop).result()
+        except Exception:
+            self.shutdown()
+            raise
+
+    async def _connect(self) -> None:
+        # Both the semaphore and the channel need to be created within the event loop
+        self._request_slots = asyncio.Semaphore(self._max_concurrent_requests)
+        self._storage_channel = grpc.aio.insecure_channel(self._storage_address, options=grpc_common_config())
+        if not await _channel_ready(self._storage_channel):
+            raise ConnectionError(f"Could not establish gRPC connection to storage at address {self._storage_address}.")
+        self.storage_stub = StorageStub(self._storage_channel)
+
+    def submit(self, coroutine: Coroutine[Any, Any, Any]) -> concurrent.futures.Future:
+        """Schedules a partition request, which starts running as soon as a request slot is free."""
+        assert self._loop is not None, "Engine has not been started"
+        return asyncio.run_coroutine_threadsafe(self._run_bounded(coroutine), self._loop)
+
+    async def _run_bounded(self, coroutine: Coroutine[Any, Any, Any]) -> Any:
+        assert self._request_slots is not None
+        try:
+            async with self._request_slots:
+                return await coroutine
+        finally:
+            # If the request got cancelled while waiting for a slot, the coroutine has never been started
+            coroutine.close()
+
+    async def _close(self, close_callback: Optional[Callable[[], Coroutine[Any, Any, None]]]) -> None:
+        current_task = asyncio.current_task()
+        pending_tasks = [task for task in asyncio.all_tasks() if task is not current_task]
+        for task in pending_tasks:
+            task.cancel()
+        await asyncio.gather(*pending_tasks, return_exceptions=True)
+
+        if close_callback is not None:
+            try:
+                await close_callback()
+            except Exception as exception:  # pylint: disable=broad-except
+                logger.warning(f"Error while closing the connections of the fetch engine: {exception}")
+
+        if self._storage_channel is not None:
+            await self._storage_channel.close()
+            self._storage_channel = None
+            self.storage_stub = None
+
+    def shutdown(self, close_callback: Optional[Callable[[], Coroutine[Any, Any, None]]] = None) -> None:
+        """
+        Cancels all pending requests and stops the event loop. The optional callback is awaited on the event loop
+        before, e.g., to close other grpc.aio channels that have been created within the loop.
+        """
+        if self._loop is None:
+            return
+
+        assert self._thread is not None
+        asyncio.run_coroutine_threadsafe(self._close(close_callback), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+        self._loop = None
+        self._thread = None
+        self._request_slots = None
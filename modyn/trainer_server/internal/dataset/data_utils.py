@@ -26,6 +26,13 @@ def prepare_dataloaders(
     parallel_prefetch_requests: int,
     tokenizer: Optional[str],
     log_path: Optional[pathlib.Path],
+    shared_prefetching: bool = False,
+    batched_bytes_parser: bool = False,
+    async_fetching: bool = False,
+    keys_per_storage_request: int = 0,
+    sample_cache_directory: Optional[pathlib.Path] = None,
+    sample_cache_size: int = 0,
+    packed_sample_keys: bool = False,
 ) -> tuple[torch.utils.data.DataLoader, Optional[torch.utils.data.DataLoader]]:
     """
     Gets the proper dataset according to the dataset id, and creates the proper dataloaders.
@@ -42,6 +49,15 @@ def prepare_dataloaders(
         tokenizer (optional[str]): Optional tokenizer for NLP tasks
         storage_address (str): Address of the Storage endpoint that the OnlineDataset workers connect to.
         selector_address (str): Address of the Selector endpoint that the OnlineDataset workers connect to.
+        shared_prefetching (bool): Whether a single process prefetches the partitions for all workers.
+        batched_bytes_parser (bool): Whether the dataset parses and collates whole batches using the
+            batched_bytes_parser_function defined in bytes_parser.
+        async_fetching (bool): Whether the workers fetch partitions from a single asyncio event loop instead of threads.
+        keys_per_storage_request (int): With async fetching, the number of keys after which a storage request is
+            issued while the remaining keys of the partition are still being received (0 disables pipelining).
+        sample_cache_directory (optional[pathlib.Path]): Directory of the local sample cache, None disables the cache.
+        sample_cache_size (int): Maximum size of the sample cache in bytes.
+        packed_sample_keys (bool): Whether the keys are received from the selector as packed buffers.
     Returns:
         tuple[Optional[torch.utils.data.DataLoader]]: Dataloaders for train and validation
 
@@ -60,9 +76,22 @@ def prepare_dataloaders(
         parallel_prefetch_requests,
         tokenizer,
         log_path,
+        batch_size=batch_size if batched_bytes_parser else None,
+        async_fetching=async_fetching,
+        keys_per_storage_request=keys_per_storage_request,
+        sample_cache_directory=sample_cache_directory,
+        sample_cache_size=sample_cache_size,
+        packed_sample_keys=packed_sample_keys,
     )
+    if shared_prefetching:
+        logger.debug("Starting shared prefetcher.")
+        train_set.start_shared_prefetching(max(num_dataloaders, 1))
+
     logger.debug("Creating DataLoader.")
-    train_dataloader = torch.utils.data.DataLoader(train_set, batch_size=batch_size, num_workers=num_dataloaders)
+    # With a batched bytes parser, the dataset already yields collated batches
+    train_dataloader = torch.utils.data.DataLoader(
+        train_set, batch_size=None if batched_bytes_parser else batch_size, num_workers=num_dataloaders
+    )
 
     # TODO(#50): what to do with the val set in the general case?
     val_dataloader = None
@@ -7,6 +7,7 @@ from enum import Enum
 
 from .abstract_key_source import AbstractKeySource  # noqa: F401
 from .local_key_source import LocalKeySource  # noqa: F401
+from .packed_selector_key_source import PackedSelectorKeySource  # noqa: F401
 from .selector_key_source import SelectorKeySource  # noqa: F401
 
 KeySourceNames = Enum("KeySource", ["LOCAL_DOWNSAMPLER", "SELECTOR"])
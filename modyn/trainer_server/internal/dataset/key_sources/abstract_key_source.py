@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 
 class AbstractKeySource(ABC):
@@ -11,6 +12,22 @@ class AbstractKeySource(ABC):
     def get_keys_and_weights(self, worker_id: int, partition_id: int) -> tuple[list[int], Optional[list[float]]]:
         raise NotImplementedError()
 
+    async def get_keys_and_weights_async(
+        self, worker_id: int, partition_id: int
+    ) -> tuple[list[int], Optional[list[float]]]:
+        # used by the async fetch engine. By default, the blocking implementation runs in a thread of the event loop
+        return await asyncio.to_thread(self.get_keys_and_weights, worker_id, partition_id)
+
+    async def stream_keys_and_weights_async(
+        self, worker_id: int, partition_id: int
+    ) -> AsyncIterator[tuple[list[int], Optional[list[float]]]]:
+        # yields the keys of a partition in chunks as soon as they are available. By default, there is a single chunk
+        yield await self.get_keys_and_weights_async(worker_id, partition_id)
+
+    async def close_async(self) -> None:
+        # closes the connections created within the event loop of the async fetch engine, before the loop is stopped
+        pass
+
     @abstractmethod
     def get_num_data_partitions(self) -> int:
         raise NotImplementedError()
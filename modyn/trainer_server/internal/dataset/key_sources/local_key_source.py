@@ -13,13 +13,12 @@ class LocalKeySource(AbstractKeySource):
 
     def get_keys_and_weights(self, worker_id: int, partition_id: int) -> tuple[list[int], Optional[list[float]]]:
         path = self._trigger_sample_storage.get_file_path(self._pipeline_id, self._trigger_id, partition_id, worker_id)
-        tuples_list = self._trigger_sample_storage.parse_file(path)
+        samples = self._trigger_sample_storage.parse_file(path)
 
-        if len(tuples_list) == 0:
+        if len(samples) == 0:
             return [], []
-        keys, weights = zip(*tuples_list)
 
-        return list(keys), list(weights)
+        return samples["f0"].tolist(), samples["f1"].tolist()
 
     def uses_weights(self) -> bool:
         return True
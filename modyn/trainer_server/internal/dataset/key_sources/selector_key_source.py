@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 import grpc
 
@@ -21,15 +21,16 @@ class SelectorKeySource(AbstractKeySource):
 
         self._selector_address = selector_address
         self._selectorstub = None  # connection is made when the pytorch worker is started
+        self._selector_channel: Optional[grpc.Channel] = None
+        self._async_selectorstub: Optional[SelectorStub] = None  # created lazily within the event loop
+        self._async_selector_channel: Optional[grpc.aio.Channel] = None
         self._uses_weights: Optional[bool] = None  # get via gRPC, so unavailable if the connection is not yet made.
 
     def get_keys_and_weights(self, worker_id: int, partition_id: int) -> tuple[list[int], Optional[list[float]]]:
         assert self._selectorstub is not None
         assert self._uses_weights is not None
 
-        req = GetSamplesRequest(
-            pipeline_id=self._pipeline_id, trigger_id=self._trigger_id, worker_id=worker_id, partition_id=partition_id
-        )
+        req = self._get_samples_request(worker_id, partition_id)
 
         if self._uses_weights:
             return self._get_both_keys_and_weights(req)
@@ -60,6 +61,52 @@ class SelectorKeySource(AbstractKeySource):
 
         return keys, weights
 
+    async def get_keys_and_weights_async(
+        self, worker_id: int, partition_id: int
+    ) -> tuple[list[int], Optional[list[float]]]:
+        keys: list[int] = []
+        weights: list[float] = []
+        async for key_chunk, weight_chunk in self.stream_keys_and_weights_async(worker_id, partition_id):
+            keys.extend(key_chunk)
+            if weight_chunk is not None:
+                weights.extend(weight_chunk)
+
+        return keys, weights if self._uses_weights else None
+
+    async def stream_keys_and_weights_async(
+        self, worker_id: int, partition_id: int
+    ) -> AsyncIterator[tuple[list[int], Optional[list[float]]]]:
+        assert self._uses_weights is not None
+
+        req = self._get_samples_request(worker_id, partition_id)
+
+        # The selector streams the keys of the partition in chunks, which we forward without waiting for the rest
+        async for response in self._get_async_selectorstub().get_sample_keys_and_weights(req):
+            yield (
+                list(response.training_samples_subset),
+                list(response.training_samples_weights) if self._uses_weights else None,
+            )
+
+    def _get_samples_request(self, worker_id: int, partition_id: int) -> GetSamplesRequest:
+        return GetSamplesRequest(
+            pipeline_id=self._pipeline_id, trigger_id=self._trigger_id, worker_id=worker_id, partition_id=partition_id
+        )
+
+    def _get_async_selectorstub(self) -> SelectorStub:
+        if self._async_selectorstub is None:
+            # A grpc.aio channel is bound to the event loop it is created in, i.e., the loop of the fetch engine
+            self._async_selector_channel = grpc.aio.insecure_channel(
+                self._selector_address, options=self._channel_options()
+            )
+            self._async_selectorstub = SelectorStub(self._async_selector_channel)
+        return self._async_selectorstub
+
+    async def close_async(self) -> None:
+        if self._async_selector_channel is not None:
+            await self._async_selector_channel.close()
+            self._async_selector_channel = None
+            self._async_selectorstub = None
+
     def get_num_data_partitions(self) -> int:
         assert self._selectorstub is not None
 
@@ -87,18 +134,23 @@ class SelectorKeySource(AbstractKeySource):
         self._uses_weights = self.uses_weights()
 
     def _connect_to_selector(self) -> SelectorStub:
-        selector_channel = grpc.insecure_channel(
-            self._selector_address,
-            options=[
-                ("grpc.max_receive_message_length", MAX_MESSAGE_SIZE),
-                ("grpc.max_send_message_length", MAX_MESSAGE_SIZE),
-            ],
-        )
-        if not grpc_connection_established(selector_channel):
+        self._selector_channel = grpc.insecure_channel(self._selector_address, options=self._channel_options())
+        if not grpc_connection_established(self._selector_channel):
             raise ConnectionError(
                 f"Could not establish gRPC connection to selector at address {self._selector_address}."
             )
-        return SelectorStub(selector_channel)
+        return SelectorStub(self._selector_channel)
+
+    @staticmethod
+    def _channel_options() -> list[tuple[str, int]]:
+        return [
+            ("grpc.max_receive_message_length", MAX_MESSAGE_SIZE),
+            ("grpc.max_send_message_length", MAX_MESSAGE_SIZE),
+        ]
 
     def end_of_trigger_cleaning(self) -> None:
-        pass
+        # the asynchronous channel is closed by the fetch engine on its event loop (see close_async)
+        if self._selector_channel is not None:
+            self._selector_channel.close()
+            self._selector_channel = None
+            self._selectorstub = None
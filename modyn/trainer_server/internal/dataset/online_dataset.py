@@ -1,21 +1,33 @@
+import asyncio
+import concurrent.futures
 import contextlib
-import gc
+import copy
 import json
 import logging
 import os
 import pathlib
 import threading
-from typing import Any, Callable, Generator, Iterator, Optional, Tuple
+from typing import Any, AsyncIterator, Callable, Generator, Iterator, Optional, Tuple
 
 import grpc
+import torch
 from modyn.common.benchmark.stopwatch import Stopwatch
 from modyn.storage.internal.grpc.generated.storage_pb2 import (  # pylint: disable=no-name-in-module
     GetRequest,
     GetResponse,
 )
 from modyn.storage.internal.grpc.generated.storage_pb2_grpc import StorageStub
-from modyn.trainer_server.internal.dataset.key_sources import AbstractKeySource, SelectorKeySource
+from modyn.trainer_server.internal.dataset.async_fetch_engine import AsyncFetchEngine
+from modyn.trainer_server.internal.dataset.key_sources import (
+    AbstractKeySource,
+    PackedSelectorKeySource,
+    SelectorKeySource,
+)
+from modyn.trainer_server.internal.dataset.partition_buffer import PartitionBuffer
+from modyn.trainer_server.internal.dataset.sample_cache import SampleCache
+from modyn.trainer_server.internal.dataset.shared_prefetcher import SharedPrefetcher
 from modyn.utils import (
+    BATCHED_BYTES_PARSER_FUNC_NAME,
     BYTES_PARSER_FUNC_NAME,
     deserialize_function,
     grpc_common_config,
@@ -32,7 +44,10 @@ logger = logging.getLogger(__name__)
 class OnlineDataset(IterableDataset):
     # pylint: disable=too-many-instance-attributes, abstract-method
 
-    def __init__(
+    # Upper bound of concurrent storage requests for the keys of a single partition when using async fetching
+    MAX_STORAGE_REQUESTS_PER_PARTITION = 4
+
+    def __init__(  # pylint: disable=too-many-locals, too-many-statements
         self,
         pipeline_id: int,
         trigger_id: int,
@@ -46,6 +61,12 @@ class OnlineDataset(IterableDataset):
         parallel_prefetch_requests: int,
         tokenizer: Optional[str],
         log_path: Optional[pathlib.Path],
+        batch_size: Optional[int] = None,
+        async_fetching: bool = False,
+        keys_per_storage_request: int = 0,
+        sample_cache_directory: Optional[pathlib.Path] = None,
+        sample_cache_size: int = 0,
+        packed_sample_keys: bool = False,
     ):
         self._pipeline_id = pipeline_id
         self._trigger_id = trigger_id
@@ -54,6 +75,17 @@ class OnlineDataset(IterableDataset):
         self._first_call = True
         self._num_prefetched_partitions = num_prefetched_partitions
         self._parallel_prefetch_requests = parallel_prefetch_requests
+        # If a batch size is given, we yield whole batches parsed by the batched bytes parser
+        # and the DataLoader must not batch again (batch_size=None).
+        self._batch_size = batch_size
+        # If enabled, partitions are fetched by coroutines on a single event loop per worker instead of threads
+        self._async_fetching = async_fetching
+        # With async fetching and a positive value, storage requests of a partition are pipelined with the key stream
+        self._keys_per_storage_request = keys_per_storage_request
+        # If a directory is given, payloads are served from a local on-disk cache before asking the storage
+        self._sample_cache_directory = sample_cache_directory
+        self._sample_cache_size = sample_cache_size
+        self._sample_cache: Optional[SampleCache] = None
 
         self._bytes_parser = bytes_parser
         self._serialized_transforms = serialized_transforms
@@ -66,8 +98,9 @@ class OnlineDataset(IterableDataset):
         self._bytes_parser_function: Optional[Callable] = None
         self._num_partitions = 0
         # the default key source is the Selector. Then it can be changed using change_key_source
-        self._key_source = SelectorKeySource(self._pipeline_id, self._trigger_id, self._selector_address)
-        self._uses_weights = None
+        key_source_class = PackedSelectorKeySource if packed_sample_keys else SelectorKeySource
+        self._key_source = key_source_class(self._pipeline_id, self._trigger_id, self._selector_address)
+        self._uses_weights: Optional[bool] = None
         self._log_path = log_path
         self._log: dict[str, Any] = {"partitions": {}}
         self._log_lock: Optional[threading.Lock] = None
@@ -75,7 +108,7 @@ class OnlineDataset(IterableDataset):
 
         self._data_threads: dict[int, threading.Thread] = {}
         self._pref_started: dict[int, bool] = {}
-        self._thread_data_container: dict[int, dict[str, Any]] = {}
+        self._thread_data_container: dict[int, PartitionBuffer] = {}
         self._partition_locks: dict[int, threading.Lock] = {}
         self._partition_signals: dict[int, threading.Condition] = {}  # Should use the lock out of partition_locks
         self._partition_valid_until: dict[int, int] = {}
@@ -83,10 +116,18 @@ class OnlineDataset(IterableDataset):
         self._next_partition_to_fetch = 0
         self._launched_prefetches = 0
         self._start_prefetch_lock: Optional[threading.Lock] = None
+        self._shared_prefetcher: Optional[SharedPrefetcher] = None
+        self._fetch_engine: Optional[AsyncFetchEngine] = None
+        self._data_futures: dict[int, concurrent.futures.Future] = {}
 
         if log_path is None:
             logger.warning("Did not provide log path for OnlineDataset - logging disabled.")
 
+        if batch_size is not None:
+            assert batch_size > 0, "The batch size must be positive"
+            if tokenizer is not None:
+                raise ValueError("Tokenizers are not supported together with a batched bytes parser.")
+
         # tokenizer for NLP tasks
         self._tokenizer = None
         self._tokenizer_name = tokenizer
@@ -98,6 +139,41 @@ class OnlineDataset(IterableDataset):
     def change_key_source(self, source: AbstractKeySource) -> None:
         self._key_source = source
 
+    def start_shared_prefetching(self, num_workers: int) -> None:
+        """
+        Starts a single prefetcher process that fetches the partitions for all `num_workers` DataLoader workers and
+        hands them over via shared memory. Needs to be called before the DataLoader workers are started.
+        """
+        assert self._shared_prefetcher is None, "Shared prefetching has already been started"
+        if self._async_fetching:
+            logger.warning(
+                "async_fetching is ignored with shared prefetching. The shared prefetcher fetches up to "
+                f"{self._parallel_prefetch_requests} partitions per worker concurrently with threads."
+            )
+        prefetcher_dataset = copy.copy(self)
+        self._shared_prefetcher = SharedPrefetcher(
+            num_workers, self._num_prefetched_partitions, self._parallel_prefetch_requests
+        )
+        self._shared_prefetcher.start(prefetcher_dataset)
+
+    def shared_prefetching_copy(self, key_source: AbstractKeySource, uses_weights: bool) -> "OnlineDataset":
+        # Used by the prefetcher process to serve one worker. The copy shares the storage connection.
+        dataset = copy.copy(self)
+        dataset._key_source = key_source
+        dataset._uses_weights = uses_weights
+        dataset._log = {"partitions": {}}
+        dataset._log_lock = threading.Lock()
+        dataset._sw = Stopwatch()
+        return dataset
+
+    def fetch_partition_buffer(self, worker_id: int, partition_id: int) -> tuple[PartitionBuffer, dict]:
+        container = self._create_partition_buffer()
+        self._get_data(container, worker_id, partition_id, None, None, None, None, None)
+
+        assert self._log_lock is not None
+        with self._log_lock:
+            return container, self._log["partitions"][str(partition_id)]
+
     def _setup_composed_transform(self) -> None:
         assert self._bytes_parser_function is not None
 
@@ -113,7 +189,9 @@ class OnlineDataset(IterableDataset):
             self._transform = transforms.Compose(self._transform_list)
 
     def _init_transforms(self) -> None:
-        self._bytes_parser_function = deserialize_function(self._bytes_parser, BYTES_PARSER_FUNC_NAME)
+        # In batched mode, the parser and all transformations operate on a list of samples instead of a single one
+        bytes_parser_func_name = BYTES_PARSER_FUNC_NAME if self._batch_size is None else BATCHED_BYTES_PARSER_FUNC_NAME
+        self._bytes_parser_function = deserialize_function(self._bytes_parser, bytes_parser_func_name)
         self._transform = self._bytes_parser_function
         self._setup_composed_transform()
 
@@ -123,6 +201,10 @@ class OnlineDataset(IterableDataset):
             raise ConnectionError(f"Could not establish gRPC connection to storage at address {self._storage_address}.")
         self._storagestub = StorageStub(self._storage_channel)
 
+    def _init_sample_cache(self) -> None:
+        if self._sample_cache_directory is not None:
+            self._sample_cache = SampleCache(self._sample_cache_directory, self._dataset_id, self._sample_cache_size)
+
     def _silence_pil(self) -> None:  # pragma: no cover
         pil_logger = logging.getLogger("PIL")
         pil_logger.setLevel(logging.INFO)  # by default, PIL on DEBUG spams the console
@@ -136,13 +218,24 @@ class OnlineDataset(IterableDataset):
     def _get_data_from_storage(
         self, selector_keys: list[int], worker_id: Optional[int] = None
     ) -> Iterator[tuple[list[int], list[bytes], list[int], int]]:
+        if self._sample_cache is not None:
+            cached_keys, cached_samples, cached_labels, selector_keys = self._sample_cache.get(selector_keys)
+            if len(cached_keys) > 0:
+                yield cached_keys, cached_samples, cached_labels, 0
+            if len(selector_keys) == 0:
+                return
+
         req = GetRequest(dataset_id=self._dataset_id, keys=selector_keys)
         stopw = Stopwatch()
 
         response: GetResponse
         stopw.start("ResponseTime", overwrite=True)
         for _, response in enumerate(self._storagestub.Get(req)):
-            yield list(response.keys), list(response.samples), list(response.labels), stopw.stop("ResponseTime")
+            keys, samples, labels = list(response.keys), list(response.samples), list(response.labels)
+            response_time = stopw.stop("ResponseTime")
+            if self._sample_cache is not None:
+                self._sample_cache.put(keys, samples, labels)
+            yield keys, samples, labels, response_time
             if not grpc_connection_established(self._storage_channel):
                 self._info("gRPC connection lost, trying to reconnect!", worker_id)
                 self._init_grpc()
@@ -151,7 +244,7 @@ class OnlineDataset(IterableDataset):
     # pylint: disable=too-many-locals
     def _get_data(
         self,
-        data_container: dict,
+        data_container: PartitionBuffer,
         worker_id: int,
         partition_id: int,
         partition_valid: Optional[dict],
@@ -170,41 +263,182 @@ class OnlineDataset(IterableDataset):
         self._sw.start(f"GetDataPart{partition_id}", overwrite=True)
         all_response_times = []
 
-        key_weight_map = {key: weights[idx] for idx, key in enumerate(keys)} if weights is not None else None
+        key_weight_map = (
+            {key: weights[idx] for idx, key in enumerate(keys)}
+            if weights is not None and data_container.uses_weights
+            else None
+        )
 
         for data_tuple in self._get_data_from_storage(keys, worker_id=worker_id):
             stor_keys, data, labels, response_time = data_tuple
             all_response_times.append(response_time)
-            num_items = len(stor_keys)
-            with partition_locks[partition_id] if partition_locks is not None else contextlib.suppress():
-                data_container["data"].extend(data)
-                data_container["keys"].extend(stor_keys)
-                data_container["labels"].extend(labels)
-                data_container["weights"].extend(
-                    [key_weight_map[key] for key in stor_keys]
-                    if key_weight_map is not None
-                    else [None for _ in range(len(stor_keys))]
-                )
-                if partition_valid_until is not None:
-                    partition_valid_until[partition_id] += num_items
-
-            if partition_signals is not None:
-                with partition_signals[partition_id]:
-                    partition_signals[partition_id].notify_all()
+            self._store_data_chunk(
+                data_container,
+                partition_id,
+                stor_keys,
+                data,
+                labels,
+                key_weight_map,
+                partition_valid_until,
+                partition_locks,
+                partition_signals,
+            )
 
         get_data_log["get_data"] = self._sw.stop(f"GetDataPart{partition_id}")
         get_data_log["response_times"] = all_response_times
-        assert self._log_lock is not None
+        self._finish_partition(partition_id, get_data_log, partition_valid, partition_locks, partition_signals)
 
-        with self._log_lock:
-            self._log["partitions"][str(partition_id)] = get_data_log
+        if callback is not None:
+            callback()
+
+    def _store_data_chunk(
+        self,
+        data_container: PartitionBuffer,
+        partition_id: int,
+        stor_keys: list[int],
+        data: list[bytes],
+        labels: list[int],
+        key_weight_map: Optional[dict[int, float]],
+        partition_valid_until: Optional[dict],
+        partition_locks: Optional[dict],
+        partition_signals: Optional[dict],
+    ) -> None:
+        stor_weights = [key_weight_map[key] for key in stor_keys] if key_weight_map is not None else None
+        with partition_locks[partition_id] if partition_locks is not None else contextlib.suppress():
+            num_items = data_container.append(stor_keys, data, labels, stor_weights)
+            if partition_valid_until is not None:
+                partition_valid_until[partition_id] += num_items
+
+        if partition_signals is not None:
+            with partition_signals[partition_id]:
+                partition_signals[partition_id].notify_all()
+
+    def _finish_partition(
+        self,
+        partition_id: int,
+        get_data_log: Optional[dict],
+        partition_valid: Optional[dict],
+        partition_locks: Optional[dict],
+        partition_signals: Optional[dict],
+    ) -> None:
+        if get_data_log is not None:
+            assert self._log_lock is not None
+            with self._log_lock:
+                self._log["partitions"][str(partition_id)] = get_data_log
 
         if partition_locks is not None and partition_valid is not None:
             with partition_locks[partition_id]:
                 partition_valid[partition_id] = True
 
-        if callback is not None:
-            callback()
+        if partition_signals is not None:
+            with partition_signals[partition_id]:
+                partition_signals[partition_id].notify_all()
+
+    async def _get_data_from_storage_async(
+        self, selector_keys: list[int]
+    ) -> AsyncIterator[tuple[list[int], list[bytes], list[int], int]]:
+        assert self._fetch_engine is not None and self._fetch_engine.storage_stub is not None
+        if self._sample_cache is not None:
+            # The cache does blocking I/O, which should not stall the other requests on the event loop
+            cached_keys, cached_samples, cached_labels, selector_keys = await asyncio.to_thread(
+                self._sample_cache.get, selector_keys
+            )
+            if len(cached_keys) > 0:
+                yield cached_keys, cached_samples, cached_labels, 0
+            if len(selector_keys) == 0:
+                return
+
+        req = GetRequest(dataset_id=self._dataset_id, keys=selector_keys)
+        stopw = Stopwatch()
+
+        response: GetResponse
+        stopw.start("ResponseTime", overwrite=True)
+        async for response in self._fetch_engine.storage_stub.Get(req):
+            keys, samples, labels = list(response.keys), list(response.samples), list(response.labels)
+            response_time = stopw.stop("ResponseTime")
+            if self._sample_cache is not None:
+                await asyncio.to_thread(self._sample_cache.put, keys, samples, labels)
+            yield keys, samples, labels, response_time
+            stopw.start("ResponseTime", overwrite=True)
+
+    async def _get_data_async(
+        self,
+        data_container: PartitionBuffer,
+        worker_id: int,
+        partition_id: int,
+        partition_valid: Optional[dict],
+        partition_valid_until: Optional[dict],
+        partition_locks: Optional[dict],
+        partition_signals: Optional[dict],
+    ) -> None:
+        # Counterpart of _get_data that runs on the event loop of the fetch engine.
+        # We cannot use the shared stopwatch, since multiple partitions are fetched concurrently on the same thread.
+        get_data_log: dict[str, Any] = {"num_items": 0, "num_storage_requests": 0}
+        all_response_times: list[int] = []
+        # Weights are added as their keys arrive, i.e., before the storage request for these keys is issued
+        key_weight_map: Optional[dict[int, float]] = {} if data_container.uses_weights else None
+        storage_request_slots = asyncio.Semaphore(self.MAX_STORAGE_REQUESTS_PER_PARTITION)
+        storage_tasks: list[asyncio.Task] = []
+        stopw = Stopwatch()
+
+        async def fetch_from_storage(keys: list[int]) -> None:
+            try:
+                async for stor_keys, data, labels, response_time in self._get_data_from_storage_async(keys):
+                    all_response_times.append(response_time)
+                    self._store_data_chunk(
+                        data_container,
+                        partition_id,
+                        stor_keys,
+                        data,
+                        labels,
+                        key_weight_map,
+                        partition_valid_until,
+                        partition_locks,
+                        partition_signals,
+                    )
+            finally:
+                storage_request_slots.release()
+
+        async def issue_storage_request(keys: list[int]) -> None:
+            await storage_request_slots.acquire()
+            if len(storage_tasks) == 0:
+                stopw.start("GetData")
+            storage_tasks.append(asyncio.create_task(fetch_from_storage(keys)))
+
+        try:
+            self._info("Getting keys from the key source and data from storage", worker_id)
+            stopw.start("GetKeysAndWeights")
+            pending_keys: list[int] = []
+            async for key_chunk, weight_chunk in self._key_source.stream_keys_and_weights_async(
+                worker_id, partition_id
+            ):
+                if key_weight_map is not None:
+                    assert weight_chunk is not None, "Key source did not provide weights"
+                    key_weight_map.update(zip(key_chunk, weight_chunk))
+                pending_keys.extend(key_chunk)
+                get_data_log["num_items"] += len(key_chunk)
+
+                # Pipelining: request the payloads of the keys we have so far while the remaining keys still arrive
+                if 0 < self._keys_per_storage_request <= len(pending_keys):
+                    await issue_storage_request(pending_keys)
+                    pending_keys = []
+
+            get_data_log["get_keys_and_weights"] = stopw.stop("GetKeysAndWeights")
+            if len(pending_keys) > 0:
+                await issue_storage_request(pending_keys)
+
+            await asyncio.gather(*storage_tasks)
+            get_data_log["get_data"] = stopw.stop("GetData") if len(storage_tasks) > 0 else 0
+            get_data_log["num_storage_requests"] = len(storage_tasks)
+            get_data_log["response_times"] = all_response_times
+        except BaseException:
+            for task in storage_tasks:
+                task.cancel()
+            # Wake up the consumer, which then gets the exception from the future of this request
+            self._finish_partition(partition_id, None, partition_valid, partition_locks, partition_signals)
+            raise
+
+        self._finish_partition(partition_id, get_data_log, partition_valid, partition_locks, partition_signals)
 
     def _get_transformed_data_tuple(
         self, key: int, sample: memoryview, label: int, weight: Optional[float]
@@ -218,9 +452,59 @@ class OnlineDataset(IterableDataset):
             return key, tranformed_sample, label, weight
         return key, tranformed_sample, label
 
+    def _get_transformed_batch(
+        self, keys: list[int], samples: list[memoryview], labels: list[int], weights: list[Optional[float]]
+    ) -> Tuple:
+        assert self._uses_weights is not None
+        self._sw.start("transform", resume=True)
+        # mypy complains here because _transform has unknown type, which is ok
+        transformed_batch = self._transform(samples)  # type: ignore
+        self._sw.stop("transform")
+        # Same types as the default collate function of the DataLoader would produce
+        key_tensor = torch.tensor(keys, dtype=torch.int64)
+        label_tensor = torch.tensor(labels, dtype=torch.int64)
+        if self._uses_weights:
+            return key_tensor, transformed_batch, label_tensor, torch.tensor(weights, dtype=torch.float64)
+        return key_tensor, transformed_batch, label_tensor
+
+    def _batch_generator(
+        self, partition_generator: Iterator[tuple[int, memoryview, int, Optional[float]]]
+    ) -> Iterator[Tuple]:
+        assert self._batch_size is not None
+        keys: list[int] = []
+        samples: list[memoryview] = []
+        labels: list[int] = []
+        weights: list[Optional[float]] = []
+
+        for key, sample, label, weight in partition_generator:
+            keys.append(key)
+            samples.append(sample)
+            labels.append(label)
+            weights.append(weight)
+
+            if len(keys) == self._batch_size:
+                yield self._get_transformed_batch(keys, samples, labels, weights)
+                keys, samples, labels, weights = [], [], [], []
+
+        # Like the DataLoader, we do not drop the last incomplete batch
+        if len(keys) > 0:
+            yield self._get_transformed_batch(keys, samples, labels, weights)
+
     def end_of_trigger_cleaning(self) -> None:
         self._key_source.end_of_trigger_cleaning()
 
+        if self._shared_prefetcher is not None:
+            self._shared_prefetcher.shutdown()
+            self._shared_prefetcher = None
+
+        if self._fetch_engine is not None:
+            self._fetch_engine.shutdown(self._key_source.close_async)
+            self._fetch_engine = None
+
+        if self._sample_cache is not None:
+            self._sample_cache.close()
+            self._sample_cache = None
+
     def _persist_log(self, worker_id: int) -> None:
         if self._log_path is None:
             return
@@ -236,19 +520,23 @@ class OnlineDataset(IterableDataset):
             self._log["transform"] = self._sw.measurements.get("transform", 0)
             self._log["wait_for_later_partitions"] = self._sw.measurements.get("wait_for_later_partitions", 0)
             self._log["wait_for_initial_partition"] = self._sw.measurements.get("wait_for_initial_partition", 0)
+            self._log["wait_for_shared_partition"] = self._sw.measurements.get("wait_for_shared_partition", 0)
+            if self._sample_cache is not None:
+                self._log["sample_cache"] = self._sample_cache.stats
 
             with open(log_file, "w", encoding="utf-8") as logfile:
                 json.dump(self._log, logfile)
 
+    def _create_partition_buffer(self) -> PartitionBuffer:
+        assert self._uses_weights is not None
+        return PartitionBuffer(self._uses_weights)
+
     def _clear_partition(self, partition_id: int) -> None:
         with self._partition_locks[partition_id] if self._partition_locks is not None else contextlib.suppress():
             self._partition_valid[partition_id] = False
             self._partition_valid_until[partition_id] = -1
             del self._thread_data_container[partition_id]
 
-        if "PYTEST_CURRENT_TEST" not in os.environ:
-            gc.collect()
-
     def _prefetch_partition(self, worker_id: int, maybe_continue: bool = False) -> None:
         assert self._start_prefetch_lock is not None
         with self._start_prefetch_lock:
@@ -267,12 +555,7 @@ class OnlineDataset(IterableDataset):
                 self._next_partition_to_fetch not in self._data_threads
             ), f"Prefetching for partition {self._next_partition_to_fetch} has already been started"
 
-            self._thread_data_container[self._next_partition_to_fetch] = {
-                "data": [],
-                "keys": [],
-                "labels": [],
-                "weights": [],
-            }
+            self._thread_data_container[self._next_partition_to_fetch] = self._create_partition_buffer()
             self._partition_valid[self._next_partition_to_fetch] = False
             self._partition_valid_until[self._next_partition_to_fetch] = -1
             self._partition_locks[self._next_partition_to_fetch] = threading.Lock()
@@ -280,6 +563,23 @@ class OnlineDataset(IterableDataset):
                 self._partition_locks[self._next_partition_to_fetch]
             )
 
+            if self._fetch_engine is not None:
+                # The engine bounds the number of concurrent requests, so we do not need the callback chain
+                self._data_futures[self._next_partition_to_fetch] = self._fetch_engine.submit(
+                    self._get_data_async(
+                        self._thread_data_container[self._next_partition_to_fetch],
+                        worker_id,
+                        self._next_partition_to_fetch,
+                        self._partition_valid,
+                        self._partition_valid_until,
+                        self._partition_locks,
+                        self._partition_signals,
+                    )
+                )
+                self._pref_started[self._next_partition_to_fetch] = True
+                self._next_partition_to_fetch += 1
+                return
+
             callback = None
             if maybe_continue:
 
@@ -324,14 +624,15 @@ class OnlineDataset(IterableDataset):
         self, worker_id: int, partition_id: int
     ) -> Iterator[tuple[int, memoryview, int, Optional[float]]]:
         assert self._num_prefetched_partitions < 1
-        container: dict[str, Any] = {"data": [], "keys": [], "labels": [], "weights": []}
-        self._get_data(container, worker_id, partition_id, None, None, None, None, None)
-        assert "data" in container and "labels" in container and "keys" in container and "weights" in container
+        container = self._create_partition_buffer()
+        if self._fetch_engine is not None:
+            self._fetch_engine.submit(
+                self._get_data_async(container, worker_id, partition_id, None, None, None, None)
+            ).result()
+        else:
+            self._get_data(container, worker_id, partition_id, None, None, None, None, None)
 
-        for idx in range(len(container["keys"])):
-            yield container["keys"][idx], memoryview(container["data"][idx]), container["labels"][idx], container[
-                "weights"
-            ][idx]
+        yield from container.samples(0, len(container))
 
     def _is_partition_fetched(self, partition_id: int) -> bool:
         if partition_id not in self._partition_locks or partition_id not in self._partition_valid:
@@ -347,18 +648,25 @@ class OnlineDataset(IterableDataset):
     def _get_partition_data(
         self, last_idx: int, max_idx: int, partition_id: int
     ) -> Iterator[tuple[int, memoryview, int, Optional[float]]]:
-        for idx in range(last_idx + 1, max_idx + 1):
-            yield self._thread_data_container[partition_id]["keys"][idx], memoryview(
-                self._thread_data_container[partition_id]["data"][idx]
-            ), self._thread_data_container[partition_id]["labels"][idx], self._thread_data_container[partition_id][
-                "weights"
-            ][
-                idx
-            ]
-
-    def _wait_for_new_partition_data(self, partition_id: int) -> None:
+        yield from self._thread_data_container[partition_id].samples(last_idx + 1, max_idx + 1)
+
+    def _wait_for_new_partition_data(self, partition_id: int, last_idx: int) -> None:
         with self._partition_signals[partition_id]:
-            self._partition_signals[partition_id].wait(1)  # In case we do not get woken up, we at most waste a second
+            if self._fetch_engine is not None:
+                # The engine notifies about every new chunk and the end of the partition, so we do not need to poll
+                self._partition_signals[partition_id].wait_for(
+                    lambda: self._partition_valid_until[partition_id] > last_idx or self._partition_valid[partition_id]
+                )
+            else:
+                # In case we do not get woken up, we at most waste a second
+                self._partition_signals[partition_id].wait(1)
+
+    def _join_partition_fetch(self, partition_id: int) -> None:
+        if partition_id in self._data_futures:
+            # Raises the exception of the request, if any
+            self._data_futures.pop(partition_id).result()
+        else:
+            self._data_threads[partition_id].join()
 
     def prefetched_partition_generator(
         self, worker_id: int, partition_id: int
@@ -368,14 +676,14 @@ class OnlineDataset(IterableDataset):
         while not self._is_partition_fetched(partition_id):
             max_idx = self._partition_max_index(partition_id)
             if max_idx <= last_idx:  # No new data
-                self._wait_for_new_partition_data(partition_id)
+                self._wait_for_new_partition_data(partition_id, last_idx)
 
             yield from self._get_partition_data(last_idx, max_idx, partition_id)
             last_idx = max_idx
 
         # Yield potential remaining data
         self._info(f"Joining thread for partition {partition_id}", worker_id)
-        self._data_threads[partition_id].join()
+        self._join_partition_fetch(partition_id)
         self._info(f"Thread for partition {partition_id} joined", worker_id)
         max_idx = self._partition_max_index(partition_id)
         yield from self._get_partition_data(last_idx, max_idx, partition_id)
@@ -387,7 +695,7 @@ class OnlineDataset(IterableDataset):
             # No prefetching at all
             return
 
-        if self._num_prefetched_partitions <= self._parallel_prefetch_requests:
+        if self._num_prefetched_partitions <= self._parallel_prefetch_requests or self._fetch_engine is not None:
             # We can emit prefetching requests once and be done with it
             for _ in range(self._num_prefetched_partitions):
                 self._prefetch_partition(worker_id, False)
@@ -413,6 +721,59 @@ class OnlineDataset(IterableDataset):
             else:
                 yield from self._fetch_partition_noprefetch(worker_id, partition_id)
 
+    def _init_prefetching(self, worker_id: int) -> None:
+        # Always reinitialize these structures for prefetching (for multiple epochs)
+        self._data_threads = {}
+        self._data_futures = {}
+        self._thread_data_container = {}
+        self._pref_started = {}
+        self._next_partition_to_fetch = 0
+        self._partition_locks = {}
+        self._partition_valid_until = {}
+        self._partition_valid = {}
+        self._partition_signals = {}
+
+        self._num_partitions = self._key_source.get_num_data_partitions()
+        self._info(
+            f"Total number of partitions will be {self._num_partitions}.\n"
+            + f"Parallel prefetch requests = {self._parallel_prefetch_requests}\n"
+            + f"Num prefetched partitions = {self._num_prefetched_partitions}",
+            worker_id,
+        )
+        assert self._log_lock is not None
+        with self._log_lock:
+            self._log["num_partitions"] = self._num_partitions
+        self._num_prefetched_partitions = min(self._num_prefetched_partitions, self._num_partitions)
+
+    def shared_partition_generator(self, worker_id: int) -> Iterator[tuple[int, memoryview, int, Optional[float]]]:
+        assert self._shared_prefetcher is not None
+        assert self._log_lock is not None
+
+        request_id, self._num_partitions, self._uses_weights = self._shared_prefetcher.request_partitions(
+            worker_id, self._key_source
+        )
+        self._info(
+            f"Total number of partitions will be {self._num_partitions}.\n"
+            + f"Partitions are prefetched by a shared prefetcher with {self._shared_prefetcher.slots_per_worker}"
+            + " slots per worker",
+            worker_id,
+        )
+        with self._log_lock:
+            self._log["num_partitions"] = self._num_partitions
+
+        for _ in range(self._num_partitions):
+            self._persist_log(worker_id)
+
+            self._sw.start("wait_for_shared_partition", resume=True)
+            partition = self._shared_prefetcher.get_partition(worker_id, request_id)
+            self._sw.stop("wait_for_shared_partition")
+
+            with self._log_lock:
+                self._log["partitions"][str(partition.partition_id)] = partition.log
+
+            yield from partition.buffer.samples(0, len(partition.buffer))
+            self._shared_prefetcher.release_partition(worker_id, request_id, partition)
+
     # pylint: disable=too-many-locals, too-many-branches, too-many-statements
 
     def __iter__(self) -> Generator:
@@ -429,9 +790,15 @@ class OnlineDataset(IterableDataset):
             # We have to initialize transformations and gRPC connections here to do it per dataloader worker,
             # otherwise the transformations/gRPC connections cannot be pickled for the new processes.
             self._init_transforms()
-            self._init_grpc()
-            self._key_source.init_worker()
-            self._uses_weights = self._key_source.uses_weights()
+            if self._shared_prefetcher is None:
+                if self._async_fetching:
+                    self._fetch_engine = AsyncFetchEngine(self._storage_address, self._parallel_prefetch_requests)
+                    self._fetch_engine.start()
+                else:
+                    self._init_grpc()
+                self._init_sample_cache()
+                self._key_source.init_worker()
+                self._uses_weights = self._key_source.uses_weights()
             self._silence_pil()
             self._debug("gRPC initialized.", worker_id)
             # Reinit logging, timetracking in this worker
@@ -440,31 +807,19 @@ class OnlineDataset(IterableDataset):
             self._start_prefetch_lock = threading.Lock()
             self._log_lock = threading.Lock()
 
-        # Always reinitialize these structures for prefetching (for multiple epochs)
-        self._data_threads = {}
-        self._thread_data_container = {}
-        self._pref_started = {}
-        self._next_partition_to_fetch = 0
-        self._partition_locks = {}
-        self._partition_valid_until = {}
-        self._partition_valid = {}
-        self._partition_signals = {}
-
         assert self._transform is not None
-        self._num_partitions = self._key_source.get_num_data_partitions()
-        self._info(
-            f"Total number of partitions will be {self._num_partitions}.\n"
-            + f"Parallel prefetch requests = {self._parallel_prefetch_requests}\n"
-            + f"Num prefetched partitions = {self._num_prefetched_partitions}",
-            worker_id,
-        )
-        assert self._log_lock is not None
-        with self._log_lock:
-            self._log["num_partitions"] = self._num_partitions
-        self._num_prefetched_partitions = min(self._num_prefetched_partitions, self._num_partitions)
+        if self._shared_prefetcher is not None:
+            # The prefetcher process talks to the storage and the key source, we only transform the samples
+            partition_generator = self.shared_partition_generator(worker_id)
+        else:
+            self._init_prefetching(worker_id)
+            partition_generator = self.all_partition_generator(worker_id)
 
-        for data_tuple in self.all_partition_generator(worker_id):
-            if (transformed_tuple := self._get_transformed_data_tuple(*data_tuple)) is not None:
-                yield transformed_tuple
+        if self._batch_size is not None:
+            yield from self._batch_generator(partition_generator)
+        else:
+            for data_tuple in partition_generator:
+                if (transformed_tuple := self._get_transformed_data_tuple(*data_tuple)) is not None:
+                    yield transformed_tuple
 
         self._persist_log(worker_id)
@@ -0,0 +1,167 @@
+from typing import Iterator, Optional, Sequence
+
+import numpy as np
+
+# Packed layout: header (size, arena size, uses weights), keys, labels, [weights], offsets, arena
+_PACKED_HEADER_ITEMS = 3
+
+
+class PartitionBuffer:
+    """
+    Columnar container for the samples of a single partition fetched by the OnlineDataset.
+
+    Keys, labels and weights are kept in growable NumPy arrays, and all sample payloads are appended to a single
+    contiguous byte arena. Sample i occupies arena[offsets[i]:offsets[i + 1]]. Compared to per-sample Python lists,
+    this keeps the number of Python objects per partition constant and allows yielding zero-copy memoryview slices.
+    """
+
+    def __init__(self, uses_weights: bool, initial_capacity: int = 1024, initial_arena_size: int = 1 << 20) -> None:
+        assert initial_capacity > 0 and initial_arena_size > 0
+        self._uses_weights = uses_weights
+        self._size = 0
+        self._arena_size = 0
+
+        self._keys = np.empty(initial_capacity, dtype=np.int64)
+        self._labels = np.empty(initial_capacity, dtype=np.int64)
+        self._weights: Optional[np.ndarray] = np.empty(initial_capacity, dtype=np.float64) if uses_weights else None
+        self._offsets = np.zeros(initial_capacity + 1, dtype=np.int64)
+        self._arena = np.empty(initial_arena_size, dtype=np.uint8)
+
+    @classmethod
+    def from_packed(cls, buffer: memoryview) -> "PartitionBuffer":
+        """
+        Creates a read-only PartitionBuffer whose columns are views into a buffer filled by pack_into, e.g.,
+        a shared memory segment. No data is copied.
+        """
+        header = np.frombuffer(buffer, dtype=np.int64, count=_PACKED_HEADER_ITEMS)
+        size, arena_size, uses_weights = (int(item) for item in header)
+        position = header.nbytes
+
+        def view(dtype: type, count: int) -> np.ndarray:
+            nonlocal position
+            array = np.frombuffer(buffer, dtype=dtype, count=count, offset=position)
+            position += array.nbytes
+            return array
+
+        partition_buffer = cls.__new__(cls)
+        partition_buffer._uses_weights = bool(uses_weights)
+        partition_buffer._size = size
+        partition_buffer._arena_size = arena_size
+        partition_buffer._keys = view(np.int64, size)
+        partition_buffer._labels = view(np.int64, size)
+        partition_buffer._weights = view(np.float64, size) if uses_weights else None
+        partition_buffer._offsets = view(np.int64, size + 1)
+        partition_buffer._arena = view(np.uint8, arena_size)
+        return partition_buffer
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def uses_weights(self) -> bool:
+        return self._uses_weights
+
+    @property
+    def num_bytes(self) -> int:
+        return self._arena_size
+
+    @property
+    def packed_size(self) -> int:
+        num_columns = 3 if self._uses_weights else 2
+        return 8 * (_PACKED_HEADER_ITEMS + num_columns * self._size + self._size + 1) + self._arena_size
+
+    def pack_into(self, buffer: memoryview) -> None:
+        """Writes the buffer contents into a contiguous buffer of at least packed_size bytes."""
+        assert len(buffer) >= self.packed_size, f"Buffer of size {len(buffer)} cannot hold {self.packed_size} bytes"
+        columns = [
+            np.array([self._size, self._arena_size, int(self._uses_weights)], dtype=np.int64),
+            self._keys[: self._size],
+            self._labels[: self._size],
+        ]
+        if self._weights is not None:
+            columns.append(self._weights[: self._size])
+        columns += [self._offsets[: self._size + 1], self._arena[: self._arena_size]]
+
+        position = 0
+        for column in columns:
+            np.frombuffer(buffer, dtype=column.dtype, count=len(column), offset=position)[:] = column
+            position += column.nbytes
+
+    @staticmethod
+    def _grown(array: np.ndarray, min_size: int) -> np.ndarray:
+        new_size = max(min_size, 2 * len(array))
+        # We do not resize in place, since memoryviews of the old array might still be referenced by consumers.
+        new_array = np.empty(new_size, dtype=array.dtype)
+        new_array[: len(array)] = array
+        return new_array
+
+    def _reserve(self, num_samples: int, num_bytes: int) -> None:
+        required_samples = self._size + num_samples
+        if required_samples > len(self._keys):
+            self._keys = self._grown(self._keys, required_samples)
+            self._labels = self._grown(self._labels, required_samples)
+            if self._weights is not None:
+                self._weights = self._grown(self._weights, required_samples)
+            self._offsets = self._grown(self._offsets, required_samples + 1)
+
+        required_bytes = self._arena_size + num_bytes
+        if required_bytes > len(self._arena):
+            self._arena = self._grown(self._arena, required_bytes)
+
+    def append(
+        self,
+        keys: Sequence[int],
+        samples: Sequence[bytes],
+        labels: Sequence[int],
+        weights: Optional[Sequence[float]] = None,
+    ) -> int:
+        """
+        Appends a chunk of samples (e.g., one GetResponse) to the buffer.
+
+        Returns:
+            int: The number of appended samples.
+        """
+        num_samples = len(keys)
+        assert len(samples) == num_samples and len(labels) == num_samples, "Inconsistent chunk lengths"
+        assert (weights is not None) == self._uses_weights, "Weights must be passed iff the buffer uses weights"
+
+        if num_samples == 0:
+            return 0
+
+        payload = b"".join(samples)
+        sample_sizes = np.fromiter(map(len, samples), dtype=np.int64, count=num_samples)
+        self._reserve(num_samples, len(payload))
+
+        start, end = self._size, self._size + num_samples
+        self._keys[start:end] = np.fromiter(keys, dtype=np.int64, count=num_samples)
+        self._labels[start:end] = np.fromiter(labels, dtype=np.int64, count=num_samples)
+        if self._weights is not None:
+            assert weights is not None
+            self._weights[start:end] = np.fromiter(weights, dtype=np.float64, count=num_samples)
+
+        np.cumsum(sample_sizes, out=self._offsets[start + 1 : end + 1])
+        self._offsets[start + 1 : end + 1] += self._arena_size
+        self._arena[self._arena_size : self._arena_size + len(payload)] = np.frombuffer(payload, dtype=np.uint8)
+
+        self._size = end
+        self._arena_size += len(payload)
+        return num_samples
+
+    def samples(self, start: int, end: int) -> Iterator[tuple[int, memoryview, int, Optional[float]]]:
+        """
+        Yields (key, sample, label, weight) tuples for the sample indices in [start, end).
+        Samples are memoryview slices into the byte arena, i.e., no payload is copied.
+        """
+        assert 0 <= start <= end <= self._size, f"Invalid range [{start}, {end}) for buffer of size {self._size}"
+        if start == end:
+            return
+
+        # Bind the current arrays, as they might be replaced by a concurrent append while we are yielding.
+        keys = self._keys[start:end].tolist()
+        labels = self._labels[start:end].tolist()
+        weights = self._weights[start:end].tolist() if self._weights is not None else [None] * (end - start)
+        offsets = self._offsets[start : end + 1].tolist()
+        arena = memoryview(self._arena)
+
+        for idx, key in enumerate(keys):
+            yield key, arena[offsets[idx] : offsets[idx + 1]], labels[idx], weights[idx]
@@ -0,0 +1,220 @@
+import mmap
+import os
+import pathlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+# SQLite limits the number of parameters per statement
+_MAX_QUERY_PARAMETERS = 900
+# Number of segments a process keeps mapped at most
+_MAX_OPEN_SEGMENTS = 64
+
+
+class SampleCache:
+    """
+    Local on-disk cache of sample payloads fetched from the storage, shared across trainings and DataLoader workers.
+
+    Every chunk of samples that is inserted (e.g., one storage response) is written to its own segment file, which is
+    memory-mapped for reading. An SQLite index maps the sample keys to their segment, offset, length and label and
+    keeps track of the last access of each segment. If the segments exceed `max_size_bytes`, the least recently used
+    segments are evicted. The index serializes concurrent access of multiple processes, hence every process (i.e.,
+    DataLoader worker) creates its own SampleCache object for the same directory. Every process keeps at most
+    `max_open_segments` segments mapped and unmaps segments that have been evicted by other processes, such that the
+    files of evicted segments do not stay pinned.
+    """
+
+    def __init__(
+        self,
+        cache_directory: pathlib.Path,
+        dataset_id: str,
+        max_size_bytes: int,
+        max_open_segments: int = _MAX_OPEN_SEGMENTS,
+    ) -> None:
+        assert max_size_bytes > 0, "The cache needs to be allowed to store at least one byte"
+        assert 0 < max_open_segments <= _MAX_QUERY_PARAMETERS, "Invalid number of open segments"
+        self._directory = cache_directory / dataset_id
+        self._segment_directory = self._directory / "segments"
+        self._segment_directory.mkdir(parents=True, exist_ok=True)
+        self._max_size_bytes = max_size_bytes
+        self._max_open_segments = max_open_segments
+
+        # The prefetching threads of a worker share the connection
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self._directory / "index.sqlite", timeout=60, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        with self._connection:
+            # Segment ids must not be reused, since other processes might still have mapped an evicted segment
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS segments "
+                + "(id INTEGER PRIMARY KEY AUTOINCREMENT, size INTEGER, last_access REAL)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS samples "
+                + "(key INTEGER PRIMARY KEY, segment INTEGER, offset INTEGER, length INTEGER, label INTEGER)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS samples_segment ON samples (segment)")
+            self._connection.execute("CREATE INDEX IF NOT EXISTS segments_last_access ON segments (last_access)")
+
+        # Mapped segments in the order of their last access
+        self._segments: OrderedDict[int, Optional[mmap.mmap]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _segment_path(self, segment_id: int) -> pathlib.Path:
+        return self._segment_directory / f"{segment_id}.bin"
+
+    def _get_segment(self, segment_id: int) -> Optional[mmap.mmap]:
+        # Returns None for empty segments, which cannot be mapped
+        if segment_id in self._segments:
+            self._segments.move_to_end(segment_id)
+            return self._segments[segment_id]
+
+        with open(self._segment_path(segment_id), "rb") as segment_file:
+            size = os.fstat(segment_file.fileno()).st_size
+            segment = mmap.mmap(segment_file.fileno(), 0, access=mmap.ACCESS_READ) if size > 0 else None
+
+        while len(self._segments) >= self._max_open_segments:
+            self._close_segment(next(iter(self._segments)))
+        self._segments[segment_id] = segment
+        return segment
+
+    def _close_segment(self, segment_id: int) -> None:
+        if (segment := self._segments.pop(segment_id, None)) is not None:
+            segment.close()
+
+    def _close_evicted_segments(self) -> None:
+        # Unmaps the segments that have been evicted by other processes, such that their files can be freed
+        if len(self._segments) == 0:
+            return
+        mapped_segments = list(self._segments)
+        rows = self._connection.execute(
+            f"SELECT id FROM segments WHERE id IN ({', '.join('?' * len(mapped_segments))})", mapped_segments
+        )
+        for segment_id in set(mapped_segments) - {row[0] for row in rows}:
+            self._close_segment(segment_id)
+
+    # pylint: disable-next=too-many-locals
+    def get(self, keys: list[int]) -> tuple[list[int], list[bytes], list[int], list[int]]:
+        """
+        Looks up the given keys in the cache.
+
+        Returns:
+            tuple[list[int], list[bytes], list[int], list[int]]: The keys, samples and labels of all cached samples,
+                and the keys that are not cached (in the order of `keys`).
+        """
+        cached_keys: list[int] = []
+        samples: list[bytes] = []
+        labels: list[int] = []
+        missing_keys: list[int] = []
+        accessed_segments: set[int] = set()
+
+        with self._lock:
+            self._close_evicted_segments()
+
+            index: dict[int, tuple[int, int, int, int]] = {}
+            for idx in range(0, len(keys), _MAX_QUERY_PARAMETERS):
+                chunk = keys[idx : idx + _MAX_QUERY_PARAMETERS]
+                rows = self._connection.execute(
+                    "SELECT key, segment, offset, length, label FROM samples "
+                    + f"WHERE key IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                )
+                index.update((row[0], row[1:]) for row in rows)
+
+            for key in keys:
+                if key not in index:
+                    missing_keys.append(key)
+                    continue
+
+                segment_id, offset, length, label = index[key]
+                try:
+                    segment = self._get_segment(segment_id)
+                except FileNotFoundError:
+                    # The segment has been evicted by another process after we read the index
+                    missing_keys.append(key)
+                    continue
+
+                cached_keys.append(key)
+                samples.append(segment[offset : offset + length] if segment is not None else b"")
+                labels.append(label)
+                accessed_segments.add(segment_id)
+
+            if len(accessed_segments) > 0:
+                with self._connection:
+                    self._connection.executemany(
+                        "UPDATE segments SET last_access = ? WHERE id = ?",
+                        [(time.time(), segment_id) for segment_id in accessed_segments],
+                    )
+
+            self._hits += len(cached_keys)
+            self._misses += len(missing_keys)
+
+        return cached_keys, samples, labels, missing_keys
+
+    def put(self, keys: list[int], samples: list[bytes], labels: list[int]) -> None:
+        """Inserts a chunk of samples as a new segment. Keys that are already cached are not replaced."""
+        assert len(keys) == len(samples) == len(labels), "Inconsistent chunk lengths"
+        if len(keys) == 0:
+            return
+
+        rows = []
+        offset = 0
+        for key, sample, label in zip(keys, samples, labels):
+            rows.append((key, offset, len(sample), label))
+            offset += len(sample)
+
+        with self._lock:
+            with self._connection:
+                segment_id = self._connection.execute(
+                    "INSERT INTO segments (size, last_access) VALUES (?, ?)", (offset, time.time())
+                ).lastrowid
+                assert segment_id is not None
+
+                # Write to a temporary file first, such that readers never see a partially written segment
+                segment_path = self._segment_path(segment_id)
+                temporary_path = segment_path.with_suffix(".tmp")
+                with open(temporary_path, "wb") as segment_file:
+                    for sample in samples:
+                        segment_file.write(sample)
+                temporary_path.rename(segment_path)
+
+                self._connection.executemany(
+                    "INSERT OR IGNORE INTO samples (key, segment, offset, length, label) VALUES (?, ?, ?, ?, ?)",
+                    [(key, segment_id, sample_offset, length, label) for key, sample_offset, length, label in rows],
+                )
+
+            self._evict()
+
+    def _evict(self) -> None:
+        with self._connection:
+            total_size = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM segments").fetchone()[0]
+            if total_size <= self._max_size_bytes:
+                return
+
+            segments = self._connection.execute("SELECT id, size FROM segments ORDER BY last_access ASC").fetchall()
+            for segment_id, size in segments:
+                if total_size <= self._max_size_bytes:
+                    break
+
+                self._connection.execute("DELETE FROM samples WHERE segment = ?", (segment_id,))
+                self._connection.execute("DELETE FROM segments WHERE id = ?", (segment_id,))
+                self._close_segment(segment_id)
+                # Other processes that have mapped this segment can still read it until they close it
+                self._segment_path(segment_id).unlink(missing_ok=True)
+                total_size -= size
+                self._evictions += 1
+
+    @property
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self._hits, "misses": self._misses, "evictions": self._evictions}
+
+    def close(self) -> None:
+        with self._lock:
+            for segment_id in list(self._segments):
+                self._close_segment(segment_id)
+            self._connection.close()
@@ -0,0 +1,301 @@
+import logging
+import multiprocessing as mp
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+from typing import TYPE_CHECKING, Any, Optional
+
+from modyn.trainer_server.internal.dataset.key_sources import AbstractKeySource
+from modyn.trainer_server.internal.dataset.partition_buffer import PartitionBuffer
+
+if TYPE_CHECKING:
+    from modyn.trainer_server.internal.dataset.online_dataset import OnlineDataset
+
+logger = logging.getLogger(__name__)
+
+# Commands sent from the DataLoader workers to the prefetcher process
+REQUEST_PARTITIONS = "request"
+RELEASE_PARTITION = "release"
+
+# Responses sent from the prefetcher process to the DataLoader workers
+PARTITIONS_STARTED = "started"
+PARTITION_AVAILABLE = "partition"
+PREFETCHING_FAILED = "failed"
+
+
+class SharedPartition:
+    """A partition that has been placed in shared memory by the prefetcher process."""
+
+    def __init__(self, partition_id: int, shm_name: str, log: dict) -> None:
+        self.partition_id = partition_id
+        self.log = log
+        self._shm = shared_memory.SharedMemory(name=shm_name)
+        self.buffer = PartitionBuffer.from_packed(self._shm.buf)
+
+    def release(self) -> bool:
+        """
+        Unlinks the shared memory segment. The mapping of this process is closed if possible. Samples of this
+        partition might still be referenced (e.g., by a batch that is being collated), in which case we return False
+        and the caller needs to retry closing later.
+        """
+        del self.buffer
+        self._shm.unlink()
+        return self.try_close()
+
+    def try_close(self) -> bool:
+        try:
+            self._shm.close()
+        except BufferError:
+            return False
+        return True
+
+
+class SharedPrefetcher:
+    """
+    Prefetches the partitions of all DataLoader workers of a training in a single process.
+
+    Instead of every worker opening its own storage connection and keeping num_prefetched_partitions partitions
+    in memory, the prefetcher process shares one storage connection among all workers and places fetched
+    partitions into shared memory segments. The workers only attach to these segments and run the transformations.
+    Each worker can have at most `slots_per_worker` partitions that are fetched but not yet consumed, of which up to
+    `parallel_prefetch_requests` are fetched concurrently.
+    """
+
+    def __init__(self, num_workers: int, num_prefetched_partitions: int, parallel_prefetch_requests: int = 1) -> None:
+        assert num_workers > 0, "Shared prefetching requires at least one worker"
+        self._num_workers = num_workers
+        self._slots_per_worker = max(1, num_prefetched_partitions // num_workers)
+        self._parallel_requests = max(1, min(parallel_prefetch_requests, self._slots_per_worker))
+        self._command_queue: mp.Queue = mp.Queue()
+        self._response_queues: list[mp.Queue] = [mp.Queue() for _ in range(num_workers)]
+        self._process: Optional[mp.Process] = None
+        self._unclosed_partitions: list[SharedPartition] = []
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        # The process handle cannot be sent to the workers, and unclosed partitions are local to a process.
+        state["_process"] = None
+        state["_unclosed_partitions"] = []
+        return state
+
+    @property
+    def slots_per_worker(self) -> int:
+        return self._slots_per_worker
+
+    def start(self, dataset: "OnlineDataset") -> None:
+        assert self._process is None, "Prefetcher has already been started"
+        # All processes should use the same resource tracker, since workers unlink segments created by the prefetcher.
+        resource_tracker.ensure_running()
+        self._process = mp.Process(
+            target=_run_prefetcher,
+            args=(dataset, self._command_queue, self._response_queues, self._slots_per_worker, self._parallel_requests),
+            daemon=True,
+        )
+        self._process.start()
+
+    def shutdown(self) -> None:
+        if self._process is None:
+            return
+
+        self._command_queue.put(None)
+        self._process.join(timeout=10)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        self._process = None
+
+        # Free all partitions that have been fetched but were never consumed.
+        for response_queue in self._response_queues:
+            while not response_queue.empty():
+                response = response_queue.get()
+                if response[0] == PARTITION_AVAILABLE:
+                    _unlink_segment(response[3])
+
+    def request_partitions(self, worker_id: int, key_source: AbstractKeySource) -> tuple[str, int, bool]:
+        """
+        Asks the prefetcher to start fetching all partitions for a worker (e.g., at the beginning of an epoch).
+
+        Returns:
+            tuple[str, int, bool]: The id of this request, the number of partitions and whether weights are used.
+        """
+        request_id = uuid.uuid4().hex
+        self._command_queue.put((REQUEST_PARTITIONS, worker_id, request_id, key_source))
+        response = self._get_response(worker_id, request_id)
+        assert response[0] == PARTITIONS_STARTED, f"Unexpected response {response[0]}"
+
+        return request_id, response[2], response[3]
+
+    def get_partition(self, worker_id: int, request_id: str) -> SharedPartition:
+        """Blocks until the next partition of the request is available."""
+        response = self._get_response(worker_id, request_id)
+        assert response[0] == PARTITION_AVAILABLE, f"Unexpected response {response[0]}"
+
+        return SharedPartition(response[2], response[3], response[4])
+
+    def release_partition(self, worker_id: int, request_id: str, partition: SharedPartition) -> None:
+        self._unclosed_partitions = [unclosed for unclosed in self._unclosed_partitions if not unclosed.try_close()]
+        if not partition.release():
+            self._unclosed_partitions.append(partition)
+
+        self._command_queue.put((RELEASE_PARTITION, worker_id, request_id))
+
+    def _get_response(self, worker_id: int, request_id: str) -> tuple:
+        while True:
+            response = self._response_queues[worker_id].get()
+            if response[1] == request_id:
+                break
+
+            # Leftover from a request that has not been consumed completely, e.g., an aborted epoch.
+            if response[0] == PARTITION_AVAILABLE:
+                _unlink_segment(response[3])
+
+        if response[0] == PREFETCHING_FAILED:
+            raise RuntimeError(f"Shared prefetching failed for worker {worker_id}: {response[2]}")
+
+        return response
+
+
+def _unlink_segment(shm_name: str) -> None:
+    shm = shared_memory.SharedMemory(name=shm_name)
+    shm.unlink()
+    shm.close()
+
+
+def _run_prefetcher(
+    dataset: "OnlineDataset",
+    command_queue: mp.Queue,
+    response_queues: list[mp.Queue],
+    slots_per_worker: int,
+    parallel_requests: int,
+) -> None:
+    _PrefetcherServer(dataset, command_queue, response_queues, slots_per_worker, parallel_requests).serve()
+
+
+class _OrderedResponses:
+    """Puts the responses of concurrently fetched partitions into the response queue of a worker in partition order."""
+
+    def __init__(self, response_queue: mp.Queue) -> None:
+        self._response_queue = response_queue
+        self._next_partition = 0
+        self._turn = threading.Condition()
+        self.failed = False
+
+    def put(self, partition_id: int, response: tuple) -> bool:
+        """
+        Waits until all previous partitions have been handled and puts the response, unless a previous partition
+        failed. Returns whether the response has been put.
+        """
+        with self._turn:
+            self._turn.wait_for(lambda: self._next_partition == partition_id)
+            published = not self.failed
+            if published:
+                self._response_queue.put(response)
+                self.failed = response[0] == PREFETCHING_FAILED
+            self._next_partition += 1
+            self._turn.notify_all()
+        return published
+
+
+class _PrefetcherServer:
+    """Runs in the prefetcher process and serves the requests of the DataLoader workers with one thread each."""
+
+    def __init__(
+        self,
+        dataset: "OnlineDataset",
+        command_queue: mp.Queue,
+        response_queues: list[mp.Queue],
+        slots_per_worker: int,
+        parallel_requests: int = 1,
+    ) -> None:
+        self._dataset = dataset
+        self._command_queue = command_queue
+        self._response_queues = response_queues
+        self._slots_per_worker = slots_per_worker
+        self._parallel_requests = parallel_requests
+
+        self._lock = threading.Lock()
+        self._slot_released = threading.Condition(self._lock)
+        self._active_requests: dict[int, str] = {}
+        self._outstanding_partitions: dict[str, int] = {}
+
+    def serve(self) -> None:
+        self._dataset._init_grpc()
+        self._dataset._init_sample_cache()
+
+        while (command := self._command_queue.get()) is not None:
+            if command[0] == REQUEST_PARTITIONS:
+                _, worker_id, request_id, key_source = command
+                with self._lock:
+                    # A new request supersedes the previous request of the worker, whose thread will terminate.
+                    if worker_id in self._active_requests:
+                        del self._outstanding_partitions[self._active_requests[worker_id]]
+                    self._active_requests[worker_id] = request_id
+                    self._outstanding_partitions[request_id] = 0
+                    self._slot_released.notify_all()
+
+                threading.Thread(
+                    target=self._serve_request, args=(worker_id, request_id, key_source), daemon=True
+                ).start()
+            elif command[0] == RELEASE_PARTITION:
+                _, worker_id, request_id = command
+                with self._lock:
+                    if request_id in self._outstanding_partitions:
+                        self._outstanding_partitions[request_id] -= 1
+                        self._slot_released.notify_all()
+            else:
+                raise ValueError(f"Unknown command {command[0]}")
+
+    def _acquire_slot(self, worker_id: int, request_id: str) -> bool:
+        with self._lock:
+            while (
+                self._active_requests.get(worker_id) == request_id
+                and self._outstanding_partitions[request_id] >= self._slots_per_worker
+            ):
+                self._slot_released.wait()
+
+            if self._active_requests.get(worker_id) != request_id:
+                return False
+
+            self._outstanding_partitions[request_id] += 1
+            return True
+
+    def _serve_request(self, worker_id: int, request_id: str, key_source: AbstractKeySource) -> None:
+        response_queue = self._response_queues[worker_id]
+
+        try:
+            key_source.init_worker()
+            num_partitions = key_source.get_num_data_partitions()
+            uses_weights = key_source.uses_weights()
+            response_queue.put((PARTITIONS_STARTED, request_id, num_partitions, uses_weights))
+
+            dataset = self._dataset.shared_prefetching_copy(key_source, uses_weights)
+        except Exception as exception:  # pylint: disable=broad-except
+            logger.exception(f"Error while prefetching partitions for worker {worker_id}")
+            response_queue.put((PREFETCHING_FAILED, request_id, str(exception)))
+            return
+
+        # Up to parallel_requests partitions are fetched at the same time, but the worker receives them in order
+        responses = _OrderedResponses(response_queue)
+        with ThreadPoolExecutor(max_workers=self._parallel_requests) as executor:
+            for partition_id in range(num_partitions):
+                if responses.failed or not self._acquire_slot(worker_id, request_id):
+                    break
+                executor.submit(self._fetch_partition, dataset, worker_id, request_id, partition_id, responses)
+
+    @staticmethod
+    def _fetch_partition(
+        dataset: "OnlineDataset", worker_id: int, request_id: str, partition_id: int, responses: _OrderedResponses
+    ) -> None:
+        try:
+            buffer, log = dataset.fetch_partition_buffer(worker_id, partition_id)
+            shm = shared_memory.SharedMemory(create=True, size=max(buffer.packed_size, 1))
+            buffer.pack_into(shm.buf)
+            shm.close()
+        except Exception as exception:  # pylint: disable=broad-except
+            logger.exception(f"Error while prefetching partition {partition_id} for worker {worker_id}")
+            responses.put(partition_id, (PREFETCHING_FAILED, request_id, str(exception)))
+            return
+
+        if not responses.put(partition_id, (PARTITION_AVAILABLE, request_id, partition_id, shm.name, log)):
+            _unlink_segment(shm.name)
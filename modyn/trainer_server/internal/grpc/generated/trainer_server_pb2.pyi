@@ -134,6 +134,11 @@ class StartTrainingRequest(google.protobuf.message.Message):
     PARALLEL_PREFETCH_REQUESTS_FIELD_NUMBER: builtins.int
     SEED_FIELD_NUMBER: builtins.int
     TOKENIZER_FIELD_NUMBER: builtins.int
+    SHARED_PREFETCHING_FIELD_NUMBER: builtins.int
+    BATCHED_BYTES_PARSER_FIELD_NUMBER: builtins.int
+    ASYNC_FETCHING_FIELD_NUMBER: builtins.int
+    KEYS_PER_STORAGE_REQUEST_FIELD_NUMBER: builtins.int
+    PACKED_SAMPLE_KEYS_FIELD_NUMBER: builtins.int
     pipeline_id: builtins.int
     trigger_id: builtins.int
     device: builtins.str
@@ -166,6 +171,11 @@ class StartTrainingRequest(google.protobuf.message.Message):
     seed: builtins.int
     @property
     def tokenizer(self) -> global___PythonString: ...
+    shared_prefetching: builtins.bool
+    batched_bytes_parser: builtins.bool
+    async_fetching: builtins.bool
+    keys_per_storage_request: builtins.int
+    packed_sample_keys: builtins.bool
     def __init__(
         self,
         *,
@@ -191,9 +201,14 @@ class StartTrainingRequest(google.protobuf.message.Message):
         parallel_prefetch_requests: builtins.int = ...,
         seed: builtins.int | None = ...,
         tokenizer: global___PythonString | None = ...,
+        shared_prefetching: builtins.bool = ...,
+        batched_bytes_parser: builtins.bool = ...,
+        async_fetching: builtins.bool = ...,
+        keys_per_storage_request: builtins.int = ...,
+        packed_sample_keys: builtins.bool = ...,
     ) -> None: ...
     def HasField(self, field_name: typing_extensions.Literal["_seed", b"_seed", "_tokenizer", b"_tokenizer", "bytes_parser", b"bytes_parser", "checkpoint_info", b"checkpoint_info", "criterion_parameters", b"criterion_parameters", "data_info", b"data_info", "grad_scaler_configuration", b"grad_scaler_configuration", "label_transformer", b"label_transformer", "lr_scheduler", b"lr_scheduler", "seed", b"seed", "tokenizer", b"tokenizer", "torch_optimizers_configuration", b"torch_optimizers_configuration"]) -> builtins.bool: ...
-    def ClearField(self, field_name: typing_extensions.Literal["_seed", b"_seed", "_tokenizer", b"_tokenizer", "batch_size", b"batch_size", "bytes_parser", b"bytes_parser", "checkpoint_info", b"checkpoint_info", "criterion_parameters", b"criterion_parameters", "data_info", b"data_info", "device", b"device", "epochs_per_trigger", b"epochs_per_trigger", "grad_scaler_configuration", b"grad_scaler_configuration", "label_transformer", b"label_transformer", "load_optimizer_state", b"load_optimizer_state", "lr_scheduler", b"lr_scheduler", "num_prefetched_partitions", b"num_prefetched_partitions", "parallel_prefetch_requests", b"parallel_prefetch_requests", "pipeline_id", b"pipeline_id", "pretrained_model_id", b"pretrained_model_id", "seed", b"seed", "tokenizer", b"tokenizer", "torch_criterion", b"torch_criterion", "torch_optimizers_configuration", b"torch_optimizers_configuration", "transform_list", b"transform_list", "trigger_id", b"trigger_id", "use_pretrained_model", b"use_pretrained_model"]) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["_seed", b"_seed", "_tokenizer", b"_tokenizer", "async_fetching", b"async_fetching", "batch_size", b"batch_size", "batched_bytes_parser", b"batched_bytes_parser", "bytes_parser", b"bytes_parser", "checkpoint_info", b"checkpoint_info", "criterion_parameters", b"criterion_parameters", "data_info", b"data_info", "device", b"device", "epochs_per_trigger", b"epochs_per_trigger", "grad_scaler_configuration", b"grad_scaler_configuration", "keys_per_storage_request", b"keys_per_storage_request", "label_transformer", b"label_transformer", "load_optimizer_state", b"load_optimizer_state", "lr_scheduler", b"lr_scheduler", "num_prefetched_partitions", b"num_prefetched_partitions", "packed_sample_keys", b"packed_sample_keys", "parallel_prefetch_requests", b"parallel_prefetch_requests", "pipeline_id", b"pipeline_id", "pretrained_model_id", b"pretrained_model_id", "seed", b"seed", "shared_prefetching", b"shared_prefetching", "tokenizer", b"tokenizer", "torch_criterion", b"torch_criterion", "torch_optimizers_configuration", b"torch_optimizers_configuration", "transform_list", b"transform_list", "trigger_id", b"trigger_id", "use_pretrained_model", b"use_pretrained_model"]) -> None: ...
     @typing.overload
     def WhichOneof(self, oneof_group: typing_extensions.Literal["_seed", b"_seed"]) -> typing_extensions.Literal["seed"] | None: ...
     @typing.overload
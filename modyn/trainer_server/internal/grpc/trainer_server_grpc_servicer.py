@@ -1,3 +1,4 @@
+import itertools
 import logging
 import multiprocessing as mp
 import os
@@ -10,12 +11,12 @@ import grpc
 import torch
 
 # pylint: disable=no-name-in-module
-from modyn.common.ftp import download_trained_model
+from modyn.common.grpc.model_streaming import checksummed_chunks, download_streamed_model, read_chunks
 from modyn.metadata_database.metadata_database_connection import MetadataDatabaseConnection
 from modyn.model_storage.internal.grpc.generated.model_storage_pb2 import (
+    FetchModelChunk,
     FetchModelRequest,
-    FetchModelResponse,
-    RegisterModelRequest,
+    RegisterModelChunk,
     RegisterModelResponse,
 )
 from modyn.model_storage.internal.grpc.generated.model_storage_pb2_grpc import ModelStorageStub
@@ -37,10 +38,11 @@ from modyn.trainer_server.internal.utils.trainer_messages import TrainerMessages
 from modyn.trainer_server.internal.utils.training_info import TrainingInfo
 from modyn.trainer_server.internal.utils.training_process_info import TrainingProcessInfo
 from modyn.utils import current_time_millis, dynamic_module_import, grpc_connection_established
-from modyn.utils.utils import calculate_checksum
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_SAMPLE_CACHE_SIZE_MB = 10240
+
 
 class TrainerServerGRPCServicer:
     """Implements necessary functionality in order to communicate with the supervisor."""
@@ -65,6 +67,12 @@ class TrainerServerGRPCServicer:
             f"{config['model_storage']['hostname']}:{config['model_storage']['port']}"
         )
         self._offline_dataset_directory = self._config["trainer_server"]["offline_dataset_directory"]
+        self._sample_cache_directory: Optional[pathlib.Path] = None
+        if "sample_cache_directory" in self._config["trainer_server"]:
+            self._sample_cache_directory = pathlib.Path(self._config["trainer_server"]["sample_cache_directory"])
+        self._sample_cache_size = (
+            self._config["trainer_server"].get("sample_cache_max_size_mb", DEFAULT_SAMPLE_CACHE_SIZE_MB) * 1024 * 1024
+        )
         logger.info("TrainerServer gRPC Servicer initialized.")
 
     @staticmethod
@@ -107,9 +115,10 @@ class TrainerServerGRPCServicer:
         pretrained_model_path: Optional[pathlib.Path] = None
         if request.use_pretrained_model:
             fetch_request = FetchModelRequest(model_id=request.pretrained_model_id, load_metadata=True)
-            fetch_resp: FetchModelResponse = self.model_storage_stub.FetchModel(fetch_request)
+            fetch_stream = self.model_storage_stub.FetchModelStream(fetch_request)
+            first_chunk: FetchModelChunk = next(fetch_stream, FetchModelChunk(success=False))
 
-            if not fetch_resp.success:
+            if not first_chunk.success:
                 logger.error(
                     f"Pretrained Model {request.pretrained_model_id} cannot be fetched from model storage. "
                     f"Training cannot be started."
@@ -120,11 +129,9 @@ class TrainerServerGRPCServicer:
                 training_id = self._next_training_id
                 self._next_training_id += 1
 
-            pretrained_model_path = download_trained_model(
+            pretrained_model_path = download_streamed_model(
                 logger=logger,
-                model_storage_config=self._config["model_storage"],
-                remote_path=pathlib.Path(fetch_resp.model_path),
-                checksum=fetch_resp.checksum,
+                chunks=((chunk.chunk, chunk.checksum) for chunk in itertools.chain([first_chunk], fetch_stream)),
                 identifier=training_id,
                 base_directory=self._modyn_base_dir,
             )
@@ -151,6 +158,8 @@ class TrainerServerGRPCServicer:
             final_checkpoint_path,
             logfile_path,
             pretrained_model_path=pretrained_model_path,
+            sample_cache_directory=self._sample_cache_directory,
+            sample_cache_size=self._sample_cache_size,
         )
         self._training_dict[training_id] = training_info
 
@@ -352,21 +361,15 @@ class TrainerServerGRPCServicer:
 
         final_checkpoint_path = self._get_final_model_path(training_id)
         if final_checkpoint_path:
-            prefix_model_path = final_checkpoint_path.relative_to(self._modyn_base_dir)
-
             pipeline_id = self._training_dict[training_id].pipeline_id
             trigger_id = self._training_dict[training_id].trigger_id
 
-            register_request = RegisterModelRequest(
-                pipeline_id=pipeline_id,
-                trigger_id=trigger_id,
-                hostname=self._config["trainer_server"]["hostname"],
-                port=int(self._config["trainer_server"]["ftp_port"]),
-                model_path=str(prefix_model_path),
-                checksum=calculate_checksum(final_checkpoint_path),
-            )
-
-            register_response: RegisterModelResponse = self.model_storage_stub.RegisterModel(register_request)
+            # The model is streamed to the model storage, which hence does not need to download it via FTP
+            with open(final_checkpoint_path, "rb") as checkpoint_file:
+                register_response: RegisterModelResponse = self.model_storage_stub.RegisterModelStream(
+                    RegisterModelChunk(pipeline_id=pipeline_id, trigger_id=trigger_id, chunk=chunk, checksum=checksum)
+                    for chunk, checksum in checksummed_chunks(read_chunks(checkpoint_file))
+                )
 
             if not register_response.success:
                 logger.error(f"Could not store final model from training id {training_id} at model storage.")
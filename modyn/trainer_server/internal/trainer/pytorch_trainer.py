@@ -29,7 +29,11 @@ from modyn.trainer_server.internal.dataset.data_utils import (
     prepare_dataloaders,
     prepare_per_class_dataloader_from_online_dataset,
 )
-from modyn.trainer_server.internal.dataset.key_sources import LocalKeySource, SelectorKeySource
+from modyn.trainer_server.internal.dataset.key_sources import (
+    LocalKeySource,
+    PackedSelectorKeySource,
+    SelectorKeySource,
+)
 from modyn.trainer_server.internal.dataset.local_dataset_writer import LocalDatasetWriter
 from modyn.trainer_server.internal.metadata_collector.metadata_collector import MetadataCollector
 from modyn.trainer_server.internal.trainer.remote_downsamplers.abstract_per_label_remote_downsample_strategy import (
@@ -142,6 +146,7 @@ class PytorchTrainer:
 
         self.selector_stub = self.connect_to_selector(training_info.selector_address)
         self.selector_address = training_info.selector_address
+        self._packed_sample_keys = training_info.packed_sample_keys
 
         downsampling_enabled, strategy_name, downsampler_config = self.get_selection_strategy()
         if downsampling_enabled:
@@ -166,6 +171,13 @@ class PytorchTrainer:
             training_info.parallel_prefetch_requests,
             training_info.tokenizer,
             self._dataset_log_path,
+            shared_prefetching=training_info.shared_prefetching,
+            batched_bytes_parser=training_info.batched_bytes_parser,
+            async_fetching=training_info.async_fetching,
+            keys_per_storage_request=training_info.keys_per_storage_request,
+            sample_cache_directory=training_info.sample_cache_directory,
+            sample_cache_size=training_info.sample_cache_size,
+            packed_sample_keys=training_info.packed_sample_keys,
         )
 
         # Create callbacks
@@ -680,7 +692,8 @@ class PytorchTrainer:
         self._model.model.eval()
         # keys must be taken from the selector.
         # This operation is needed only when we sample several times (otherwise the source is already the selector)
-        selector_key_source = SelectorKeySource(
+        key_source_class = PackedSelectorKeySource if self._packed_sample_keys else SelectorKeySource
+        selector_key_source = key_source_class(
             pipeline_id=self.pipeline_id, trigger_id=self.trigger_id, selector_address=self.selector_address
         )
         self._train_dataloader.dataset.change_key_source(selector_key_source)
@@ -11,7 +11,7 @@ logger = logging.getLogger(__name__)
 
 
 class TrainingInfo:
-    # pylint: disable=too-many-instance-attributes
+    # pylint: disable=too-many-instance-attributes, too-many-statements
 
     def __init__(
         self,
@@ -26,12 +26,18 @@ class TrainingInfo:
         final_checkpoint_path: pathlib.Path,
         log_file_path: pathlib.Path,
         pretrained_model_path: Optional[pathlib.Path] = None,
+        sample_cache_directory: Optional[pathlib.Path] = None,
+        sample_cache_size: int = 0,
     ) -> None:
         self.pipeline_id = request.pipeline_id
         self.trigger_id = request.trigger_id
         self.training_id = training_id
         self.num_prefetched_partitions = request.num_prefetched_partitions
         self.parallel_prefetch_requests = request.parallel_prefetch_requests
+        self.shared_prefetching = request.shared_prefetching
+        self.async_fetching = request.async_fetching
+        self.keys_per_storage_request = request.keys_per_storage_request
+        self.packed_sample_keys = request.packed_sample_keys
 
         self.dataset_id = request.data_info.dataset_id
         self.num_dataloaders = request.data_info.num_dataloaders
@@ -44,6 +50,7 @@ class TrainingInfo:
 
         self.transform_list = list(request.transform_list)
         self.bytes_parser = request.bytes_parser.value
+        self.batched_bytes_parser = request.batched_bytes_parser
         self.label_transformer = request.label_transformer.value
 
         self.model_class_name = model_class_name
@@ -85,3 +92,5 @@ class TrainingInfo:
             self.tokenizer = None
 
         self.offline_dataset_path = offline_dataset_path
+        self.sample_cache_directory = sample_cache_directory
+        self.sample_cache_size = sample_cache_size
@@ -6,6 +6,7 @@ components in Modyn.
 import os
 
 from .utils import (  # noqa: F401
+    BATCHED_BYTES_PARSER_FUNC_NAME,
     BYTES_PARSER_FUNC_NAME,
     EMIT_MESSAGE_PERCENTAGES,
     EVALUATION_TRANSFORMER_FUNC_NAME,